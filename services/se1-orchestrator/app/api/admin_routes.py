@@ -14,7 +14,7 @@ from common.datetime_utils import now_brazil
 from common.log_utils import get_logger
 from app.core.config import get_settings
 from app.core.constants import ADMIN_SERVICE_CHECK_TIMEOUT_SECONDS
-from app.infrastructure.dependency_injection import get_pipeline_orchestrator
+from app.infrastructure.dependency_injection import get_http_pool, get_pipeline_orchestrator
 from app.infrastructure.redis_store import get_store
 from app.domain.models import AdminCleanupResponse, AdminStatsResponse, FactoryResetResponse
 
@@ -40,7 +40,8 @@ def _get_orchestrator() -> Any:
 async def get_stats(redis_store: Any = Depends(_get_redis_store)) -> dict[str, Any]:
     """Retorna estatísticas do orchestrator, incluindo Redis e configurações ativas."""
     try:
-        stats = redis_store.get_stats()
+        stats = await redis_store.aget_stats()
+        http_pool = get_http_pool()
 
         return {
             "orchestrator": {
@@ -48,6 +49,7 @@ async def get_stats(redis_store: Any = Depends(_get_redis_store)) -> dict[str, A
                 "environment": settings["environment"],
             },
             "redis": stats,
+            "http_pools": http_pool.metrics() if http_pool else {},
             "settings": {
                 "cache_ttl_hours": settings["cache_ttl_hours"],
                 "job_timeout_minutes": settings["job_timeout_minutes"],
@@ -96,7 +98,7 @@ async def cleanup_old_jobs(
             "logs_cleaned": False,
         }
 
-        removed = redis_store.cleanup_old_jobs(max_age_hours)
+        removed = await redis_store.acleanup_old_jobs(max_age_hours)
         result["jobs_removed"] = removed
 
         if deep or remove_logs:
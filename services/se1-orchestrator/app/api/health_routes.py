@@ -46,7 +46,7 @@ async def health_check(
         redis_ok = False
         if redis_store:
             try:
-                redis_ok = redis_store.ping()
+                redis_ok = await redis_store.aping()
             except Exception as e:
                 logger.error(f"Redis health check failed: {e}")
 
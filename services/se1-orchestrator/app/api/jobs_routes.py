@@ -45,24 +45,24 @@ def _get_redis_store() -> Any:
 )
 async def list_jobs(
     limit: int = Query(50, ge=1, le=200, description="Quantidade máxima de jobs retornados.", examples=[50, 100]),
+    offset: int = Query(0, ge=0, description="Quantidade de jobs a pular (paginação).", examples=[0, 50]),
+    status_filter: str | None = Query(None, alias="status", description="Filtra por status do job.", examples=["processing", "failed"]),
     redis_store: Any = Depends(_get_redis_store),
 ) -> dict[str, Any]:
     """Lista jobs recentes da pipeline com status e progresso."""
     try:
-        job_ids = redis_store.list_jobs(limit=limit)
-
         jobs = []
-        for job_id in job_ids:
-            job = redis_store.get_job(job_id)
-            if job:
-                jobs.append({
-                    "job_id": job.id,
-                    "youtube_url": job.youtube_url,
-                    "status": job.status.value,
-                    "progress": job.overall_progress,
-                    "created_at": job.created_at,
-                    "updated_at": job.updated_at,
-                })
+        for job in await redis_store.alist_jobs(
+            limit=limit, status=status_filter, offset=offset, include_blobs=False
+        ):
+            jobs.append({
+                "job_id": job.id,
+                "youtube_url": job.youtube_url,
+                "status": job.status.value,
+                "progress": job.overall_progress,
+                "created_at": job.created_at,
+                "updated_at": job.updated_at,
+            })
 
         return {"total": len(jobs), "jobs": jobs}
 
@@ -84,7 +84,7 @@ async def get_job_status(
 ) -> PipelineStatusResponse:
     """Retorna o status detalhado de um job da pipeline, incluindo todos os estágios."""
     try:
-        job = redis_store.get_job(job_id)
+        job = await redis_store.aget_job(job_id)
 
         if not job:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job {job_id} nao encontrado")
@@ -147,7 +147,7 @@ async def wait_for_job_completion(
 
     try:
         while now_brazil() - start_time < max_wait:
-            job = redis_store.get_job(job_id)
+            job = await redis_store.aget_job(job_id)
 
             if not job:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job {job_id} nao encontrado")
@@ -240,7 +240,7 @@ async def stream_job_progress(
             yield f"event: connected\ndata: {json.dumps({'message': 'Conectado ao stream', 'job_id': job_id})}\n\n"
 
             while now_brazil() - start_time < max_wait:
-                job = redis_store.get_job(job_id)
+                job = await redis_store.aget_job(job_id)
 
                 if not job:
                     yield f"event: error\ndata: {json.dumps({'error': 'Job nao encontrado', 'job_id': job_id})}\n\n"
@@ -10,6 +10,9 @@ from typing import Any, Optional
 from pydantic import Field, field_validator, model_validator
 
 from common.config_utils.base_settings import BaseServiceSettings
+from common.redis_utils.job_events import job_events_channel
+
+from app.core.constants import TRANSFER_MODES
 
 
 class OrchestratorSettings(BaseServiceSettings):
@@ -33,6 +36,12 @@ class OrchestratorSettings(BaseServiceSettings):
     # Limitações de recursos
     max_file_size_mb: int = Field(default=500)
 
+    # Transferência de artefatos entre estágios
+    # "stream": repassa chunks do /download de um serviço direto para o upload do próximo
+    # "buffer": baixa o arquivo inteiro para memória antes de reenviar (comportamento legado)
+    artifact_transfer_mode: str = Field(default="stream")
+    stream_chunk_size_kb: int = Field(default=256, ge=4)
+
     # Microserviços URLs - required but with None default for validation
     video_downloader_url: Optional[str] = Field(
         default=None,
@@ -62,6 +71,16 @@ class OrchestratorSettings(BaseServiceSettings):
     poll_interval_max: float = Field(default=30.0)
     max_poll_attempts: int = Field(default=300)
 
+    # Eventos de conclusão via Redis pub/sub (polling vira fallback)
+    job_events_enabled: bool = Field(default=True)
+    job_events_fallback_poll_interval: float = Field(default=30.0, gt=0)
+
+    # Pool de conexões HTTP por microserviço (keep-alive)
+    http_pool_max_connections: int = Field(default=20, ge=1)
+    http_pool_max_keepalive: int = Field(default=10, ge=0)
+    http_pool_keepalive_expiry: float = Field(default=30.0, ge=0)
+    http_pool_http2: bool = Field(default=False)
+
     # Retry para requisições HTTP
     microservice_max_retries: int = Field(default=3)
     microservice_retry_delay: float = Field(default=2.0)
@@ -105,6 +124,15 @@ class OrchestratorSettings(BaseServiceSettings):
             raise ValueError(f"URL must start with http:// or https://: {v}")
         return v.rstrip("/")
 
+    @field_validator("artifact_transfer_mode")
+    @classmethod
+    def validate_transfer_mode(cls, v: str) -> str:
+        """Valida modo de transferência de artefatos."""
+        mode = v.lower()
+        if mode not in TRANSFER_MODES:
+            raise ValueError(f"artifact_transfer_mode must be one of {TRANSFER_MODES}: {v}")
+        return mode
+
     @model_validator(mode='after')
     def validate_required_urls(self) -> OrchestratorSettings:
         """Valida que URLs obrigatórias foram fornecidas."""
@@ -154,6 +182,7 @@ def get_microservice_config(service_name: str) -> dict[str, Any]:
             "timeout": settings.video_downloader_timeout,
             "max_retries": settings.microservice_max_retries,
             "retry_delay": settings.microservice_retry_delay,
+            "events_channel": job_events_channel("video_downloader"),
             "endpoints": {
                 "submit": "/jobs",
                 "status": "/jobs/{job_id}",
@@ -166,6 +195,7 @@ def get_microservice_config(service_name: str) -> dict[str, Any]:
             "timeout": settings.audio_normalization_timeout,
             "max_retries": settings.microservice_max_retries,
             "retry_delay": settings.microservice_retry_delay,
+            "events_channel": job_events_channel("audio_normalization"),
             "endpoints": {
                 "submit": "/jobs",
                 "status": "/jobs/{job_id}",
@@ -185,6 +215,7 @@ def get_microservice_config(service_name: str) -> dict[str, Any]:
             "timeout": settings.audio_transcriber_timeout,
             "max_retries": settings.microservice_max_retries,
             "retry_delay": settings.microservice_retry_delay,
+            "events_channel": job_events_channel("audio_transcriber"),
             "endpoints": {
                 "submit": "/jobs",
                 "status": "/jobs/{job_id}",
@@ -10,8 +10,14 @@ DOWNLOAD_TIMEOUT_SECONDS: float = 300.0
 DOWNLOAD_READ_TIMEOUT_SECONDS: float = 900.0
 DOWNLOAD_WRITE_TIMEOUT_SECONDS: float = 300.0
 DOWNLOAD_CONNECT_TIMEOUT_SECONDS: float = 30.0
+DOWNLOAD_TOTAL_TIMEOUT_SECONDS: float = 960.0  # 16 minutos por download, do GET ao último byte
 ADMIN_SERVICE_CHECK_TIMEOUT_SECONDS: float = 30.0
 
+# --- Artifact transfer between services ---
+TRANSFER_MODE_STREAM: str = "stream"
+TRANSFER_MODE_BUFFER: str = "buffer"
+TRANSFER_MODES: tuple[str, ...] = (TRANSFER_MODE_STREAM, TRANSFER_MODE_BUFFER)
+
 # --- Query defaults ---
 WAIT_FOR_JOB_DEFAULT_TIMEOUT: int = 1800
 WAIT_FOR_JOB_MAX_TIMEOUT: int = 7200
@@ -81,6 +81,20 @@ class PipelineStageError(OrchestratorError):
         return f"{service}Stage '{self.stage}' failed: {self.message}"
 
 
+class ArtifactStreamError(PipelineStageError):
+    """
+    Falha ao ler o artefato do serviço de origem durante um streaming.
+
+    ``service_name`` é sempre o serviço de origem: o erro atravessa o upload
+    para o estágio seguinte sem contar no circuit breaker do destino.
+    """
+
+    def __init__(
+        self, message: str, service_name: str, original: Optional[Exception] = None
+    ) -> None:
+        super().__init__("download", message, original, service_name)
+
+
 class CircuitBreakerOpenError(OrchestratorError):
     """Circuit breaker está aberto."""
 
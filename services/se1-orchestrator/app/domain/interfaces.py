@@ -7,6 +7,7 @@ permitindo injeção de dependência e testes unitários.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 from typing import Any, Protocol
 
 
@@ -95,6 +96,56 @@ class MicroserviceClientInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def fetch_job_resource(self, job_id: str, endpoint_key: str) -> dict[str, Any] | None:
+        """
+        Busca um recurso JSON auxiliar do job (ex.: texto, segmentos).
+
+        Args:
+            job_id: ID do job
+            endpoint_key: Chave do endpoint configurado
+
+        Returns:
+            Optional[Dict[str, Any]]: JSON do recurso ou None se indisponível
+        """
+        pass
+
+    @abstractmethod
+    def open_download_stream(self, job_id: str) -> AbstractAsyncContextManager[Any]:
+        """
+        Abre o resultado do job para leitura em chunks.
+
+        Args:
+            job_id: ID do job
+
+        Returns:
+            Context manager assíncrono que fornece o stream do artefato
+
+        Raises:
+            PipelineStageError: Se não for possível abrir o stream
+        """
+        pass
+
+    @abstractmethod
+    async def submit_multipart_stream(
+        self, field_name: str, stream: Any, data: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Submete arquivo via multipart/form-data a partir de um stream.
+
+        Args:
+            field_name: Nome do campo de arquivo
+            stream: Stream obtido de ``open_download_stream``
+            data: Dados adicionais do formulário
+
+        Returns:
+            Dict[str, Any]: Resposta do serviço
+
+        Raises:
+            PipelineStageError: Se a submissão falhar
+        """
+        pass
+
 
 class PipelineStageInterface(ABC):
     """
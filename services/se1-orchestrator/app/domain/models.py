@@ -294,6 +294,10 @@ class OrchestratorSettingsSnapshot(BaseModel):
 class AdminStatsResponse(BaseModel):
     orchestrator: OrchestratorStatsInfo = Field(..., description="Informações gerais do orchestrator.")
     redis: dict[str, Any] = Field(default_factory=dict, description="Métricas relacionadas ao Redis.")
+    http_pools: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Métricas dos pools HTTP por serviço (conexões abertas, requisições, taxa de reuso).",
+    )
     settings: OrchestratorSettingsSnapshot = Field(..., description="Configurações ativas relevantes.")
 
 
@@ -66,6 +66,7 @@ class CircuitBreaker(CircuitBreakerInterface):
         recovery_timeout: Tempo em segundos até tentar reabrir
         half_open_max_calls: Máximo de calls permitidas em estado HALF_OPEN
         name: Identificador do circuit breaker para logging
+        excluded_exceptions: Exceções que atravessam ``call`` sem contar como falha
         state: Estado atual do circuit breaker
     
     Example:
@@ -84,6 +85,7 @@ class CircuitBreaker(CircuitBreakerInterface):
         recovery_timeout: int = 60,
         half_open_max_calls: int = 3,
         name: str = "default",
+        excluded_exceptions: tuple[type[BaseException], ...] = (),
     ) -> None:
         """Inicializa Circuit Breaker.
 
@@ -92,11 +94,14 @@ class CircuitBreaker(CircuitBreakerInterface):
             recovery_timeout: Segundos até tentar reabrir
             half_open_max_calls: Máximo de calls em estado HALF_OPEN
             name: Nome identificador para logging
+            excluded_exceptions: Exceções que não indicam falha deste serviço
+                (ex.: erro de leitura de outro serviço repassado no upload)
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.half_open_max_calls = half_open_max_calls
         self.name = name
+        self.excluded_exceptions = excluded_exceptions
 
         self._failure_count: int = 0
         self._last_failure_time: datetime | None = None
@@ -152,10 +157,20 @@ permite execução limitada para testar se o serviço recuperou.
             result = await func(*args, **kwargs)
             self._on_success()
             return result
+        except self.excluded_exceptions:
+            raise
         except Exception as e:
             self._on_failure()
             raise
 
+    def record_failure(self) -> None:
+        """Registra uma falha observada fora de ``call``.
+
+        Usado quando a falha acontece depois que a chamada protegida já
+        retornou, como na leitura de um corpo em streaming.
+        """
+        self._on_failure()
+
     def _should_attempt_reset(self) -> bool:
         """Verifica se deve tentar reabrir após timeout.
         
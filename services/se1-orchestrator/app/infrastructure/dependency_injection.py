@@ -9,15 +9,21 @@ from datetime import datetime
 from functools import lru_cache
 from typing import Any
 
-from app.core.config import get_settings
+from app.core.config import get_microservice_config, get_settings
 from app.domain.interfaces import MicroserviceClientInterface
 from app.infrastructure.circuit_breaker import CircuitBreaker
+from app.infrastructure.http_pool import ServiceHttpPool
+from app.infrastructure.job_event_listener import JobEventListener
 from app.infrastructure.microservice_client import MicroserviceClient
 from app.infrastructure.redis_store import RedisStore, get_store
 from app.services.health_checker import HealthChecker
 from app.services.pipeline_orchestrator import PipelineOrchestrator
 
 _app_start_time: datetime | None = None
+_http_pool: ServiceHttpPool | None = None
+_job_event_listener: JobEventListener | None = None
+
+_PIPELINE_SERVICES = ("se2-video-downloader", "se3-audio-normalization", "se4-audio-transcriber")
 
 
 def set_app_start_time(dt: datetime) -> None:
@@ -29,6 +35,65 @@ def get_app_start_time() -> datetime | None:
     return _app_start_time
 
 
+def init_http_pool() -> ServiceHttpPool:
+    """
+    Cria o pool de clients HTTP compartilhados (chamado no lifespan).
+
+    Returns:
+        ServiceHttpPool ativo
+    """
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = ServiceHttpPool()
+        get_health_checker.cache_clear()
+    return _http_pool
+
+
+def get_http_pool() -> ServiceHttpPool | None:
+    """Retorna o pool de clients HTTP, se inicializado pelo lifespan."""
+    return _http_pool
+
+
+async def close_http_pool() -> None:
+    """Fecha o pool de clients HTTP (chamado no shutdown do lifespan)."""
+    global _http_pool
+    if _http_pool is not None:
+        await _http_pool.aclose()
+        _http_pool = None
+        get_health_checker.cache_clear()
+
+
+async def init_job_event_listener() -> JobEventListener | None:
+    """
+    Inicia o listener de eventos de jobs dos microserviços (chamado no lifespan).
+
+    Returns:
+        JobEventListener ativo, ou None se desabilitado por configuração
+    """
+    global _job_event_listener
+    settings = get_settings()
+    if not settings.job_events_enabled:
+        return None
+    if _job_event_listener is None:
+        channels = [get_microservice_config(name)["events_channel"] for name in _PIPELINE_SERVICES]
+        _job_event_listener = JobEventListener(settings.redis_url, channels)
+        await _job_event_listener.start()
+    return _job_event_listener
+
+
+def get_job_event_listener() -> JobEventListener | None:
+    """Retorna o listener de eventos de jobs, se iniciado pelo lifespan."""
+    return _job_event_listener
+
+
+async def close_job_event_listener() -> None:
+    """Para o listener de eventos de jobs (chamado no shutdown do lifespan)."""
+    global _job_event_listener
+    if _job_event_listener is not None:
+        await _job_event_listener.stop()
+        _job_event_listener = None
+
+
 @lru_cache()
 def get_circuit_breaker(
     failure_threshold: int | None = None,
@@ -58,13 +123,17 @@ def get_microservice_client(service_name: str) -> MicroserviceClient:
     """
     Factory para MicroserviceClient.
 
+    Usa o client HTTP compartilhado do serviço quando o pool foi
+    inicializado pelo lifespan; caso contrário cada chamada abre sua conexão.
+
     Args:
         service_name: Nome do serviço
 
     Returns:
         MicroserviceClient configurado
     """
-    return MicroserviceClient(service_name)
+    http_client = _http_pool.get_client(service_name) if _http_pool is not None else None
+    return MicroserviceClient(service_name, http_client=http_client)
 
 
 @lru_cache()
@@ -107,6 +176,7 @@ def get_pipeline_orchestrator(redis_store: RedisStore | None = None) -> Pipeline
         transcription_client=transcription_client,
         health_checker=health_checker,
         redis_store=redis_store,
+        event_listener=_job_event_listener,
     )
 
 
@@ -149,4 +219,5 @@ def get_orchestrator_with_custom_clients(
         transcription_client=transcription_client,
         health_checker=health_checker,
         redis_store=redis_store,
+        event_listener=_job_event_listener,
     )
@@ -0,0 +1,145 @@
+"""
+Pool de clientes HTTP por microserviço.
+
+Mantém um ``httpx.AsyncClient`` de longa duração por serviço downstream,
+reaproveitando conexões TCP/TLS entre submissões, polls de status e
+downloads. O ciclo de vida é controlado pelo lifespan da aplicação.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from common.log_utils import get_logger
+
+from app.core.config import get_settings
+from app.core.ssl_config import get_ssl_context
+
+logger = get_logger(__name__)
+
+# Eventos de trace do httpcore emitidos apenas quando uma conexão nova é aberta
+_NEW_CONNECTION_EVENT = "connection.connect_tcp.complete"
+
+
+@dataclass
+class PoolStats:
+    """
+    Contadores de uso do pool de um serviço.
+
+    Attributes:
+        requests: Total de requisições enviadas pelo client
+        connections_opened: Total de conexões TCP abertas
+    """
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fração das requisições atendidas por conexões já abertas."""
+        if self.requests == 0:
+            return 0.0
+        reused = max(self.requests - self.connections_opened, 0)
+        return reused / self.requests
+
+
+class ServiceHttpPool:
+    """
+    Registro de clients HTTP compartilhados, um por microserviço.
+
+    Os clients são criados sob demanda com os limites de keep-alive
+    configurados e fechados juntos em ``aclose``.
+
+    Example:
+        >>> pool = ServiceHttpPool()
+        >>> client = pool.get_client("se2-video-downloader")
+        >>> response = await client.get(url)
+        >>> await pool.aclose()
+    """
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        self._limits = httpx.Limits(
+            max_connections=settings.http_pool_max_connections,
+            max_keepalive_connections=settings.http_pool_max_keepalive,
+            keepalive_expiry=settings.http_pool_keepalive_expiry,
+        )
+        self._http2 = settings.http_pool_http2
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._transports: dict[str, httpx.AsyncHTTPTransport] = {}
+        self._stats: dict[str, PoolStats] = {}
+
+    def get_client(self, service_name: str) -> httpx.AsyncClient:
+        """
+        Retorna o client compartilhado do serviço, criando-o se necessário.
+
+        Args:
+            service_name: Nome do serviço downstream
+
+        Returns:
+            httpx.AsyncClient com pool de conexões
+        """
+        client = self._clients.get(service_name)
+        if client is None or client.is_closed:
+            client = self._create_client(service_name)
+            self._clients[service_name] = client
+        return client
+
+    def _create_client(self, service_name: str) -> httpx.AsyncClient:
+        ssl_verify = get_ssl_context()
+        try:
+            transport = httpx.AsyncHTTPTransport(
+                verify=ssl_verify, limits=self._limits, http2=self._http2
+            )
+        except ImportError:
+            logger.warning(f"[{service_name}] HTTP/2 requested but 'h2' is not installed - using HTTP/1.1")
+            transport = httpx.AsyncHTTPTransport(verify=ssl_verify, limits=self._limits)
+
+        stats = self._stats.setdefault(service_name, PoolStats())
+
+        async def _trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name == _NEW_CONNECTION_EVENT:
+                stats.connections_opened += 1
+
+        async def _on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            request.extensions["trace"] = _trace
+
+        self._transports[service_name] = transport
+        logger.info(
+            f"[{service_name}] HTTP pool created "
+            f"(max_connections={self._limits.max_connections}, "
+            f"max_keepalive={self._limits.max_keepalive_connections}, http2={self._http2})"
+        )
+        return httpx.AsyncClient(transport=transport, event_hooks={"request": [_on_request]})
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """
+        Métricas por serviço: conexões abertas, requisições e taxa de reuso.
+
+        Returns:
+            Dict de nome do serviço -> métricas do pool
+        """
+        result: dict[str, dict[str, Any]] = {}
+        for service_name, stats in self._stats.items():
+            transport = self._transports.get(service_name)
+            pool = getattr(transport, "_pool", None)
+            connections = getattr(pool, "connections", []) if pool is not None else []
+            result[service_name] = {
+                "open_connections": len(connections),
+                "requests": stats.requests,
+                "connections_opened": stats.connections_opened,
+                "reuse_ratio": round(stats.reuse_ratio, 4),
+            }
+        return result
+
+    async def aclose(self) -> None:
+        """Fecha todos os clients e suas conexões."""
+        for service_name, client in self._clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"[{service_name}] Failed to close HTTP pool: {e}")
+        self._clients.clear()
+        self._transports.clear()
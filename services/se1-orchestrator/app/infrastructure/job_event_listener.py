@@ -0,0 +1,168 @@
+"""
+Listener de eventos de jobs publicados pelos microserviços via Redis pub/sub.
+
+Os serviços se2/se3/se4 publicam cada mudança de estado de job no canal
+``<service>:job_events``. O orquestrador assina esses canais e acorda o
+``_wait_until_done`` correspondente assim que o evento chega, mantendo o
+polling apenas como fallback.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import redis.asyncio as aioredis
+from common.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+_RECONNECT_DELAY_SECONDS = 2.0
+_RECONNECT_DELAY_MAX_SECONDS = 30.0
+
+
+class JobEventWatch:
+    """
+    Inscrição de um waiter nos eventos de um job específico.
+
+    Eventos recebidos entre duas chamadas a ``wait`` não são perdidos:
+    o último payload fica guardado até ser consumido.
+    """
+
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+        self._payload: dict[str, Any] | None = None
+
+    def notify(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+        self._event.set()
+
+    async def wait(self, timeout: float) -> dict[str, Any] | None:
+        """
+        Aguarda o próximo evento do job.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos
+
+        Returns:
+            Payload do evento, ou None se o timeout expirar
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._event.clear()
+        payload, self._payload = self._payload, None
+        return payload
+
+
+class JobEventListener:
+    """
+    Assina os canais de eventos de job e distribui para os waiters.
+
+    Example:
+        >>> listener = JobEventListener(redis_url, ["audio_normalization:job_events"])
+        >>> await listener.start()
+        >>> with listener.watch("audio_normalization:job_events", job_id) as watch:
+        ...     event = await watch.wait(timeout=30)
+        >>> await listener.stop()
+    """
+
+    def __init__(self, redis_url: str, channels: list[str]) -> None:
+        self.redis_url = redis_url
+        self.channels = channels
+        self._watchers: dict[tuple[str, str], set[JobEventWatch]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._subscribed = False
+        self.events_received = 0
+
+    @property
+    def connected(self) -> bool:
+        """True enquanto a assinatura dos canais estiver ativa."""
+        return self._subscribed
+
+    async def start(self) -> None:
+        """Inicia a task de escuta em background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Job event listener started for channels: {self.channels}")
+
+    async def stop(self) -> None:
+        """Cancela a task de escuta e libera a conexão."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._subscribed = False
+
+    @contextmanager
+    def watch(self, channel: str, job_id: str) -> Iterator[JobEventWatch]:
+        """
+        Registra interesse nos eventos de um job.
+
+        Registre antes de consultar o status para não perder eventos
+        publicados entre a consulta e a espera.
+
+        Args:
+            channel: Canal de eventos do serviço
+            job_id: ID do job no serviço
+
+        Yields:
+            JobEventWatch para aguardar eventos
+        """
+        key = (channel, job_id)
+        watch = JobEventWatch()
+        self._watchers.setdefault(key, set()).add(watch)
+        try:
+            yield watch
+        finally:
+            watchers = self._watchers.get(key)
+            if watchers is not None:
+                watchers.discard(watch)
+                if not watchers:
+                    del self._watchers[key]
+
+    def dispatch(self, channel: str, data: str) -> None:
+        """Entrega uma mensagem bruta do pub/sub aos waiters do job."""
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Ignoring malformed job event on {channel}: {e}")
+            return
+
+        job_id = payload.get("job_id")
+        self.events_received += 1
+        for watch in list(self._watchers.get((channel, job_id), ())):
+            watch.notify(payload)
+
+    async def _run(self) -> None:
+        delay = _RECONNECT_DELAY_SECONDS
+        while True:
+            client = aioredis.from_url(self.redis_url, decode_responses=True)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(*self.channels)
+                self._subscribed = True
+                delay = _RECONNECT_DELAY_SECONDS
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.dispatch(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Job event listener disconnected: {e} - retrying in {delay:.0f}s")
+            finally:
+                self._subscribed = False
+                try:
+                    await pubsub.aclose()
+                    await client.aclose()
+                except Exception as e:
+                    logger.debug(f"Error closing job event subscription: {e}")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RECONNECT_DELAY_MAX_SECONDS)
@@ -8,18 +8,22 @@ from __future__ import annotations
 import asyncio
 import random
 import re
+import secrets
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
 import httpx
 from common.log_utils import get_logger
 
-from app.core.constants import BYTES_PER_MB, HEALTH_CHECK_TIMEOUT_SECONDS, DOWNLOAD_TIMEOUT_SECONDS, DOWNLOAD_READ_TIMEOUT_SECONDS, DOWNLOAD_WRITE_TIMEOUT_SECONDS, DOWNLOAD_CONNECT_TIMEOUT_SECONDS
+from app.core.constants import BYTES_PER_MB, HEALTH_CHECK_TIMEOUT_SECONDS, DOWNLOAD_TIMEOUT_SECONDS, DOWNLOAD_READ_TIMEOUT_SECONDS, DOWNLOAD_WRITE_TIMEOUT_SECONDS, DOWNLOAD_CONNECT_TIMEOUT_SECONDS, DOWNLOAD_TOTAL_TIMEOUT_SECONDS
 from app.core.config import get_microservice_config, get_settings
 from app.core.ssl_config import get_ssl_context
 from app.domain.interfaces import MicroserviceClientInterface
 from app.infrastructure.circuit_breaker import CircuitBreaker
-from app.core.exceptions import CircuitBreakerOpenError, PipelineStageError
+from app.core.exceptions import ArtifactStreamError, CircuitBreakerOpenError, PipelineStageError
 
 logger = get_logger(__name__)
 
@@ -33,6 +37,52 @@ def _filename_from_cd(cd: str | None) -> str | None:
     return m.group(1) if m else None
 
 
+@dataclass
+class ArtifactStream:
+    """
+    Artefato de um job sendo lido em streaming do serviço de origem.
+
+    Attributes:
+        filename: Nome extraído do Content-Disposition (ou fallback)
+        content_length: Tamanho anunciado pelo serviço, se conhecido
+        chunks: Iterador assíncrono com o corpo da resposta
+    """
+
+    filename: str
+    content_length: int | None
+    chunks: AsyncIterator[bytes]
+
+
+async def _multipart_stream(
+    boundary: str,
+    field_name: str,
+    stream: ArtifactStream,
+    data: dict[str, Any] | None = None,
+    content_type: str = "application/octet-stream",
+) -> AsyncIterator[bytes]:
+    """
+    Gera corpo multipart/form-data sem materializar o arquivo em memória.
+
+    Campos simples vêm primeiro; o arquivo é repassado chunk a chunk.
+    """
+    for name, value in (data or {}).items():
+        yield (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            f'{value}\r\n'
+        ).encode()
+
+    safe_filename = stream.filename.replace('"', "%22")
+    yield (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="{field_name}"; filename="{safe_filename}"\r\n'
+        f'Content-Type: {content_type}\r\n\r\n'
+    ).encode()
+    async for chunk in stream.chunks:
+        yield chunk
+    yield f"\r\n--{boundary}--\r\n".encode()
+
+
 class MicroserviceClient(MicroserviceClientInterface):
     """
     Cliente para comunicação com microserviços.
@@ -44,14 +94,17 @@ class MicroserviceClient(MicroserviceClientInterface):
     - Logging estruturado
     """
 
-    def __init__(self, service_name: str) -> None:
+    def __init__(self, service_name: str, http_client: httpx.AsyncClient | None = None) -> None:
         """
         Inicializa cliente.
 
         Args:
             service_name: Nome do serviço (se2-video-downloader, se3-audio-normalization, se4-audio-transcriber)
+            http_client: Client compartilhado do pool (ServiceHttpPool). Sem ele,
+                cada chamada abre e fecha um client próprio.
         """
         self.service_name = service_name
+        self._http_client = http_client
         self.config = get_microservice_config(service_name)
         self.base_url = self.config["url"].rstrip("/")
         self.timeout = self.config["timeout"]
@@ -70,6 +123,7 @@ class MicroserviceClient(MicroserviceClientInterface):
             recovery_timeout=settings.circuit_breaker_recovery_timeout,
             half_open_max_calls=settings.circuit_breaker_half_open_max_requests,
             name=service_name,
+            excluded_exceptions=(ArtifactStreamError,),
         )
 
     async def check_health(self) -> dict[str, Any]:
@@ -91,9 +145,8 @@ class MicroserviceClient(MicroserviceClientInterface):
         """
         try:
             url = f"{self.base_url}/health"
-            ssl_verify = get_ssl_context()
-            async with httpx.AsyncClient(timeout=HEALTH_CHECK_TIMEOUT_SECONDS, verify=ssl_verify) as client:
-                response = await client.get(url, headers=self._headers)
+            async with self._http(HEALTH_CHECK_TIMEOUT_SECONDS) as client:
+                response = await client.get(url, headers=self._headers, timeout=HEALTH_CHECK_TIMEOUT_SECONDS)
                 response.raise_for_status()
                 return response.json()
         except httpx.HTTPStatusError as http_error:
@@ -129,9 +182,8 @@ class MicroserviceClient(MicroserviceClientInterface):
         async def _do_request() -> dict[str, Any]:
             url = self._url("submit")
             logger.info(f"Submitting JSON to {self.service_name}: {url}")
-            ssl_verify = get_ssl_context()
-            async with httpx.AsyncClient(timeout=self.timeout, verify=ssl_verify) as client:
-                response = await client.post(url, json=payload, headers=self._headers)
+            async with self._http(self.timeout) as client:
+                response = await client.post(url, json=payload, headers=self._headers, timeout=self.timeout)
                 response.raise_for_status()
                 return response.json()
 
@@ -176,9 +228,8 @@ class MicroserviceClient(MicroserviceClientInterface):
         async def _do_request() -> dict[str, Any]:
             url = self._url("submit")
             logger.info(f"Submitting multipart to {self.service_name}: {url}")
-            ssl_verify = get_ssl_context()
-            async with httpx.AsyncClient(timeout=self.timeout, verify=ssl_verify) as client:
-                response = await client.post(url, files=files, data=data or {}, headers=self._headers)
+            async with self._http(self.timeout) as client:
+                response = await client.post(url, files=files, data=data or {}, headers=self._headers, timeout=self.timeout)
                 response.raise_for_status()
                 return response.json()
 
@@ -218,11 +269,10 @@ class MicroserviceClient(MicroserviceClientInterface):
             >>> print(status.get("progress", 0))
         """
         url = self._url("status", job_id=job_id)
-        ssl_verify = get_ssl_context()
 
         async def _do_request() -> dict[str, Any]:
-            async with httpx.AsyncClient(timeout=self.timeout, verify=ssl_verify) as client:
-                response = await client.get(url, headers=self._headers)
+            async with self._http(self.timeout) as client:
+                response = await client.get(url, headers=self._headers, timeout=self.timeout)
                 response.raise_for_status()
                 return response.json()
 
@@ -260,14 +310,13 @@ class MicroserviceClient(MicroserviceClientInterface):
         service_settings = get_settings()
         max_size_bytes = service_settings.max_file_size_mb * 1024 * 1024
         download_timeout = httpx.Timeout(DOWNLOAD_TIMEOUT_SECONDS, read=DOWNLOAD_READ_TIMEOUT_SECONDS, write=DOWNLOAD_WRITE_TIMEOUT_SECONDS, connect=DOWNLOAD_CONNECT_TIMEOUT_SECONDS)
-        ssl_verify = get_ssl_context()
 
         async def _download() -> tuple[bytes, str]:
             try:
-                async with asyncio.timeout(960):  # 16 minutos total
-                    async with httpx.AsyncClient(timeout=download_timeout, verify=ssl_verify) as client:
+                async with asyncio.timeout(DOWNLOAD_TOTAL_TIMEOUT_SECONDS):
+                    async with self._http(download_timeout) as client:
                         logger.info(f"[{self.service_name}] Starting download for job {job_id}...")
-                        response = await client.get(url, headers=self._headers)
+                        response = await client.get(url, headers=self._headers, timeout=download_timeout)
                         response.raise_for_status()
 
                         # Verifica Content-Length
@@ -302,6 +351,209 @@ class MicroserviceClient(MicroserviceClientInterface):
                 "download", f"Request failed: {str(request_error)}", request_error, self.service_name
             ) from request_error
 
+    @asynccontextmanager
+    async def open_download_stream(self, job_id: str) -> AsyncIterator[ArtifactStream]:
+        """
+        Abre o resultado do job para leitura em streaming.
+
+        O corpo é lido em chunks de ``stream_chunk_size_kb`` e o limite de
+        ``max_file_size_mb`` é verificado conforme os bytes chegam, então a
+        memória usada independe do tamanho do arquivo. Como em ``download_file``,
+        abertura e leitura compartilham o prazo total de
+        ``DOWNLOAD_TOTAL_TIMEOUT_SECONDS``.
+
+        Falhas de leitura são registradas no circuit breaker deste serviço e
+        levantadas como ``ArtifactStreamError``, que o breaker do serviço de
+        destino ignora em ``submit_multipart_stream``.
+
+        Args:
+            job_id: ID do job cujo resultado será lido
+
+        Yields:
+            ArtifactStream: Nome, tamanho anunciado e iterador de chunks
+
+        Raises:
+            PipelineStageError: Se falhar ao abrir o stream ou circuit breaker estiver aberto
+            ArtifactStreamError: Se a leitura falhar, estourar o prazo ou exceder o tamanho máximo
+
+        Example:
+            >>> async with client.open_download_stream("abc123") as stream:
+            ...     async for chunk in stream.chunks:
+            ...         sink.write(chunk)
+        """
+        url = self._url("download", job_id=job_id)
+        service_settings = get_settings()
+        max_size_bytes = service_settings.max_file_size_mb * BYTES_PER_MB
+        chunk_size = service_settings.stream_chunk_size_kb * 1024
+        download_timeout = httpx.Timeout(DOWNLOAD_TIMEOUT_SECONDS, read=DOWNLOAD_READ_TIMEOUT_SECONDS, write=DOWNLOAD_WRITE_TIMEOUT_SECONDS, connect=DOWNLOAD_CONNECT_TIMEOUT_SECONDS)
+
+        deadline = asyncio.get_running_loop().time() + DOWNLOAD_TOTAL_TIMEOUT_SECONDS
+        timeout_message = f"Download timeout after 16 minutes for job {job_id}"
+
+        async with AsyncExitStack() as stack:
+            async def _open() -> httpx.Response:
+                async with asyncio.timeout_at(deadline):
+                    client = await stack.enter_async_context(self._http(download_timeout))
+                    response = await stack.enter_async_context(
+                        client.stream("GET", url, headers=self._headers, timeout=download_timeout)
+                    )
+                    response.raise_for_status()
+                    return response
+
+            try:
+                response = await self._circuit_breaker.call(_open)
+            except asyncio.TimeoutError as timeout_error:
+                raise PipelineStageError(
+                    "download", timeout_message, service_name=self.service_name
+                ) from timeout_error
+            except CircuitBreakerOpenError as circuit_error:
+                raise PipelineStageError(
+                    "download", f"Circuit breaker OPEN for {self.service_name}", service_name=self.service_name
+                ) from circuit_error
+            except httpx.HTTPStatusError as http_error:
+                raise PipelineStageError(
+                    "download", f"HTTP {http_error.response.status_code}", http_error, self.service_name
+                ) from http_error
+            except httpx.RequestError as request_error:
+                raise PipelineStageError(
+                    "download", f"Request failed: {str(request_error)}", request_error, self.service_name
+                ) from request_error
+
+            content_length_header = response.headers.get("Content-Length")
+            content_length = int(content_length_header) if content_length_header else None
+            if content_length and content_length > max_size_bytes:
+                raise ArtifactStreamError(f"File too large: {content_length} bytes", self.service_name)
+
+            filename = _filename_from_cd(response.headers.get("Content-Disposition")) or f"{self.service_name}-{job_id}"
+
+            async def _chunks() -> AsyncIterator[bytes]:
+                received = 0
+                body = response.aiter_bytes(chunk_size)
+                while True:
+                    # O prazo vale só para a leitura da origem; o tempo gasto pelo
+                    # consumidor entre chunks é limitado pelos timeouts do destino
+                    try:
+                        async with asyncio.timeout_at(deadline):
+                            chunk = await anext(body)
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError as timeout_error:
+                        self._circuit_breaker.record_failure()
+                        raise ArtifactStreamError(timeout_message, self.service_name) from timeout_error
+                    except httpx.HTTPError as read_error:
+                        self._circuit_breaker.record_failure()
+                        raise ArtifactStreamError(
+                            f"Stream read failed: {read_error}", self.service_name, read_error
+                        ) from read_error
+
+                    received += len(chunk)
+                    if received > max_size_bytes:
+                        raise ArtifactStreamError(f"Downloaded file too large: {received} bytes", self.service_name)
+                    yield chunk
+                logger.info(f"[{self.service_name}] Streamed {filename}: {received / BYTES_PER_MB:.1f}MB")
+
+            logger.info(f"[{self.service_name}] Streaming download for job {job_id}...")
+            yield ArtifactStream(filename=filename, content_length=content_length, chunks=_chunks())
+
+    async def submit_multipart_stream(
+        self, field_name: str, stream: ArtifactStream, data: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Submete arquivo via multipart/form-data repassando chunks de um stream.
+
+        Equivalente a ``submit_multipart``, mas o corpo é enviado com
+        chunked transfer encoding à medida que o stream de origem é lido.
+        Falhas na leitura da origem (``ArtifactStreamError``) não contam no
+        circuit breaker deste serviço.
+
+        Args:
+            field_name: Nome do campo de arquivo no formulário
+            stream: Stream aberto com ``open_download_stream`` de outro serviço
+            data: Dados adicionais opcionais como dicionário
+
+        Returns:
+            Dict[str, Any]: Resposta do serviço com dados do processamento
+
+        Raises:
+            PipelineStageError: Se falhar no upload ou circuit breaker estiver aberto
+            ArtifactStreamError: Se a leitura do serviço de origem falhar
+
+        Example:
+            >>> async with se3_client.open_download_stream(job_id) as stream:
+            ...     response = await se4_client.submit_multipart_stream("file", stream, {"language_in": "pt"})
+        """
+        async def _do_request() -> dict[str, Any]:
+            url = self._url("submit")
+            logger.info(f"Streaming multipart to {self.service_name}: {url}")
+            boundary = secrets.token_hex(16)
+            headers = {**self._headers, "Content-Type": f"multipart/form-data; boundary={boundary}"}
+            upload_timeout = httpx.Timeout(self.timeout, write=DOWNLOAD_WRITE_TIMEOUT_SECONDS, read=DOWNLOAD_READ_TIMEOUT_SECONDS)
+            async with self._http(upload_timeout) as client:
+                response = await client.post(
+                    url,
+                    content=_multipart_stream(boundary, field_name, stream, data),
+                    headers=headers,
+                    timeout=upload_timeout,
+                )
+                response.raise_for_status()
+                return response.json()
+
+        try:
+            return await self._circuit_breaker.call(_do_request)
+        except CircuitBreakerOpenError as circuit_error:
+            raise PipelineStageError(
+                "submit", f"Circuit breaker OPEN for {self.service_name}", service_name=self.service_name
+            ) from circuit_error
+        except httpx.HTTPStatusError as http_error:
+            raise PipelineStageError(
+                "submit", f"HTTP {http_error.response.status_code}", http_error, self.service_name
+            ) from http_error
+        except httpx.RequestError as request_error:
+            raise PipelineStageError(
+                "submit", f"Request failed: {str(request_error)}", request_error, self.service_name
+            ) from request_error
+
+    async def fetch_job_resource(self, job_id: str, endpoint_key: str) -> dict[str, Any] | None:
+        """
+        Busca um recurso JSON auxiliar de um job (ex.: texto ou segmentos).
+
+        Falhas não abrem o circuit breaker: o recurso é opcional para o pipeline,
+        então erros HTTP, de conexão ou JSON inválido são registrados e viram None.
+
+        Args:
+            job_id: ID do job
+            endpoint_key: Chave do endpoint configurado (ex.: "text", "transcription")
+
+        Returns:
+            Optional[Dict[str, Any]]: JSON da resposta, ou None se a busca falhar
+        """
+        url = self._url(endpoint_key, job_id=job_id)
+        try:
+            async with self._http(self.timeout) as client:
+                response = await client.get(url, headers=self._headers, timeout=self.timeout)
+                if response.status_code != 200:
+                    logger.warning(f"[{self.service_name}] {endpoint_key} for job {job_id} returned HTTP {response.status_code}")
+                    return None
+                return response.json()
+        except (httpx.HTTPError, ValueError) as fetch_error:
+            logger.warning(f"[{self.service_name}] {endpoint_key} for job {job_id} failed: {fetch_error}")
+            return None
+
+    @asynccontextmanager
+    async def _http(self, timeout: float | httpx.Timeout) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Client HTTP para uma chamada.
+
+        Usa o client compartilhado do pool quando injetado (sem fechá-lo);
+        caso contrário abre um client temporário com o timeout informado.
+        """
+        if self._http_client is not None:
+            yield self._http_client
+            return
+
+        async with httpx.AsyncClient(timeout=timeout, verify=get_ssl_context()) as client:
+            yield client
+
     def _url(self, endpoint_key: str, **format_args: Any) -> str:
         """
         Gera URL completa para um endpoint.
@@ -7,13 +7,18 @@ import os
 from typing import Any
 
 from common.log_utils import get_logger
-from common.redis_utils import ResilientRedisStore
-from common.job_utils.store import JobRedisStore
+from common.redis_utils import AsyncResilientRedisStore, ResilientRedisStore, create_job_serializer
+from common.job_utils.async_store import AsyncJobRedisStore
+from common.job_utils.store import INDEXED_STATUSES, JobRedisStore
 
+from app.domain.models import PipelineStatus
 from app.domain.pipeline_job_v2 import PipelineJobV2
 
 logger = get_logger(__name__)
 
+# Campos pesados gravados fora do payload de status (hash ``<job>:blobs``)
+JOB_BLOB_FIELDS = ("transcription_text", "transcription_segments")
+
 # Alias for backward compatibility
 RedisStore = None  # Legacy alias, use OrchestratorJobStore
 
@@ -25,74 +30,105 @@ class OrchestratorJobStore:
             max_connections=50,
             circuit_breaker_enabled=True,
         )
-        self._store = JobRedisStore(
-            redis_store=self._resilient,
+        store_options: dict[str, Any] = dict(
             service_name="orchestrator",
             ttl_hours=int(os.getenv('CACHE_TTL_HOURS', '24')),
+            job_model=PipelineJobV2,
+            statuses=(*INDEXED_STATUSES, *(s.value for s in PipelineStatus)),
+            serializer=create_job_serializer(
+                os.getenv('JOB_SERIALIZER', 'json'),
+                os.getenv('JOB_COMPRESSION', 'none'),
+            ),
+            blob_fields=JOB_BLOB_FIELDS,
+            publish_events=False,
         )
+        self._store = JobRedisStore(redis_store=self._resilient, **store_options)
+
+        # Variante assíncrona (mesmas chaves) usada pela API e pelo pipeline,
+        # para que uma lentidão do Redis não bloqueie o event loop
+        self._async_resilient = AsyncResilientRedisStore(
+            redis_url=redis_url,
+            max_connections=50,
+            circuit_breaker_enabled=True,
+        )
+        self._async_store = AsyncJobRedisStore(redis_store=self._async_resilient, **store_options)
+        # Mesmo cache de digests dos blobs: as duas variantes gravam os mesmos jobs
+        self._async_store._blob_digests = self._store._blob_digests
         self.redis = self._resilient.redis
         self.key_prefix = "orchestrator:job:"
         self.list_key = "orchestrator:jobs:list"
 
     def save_job(self, job: PipelineJobV2) -> PipelineJobV2:
-        data = job.model_dump_json()
-        key = f"{self.key_prefix}{job.id}"
-        ttl = 24 * 3600
-        self._resilient.setex(key, ttl, data)
-        self.redis.zadd(self.list_key, {job.id: job.created_at.timestamp()})
+        self._store.save_job(job)
         return job
 
     def get_job(self, job_id: str) -> PipelineJobV2 | None:
-        key = f"{self.key_prefix}{job_id}"
-        data = self._resilient.get(key)
-        if not data:
-            return None
-        try:
-            return PipelineJobV2.model_validate_json(data)
-        except Exception as exc:
-            logger.error("Error deserializing job %s: %s", job_id, exc)
-            return None
+        return self._store.get_job(job_id)
 
     def update_job(self, job: PipelineJobV2) -> PipelineJobV2:
         return self.save_job(job)
 
     def delete_job(self, job_id: str) -> bool:
-        self.redis.zrem(self.list_key, job_id)
-        return self._resilient.delete(f"{self.key_prefix}{job_id}") > 0
-
-    def list_jobs(self, limit: int = 100) -> list[PipelineJobV2]:
-        all_ids = self.redis.zrevrange(self.list_key, 0, -1)
-        jobs: list[PipelineJobV2] = []
-        for jid in all_ids[:limit]:
-            job = self.get_job(str(jid))
-            if job:
-                jobs.append(job)
-        return jobs
+        return self._store.delete_job(job_id)
+
+    def list_jobs(
+        self,
+        limit: int = 100,
+        status: str | None = None,
+        offset: int = 0,
+        include_blobs: bool = True,
+    ) -> list[PipelineJobV2]:
+        """Uma página de jobs (mais recentes primeiro), via índice + MGET."""
+        return self._store.list_jobs(
+            status=status, limit=limit, offset=offset, include_blobs=include_blobs
+        )
 
     def get_stats(self) -> dict[str, Any]:
-        all_ids = self.redis.zrevrange(self.list_key, 0, -1)
-        total = len(all_ids)
-        by_status: dict[str, int] = {}
-        for jid in all_ids:
-            job = self.get_job(str(jid))
-            if job:
-                s = job.status.value if hasattr(job.status, 'value') else str(job.status)
-                by_status[s] = by_status.get(s, 0) + 1
-        return {"total_jobs": total, "by_status": by_status}
-
-    def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
-        all_ids = self.redis.zrevrange(self.list_key, 0, -1)
-        removed = 0
-        for jid in all_ids:
-            job = self.get_job(str(jid))
-            if job and job.is_expired:
-                self.delete_job(job.id)
-                removed += 1
-        return removed
+        """Contagens por status lidas dos índices (ZCARD), sem carregar jobs."""
+        return self._store.get_stats()
+
+    def cleanup_old_jobs(self, max_age_hours: int | None = None) -> int:
+        """Remove jobs expirados, ou criados há mais de ``max_age_hours``."""
+        return self._store.cleanup_expired(max_age_hours)
 
     def ping(self) -> bool:
         return self._resilient.ping()
 
+    # -- API assíncrona ----------------------------------------------------
+
+    async def asave_job(self, job: PipelineJobV2) -> PipelineJobV2:
+        await self._async_store.save_job(job)
+        return job
+
+    async def aget_job(self, job_id: str) -> PipelineJobV2 | None:
+        return await self._async_store.get_job(job_id)
+
+    async def adelete_job(self, job_id: str) -> bool:
+        return await self._async_store.delete_job(job_id)
+
+    async def alist_jobs(
+        self,
+        limit: int = 100,
+        status: str | None = None,
+        offset: int = 0,
+        include_blobs: bool = True,
+    ) -> list[PipelineJobV2]:
+        return await self._async_store.list_jobs(
+            status=status, limit=limit, offset=offset, include_blobs=include_blobs
+        )
+
+    async def aget_stats(self) -> dict[str, Any]:
+        return await self._async_store.get_stats()
+
+    async def acleanup_old_jobs(self, max_age_hours: int | None = None) -> int:
+        return await self._async_store.cleanup_expired(max_age_hours)
+
+    async def aping(self) -> bool:
+        return await self._async_resilient.ping()
+
+    async def aclose(self) -> None:
+        await self._async_resilient.close()
+
 
 # Factory functions for DI
 _redis_store_instance: OrchestratorJobStore | None = None
@@ -17,10 +17,18 @@ from common.fastapi_utils import create_service_app, create_api_key_dependency
 from app.domain.models import (
     PipelineRequest, PipelineResponse, PipelineJob, PipelineStatus, RootResponse,
 )
-from app.infrastructure.dependency_injection import get_pipeline_orchestrator, get_health_checker, set_app_start_time
+from app.infrastructure.dependency_injection import (
+    close_http_pool,
+    close_job_event_listener,
+    get_health_checker,
+    get_microservice_client,
+    get_pipeline_orchestrator,
+    init_http_pool,
+    init_job_event_listener,
+    set_app_start_time,
+)
 from app.infrastructure.redis_store import RedisStore, get_store
 from app.services.pipeline_background import execute_pipeline_background
-from app.infrastructure.microservice_client import MicroserviceClient
 from app.core.config import get_settings
 from app.core.exceptions import ValidationError, JobCreationError, RedisConnectionError
 from app.api.health_routes import router as health_router
@@ -47,13 +55,13 @@ async def validate_configuration() -> None:
     logger.info("Validating configuration...")
     if not redis_store:
         raise RuntimeError("Redis store not initialized")
-    if not redis_store.ping():
+    if not await redis_store.aping():
         raise RuntimeError("Redis not accessible - cannot start service")
     logger.info("Redis connection validated")
     services_to_check = ["se2-video-downloader", "se3-audio-normalization", "se4-audio-transcriber"]
     for service_name in services_to_check:
         try:
-            client = MicroserviceClient(service_name)
+            client = get_microservice_client(service_name)
             health = await client.check_health()
             if health.get("status") == "healthy":
                 logger.info(f"{service_name} is healthy")
@@ -69,6 +77,8 @@ async def lifespan(app: FastAPI) -> Any:
     global orchestrator, redis_store, app_start_time
     logger.info("Starting YouTube Caption Orchestrator API")
     try:
+        init_http_pool()
+        await init_job_event_listener()
         redis_store = get_store()
         orchestrator = get_pipeline_orchestrator(redis_store=redis_store)
         await validate_configuration()
@@ -79,6 +89,10 @@ async def lifespan(app: FastAPI) -> Any:
         raise
     yield
     logger.info("Shutting down Orchestrator API...")
+    await close_job_event_listener()
+    await close_http_pool()
+    if redis_store:
+        await redis_store.aclose()
 
 
 cors_config = {
@@ -182,7 +196,7 @@ async def root() -> dict[str, Any]:
 async def process_youtube_video(request: PipelineRequest, background_tasks: BackgroundTasks) -> PipelineResponse:
     try:
         job = await _create_pipeline_job(request)
-        redis_store.save_job(job)
+        await redis_store.asave_job(job)
         background_tasks.add_task(execute_pipeline_background, job.id)
         return PipelineResponse(
             job_id=job.id,
@@ -7,15 +7,19 @@ Delega health checks, circuit breaking e downloads para classes especializadas.
 from __future__ import annotations
 
 import asyncio
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
 from typing import Any
 
 from common.log_utils import get_logger
 from common.datetime_utils import now_brazil
 
-from app.core.constants import BYTES_PER_MB
+from app.core.constants import BYTES_PER_MB, TRANSFER_MODE_STREAM
 from app.core.config import get_microservice_config, get_settings
 from app.domain.interfaces import MicroserviceClientInterface
-from app.domain.models import PipelineJob, PipelineStatus, StageStatus
+from app.domain.models import PipelineJob, PipelineStage, PipelineStatus, StageStatus
+from app.infrastructure.job_event_listener import JobEventListener, JobEventWatch
+from app.infrastructure.microservice_client import ArtifactStream
 from app.infrastructure.redis_store import RedisStore
 from app.services.health_checker import HealthChecker
 
@@ -30,11 +34,69 @@ _SERVICE_TIMEOUTS: dict[str, str] = {
 _DEFAULT_TIMEOUT_ATTR = "video_downloader_job_timeout"
 
 
+_COMPLETED_STATES = frozenset({"completed", "success", "done", "finished"})
+_FAILED_STATES = frozenset({"failed", "error", "cancelled", "canceled", "aborted"})
+
+
 def _bool_to_str(v: bool) -> str:
     """Converte bool para string 'true'/'false'."""
     return "true" if v else "false"
 
 
+def _apply_progress(stage: Any, value: Any) -> None:
+    """Atualiza progresso do estágio aceitando frações (0-1) ou percentuais."""
+    try:
+        p = float(value)
+        stage.progress = p * 100.0 if p <= 1.0 else p
+    except Exception as e:
+        logger.debug(f"Failed to parse progress value: {e}")
+
+
+@dataclass
+class StageArtifact:
+    """
+    Arquivo produzido por um estágio do pipeline.
+
+    No modo buffer ``content`` contém o arquivo inteiro. No modo stream
+    ``stream`` é o ``/jobs/{id}/download`` já aberto, com nome e tamanho lidos
+    dos headers: o estágio seguinte consome os chunks direto no próprio
+    upload, e ``aclose`` libera a conexão depois disso.
+
+    Attributes:
+        client: Cliente do serviço que produziu o arquivo
+        job_id: ID do job no serviço de origem
+        filename: Nome do arquivo (Content-Disposition do serviço de origem)
+        stage: Estágio que produziu o arquivo
+        content: Conteúdo em memória (apenas no modo buffer)
+        size: Tamanho em bytes, se conhecido (Content-Length no modo stream)
+        stream: Download aberto no serviço de origem (apenas no modo stream)
+    """
+
+    client: MicroserviceClientInterface
+    job_id: str
+    filename: str
+    stage: PipelineStage
+    content: bytes | None = None
+    size: int | None = None
+    stream: ArtifactStream | None = None
+    _exit_stack: AsyncExitStack | None = field(default=None, repr=False)
+
+    async def aclose(self) -> None:
+        """Fecha o download aberto no modo stream; chamadas repetidas são ignoradas."""
+        exit_stack, self._exit_stack = self._exit_stack, None
+        self.stream = None
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
+    def describe_size(self) -> str:
+        """Tamanho legível para logs."""
+        if self.content is not None:
+            return f"{len(self.content) / BYTES_PER_MB:.1f}MB"
+        if self.size is not None:
+            return f"{self.size / BYTES_PER_MB:.1f}MB (streamed)"
+        return "streamed"
+
+
 class PipelineOrchestrator:
     """
     Orquestrador de pipeline refatorado com injeção de dependência.
@@ -50,6 +112,8 @@ class PipelineOrchestrator:
         transcription_client: Cliente do serviço se4-audio-transcriber
         health_checker: Verificador de saúde dos serviços
         redis_store: Store Redis para persistência
+        transfer_mode: "stream" ou "buffer" (padrão: settings.artifact_transfer_mode)
+        event_listener: Listener de eventos de jobs (Redis pub/sub), opcional
     """
 
     def __init__(
@@ -59,17 +123,22 @@ class PipelineOrchestrator:
         transcription_client: MicroserviceClientInterface,
         health_checker: HealthChecker,
         redis_store: RedisStore | None = None,
+        transfer_mode: str | None = None,
+        event_listener: JobEventListener | None = None,
     ) -> None:
         self._video_client = video_client
         self._audio_client = audio_client
         self._transcription_client = transcription_client
         self._health_checker = health_checker
         self._redis = redis_store
+        self._events = event_listener
 
         settings = get_settings()
         self.poll_interval_initial = settings.poll_interval_initial
         self.poll_interval_max = settings.poll_interval_max
         self.max_attempts = settings.max_poll_attempts
+        self.transfer_mode = transfer_mode or settings.artifact_transfer_mode
+        self.event_fallback_poll_interval = settings.job_events_fallback_poll_interval
 
     async def execute_pipeline(self, job: PipelineJob) -> PipelineJob:
         """
@@ -87,6 +156,8 @@ class PipelineOrchestrator:
             >>> print(result.status)
             'completed'
         """
+        dl: StageArtifact | None = None
+        norm: StageArtifact | None = None
         try:
             logger.info(f"Starting pipeline for job {job.id}")
 
@@ -105,10 +176,9 @@ class PipelineOrchestrator:
                 await self._save_job(job)
                 return job
 
-            audio_bytes, audio_name = dl
             logger.info(
-                f"[PIPELINE:{job.id}] DOWNLOAD completed: {audio_name} "
-                f"({len(audio_bytes) / BYTES_PER_MB:.1f}MB)"
+                f"[PIPELINE:{job.id}] DOWNLOAD completed: {dl.filename} "
+                f"({dl.describe_size()})"
             )
 
             # 2) NORMALIZAÇÃO
@@ -116,18 +186,17 @@ class PipelineOrchestrator:
             await self._save_job(job)
             logger.info(f"[PIPELINE:{job.id}] Starting NORMALIZATION stage")
 
-            norm = await self._execute_normalization(job, audio_bytes, audio_name)
+            norm = await self._execute_normalization(job, dl)
             if not norm:
                 logger.error(f"[PIPELINE:{job.id}] NORMALIZATION stage failed")
                 job.mark_as_failed("Audio normalization failed")
                 await self._save_job(job)
                 return job
 
-            norm_bytes, norm_name = norm
-            job.audio_file = norm_name
+            job.audio_file = norm.filename
             logger.info(
-                f"[PIPELINE:{job.id}] NORMALIZATION completed: {norm_name} "
-                f"({len(norm_bytes) / BYTES_PER_MB:.1f}MB)"
+                f"[PIPELINE:{job.id}] NORMALIZATION completed: {norm.filename} "
+                f"({norm.describe_size()})"
             )
 
             # 3) TRANSCRIÇÃO
@@ -135,7 +204,7 @@ class PipelineOrchestrator:
             await self._save_job(job)
             logger.info(f"[PIPELINE:{job.id}] Starting TRANSCRIPTION stage")
 
-            tr = await self._execute_transcription(job, norm_bytes, norm_name)
+            tr = await self._execute_transcription(job, norm)
             if not tr:
                 logger.error(f"[PIPELINE:{job.id}] TRANSCRIPTION stage failed")
                 job.mark_as_failed("Transcription failed")
@@ -162,10 +231,16 @@ class PipelineOrchestrator:
             await self._save_job(job)
             return job
 
+        finally:
+            # Streams de origem que nenhum estágio chegou a consumir
+            for artifact in (dl, norm):
+                if artifact is not None:
+                    await artifact.aclose()
+
     async def _save_job(self, job: PipelineJob) -> None:
         """Salva job no Redis se disponível."""
         if self._redis:
-            self._redis.save_job(job)
+            await self._redis.asave_job(job)
 
     async def check_services_health(self) -> dict[str, str]:
         """
@@ -176,9 +251,78 @@ class PipelineOrchestrator:
         """
         return await self._health_checker.check_all()
 
+    async def _collect_artifact(
+        self, client: MicroserviceClientInterface, stage: PipelineStage
+    ) -> StageArtifact:
+        """
+        Obtém o arquivo de um job concluído conforme o modo de transferência.
+
+        No modo stream o download fica aberto no artefato com nome e tamanho
+        dos headers; o corpo é consumido uma única vez por ``_submit_artifact``
+        ou ``_fetch_result_file``, que fecham o stream ao terminar.
+        """
+        if self.transfer_mode == TRANSFER_MODE_STREAM:
+            exit_stack = AsyncExitStack()
+            stream = await exit_stack.enter_async_context(client.open_download_stream(stage.job_id))
+            return StageArtifact(
+                client=client,
+                job_id=stage.job_id,
+                filename=stream.filename,
+                stage=stage,
+                size=stream.content_length,
+                stream=stream,
+                _exit_stack=exit_stack,
+            )
+
+        content, filename = await client.download_file(stage.job_id)
+        return StageArtifact(
+            client=client, job_id=stage.job_id, filename=filename, stage=stage, content=content
+        )
+
+    async def _submit_artifact(
+        self,
+        target: MicroserviceClientInterface,
+        artifact: StageArtifact,
+        data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Envia o arquivo de um estágio para o serviço do estágio seguinte.
+
+        No modo stream os chunks do download de origem são repassados ao
+        upload de destino, mantendo a memória limitada a poucos chunks.
+        """
+        if artifact.stream is None:
+            files = {"file": (artifact.filename, artifact.content, "application/octet-stream")}
+            return await target.submit_multipart(files=files, data=data)
+
+        try:
+            return await target.submit_multipart_stream("file", artifact.stream, data=data)
+        finally:
+            await artifact.aclose()
+
+    async def _fetch_result_file(self, artifact: StageArtifact) -> int:
+        """
+        Lê o arquivo final de um job e retorna seu tamanho em bytes.
+
+        No modo stream usa o Content-Length anunciado; sem ele, o corpo do
+        stream já aberto é consumido em chunks apenas para contagem.
+        """
+        if artifact.stream is None:
+            return len(artifact.content or b"")
+
+        try:
+            if artifact.size is not None:
+                return artifact.size
+            size = 0
+            async for chunk in artifact.stream.chunks:
+                size += len(chunk)
+            return size
+        finally:
+            await artifact.aclose()
+
     async def _execute_download(
         self, job: PipelineJob
-    ) -> tuple[bytes, str] | None:
+    ) -> StageArtifact | None:
         """
         Executa estágio de download.
 
@@ -186,10 +330,11 @@ class PipelineOrchestrator:
             job: Job em processamento
 
         Returns:
-            Tuple com bytes e nome do arquivo, ou None se falhar
+            StageArtifact com o áudio baixado, ou None se falhar
         """
         stage = job.download_stage
         stage.start()
+        artifact: StageArtifact | None = None
 
         try:
             payload = {"url": job.youtube_url, "quality": "audio"}
@@ -209,42 +354,41 @@ class PipelineOrchestrator:
                 stage.fail("Download job failed/timeout")
                 return None
 
-            content, filename = await self._video_client.download_file(stage.job_id)
-            stage.complete(filename)
+            artifact = await self._collect_artifact(self._video_client, stage)
+            stage.complete(artifact.filename)
             job.update_progress()
             await self._save_job(job)
 
-            return content, filename
+            return artifact
 
         except Exception as e:
+            if artifact is not None:
+                await artifact.aclose()
             logger.error(f"Download stage failed: {e}")
             stage.fail(str(e))
             return None
 
     async def _execute_normalization(
-        self, job: PipelineJob, audio_bytes: bytes, audio_name: str
-    ) -> tuple[bytes, str] | None:
+        self, job: PipelineJob, source: StageArtifact
+    ) -> StageArtifact | None:
         """
         Executa estágio de normalização.
 
         Args:
             job: Job em processamento
-            audio_bytes: Bytes do arquivo de áudio
-            audio_name: Nome do arquivo
+            source: Áudio produzido pelo estágio de download
 
         Returns:
-            Tuple com bytes e nome do arquivo normalizado, ou None
+            StageArtifact com o áudio normalizado, ou None
         """
         stage = job.normalization_stage
         stage.start()
+        artifact: StageArtifact | None = None
 
         try:
             cfg = get_microservice_config("se3-audio-normalization")
             defaults = (cfg.get("default_params") or {}).copy()
 
-            files = {
-                "file": (audio_name, audio_bytes, "application/octet-stream")
-            }
             data = {
                 "remove_noise": _bool_to_str(
                     job.remove_noise
@@ -273,7 +417,7 @@ class PipelineOrchestrator:
                 ),
             }
 
-            resp = await self._audio_client.submit_multipart(files=files, data=data)
+            resp = await self._submit_artifact(self._audio_client, source, data)
             stage.job_id = resp.get("job_id") or resp.get("id")
 
             if not stage.job_id:
@@ -288,28 +432,29 @@ class PipelineOrchestrator:
                 stage.fail("Normalization job failed/timeout")
                 return None
 
-            out_bytes, out_name = await self._audio_client.download_file(stage.job_id)
-            stage.complete(out_name)
+            artifact = await self._collect_artifact(self._audio_client, stage)
+            stage.complete(artifact.filename)
             job.update_progress()
             await self._save_job(job)
 
-            return out_bytes, out_name
+            return artifact
 
         except Exception as e:
+            if artifact is not None:
+                await artifact.aclose()
             logger.error(f"Normalization stage failed: {e}")
             stage.fail(str(e))
             return None
 
     async def _execute_transcription(
-        self, job: PipelineJob, audio_bytes: bytes, audio_name: str
+        self, job: PipelineJob, source: StageArtifact
     ) -> dict[str, Any] | None:
         """
         Executa estágio de transcrição.
 
         Args:
             job: Job em processamento
-            audio_bytes: Bytes do arquivo de áudio
-            audio_name: Nome do arquivo
+            source: Áudio produzido pelo estágio de normalização
 
         Returns:
             Dict com text, segments e file_name, ou None
@@ -324,12 +469,11 @@ class PipelineOrchestrator:
             lang_in = job.language or defaults.get("language_in", "auto")
             lang_out = job.language_out
 
-            files = {"file": (audio_name, audio_bytes, "application/octet-stream")}
             data: dict[str, str] = {"language_in": lang_in}
             if lang_out:
                 data["language_out"] = lang_out
 
-            resp = await self._transcription_client.submit_multipart(files=files, data=data)
+            resp = await self._submit_artifact(self._transcription_client, source, data)
             stage.job_id = resp.get("job_id") or resp.get("id")
 
             if not stage.job_id:
@@ -349,45 +493,36 @@ class PipelineOrchestrator:
             segments = None
 
             try:
-                text_url = f"{self._transcription_client.base_url}/jobs/{stage.job_id}/text"
-                import httpx
-                from app.core.ssl_config import get_ssl_context
-                ssl_verify = get_ssl_context()
-                _headers = getattr(self._transcription_client, '_headers', {})
-                async with httpx.AsyncClient(timeout=self._transcription_client.timeout, verify=ssl_verify) as client:
-                    tr = await client.get(text_url, headers=_headers)
-                    if tr.status_code == 200:
-                        text_data = tr.json()
-                        text = text_data.get("text", "")
-                        logger.info(f"Transcription text retrieved: {len(text) if text else 0} chars")
+                text_data = await self._transcription_client.fetch_job_resource(stage.job_id, "text")
+                if text_data:
+                    text = text_data.get("text", "")
+                    logger.info(f"Transcription text retrieved: {len(text) if text else 0} chars")
             except Exception as e:
                 logger.warning(f"Failed to get transcription text: {e}")
 
             # Busca segments
             try:
-                seg_url = f"{self._transcription_client.base_url}/jobs/{stage.job_id}/transcription"
-                async with httpx.AsyncClient(timeout=self._transcription_client.timeout, verify=ssl_verify) as client:
-                    tr = await client.get(seg_url, headers=_headers)
-                    if tr.status_code == 200:
-                        seg_data = tr.json()
-                        segments = seg_data.get("segments", [])
-                        if not text:
-                            text = seg_data.get("full_text", "")
-                        logger.info(f"Transcription segments retrieved: {len(segments)} segments")
+                seg_data = await self._transcription_client.fetch_job_resource(stage.job_id, "transcription")
+                if seg_data:
+                    segments = seg_data.get("segments", [])
+                    if not text:
+                        text = seg_data.get("full_text", "")
+                    logger.info(f"Transcription segments retrieved: {len(segments)} segments")
             except Exception as e:
                 logger.warning(f"Failed to get transcription segments: {e}")
 
             # Download do arquivo
-            out_bytes, out_name = await self._transcription_client.download_file(stage.job_id)
+            artifact = await self._collect_artifact(self._transcription_client, stage)
+            file_bytes_len = await self._fetch_result_file(artifact)
 
             result = {
                 "text": text,
                 "segments": segments,
-                "file_name": out_name,
-                "file_bytes_len": len(out_bytes),
+                "file_name": artifact.filename,
+                "file_bytes_len": file_bytes_len,
             }
 
-            stage.complete(out_name)
+            stage.complete(artifact.filename)
             job.update_progress()
             await self._save_job(job)
 
@@ -406,13 +541,46 @@ class PipelineOrchestrator:
         service_name: str,
     ) -> dict[str, Any] | None:
         """
-        Aguarda job completar via polling.
+        Aguarda job completar.
+
+        Com o listener de eventos conectado, acorda assim que o serviço
+        publica um estado terminal e consulta o status apenas para
+        confirmar; o polling continua como fallback em intervalos longos.
+        Sem eventos, usa o polling adaptativo.
+
+        Args:
+            client: Cliente do serviço
+            job_id: ID do job
+            stage: Estágio atual
+            service_name: Nome do serviço
+
+        Returns:
+            Status final ou None se falhar
+        """
+        channel = get_microservice_config(service_name).get("events_channel")
+        if self._events is None or not channel:
+            return await self._poll_until_done(client, job_id, stage, service_name, None)
+
+        with self._events.watch(channel, job_id) as watch:
+            return await self._poll_until_done(client, job_id, stage, service_name, watch)
+
+    async def _poll_until_done(
+        self,
+        client: MicroserviceClientInterface,
+        job_id: str,
+        stage: Any,
+        service_name: str,
+        watch: JobEventWatch | None,
+    ) -> dict[str, Any] | None:
+        """
+        Loop de consulta de status usado por ``_wait_until_done``.
 
         Args:
             client: Cliente do serviço
             job_id: ID do job
             stage: Estágio atual
             service_name: Nome do serviço
+            watch: Inscrição nos eventos do job, ou None para polling puro
 
         Returns:
             Status final ou None se falhar
@@ -441,17 +609,13 @@ class PipelineOrchestrator:
 
                 # Atualiza progresso
                 if status and "progress" in status:
-                    try:
-                        p = float(status["progress"])
-                        stage.progress = p * 100.0 if p <= 1.0 else p
-                    except Exception as e:
-                        logger.debug(f"Failed to parse progress value: {e}")
+                    _apply_progress(stage, status["progress"])
 
                 state = (status.get("status") or status.get("state") or "").lower()
-                if state in {"completed", "success", "done", "finished"}:
+                if state in _COMPLETED_STATES:
                     logger.info(f"Job {job_id} completed after {elapsed_time:.0f}s")
                     return status
-                if state in {"failed", "error", "cancelled", "canceled", "aborted"}:
+                if state in _FAILED_STATES:
                     error_msg = status.get("error") or status.get(
                         "error_message", f"Job failed with state: {state}"
                     )
@@ -476,9 +640,35 @@ class PipelineOrchestrator:
             else:
                 poll_delay = self.poll_interval_max
 
-            await asyncio.sleep(poll_delay)
+            if watch is not None and self._events.connected:
+                await self._await_terminal_event(
+                    watch, stage, max(poll_delay, self.event_fallback_poll_interval)
+                )
+            else:
+                await asyncio.sleep(poll_delay)
             attempts += 1
 
         logger.error(f"Job {job_id} timeout after {attempts} attempts")
         stage.fail(f"Timeout after {attempts} polling attempts")
         return None
+
+    async def _await_terminal_event(
+        self, watch: JobEventWatch, stage: Any, timeout: float
+    ) -> None:
+        """
+        Aguarda um evento terminal do job ou o fim do intervalo de fallback.
+
+        Eventos de progresso apenas atualizam o estágio; o retorno
+        dispara a próxima consulta de status.
+        """
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
+            event = await watch.wait(remaining)
+            if event is None:
+                return
+            if event.get("progress") is not None:
+                _apply_progress(stage, event["progress"])
+            state = str(event.get("status") or "").lower()
+            if state in _COMPLETED_STATES or state in _FAILED_STATES:
+                return
@@ -4,6 +4,7 @@ Fixtures compartilhadas para testes.
 import asyncio
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, Generator, Tuple
 from unittest.mock import AsyncMock, MagicMock, Mock
@@ -94,6 +95,29 @@ def mock_microservice_client() -> AsyncMock:
     client.get_job_status.return_value = {"job_id": "test-123", "status": "completed", "progress": 1.0}
     client.check_health.return_value = {"status": "healthy", "version": "1.0.0"}
     client.download_file.return_value = (b"test content", "test-file.mp3")
+    client.fetch_job_resource.return_value = None
+
+    # Modo stream espelha download_file/submit_multipart para que os testes
+    # configurem um único return_value independentemente do modo
+    from app.infrastructure.microservice_client import ArtifactStream
+
+    @asynccontextmanager
+    async def _open_download_stream(job_id: str):
+        content, filename = await client.download_file(job_id)
+
+        async def _chunks():
+            yield content
+
+        yield ArtifactStream(filename=filename, content_length=len(content), chunks=_chunks())
+
+    async def _submit_multipart_stream(field_name: str, stream: ArtifactStream, data: Dict[str, Any] = None):
+        content = b"".join([chunk async for chunk in stream.chunks])
+        return await client.submit_multipart(
+            files={field_name: (stream.filename, content, "application/octet-stream")}, data=data
+        )
+
+    client.open_download_stream = _open_download_stream
+    client.submit_multipart_stream.side_effect = _submit_multipart_stream
     client.base_url = "http://localhost:8000"
     client.timeout = 30
     client.service_name = "test-service"
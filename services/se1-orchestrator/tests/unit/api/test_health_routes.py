@@ -11,6 +11,11 @@ def orchestrator_client():
     mock_store.save_job = MagicMock()
     mock_store.get_job = MagicMock(return_value=None)
     mock_store.list_jobs = MagicMock(return_value=[])
+    mock_store.aping = AsyncMock(return_value=True)
+    mock_store.asave_job = AsyncMock()
+    mock_store.aget_job = AsyncMock(return_value=None)
+    mock_store.alist_jobs = AsyncMock(return_value=[])
+    mock_store.aclose = AsyncMock()
 
     mock_orchestrator = MagicMock()
     mock_orchestrator.check_services_health = AsyncMock(return_value={
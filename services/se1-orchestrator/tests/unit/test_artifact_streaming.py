@@ -0,0 +1,191 @@
+"""
+Testes para a transferência de artefatos em streaming entre estágios.
+"""
+from contextlib import asynccontextmanager
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.config import get_microservice_config
+from app.infrastructure.microservice_client import ArtifactStream, _multipart_stream
+from domain.models import PipelineStage, PipelineStatus
+from services.pipeline_orchestrator import PipelineOrchestrator
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+class TestMultipartStream:
+    """Testes para o encoder multipart em streaming."""
+
+    @pytest.mark.asyncio
+    async def test_body_is_valid_multipart(self):
+        """Corpo gerado deve ser parseável como multipart/form-data."""
+        stream = ArtifactStream(
+            filename="audio.webm", content_length=None, chunks=_chunks(b"abc", b"def")
+        )
+        body = b"".join(
+            [chunk async for chunk in _multipart_stream("xyz", "file", stream, {"language_in": "pt"})]
+        )
+
+        message = BytesParser(policy=default_policy).parsebytes(
+            b"Content-Type: multipart/form-data; boundary=xyz\r\n\r\n" + body
+        )
+        parts = {part.get_param("name", header="content-disposition"): part for part in message.iter_parts()}
+
+        assert parts["language_in"].get_content().strip() == "pt"
+        assert parts["file"].get_filename() == "audio.webm"
+        assert parts["file"].get_payload(decode=True) == b"abcdef"
+
+    @pytest.mark.asyncio
+    async def test_filename_quotes_are_escaped(self):
+        """Aspas no nome do arquivo não devem quebrar o header."""
+        stream = ArtifactStream(filename='a"b.wav', content_length=None, chunks=_chunks(b"x"))
+        body = b"".join([chunk async for chunk in _multipart_stream("xyz", "file", stream)])
+
+        assert b'filename="a%22b.wav"' in body
+
+
+class TestPipelineTransferModes:
+    """Testes para os modos stream/buffer do orquestrador."""
+
+    def _orchestrator(self, client, health_checker, mode):
+        return PipelineOrchestrator(
+            video_client=client,
+            audio_client=client,
+            transcription_client=client,
+            health_checker=health_checker,
+            redis_store=None,
+            transfer_mode=mode,
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_mode_relays_without_buffering(
+        self, mock_microservice_client, mock_health_checker, sample_pipeline_job
+    ):
+        """No modo stream os uploads usam submit_multipart_stream."""
+        orchestrator = self._orchestrator(mock_microservice_client, mock_health_checker, "stream")
+
+        result = await orchestrator.execute_pipeline(sample_pipeline_job)
+
+        assert result.status == PipelineStatus.COMPLETED
+        assert mock_microservice_client.submit_multipart_stream.await_count == 2
+        assert result.audio_file == "test-file.mp3"
+        assert result.download_stage.output_file == "test-file.mp3"
+
+    @pytest.mark.asyncio
+    async def test_buffer_mode_keeps_legacy_behaviour(
+        self, mock_microservice_client, mock_health_checker, sample_pipeline_job
+    ):
+        """No modo buffer o arquivo inteiro é baixado e reenviado."""
+        orchestrator = self._orchestrator(mock_microservice_client, mock_health_checker, "buffer")
+
+        result = await orchestrator.execute_pipeline(sample_pipeline_job)
+
+        assert result.status == PipelineStatus.COMPLETED
+        assert not mock_microservice_client.submit_multipart_stream.called
+        assert mock_microservice_client.download_file.await_count == 3
+        files = mock_microservice_client.submit_multipart.call_args.kwargs["files"]
+        assert files["file"][1] == b"test content"
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_fails_next_stage(
+        self, mock_microservice_client, mock_health_checker, sample_pipeline_job
+    ):
+        """Erro ao repassar o stream deve falhar o estágio de normalização."""
+        mock_microservice_client.submit_multipart_stream.side_effect = RuntimeError("upstream closed")
+        orchestrator = self._orchestrator(mock_microservice_client, mock_health_checker, "stream")
+
+        result = await orchestrator.execute_pipeline(sample_pipeline_job)
+
+        assert result.status == PipelineStatus.FAILED
+        assert "normalization" in result.error_message.lower()
+
+    @pytest.mark.asyncio
+    async def test_stream_artifact_uses_source_headers(self, mock_health_checker):
+        """Nome e tamanho vêm dos headers do download, sem ler o corpo."""
+        events = []
+
+        async def _unread_body():
+            raise AssertionError("body should not be read")
+            yield b""
+
+        @asynccontextmanager
+        async def _open_download_stream(job_id: str):
+            events.append("open")
+            try:
+                yield ArtifactStream(filename="video.webm", content_length=4096, chunks=_unread_body())
+            finally:
+                events.append("close")
+
+        source = MagicMock()
+        source.open_download_stream = _open_download_stream
+        orchestrator = self._orchestrator(source, mock_health_checker, "stream")
+        stage = PipelineStage(name="download", job_id="job-1")
+
+        artifact = await orchestrator._collect_artifact(source, stage)
+
+        assert artifact.filename == "video.webm"
+        assert artifact.size == 4096
+        assert events == ["open"]
+        assert await orchestrator._fetch_result_file(artifact) == 4096
+        assert events == ["open", "close"]
+
+    @pytest.mark.asyncio
+    async def test_stream_mode_opens_each_download_once(
+        self, mock_microservice_client, mock_health_checker, sample_pipeline_job
+    ):
+        """O stream aberto ao coletar o artefato é o mesmo repassado ao upload."""
+        opened = []
+        open_download_stream = mock_microservice_client.open_download_stream
+
+        @asynccontextmanager
+        async def _counting_open(job_id: str):
+            opened.append(job_id)
+            async with open_download_stream(job_id) as stream:
+                yield stream
+
+        mock_microservice_client.open_download_stream = _counting_open
+        orchestrator = self._orchestrator(mock_microservice_client, mock_health_checker, "stream")
+
+        result = await orchestrator.execute_pipeline(sample_pipeline_job)
+
+        assert result.status == PipelineStatus.COMPLETED
+        assert len(opened) == 3
+        files = mock_microservice_client.submit_multipart.call_args.kwargs["files"]
+        assert files["file"][1] == b"test content"
+
+    @pytest.mark.asyncio
+    async def test_unconsumed_stream_is_closed(
+        self, mock_microservice_client, mock_health_checker, sample_pipeline_job
+    ):
+        """Stream coletado deve ser fechado mesmo se o estágio seguinte falhar antes do upload."""
+        closed = []
+        open_download_stream = mock_microservice_client.open_download_stream
+
+        @asynccontextmanager
+        async def _tracked_open(job_id: str):
+            try:
+                async with open_download_stream(job_id) as stream:
+                    yield stream
+            finally:
+                closed.append(job_id)
+
+        mock_microservice_client.open_download_stream = _tracked_open
+        orchestrator = self._orchestrator(mock_microservice_client, mock_health_checker, "stream")
+
+        def _config(service_name: str):
+            if service_name == "se3-audio-normalization":
+                raise RuntimeError("config unavailable")
+            return get_microservice_config(service_name)
+
+        with patch("services.pipeline_orchestrator.get_microservice_config", side_effect=_config):
+            result = await orchestrator.execute_pipeline(sample_pipeline_job)
+
+        assert result.status == PipelineStatus.FAILED
+        assert closed == ["test-123"]
+        assert not mock_microservice_client.submit_multipart_stream.called
@@ -0,0 +1,174 @@
+"""
+Testes para a variante assíncrona do job store (AsyncJobRedisStore).
+"""
+import asyncio
+import threading
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from common.datetime_utils import now_brazil
+from common.job_utils.models import JobStatus
+from common.redis_utils import BinarySerializer
+from domain.pipeline_job_v2 import PipelineJobV2
+from infrastructure.redis_store import JOB_BLOB_FIELDS
+
+
+def _job(n: int, status: JobStatus = JobStatus.QUEUED, age_hours: float = 0) -> PipelineJobV2:
+    created = now_brazil() - timedelta(hours=age_hours, seconds=n)
+    return PipelineJobV2(
+        id=f"job-{n}",
+        youtube_url=f"https://youtu.be/{n}",
+        status=status,
+        created_at=created,
+        expires_at=created + timedelta(hours=24),
+    )
+
+
+@pytest.fixture
+def store(mock_redis_store):
+    return mock_redis_store
+
+
+class TestAsyncJobStore:
+
+    async def test_async_and_sync_stores_share_keys(self, store):
+        await store.asave_job(_job(1))
+        store.save_job(_job(2, JobStatus.FAILED))
+
+        assert store.get_job("job-1").id == "job-1"
+        assert (await store.aget_job("job-2")).status == JobStatus.FAILED
+        assert [j.id for j in await store.alist_jobs()] == ["job-1", "job-2"]
+
+    async def test_save_updates_status_index(self, store):
+        job = _job(1)
+        await store.asave_job(job)
+        job.status = JobStatus.COMPLETED
+        await store.asave_job(job)
+
+        assert await store.aget_stats() == {"total_jobs": 1, "by_status": {"completed": 1}}
+        assert store.get_stats() == {"total_jobs": 1, "by_status": {"completed": 1}}
+
+    async def test_list_by_status_with_offset(self, store):
+        for n in range(6):
+            await store.asave_job(_job(n, JobStatus.FAILED if n % 2 else JobStatus.QUEUED))
+
+        page = await store.alist_jobs(limit=2, offset=1, status="queued")
+
+        assert [j.id for j in page] == ["job-2", "job-4"]
+
+    async def test_delete_and_cleanup(self, store):
+        await store.asave_job(_job(1))
+        await store.asave_job(_job(2, age_hours=30))
+
+        assert await store.adelete_job("job-1") is True
+        assert await store.acleanup_old_jobs(max_age_hours=24) == 1
+        assert await store.aget_stats() == {"total_jobs": 0, "by_status": {}}
+
+    async def test_stats_keep_live_jobs_older_than_ttl(self, store):
+        await store.asave_job(_job(1, JobStatus.PROCESSING, age_hours=30))
+        await store.asave_job(_job(2, age_hours=30))
+        store.redis.delete(f"{store.key_prefix}job-2")
+
+        assert await store.aget_stats() == {"total_jobs": 1, "by_status": {"processing": 1}}
+
+    async def test_redis_error_degrades_gracefully(self, store, monkeypatch):
+        async def boom(*args, **kwargs):
+            raise ConnectionError("redis fora do ar")
+
+        monkeypatch.setattr(store._async_resilient.redis, "get", boom)
+        monkeypatch.setattr(store._async_resilient.redis, "zrevrange", boom)
+
+        assert await store.aget_job("job-1") is None
+        assert await store.alist_jobs() == []
+
+    async def test_binary_roundtrip_with_blobs(self, store):
+        serializer = BinarySerializer(format="msgpack")
+        for inner in (store._store, store._async_store):
+            inner.serializer = serializer
+            inner.blob_fields = JOB_BLOB_FIELDS
+        job = _job(1)
+        job.transcription_text = "texto " * 500
+
+        await store.asave_job(job)
+
+        assert store.get_job("job-1").transcription_text == job.transcription_text
+        listed = await store.alist_jobs(include_blobs=False)
+        assert listed[0].id == "job-1" and listed[0].transcription_text is None
+
+    async def test_blob_removed_elsewhere_is_rewritten(self, store):
+        serializer = BinarySerializer(format="msgpack")
+        store._async_store.serializer = serializer
+        store._async_store.blob_fields = JOB_BLOB_FIELDS
+        store._store.serializer = serializer
+        job = _job(1)
+        job.transcription_text = "texto " * 500
+        await store.asave_job(job)
+        store.redis.delete("orchestrator:job:job-1:blobs")
+
+        job.progress = 50.0
+        await store.asave_job(job)
+
+        assert (await store.aget_job("job-1")).transcription_text == job.transcription_text
+
+
+
+def _per_loop_store():
+    """Store com cliente falso por loop; devolve (store, clientes criados)."""
+    from common.redis_utils import AsyncResilientRedisStore
+
+    clients = []
+
+    def factory():
+        clients.append(MagicMock(aclose=AsyncMock()))
+        return clients[-1]
+
+    return AsyncResilientRedisStore(client_factory=factory), clients
+
+
+async def _client_of(store):
+    return store.redis
+
+
+class TestAsyncClientPerLoop:
+    """O cliente redis.asyncio é recriado por event loop; o anterior é fechado."""
+
+    def test_client_of_idle_loop_is_closed_when_it_runs_again(self):
+        store, clients = _per_loop_store()
+        idle = asyncio.new_event_loop()
+        try:
+            idle.run_until_complete(_client_of(store))
+            asyncio.run(_client_of(store))
+            idle.run_until_complete(asyncio.sleep(0))
+        finally:
+            idle.close()
+
+        assert len(clients) == 2
+        clients[0].aclose.assert_awaited_once()
+        clients[1].aclose.assert_not_awaited()
+
+    def test_client_of_loop_running_elsewhere_is_closed_there(self):
+        store, clients = _per_loop_store()
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(_client_of(store), other).result(timeout=5)
+            asyncio.run(_client_of(store))
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other).result(timeout=5)
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join()
+            other.close()
+
+        clients[0].aclose.assert_awaited_once()
+
+    def test_client_of_closed_loop_is_dropped(self):
+        store, clients = _per_loop_store()
+
+        first = asyncio.run(_client_of(store))
+        second = asyncio.run(_client_of(store))
+
+        assert first is not second
+        assert store.redis is second
@@ -0,0 +1,189 @@
+"""
+Testes para o pool de clients HTTP e o uso compartilhado no MicroserviceClient.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.exceptions import ArtifactStreamError, PipelineStageError
+from app.infrastructure import microservice_client
+from app.infrastructure.http_pool import PoolStats, ServiceHttpPool
+from app.infrastructure.microservice_client import MicroserviceClient
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _refuse_connection(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("refused", request=request)
+
+
+class BrokenBody(httpx.AsyncByteStream):
+    """Corpo que entrega um chunk e então falha (ou trava)."""
+
+    def __init__(self, error: Exception | None = None, stall: float = 0.0) -> None:
+        self.error = error
+        self.stall = stall
+
+    async def __aiter__(self):
+        yield b"first"
+        if self.stall:
+            await asyncio.sleep(self.stall)
+        if self.error:
+            raise self.error
+        yield b"second"
+
+
+class TestPoolStats:
+    """Testes para os contadores do pool."""
+
+    def test_reuse_ratio_without_requests(self):
+        assert PoolStats().reuse_ratio == 0.0
+
+    def test_reuse_ratio(self):
+        stats = PoolStats(requests=10, connections_opened=2)
+        assert stats.reuse_ratio == pytest.approx(0.8)
+
+
+class TestServiceHttpPool:
+    """Testes para o registro de clients por serviço."""
+
+    @pytest.mark.asyncio
+    async def test_one_client_per_service(self):
+        pool = ServiceHttpPool()
+        try:
+            first = pool.get_client("se2-video-downloader")
+            assert pool.get_client("se2-video-downloader") is first
+            assert pool.get_client("se3-audio-normalization") is not first
+        finally:
+            await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_metrics_per_service(self):
+        pool = ServiceHttpPool()
+        try:
+            pool.get_client("se2-video-downloader")
+            metrics = pool.metrics()
+            assert set(metrics["se2-video-downloader"]) == {
+                "open_connections", "requests", "connections_opened", "reuse_ratio",
+            }
+            assert metrics["se2-video-downloader"]["open_connections"] == 0
+        finally:
+            await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients(self):
+        pool = ServiceHttpPool()
+        client = pool.get_client("se2-video-downloader")
+        await pool.aclose()
+        assert client.is_closed
+        assert pool.get_client("se2-video-downloader") is not client
+        await pool.aclose()
+
+
+class TestMicroserviceClientWithPool:
+    """Testes do MicroserviceClient usando client compartilhado."""
+
+    @pytest.mark.asyncio
+    async def test_shared_client_is_not_closed_between_calls(self):
+        http_client = _mock_client(lambda request: httpx.Response(200, json={"status": "completed"}))
+        client = MicroserviceClient("se2-video-downloader", http_client=http_client)
+
+        await client.get_job_status("job-1")
+        await client.get_job_status("job-2")
+
+        assert not http_client.is_closed
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fetch_job_resource_returns_none_on_error(self):
+        http_client = _mock_client(lambda request: httpx.Response(404))
+        client = MicroserviceClient("se4-audio-transcriber", http_client=http_client)
+
+        assert await client.fetch_job_resource("job-1", "text") is None
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "handler",
+        [
+            lambda request: httpx.Response(200, content=b"not json"),
+            _refuse_connection,
+        ],
+        ids=["invalid-json", "connect-error"],
+    )
+    async def test_fetch_job_resource_returns_none_on_failure(self, handler):
+        http_client = _mock_client(handler)
+        client = MicroserviceClient("se4-audio-transcriber", http_client=http_client)
+
+        assert await client.fetch_job_resource("job-1", "text") is None
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_open_download_stream_reads_chunks(self):
+        body = b"x" * 10_000
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                content=body,
+                headers={"Content-Disposition": 'attachment; filename="audio.webm"'},
+            )
+
+        http_client = _mock_client(handler)
+        client = MicroserviceClient("se3-audio-normalization", http_client=http_client)
+
+        async with client.open_download_stream("job-1") as stream:
+            received = b"".join([chunk async for chunk in stream.chunks])
+
+        assert stream.filename == "audio.webm"
+        assert received == body
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_open_download_stream_http_error(self):
+        http_client = _mock_client(lambda request: httpx.Response(500))
+        client = MicroserviceClient("se3-audio-normalization", http_client=http_client)
+
+        with pytest.raises(PipelineStageError):
+            async with client.open_download_stream("job-1"):
+                pass
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_source_read_error_counts_against_source_only(self):
+        source_http = _mock_client(lambda request: httpx.Response(200, stream=BrokenBody(httpx.ReadError("reset"))))
+
+        async def target_handler(request: httpx.Request) -> httpx.Response:
+            await request.aread()
+            return httpx.Response(200, json={"job_id": "t-1"})
+
+        target_http = _mock_client(target_handler)
+        source = MicroserviceClient("se2-video-downloader", http_client=source_http)
+        target = MicroserviceClient("se3-audio-normalization", http_client=target_http)
+
+        with pytest.raises(ArtifactStreamError) as exc_info:
+            async with source.open_download_stream("job-1") as stream:
+                await target.submit_multipart_stream("file", stream)
+
+        assert exc_info.value.service_name == "se2-video-downloader"
+        assert source._circuit_breaker._failure_count == 1
+        assert target._circuit_breaker._failure_count == 0
+        await source_http.aclose()
+        await target_http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_open_download_stream_total_deadline(self, monkeypatch):
+        monkeypatch.setattr(microservice_client, "DOWNLOAD_TOTAL_TIMEOUT_SECONDS", 0.05)
+        http_client = _mock_client(lambda request: httpx.Response(200, stream=BrokenBody(stall=5)))
+        client = MicroserviceClient("se3-audio-normalization", http_client=http_client)
+
+        with pytest.raises(ArtifactStreamError, match="timeout"):
+            async with client.open_download_stream("job-1") as stream:
+                async for _ in stream.chunks:
+                    pass
+
+        assert client._circuit_breaker._failure_count == 1
+        await http_client.aclose()
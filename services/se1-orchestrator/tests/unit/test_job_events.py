@@ -0,0 +1,106 @@
+"""
+Testes para a conclusão de estágios via eventos Redis pub/sub.
+"""
+import asyncio
+import json
+
+import fakeredis
+import pytest
+
+from common.redis_utils import JobEventPublisher, ResilientRedisStore, job_events_channel
+from app.infrastructure.job_event_listener import JobEventListener
+from domain.models import PipelineJob
+from services.pipeline_orchestrator import PipelineOrchestrator
+
+CHANNEL = job_events_channel("audio_normalization")
+
+
+def _event(job_id: str, status: str, progress: float | None = None) -> str:
+    return json.dumps({"job_id": job_id, "status": status, "progress": progress})
+
+
+class TestJobEventPublisher:
+    """Testes para o publisher compartilhado."""
+
+    def test_publishes_status_payload(self, sample_pipeline_job):
+        fake = fakeredis.FakeRedis(decode_responses=True)
+        store = ResilientRedisStore(redis_client=fake)
+        pubsub = fake.pubsub()
+        pubsub.subscribe(CHANNEL)
+        pubsub.get_message(timeout=1)
+
+        JobEventPublisher(store, "audio_normalization").publish_job(sample_pipeline_job)
+
+        message = pubsub.get_message(timeout=1)
+        payload = json.loads(message["data"])
+        assert payload["job_id"] == sample_pipeline_job.id
+        assert payload["status"] == "queued"
+
+    def test_publish_failure_is_swallowed(self, sample_pipeline_job):
+        class BrokenStore:
+            def publish(self, channel, message):
+                raise ConnectionError("redis down")
+
+        assert JobEventPublisher(BrokenStore(), "audio_normalization").publish_job(sample_pipeline_job) == 0
+
+
+class TestJobEventListener:
+    """Testes para a distribuição de eventos aos waiters."""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_wakes_matching_watch(self):
+        listener = JobEventListener("redis://unused", [CHANNEL])
+        with listener.watch(CHANNEL, "job-1") as watch:
+            listener.dispatch(CHANNEL, _event("job-1", "completed"))
+            payload = await watch.wait(timeout=1)
+
+        assert payload["status"] == "completed"
+        assert listener._watchers == {}
+
+    @pytest.mark.asyncio
+    async def test_other_jobs_do_not_wake_watch(self):
+        listener = JobEventListener("redis://unused", [CHANNEL])
+        with listener.watch(CHANNEL, "job-1") as watch:
+            listener.dispatch(CHANNEL, _event("job-2", "completed"))
+            listener.dispatch(CHANNEL, "not json")
+            assert await watch.wait(timeout=0.05) is None
+
+
+class TestOrchestratorEventWait:
+    """Testes do _wait_until_done com eventos."""
+
+    @pytest.mark.asyncio
+    async def test_terminal_event_skips_poll_delay(self, mock_microservice_client, mock_health_checker):
+        listener = JobEventListener("redis://unused", [CHANNEL])
+        listener._subscribed = True
+        orchestrator = PipelineOrchestrator(
+            video_client=mock_microservice_client,
+            audio_client=mock_microservice_client,
+            transcription_client=mock_microservice_client,
+            health_checker=mock_health_checker,
+            event_listener=listener,
+        )
+        orchestrator.event_fallback_poll_interval = 60
+        mock_microservice_client.get_job_status.side_effect = [
+            {"status": "processing", "progress": 0.1},
+            {"status": "completed", "progress": 1.0},
+        ]
+        stage = PipelineJob.create_new(youtube_url="https://youtu.be/x").normalization_stage
+
+        async def _publish_later():
+            await asyncio.sleep(0.05)
+            listener.dispatch(CHANNEL, _event("norm-1", "processing", 0.5))
+            await asyncio.sleep(0.05)
+            listener.dispatch(CHANNEL, _event("norm-1", "completed", 1.0))
+
+        publisher = asyncio.create_task(_publish_later())
+        status = await asyncio.wait_for(
+            orchestrator._wait_until_done(
+                mock_microservice_client, "norm-1", stage, "se3-audio-normalization"
+            ),
+            timeout=5,
+        )
+        await publisher
+
+        assert status["status"] == "completed"
+        assert mock_microservice_client.get_job_status.await_count == 2
@@ -0,0 +1,116 @@
+"""
+Testes para o serializer binário de jobs e o armazenamento com blobs separados.
+"""
+import json
+
+import pytest
+
+from common.job_utils.models import JobStatus
+from common.redis_utils import BinarySerializer, SERIALIZATION_VERSION, create_job_serializer
+from domain.pipeline_job_v2 import PipelineJobV2
+from infrastructure.redis_store import JOB_BLOB_FIELDS
+
+
+SEGMENTS = [{"text": f"segmento {i}", "start": i, "end": i + 1, "duration": 1.0} for i in range(200)]
+
+
+class TestBinarySerializer:
+
+    @pytest.mark.parametrize("fmt", ["msgpack", "orjson", "json"])
+    def test_roundtrip_keeps_version_tag(self, fmt):
+        serializer = BinarySerializer(format=fmt)
+        raw = serializer.dumps({"id": "j1", "progress": 12.5, "segments": SEGMENTS})
+
+        assert raw[:1] == b"Y"
+        assert serializer.decode(raw)["_version"] == SERIALIZATION_VERSION
+        assert serializer.loads(raw) == {"id": "j1", "progress": 12.5, "segments": SEGMENTS}
+
+    def test_reads_legacy_json_and_other_formats(self):
+        msgpack = BinarySerializer(format="msgpack")
+        legacy = json.dumps({"id": "j1", "created_at": "2024-01-01 10:00:00"})
+
+        assert msgpack.loads(legacy)["created_at"] == "2024-01-01T10:00:00"
+        assert msgpack.loads(BinarySerializer(format="orjson").dumps({"id": "j2"}))["id"] == "j2"
+
+    def test_zstd_compresses_large_payloads_only(self):
+        pytest.importorskip("zstandard")
+        serializer = BinarySerializer(format="msgpack", compression="zstd", compress_min_bytes=512)
+
+        small = serializer.encode({"progress": 1})
+        large = serializer.encode(SEGMENTS)
+
+        assert not small[1] & 0x10
+        assert large[1] & 0x10
+        assert serializer.decode(large) == SEGMENTS
+
+    def test_plain_json_keeps_legacy_store_format(self):
+        assert create_job_serializer("json", "none") is None
+        assert isinstance(create_job_serializer("msgpack", None), BinarySerializer)
+        with pytest.raises(ValueError):
+            create_job_serializer("yaml")
+
+
+class TestBinaryJobStore:
+
+    @pytest.fixture
+    def store(self, mock_redis_store):
+        inner = mock_redis_store._store
+        inner.serializer = BinarySerializer(format="msgpack")
+        inner.blob_fields = JOB_BLOB_FIELDS
+        return mock_redis_store
+
+    def _job(self) -> PipelineJobV2:
+        return PipelineJobV2(id="job-1", youtube_url="https://youtu.be/x", transcription_text="texto " * 1000)
+
+    def test_roundtrip_with_blobs(self, store):
+        job = self._job()
+        store.save_job(job)
+
+        loaded = store.get_job("job-1")
+        listed = store.list_jobs(include_blobs=False)
+
+        assert loaded.transcription_text == job.transcription_text
+        assert listed[0].id == "job-1" and listed[0].transcription_text is None
+
+    def test_progress_update_does_not_rewrite_blobs(self, store):
+        job = self._job()
+        store.save_job(job)
+        # Marcador: só some se o blob for regravado
+        store.redis.hset("orchestrator:job:job-1:blobs", "transcription_text", "sentinela")
+
+        job.progress = 50.0
+        job.status = JobStatus.PROCESSING
+        store.save_job(job)
+
+        assert store.redis.hget("orchestrator:job:job-1:blobs", "transcription_text") == "sentinela"
+        assert store.redis.strlen("orchestrator:job:job-1") < 1024
+
+        job.transcription_text = "novo texto"
+        store.save_job(job)
+
+        loaded = store.get_job("job-1")
+        assert loaded.progress == 50.0
+        assert loaded.transcription_text == "novo texto"
+
+    def test_blob_removed_elsewhere_is_rewritten(self, store):
+        job = self._job()
+        store.save_job(job)
+        # Chave de blobs expirada ou apagada por outro processo
+        store.redis.delete("orchestrator:job:job-1:blobs")
+
+        job.progress = 50.0
+        store.save_job(job)
+
+        assert store.get_job("job-1").transcription_text == job.transcription_text
+
+    def test_reads_jobs_saved_as_json(self, store):
+        job = self._job()
+        store._resilient.setex("orchestrator:job:job-1", 3600, job.model_dump_json())
+
+        assert store.get_job("job-1").transcription_text == job.transcription_text
+
+    def test_delete_removes_blobs(self, store):
+        store.save_job(self._job())
+        store.delete_job("job-1")
+
+        assert not store.redis.exists("orchestrator:job:job-1:blobs")
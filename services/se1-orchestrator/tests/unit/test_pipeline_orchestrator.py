@@ -101,7 +101,7 @@ class TestPipelineOrchestrator:
     async def test_pipeline_with_redis(self, mock_microservice_client, mock_health_checker, sample_pipeline_job):
         """Deve salvar no Redis se disponível."""
         mock_redis = Mock()
-        mock_redis.save_job.return_value = True
+        mock_redis.asave_job = AsyncMock(return_value=True)
 
         orchestrator = PipelineOrchestrator(
             video_client=mock_microservice_client,
@@ -122,4 +122,4 @@ class TestPipelineOrchestrator:
         await orchestrator.execute_pipeline(sample_pipeline_job)
 
         # Verifica se salvou no Redis
-        assert mock_redis.save_job.called
+        assert mock_redis.asave_job.called
@@ -0,0 +1,108 @@
+"""
+Testes para listagem paginada, índices por status e stats do OrchestratorJobStore.
+"""
+from datetime import timedelta
+
+import pytest
+
+from common.datetime_utils import now_brazil
+from common.job_utils.models import JobStatus
+from domain.pipeline_job_v2 import PipelineJobV2
+
+
+def _job(n: int, status: JobStatus = JobStatus.QUEUED, age_hours: float = 0) -> PipelineJobV2:
+    created = now_brazil() - timedelta(hours=age_hours, seconds=n)
+    return PipelineJobV2(
+        id=f"job-{n}",
+        youtube_url=f"https://youtu.be/{n}",
+        status=status,
+        created_at=created,
+        expires_at=created + timedelta(hours=24),
+    )
+
+
+@pytest.fixture
+def store(mock_redis_store):
+    return mock_redis_store
+
+
+class TestStatusIndex:
+
+    def test_save_moves_job_between_status_indexes(self, store):
+        job = _job(1)
+        store.save_job(job)
+        job.status = JobStatus.COMPLETED
+        store.save_job(job)
+
+        assert store.get_stats() == {"total_jobs": 1, "by_status": {"completed": 1}}
+
+    def test_stats_do_not_load_jobs(self, store, monkeypatch):
+        for n in range(5):
+            store.save_job(_job(n, JobStatus.FAILED if n % 2 else JobStatus.QUEUED))
+        monkeypatch.setattr(store.redis, "mget", lambda *a, **k: pytest.fail("MGET em stats"))
+        monkeypatch.setattr(store.redis, "get", lambda *a, **k: pytest.fail("GET em stats"))
+
+        stats = store.get_stats()
+
+        assert stats == {"total_jobs": 5, "by_status": {"queued": 3, "failed": 2}}
+
+    def test_stats_rebuild_index_for_legacy_jobs(self, store):
+        for n in range(3):
+            job = _job(n)
+            store._resilient.setex(f"{store.key_prefix}{job.id}", 3600, job.model_dump_json())
+            store.redis.zadd(store.list_key, {job.id: job.created_at.timestamp()})
+
+        assert store.get_stats()["by_status"] == {"queued": 3}
+
+    def test_pipeline_statuses_are_indexed(self, store):
+        job = _job(1)
+        store.save_job(job)
+        store._store.index_job(job.model_copy(update={"status": "downloading"}))
+        store._store.index_job(job.model_copy(update={"status": "transcribing"}))
+
+        assert store.get_stats()["by_status"] == {"transcribing": 1}
+
+
+class TestListing:
+
+    def test_pages_are_newest_first(self, store):
+        for n in range(10):
+            store.save_job(_job(n))
+
+        first = store.list_jobs(limit=4)
+        second = store.list_jobs(limit=4, offset=4)
+
+        assert [j.id for j in first] == ["job-0", "job-1", "job-2", "job-3"]
+        assert [j.id for j in second] == ["job-4", "job-5", "job-6", "job-7"]
+
+    def test_status_filter_reads_only_that_index(self, store):
+        for n in range(6):
+            store.save_job(_job(n, JobStatus.FAILED if n in (2, 4) else JobStatus.QUEUED))
+
+        assert [j.id for j in store.list_jobs(status="failed")] == ["job-2", "job-4"]
+
+    def test_expired_keys_are_dropped_from_indexes(self, store):
+        store.save_job(_job(1))
+        store.redis.delete(f"{store.key_prefix}job-1")
+
+        assert store.list_jobs() == []
+        assert store.get_stats() == {"total_jobs": 0, "by_status": {}}
+
+    def test_stats_keep_live_jobs_older_than_ttl(self, store):
+        """Saves refresh the TTL: only entries whose key is gone are pruned."""
+        store.save_job(_job(1, JobStatus.PROCESSING, age_hours=30))
+        store.save_job(_job(2, age_hours=30))
+        store.redis.delete(f"{store.key_prefix}job-2")
+
+        assert store.get_stats() == {"total_jobs": 1, "by_status": {"processing": 1}}
+        assert [j.id for j in store.list_jobs()] == ["job-1"]
+
+
+class TestCleanup:
+
+    def test_cleanup_by_age_uses_creation_score(self, store):
+        store.save_job(_job(1, age_hours=30))
+        store.save_job(_job(2, age_hours=1))
+
+        assert store.cleanup_old_jobs(max_age_hours=24) == 1
+        assert [j.id for j in store.list_jobs()] == ["job-2"]
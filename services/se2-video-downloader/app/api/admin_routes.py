@@ -369,7 +369,7 @@ async def get_stats(
     """Retrieve download service statistics including Redis, cache, and Celery info."""
     from app.infrastructure.celery_config import celery_app
 
-    stats = store.get_stats()
+    stats = await store.aget_stats()
 
     cache_path = Path(settings.cache_dir)
     if cache_path.exists():
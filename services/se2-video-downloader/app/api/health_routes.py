@@ -61,7 +61,7 @@ async def prometheus_metrics(store: VideoDownloadJobStore = Depends(job_store))
     svc = "video_downloader"
     stats: dict[str, Any] = {}
     try:
-        stats = store.get_stats()
+        stats = await store.aget_stats()
     except Exception as _e:
         logger.warning("Metrics: failed to get stats: %s", _e)
 
@@ -30,9 +30,9 @@ router = APIRouter(tags=["Jobs"])
 logger = get_logger(__name__)
 
 
-def _get_job_or_404(store: VideoDownloadJobStore, job_id: str, *, check_expired: bool = True) -> VideoDownloadJob:
+async def _get_job_or_404(store: VideoDownloadJobStore, job_id: str, *, check_expired: bool = True) -> VideoDownloadJob:
     """Retrieve a job or raise HTTP 404/410."""
-    job = store.get_job(job_id)
+    job = await store.aget_job(job_id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
     if check_expired and job.is_expired:
@@ -76,7 +76,7 @@ async def create_download_job(request: VideoDownloadJobRequest, store: VideoDown
             logger.warning("Celery worker inspection failed: %s", e)
 
         new_job = VideoDownloadJob.create_new(request.url, request.quality)
-        existing_job = store.get_job(new_job.id)
+        existing_job = await store.aget_job(new_job.id)
         if existing_job:
             if existing_job.status == "completed":
                 logger.info(f"Job {new_job.id} already completed")
@@ -89,11 +89,11 @@ async def create_download_job(request: VideoDownloadJobRequest, store: VideoDown
                 existing_job.status = JobStatus.QUEUED
                 existing_job.error_message = None
                 existing_job.progress = 0.0
-                store.update_job(existing_job)
+                await store.aupdate_job(existing_job)
                 download_video_task.apply_async(args=[existing_job.model_dump(mode="json")], task_id=existing_job.id)
                 return VideoDownloadJobCreatedResponse.from_job(existing_job)
 
-        store.save_job(new_job)
+        await store.asave_job(new_job)
         download_video_task.apply_async(args=[new_job.model_dump(mode="json")], task_id=new_job.id)
         logger.info(f"Download job created: {new_job.id}")
         return VideoDownloadJobCreatedResponse.from_job(new_job)
@@ -106,13 +106,13 @@ async def create_download_job(request: VideoDownloadJobRequest, store: VideoDown
 @router.get("/jobs/{job_id}", summary="Get job status", response_model=VideoDownloadJob, responses={404: {"model": ErrorResponse}, 410: {"model": ErrorResponse}})
 async def get_job_status(job_id: str, store: VideoDownloadJobStore = Depends(job_store)) -> VideoDownloadJob:
     """Retrieve the current status and details of a download job."""
-    return _get_job_or_404(store, job_id)
+    return await _get_job_or_404(store, job_id)
 
 
 @router.get("/jobs/{job_id}/download", summary="Download video file", responses={404: {"description": "Job or file not found"}, 410: {"description": "Job expired"}, 425: {"description": "Download not ready"}})
 async def download_file(job_id: str, store: VideoDownloadJobStore = Depends(job_store), downloader: YDLPVideoDownloader = Depends(downloader)) -> FileResponse:
     """Download the video file for a completed job."""
-    job = _get_job_or_404(store, job_id)
+    job = await _get_job_or_404(store, job_id)
     if job.status.value not in ("completed",):
         raise HTTPException(status_code=status.HTTP_425_TOO_EARLY, detail=f"Download not ready. Status: {job.status}")
 
@@ -126,13 +126,13 @@ async def download_file(job_id: str, store: VideoDownloadJobStore = Depends(job_
 @router.get("/jobs", summary="List jobs", response_model=List[VideoDownloadJob])
 async def list_jobs(limit: int = Query(20, ge=1, le=200), store: VideoDownloadJobStore = Depends(job_store)) -> list[VideoDownloadJob]:
     """List recent download jobs."""
-    return store.list_jobs(limit)
+    return await store.alist_jobs(limit)
 
 
 @router.delete("/jobs/{job_id}", summary="Delete job", response_model=DeleteJobResponse, responses={404: {"model": ErrorResponse}})
 async def delete_job(job_id: str, store: VideoDownloadJobStore = Depends(job_store)) -> dict[str, Any]:
     """Delete a download job and its associated files."""
-    job = _get_job_or_404(store, job_id, check_expired=False)
+    job = await _get_job_or_404(store, job_id, check_expired=False)
     files_deleted = 0
     if job.file_path:
         try:
@@ -142,7 +142,7 @@ async def delete_job(job_id: str, store: VideoDownloadJobStore = Depends(job_sto
                 files_deleted += 1
         except Exception as e:
             logger.warning("Failed to delete file %s for job %s: %s", job.file_path, job_id, e)
-    store.delete_job(job_id)
+    await store.adelete_job(job_id)
     return {"message": "Job deleted successfully", "job_id": job_id, "files_deleted": files_deleted}
 
 
@@ -200,9 +200,9 @@ async def cleanup_orphaned_jobs(
             age = (now_brazil() - job.started_at).total_seconds() / 60
         if mark_as_failed:
             job.mark_as_failed(f"Orphaned: stuck for {age:.1f} minutes")
-            store.update_job(job)
+            await store.aupdate_job(job)
             actions.append({"job_id": job.id, "action": "marked_as_failed", "age_minutes": round(age, 2)})
         else:
-            store.delete_job(job.id)
+            await store.adelete_job(job.id)
             actions.append({"job_id": job.id, "action": "deleted", "age_minutes": round(age, 2)})
     return {"status": "success", "message": f"Cleaned up {len(orphaned)} orphaned job(s)", "count": len(orphaned), "mode": "mark_as_failed" if mark_as_failed else "delete", "actions": actions}
\ No newline at end of file
@@ -217,6 +217,10 @@ def cleanup_expired_jobs_task() -> dict[str, Any]:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
     
-    expired = loop.run_until_complete(store.cleanup_expired())
+    try:
+        expired = loop.run_until_complete(store.cleanup_expired())
+    finally:
+        # Store criado por task: fecha o pool assíncrono para não vazar conexões
+        loop.run_until_complete(store.aclose())
     
     return {"status": "completed", "expired_jobs": expired}
\ No newline at end of file
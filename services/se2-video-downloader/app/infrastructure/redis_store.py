@@ -6,16 +6,13 @@ while preserving the service-specific VideoDownloadJob model
 and backward-compatible API.
 """
 import os
-import json
 import asyncio
 from typing import Any
-from datetime import datetime, timedelta
 
 from common.log_utils import get_logger
-from common.redis_utils import ResilientRedisStore
+from common.redis_utils import AsyncResilientRedisStore, ResilientRedisStore
+from common.job_utils.async_store import AsyncJobRedisStore
 from common.job_utils.store import JobRedisStore
-from common.job_utils.models import StandardJob
-from common.datetime_utils import now_brazil, ensure_timezone_aware
 
 from app.core.models import VideoDownloadJob
 from app.core.constants import (
@@ -31,80 +28,85 @@ class VideoDownloadJobStore:
     """
     Redis store for VideoDownloadJob that delegates persistence
     to the common JobRedisStore while adding service-specific methods.
+
+    The ``a*`` methods use the asyncio store (same keys and indexes) and
+    are the ones FastAPI handlers should call; the synchronous methods
+    remain for Celery workers.
     """
 
     def __init__(self, redis_url: str = "redis://localhost:6379/0") -> None:
-        self._resilient = ResilientRedisStore(
-            redis_url=redis_url,
+        breaker_options: dict[str, Any] = dict(
             max_connections=DEFAULT_REDIS_MAX_CONNECTIONS,
             circuit_breaker_enabled=True,
             circuit_breaker_max_failures=int(os.getenv('REDIS_CIRCUIT_BREAKER_MAX_FAILURES', '5')),
             circuit_breaker_timeout=int(os.getenv('REDIS_CIRCUIT_BREAKER_TIMEOUT', '60')),
         )
-        self._store = JobRedisStore(
-            redis_store=self._resilient,
+        store_options: dict[str, Any] = dict(
             service_name="video_downloader",
             ttl_hours=int(os.getenv('CACHE_TTL_HOURS', '24')),
+            job_model=VideoDownloadJob,
+            key_prefix="job:",
         )
+        self._resilient = ResilientRedisStore(redis_url=redis_url, **breaker_options)
+        self._store = JobRedisStore(redis_store=self._resilient, **store_options)
+        self._async_resilient = AsyncResilientRedisStore(redis_url=redis_url, **breaker_options)
+        self._async_store = AsyncJobRedisStore(redis_store=self._async_resilient, **store_options)
         self.redis = self._resilient.redis
         self._cleanup_task: asyncio.Task[None] | None = None
         self.cache_ttl_hours = int(os.getenv('CACHE_TTL_HOURS', '24'))
         self.cleanup_interval_minutes = int(os.getenv('CLEANUP_INTERVAL_MINUTES', '30'))
 
     def save_job(self, job: VideoDownloadJob) -> VideoDownloadJob:
-        data = job.model_dump_json()
-        key = f"job:{job.id}"
-        ttl = self.cache_ttl_hours * 3600
-        self._resilient.setex(key, ttl, data)
-        self.redis.zadd("video_downloader:jobs:list", {job.id: job.created_at.timestamp()})
+        self._store.save_job(job)
         return job
 
     def get_job(self, job_id: str) -> VideoDownloadJob | None:
-        key = f"job:{job_id}"
-        data = self._resilient.get(key)
-        if not data:
-            return None
-        try:
-            return VideoDownloadJob.model_validate_json(data)
-        except Exception as exc:
-            logger.error("Error deserializing job %s: %s", job_id, exc)
-            return None
+        return self._store.get_job(job_id)
 
     def update_job(self, job: VideoDownloadJob) -> VideoDownloadJob:
         return self.save_job(job)
 
     def delete_job(self, job_id: str) -> bool:
-        key = f"job:{job_id}"
-        self.redis.zrem("video_downloader:jobs:list", job_id)
-        result = self._resilient.delete(key)
-        return result > 0
+        return self._store.delete_job(job_id)
 
     def list_jobs(self, limit: int = DEFAULT_LIST_JOBS_LIMIT) -> list[VideoDownloadJob]:
-        all_ids = self.redis.zrevrange("video_downloader:jobs:list", 0, -1)
-        jobs = []
-        for jid in all_ids[:limit * 2]:
-            job = self.get_job(str(jid))
-            if job:
-                jobs.append(job)
-        jobs.sort(key=lambda j: j.created_at, reverse=True)
-        return jobs[:limit]
+        return self._store.list_jobs(limit=limit)
 
     def get_stats(self) -> dict[str, Any]:
-        all_ids = self.redis.zrevrange("video_downloader:jobs:list", 0, -1)
-        total = len(all_ids)
-        by_status: dict[str, int] = {}
-        for jid in all_ids:
-            job = self.get_job(str(jid))
-            if job:
-                status = job.status.value if hasattr(job.status, 'value') else str(job.status)
-                by_status[status] = by_status.get(status, 0) + 1
         return {
-            "total_jobs": total,
-            "by_status": by_status,
+            **self._store.get_stats(),
             "cleanup_active": self._cleanup_task is not None,
             "redis_connected": self._resilient.ping(),
         }
 
+    # -- async API ---------------------------------------------------------
+
+    async def asave_job(self, job: VideoDownloadJob) -> VideoDownloadJob:
+        await self._async_store.save_job(job)
+        return job
+
+    async def aget_job(self, job_id: str) -> VideoDownloadJob | None:
+        return await self._async_store.get_job(job_id)
+
+    async def aupdate_job(self, job: VideoDownloadJob) -> VideoDownloadJob:
+        return await self.asave_job(job)
+
+    async def adelete_job(self, job_id: str) -> bool:
+        return await self._async_store.delete_job(job_id)
+
+    async def alist_jobs(self, limit: int = DEFAULT_LIST_JOBS_LIMIT) -> list[VideoDownloadJob]:
+        return await self._async_store.list_jobs(limit=limit)
+
+    async def aget_stats(self) -> dict[str, Any]:
+        return {
+            **await self._async_store.get_stats(),
+            "cleanup_active": self._cleanup_task is not None,
+            "redis_connected": await self._async_resilient.ping(),
+        }
+
+    async def aclose(self) -> None:
+        await self._async_resilient.close()
+
     async def start_cleanup_task(self) -> None:
         if self._cleanup_task is None:
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
@@ -133,40 +135,26 @@ class VideoDownloadJobStore:
 
     async def cleanup_expired(self) -> int:
         from pathlib import Path
-        now = now_brazil()
         expired_count = 0
-        all_ids = self.redis.zrevrange("video_downloader:jobs:list", 0, -1)
-        for jid in all_ids:
-            job = self.get_job(str(jid))
-            if job and job.is_expired:
-                if job.file_path:
-                    fp = Path(job.file_path)
-                    if fp.exists():
-                        try:
-                            fp.unlink()
-                        except Exception as e:
-                            logger.warning("Failed to delete expired file %s: %s", fp, e)
-                self.delete_job(job.id)
-                expired_count += 1
+        async for job in self._async_store.iter_jobs():
+            if not job.is_expired:
+                continue
+            if job.file_path:
+                fp = Path(job.file_path)
+                if fp.exists():
+                    try:
+                        fp.unlink()
+                    except Exception as e:
+                        logger.warning("Failed to delete expired file %s: %s", fp, e)
+            await self._async_store.delete_job(job.id)
+            expired_count += 1
         return expired_count
 
     async def find_orphaned_jobs(self, max_age_minutes: int = 30) -> list[VideoDownloadJob]:
-        orphaned = []
-        now = now_brazil()
-        max_age = timedelta(minutes=max_age_minutes)
-        all_ids = self.redis.zrevrange("video_downloader:jobs:list", 0, -1)
-        for jid in all_ids:
-            job = self.get_job(str(jid))
-            if job and job.started_at:
-                age = now - job.started_at
-                if age > max_age and job.status not in (
-                    "completed", "failed", "cancelled"
-                ):
-                    orphaned.append(job)
-        return orphaned
+        return await self._async_store.find_orphaned(max_age_hours=max_age_minutes / 60)
 
     async def get_queue_info(self) -> dict[str, Any]:
-        jobs = self.list_jobs(limit=MAX_QUEUE_INFO_LIST_LIMIT)
+        jobs = await self.alist_jobs(limit=MAX_QUEUE_INFO_LIST_LIMIT)
         queue_info: dict[str, Any] = {
             "total_jobs": len(jobs),
             "by_status": {"queued": 0, "processing": 0, "completed": 0, "failed": 0},
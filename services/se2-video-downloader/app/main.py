@@ -49,6 +49,7 @@ async def lifespan(app: Any) -> AsyncGenerator[None, None]:
     try:
         _store = get_job_store()
         await _store.stop_cleanup_task()
+        await _store.aclose()
         logger.info("Video Download Service parado graciosamente")
     except Exception as e:
         logger.error("Erro durante shutdown: %s", e)
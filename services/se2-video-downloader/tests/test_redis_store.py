@@ -0,0 +1,53 @@
+"""Tests for VideoDownloadJobStore (sync and asyncio APIs)."""
+from datetime import timedelta
+
+from common.datetime_utils import now_brazil
+from common.job_utils.models import JobStatus
+
+from app.core.models import VideoDownloadJob
+
+
+def _job(video_id: str) -> VideoDownloadJob:
+    return VideoDownloadJob.create_new(f"https://youtu.be/{video_id}", "best")
+
+
+class TestVideoDownloadJobStore:
+
+    async def test_async_save_is_visible_to_sync_api(self, mock_job_store):
+        job = _job("abcdefghijk")
+
+        await mock_job_store.asave_job(job)
+
+        assert mock_job_store.get_job(job.id).url == job.url
+        assert mock_job_store.redis.exists(f"job:{job.id}")
+        assert [j.id for j in await mock_job_store.alist_jobs()] == [job.id]
+
+    async def test_stats_come_from_status_indexes(self, mock_job_store):
+        queued, failed = _job("aaaaaaaaaaa"), _job("bbbbbbbbbbb")
+        failed.status = JobStatus.FAILED
+        mock_job_store.save_job(queued)
+        await mock_job_store.asave_job(failed)
+
+        stats = await mock_job_store.aget_stats()
+
+        assert stats["total_jobs"] == 2
+        assert stats["by_status"] == {"queued": 1, "failed": 1}
+
+    async def test_find_orphaned_jobs(self, mock_job_store):
+        stuck, fresh = _job("ccccccccccc"), _job("ddddddddddd")
+        for job, minutes in ((stuck, 90), (fresh, 1)):
+            job.status = JobStatus.PROCESSING
+            job.started_at = now_brazil() - timedelta(minutes=minutes)
+            await mock_job_store.asave_job(job)
+
+        orphaned = await mock_job_store.find_orphaned_jobs(max_age_minutes=30)
+
+        assert [j.id for j in orphaned] == [stuck.id]
+
+    async def test_delete_removes_job_and_index(self, mock_job_store):
+        job = _job("eeeeeeeeeee")
+        await mock_job_store.asave_job(job)
+
+        assert await mock_job_store.adelete_job(job.id) is True
+        assert await mock_job_store.aget_job(job.id) is None
+        assert (await mock_job_store.aget_stats())["total_jobs"] == 0
@@ -66,6 +66,16 @@ class ServiceSettings(BaseServiceSettings):
     ffmpeg_preset: str = Field(default="medium")
     ffmpeg_audio_codec: str = Field(default="libopus")
     ffmpeg_audio_bitrate: str = Field(default="128k")
+    # Compila highpass/mono/16k/volume/encode em um único filter graph ffmpeg
+    normalization_single_pass: bool = Field(default=True)
+
+    # Cache de resultados por conteúdo: job ID = SHA-256 do upload + flags
+    result_cache_enabled: bool = Field(default=True)
+    result_cache_dir: str = "./data/cache"
+    result_cache_max_size_mb: int = Field(default=2048, ge=0)  # 0 = sem limite
+
+    # DSP (noisereduce/HPSS/pydub) em pool de processos, fora do event loop
+    dsp_pool_workers: int = Field(default=0, ge=0)  # processos por worker (0 = nº de CPUs)
 
     # Directories
     upload_dir: str = "./data/uploads"
@@ -119,5 +129,7 @@ def get_service_config() -> dict[str, Any]:
             'audio_codec': s.ffmpeg_audio_codec,
             'audio_bitrate': s.ffmpeg_audio_bitrate,
         },
+        'single_pass': s.normalization_single_pass,
+        'dsp_pool_workers': s.dsp_pool_workers,
         'extraction_timeout_sec': s.extraction_timeout_sec,
     }
@@ -16,6 +16,15 @@ from common.log_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Flags que alteram o resultado da normalização (ordem fixa: compõe a chave do cache)
+OPERATION_FIELDS = (
+    "remove_noise",
+    "convert_to_mono",
+    "apply_highpass_filter",
+    "set_sample_rate_16k",
+    "isolate_vocals",
+)
+
 
 class AudioNormJob(StandardJob):
     input_file: str | None = Field(
@@ -41,6 +50,10 @@ class AudioNormJob(StandardJob):
         ge=0,
         description="Tamanho do arquivo processado em bytes.",
     )
+    content_hash: str | None = Field(
+        default=None,
+        description="SHA-256 do arquivo enviado (calculado durante o upload).",
+    )
 
     # Processing parameters
     remove_noise: bool = Field(
@@ -73,14 +86,47 @@ class AudioNormJob(StandardJob):
     # json_encoders removed — Pydantic v2 handles datetime natively
 
     @classmethod
-    def create_new(cls, filename: str, **kwargs: Any) -> AudioNormJob:
+    def build_result_key(cls, content_hash: str, **params: Any) -> str:
+        """
+        Chave do resultado: digest do conteúdo + flags de normalização.
+
+        Flags ausentes usam o default do modelo, então a mesma combinação
+        efetiva de operações sempre gera a mesma chave.
+        """
+        flags = "".join(
+            "1" if params.get(name, cls.model_fields[name].default) else "0"
+            for name in OPERATION_FIELDS
+        )
+        return f"{content_hash}:{flags}"
+
+    @property
+    def result_key(self) -> str | None:
+        if not self.content_hash:
+            return None
+        return self.build_result_key(
+            self.content_hash, **{name: getattr(self, name) for name in OPERATION_FIELDS}
+        )
+
+    @classmethod
+    def create_new(cls, filename: str, content_hash: str | None = None, **kwargs: Any) -> AudioNormJob:
+        """
+        Cria um job na fila.
+
+        Com ``content_hash``, o ID é derivado do conteúdo + flags: o mesmo
+        áudio enviado de novo com as mesmas operações cai no mesmo job.
+        Sem ele, o ID é único por envio (nome + timestamp).
+        """
         from common.job_utils.models import generate_job_id
-        unique_str = f"{filename}_{now_brazil().isoformat()}"
+        if content_hash:
+            unique_str = cls.build_result_key(content_hash, **kwargs)
+        else:
+            unique_str = f"{filename}_{now_brazil().isoformat()}"
         job_id = generate_job_id(unique_str, prefix="an_")
 
         job = cls(
             id=job_id,
             filename=filename,
+            content_hash=content_hash,
             **kwargs,
         )
         job.add_stage("processing", "Audio normalization")
@@ -117,6 +163,13 @@ class AudioNormJob(StandardJob):
             ops.append("vocal_isolation")
         return ops
 
+    @property
+    def output_filename(self) -> str:
+        """Nome do arquivo processado: ID do job + operações aplicadas."""
+        ops = self.processing_operations
+        suffix = f"_{'_'.join(ops)}" if ops else ""
+        return f"{self.id}{suffix}.webm"
+
 
 class DeleteJobResponse(BaseModel):
     message: str = Field(..., description="Resultado da exclusão do job.")
@@ -200,15 +200,33 @@ class FileValidator:
             FileTooLargeError: Se arquivo exceder limite
             ValidationError: Se conteúdo for inválido
         """
+        FileValidator.validate_file_size(len(content) if content else 0, max_size_mb)
+
+    @staticmethod
+    def validate_file_size(
+        size_bytes: int,
+        max_size_mb: int = FILE_CONSTANTS.DEFAULT_MAX_FILE_SIZE_MB
+    ) -> None:
+        """
+        Valida o tamanho de um arquivo já gravado em disco (upload em streaming).
+
+        Args:
+            size_bytes: Tamanho do arquivo em bytes
+            max_size_mb: Tamanho máximo permitido
+
+        Raises:
+            FileTooLargeError: Se arquivo exceder limite
+            ValidationError: Se arquivo estiver vazio
+        """
         # Verifica se não está vazio
-        if not content or len(content) == 0:
+        if size_bytes <= 0:
             raise ValidationError("Arquivo está vazio", status_code=400)
 
         # Verifica tamanho
         max_size_bytes = max_size_mb * FILE_CONSTANTS.BYTES_PER_MB
-        file_size_mb = len(content) / FILE_CONSTANTS.BYTES_PER_MB
+        file_size_mb = size_bytes / FILE_CONSTANTS.BYTES_PER_MB
 
-        if len(content) > max_size_bytes:
+        if size_bytes > max_size_bytes:
             raise FileTooLargeError(file_size_mb, max_size_mb)
 
         logger.info(f"✅ Validação de tamanho: {file_size_mb:.2f}MB / {max_size_mb}MB permitidos")
@@ -42,6 +42,26 @@ class IJobStore(Protocol):
         """Remove todos os jobs do store. Retorna quantidade removida."""
         ...
 
+    async def asave_job(self, job: AudioNormJob) -> AudioNormJob:
+        """Salva job no storage (sem bloquear o event loop)."""
+        ...
+
+    async def aget_job(self, job_id: str) -> AudioNormJob | None:
+        """Recupera job pelo ID (sem bloquear o event loop)."""
+        ...
+
+    async def aupdate_job(self, job: AudioNormJob) -> AudioNormJob:
+        """Atualiza job existente (sem bloquear o event loop)."""
+        ...
+
+    async def adelete_job(self, job_id: str) -> bool:
+        """Remove job do storage (sem bloquear o event loop)."""
+        ...
+
+    async def alist_jobs(self, limit: int = 50) -> list[AudioNormJob]:
+        """Lista jobs recentes (sem bloquear o event loop)."""
+        ...
+
 
 class IAudioProcessor(Protocol):
     """Protocolo para processamento de áudio."""
@@ -19,6 +19,10 @@ celery_app = create_celery_app(
     task_soft_time_limit=int(os.getenv("CELERY_TASK_SOFT_TIME_LIMIT", "1500")),
     worker_prefetch_multiplier=int(os.getenv("CELERY_WORKER_PREFETCH_MULTIPLIER", "1")),
     worker_max_tasks_per_child=int(os.getenv("CELERY_WORKER_MAX_TASKS_PER_CHILD", "50")),
+    # Threads, not prefork: prefork children are daemon processes and cannot
+    # start the DSP process pool (app.services.dsp_pool). CPU-bound DSP runs in
+    # that pool; the job timeout is enforced inside the task (asyncio.wait_for).
+    worker_pool=os.getenv("CELERY_WORKER_POOL", "threads"),
     task_acks_late=os.getenv("CELERY_TASK_ACKS_LATE", "true").lower() == "true",
     include=["app.infrastructure.celery_tasks"],
     broker_connection_retry=True,
@@ -126,8 +126,9 @@ class CallbackTask(Task):
             from ..core.config import get_service_config, get_settings
             settings = get_settings()
             from ..services.audio_processor import AudioConfig
+            from .dependencies import get_result_cache
             audio_config = AudioConfig(settings)
-            self._processor = AudioProcessor(config=audio_config)
+            self._processor = AudioProcessor(config=audio_config, result_cache=get_result_cache())
             if self._job_store is not None:
                 self._processor.job_store = self._job_store
         return self._processor
@@ -13,6 +13,7 @@ from common.di import Dep
 from app.core.config import get_settings
 from app.infrastructure.redis_store import AudioNormJobStore
 from app.services.audio_processor import AudioProcessor, AudioConfig
+from app.services.result_cache import ResultCache
 from app.services.job_service import (
     JobCreationService,
     JobSubmissionService,
@@ -37,11 +38,26 @@ def get_upload_dir() -> Path:
     return Path(_get_settings().get('upload_dir', './uploads'))
 
 
+def get_processed_dir() -> Path:
+    return Path(_get_settings().get('processed_dir', './data/processed'))
+
+
 @lru_cache(maxsize=1)
 def get_job_store() -> AudioNormJobStore:
     return AudioNormJobStore(redis_url=get_redis_url())
 
 
+@lru_cache(maxsize=1)
+def get_result_cache() -> ResultCache | None:
+    settings = _get_settings()
+    if not settings.get('result_cache_enabled', True):
+        return None
+    return ResultCache(
+        Path(settings.get('result_cache_dir', './data/cache')),
+        max_size_mb=settings.get('result_cache_max_size_mb', 2048),
+    )
+
+
 @lru_cache(maxsize=1)
 def get_audio_config() -> AudioConfig:
     return AudioConfig(_get_settings())
@@ -49,7 +65,7 @@ def get_audio_config() -> AudioConfig:
 
 @lru_cache(maxsize=1)
 def get_audio_processor() -> AudioProcessor:
-    processor = AudioProcessor(get_audio_config())
+    processor = AudioProcessor(get_audio_config(), result_cache=get_result_cache())
     processor.set_job_store(get_job_store())
     return processor
 
@@ -58,12 +74,13 @@ def get_job_creation_service() -> JobCreationService:
     return JobCreationService(
         job_store=get_job_store(),
         upload_dir=get_upload_dir(),
-        max_file_size_mb=_get_settings()['max_file_size_mb']
+        max_file_size_mb=_get_settings()['max_file_size_mb'],
+        content_addressed=get_result_cache() is not None,
     )
 
 
 def get_job_submission_service() -> JobSubmissionService:
-    return JobSubmissionService(job_store=get_job_store())
+    return JobSubmissionService(job_store=get_job_store(), result_cache=get_result_cache())
 
 
 def get_job_retrieval_service() -> JobRetrievalService:
@@ -7,103 +7,99 @@ import asyncio
 import os
 from typing import Any
 
-from common.redis_utils import ResilientRedisStore
+from common.redis_utils import AsyncResilientRedisStore, ResilientRedisStore
 from common.log_utils import get_logger
+from common.job_utils.async_store import AsyncJobRedisStore
 from common.job_utils.store import JobRedisStore
-from common.job_utils.models import StandardJob
-from common.datetime_utils import now_brazil
 
 from app.core.models import AudioNormJob
 
 logger = get_logger(__name__)
 
 class AudioNormJobStore:
+    """
+    Store de jobs de normalização sobre o JobRedisStore comum.
+
+    Os métodos ``a*`` usam a variante asyncio (mesmas chaves e índices) e
+    são os usados pelos handlers FastAPI; os síncronos ficam para o worker
+    Celery.
+    """
+
     def __init__(self, redis_url: str = "redis://localhost:6379/0") -> None:
+        store_options: dict[str, Any] = dict(
+            service_name="audio_normalization",
+            ttl_hours=int(os.getenv('CACHE_TTL_HOURS', '24')),
+            job_model=AudioNormJob,
+        )
         self._resilient = ResilientRedisStore(
             redis_url=redis_url,
             max_connections=50,
             circuit_breaker_enabled=True,
         )
-        self._store = JobRedisStore(
-            redis_store=self._resilient,
-            service_name="audio_normalization",
-            ttl_hours=int(os.getenv('CACHE_TTL_HOURS', '24')),
+        self._store = JobRedisStore(redis_store=self._resilient, **store_options)
+        self._async_resilient = AsyncResilientRedisStore(
+            redis_url=redis_url,
+            max_connections=50,
+            circuit_breaker_enabled=True,
         )
+        self._async_store = AsyncJobRedisStore(redis_store=self._async_resilient, **store_options)
         self.redis = self._resilient.redis
-        self.key_prefix = "audio_normalization:job:"
-        self.list_key = "audio_normalization:jobs:list"
+        self.key_prefix = self._store.key_prefix
+        self.list_key = self._store.list_key
         self._cleanup_task = None
         self.cleanup_interval_minutes = int(os.getenv('CLEANUP_INTERVAL_MINUTES', '30'))
 
     def save_job(self, job: AudioNormJob) -> AudioNormJob:
-        data = job.model_dump_json()
-        key = f"{self.key_prefix}{job.id}"
-        ttl = 24 * 3600
-        self._resilient.setex(key, ttl, data)
-        self.redis.zadd(self.list_key, {job.id: job.created_at.timestamp()})
+        self._store.save_job(job)
         return job
 
     def get_job(self, job_id: str) -> AudioNormJob | None:
-        key = f"{self.key_prefix}{job_id}"
-        data = self._resilient.get(key)
-        if not data:
-            return None
-        try:
-            return AudioNormJob.model_validate_json(data)
-        except Exception as exc:
-            logger.error("Error deserializing job %s: %s", job_id, exc)
-            return None
+        return self._store.get_job(job_id)
 
     def update_job(self, job: AudioNormJob) -> AudioNormJob:
         return self.save_job(job)
 
     def delete_job(self, job_id: str) -> bool:
-        self.redis.zrem(self.list_key, job_id)
-        return self._resilient.delete(f"{self.key_prefix}{job_id}") > 0
+        return self._store.delete_job(job_id)
 
     def list_jobs(self, limit: int = 100) -> list[AudioNormJob]:
-        all_ids = self.redis.zrevrange(self.list_key, 0, -1)
-        jobs: list[AudioNormJob] = []
-        for jid in all_ids[:limit]:
-            job = self.get_job(str(jid))
-            if job:
-                jobs.append(job)
-        return jobs
+        return self._store.list_jobs(limit=limit)
 
     def get_stats(self) -> dict[str, Any]:
-        all_ids = self.redis.zrevrange(self.list_key, 0, -1)
-        total = len(all_ids)
-        by_status: dict[str, int] = {}
-        for jid in all_ids:
-            job = self.get_job(str(jid))
-            if job:
-                s = job.status.value if hasattr(job.status, 'value') else str(job.status)
-                by_status[s] = by_status.get(s, 0) + 1
-        return {"total_jobs": total, "by_status": by_status}
+        return self._store.get_stats()
 
     def cleanup_expired(self) -> int:
-        all_ids = self.redis.zrevrange(self.list_key, 0, -1)
-        removed = 0
-        for jid in all_ids:
-            job = self.get_job(str(jid))
-            if job and job.is_expired:
-                self.delete_job(job.id)
-                removed += 1
-        return removed
+        return self._store.cleanup_expired()
 
     def find_orphaned_jobs(self, max_age_minutes: int = 30) -> list[AudioNormJob]:
-        from datetime import timedelta
-        orphaned: list[AudioNormJob] = []
-        now = now_brazil()
-        max_age = timedelta(minutes=max_age_minutes)
-        all_ids = self.redis.zrevrange(self.list_key, 0, -1)
-        for jid in all_ids:
-            job = self.get_job(str(jid))
-            if job and job.started_at and not job.is_terminal:
-                age = now - job.started_at
-                if age > max_age:
-                    orphaned.append(job)
-        return orphaned
+        return self._store.find_orphaned(max_age_hours=max_age_minutes / 60)
+
+    # -- API assíncrona ----------------------------------------------------
+
+    async def asave_job(self, job: AudioNormJob) -> AudioNormJob:
+        await self._async_store.save_job(job)
+        return job
+
+    async def aget_job(self, job_id: str) -> AudioNormJob | None:
+        return await self._async_store.get_job(job_id)
+
+    async def aupdate_job(self, job: AudioNormJob) -> AudioNormJob:
+        return await self.asave_job(job)
+
+    async def adelete_job(self, job_id: str) -> bool:
+        return await self._async_store.delete_job(job_id)
+
+    async def alist_jobs(self, limit: int = 100) -> list[AudioNormJob]:
+        return await self._async_store.list_jobs(limit=limit)
+
+    async def aget_stats(self) -> dict[str, Any]:
+        return await self._async_store.get_stats()
+
+    async def acleanup_expired(self) -> int:
+        return await self._async_store.cleanup_expired()
+
+    async def aclose(self) -> None:
+        await self._async_resilient.close()
 
     async def start_cleanup_task(self) -> None:
         import asyncio
@@ -124,21 +120,21 @@ class AudioNormJobStore:
         while True:
             try:
                 await asyncio.sleep(self.cleanup_interval_minutes * 60)
-                self.cleanup_expired()
+                await self.acleanup_expired()
             except asyncio.CancelledError:
                 break
 
     def cleanup_all(self) -> int:
         """Delete all SE3 jobs (keys + sorted set), not the entire Redis DB."""
-        all_ids = self.redis.zrevrange(self.list_key, 0, -1)
+        all_ids = self._store.list_job_ids()
         count = len(all_ids)
         for jid in all_ids:
-            self.redis.delete(f"{self.key_prefix}{jid.decode()}")
-        self.redis.delete(self.list_key)
+            self.redis.delete(f"{self.key_prefix}{jid}")
+        self.redis.delete(self.list_key, *(self._store._status_key(st) for st in self._store.statuses))
         return count
 
     async def get_queue_info(self) -> dict[str, Any]:
-        jobs = self.list_jobs(limit=10000)
+        jobs = await self.alist_jobs(limit=10000)
         by_status: dict[str, int] = {"queued": 0, "processing": 0, "completed": 0, "failed": 0}
         for job in jobs:
             s = job.status.value if hasattr(job.status, 'value') else str(job.status)
@@ -44,7 +44,9 @@ from .infrastructure.dependencies import (
     job_store,
     audio_processor,
     get_upload_dir,
+    get_processed_dir,
     get_settings_dep,
+    get_result_cache,
 )
 from .services.audio_processor import AudioProcessor
 from .services.job_service import (
@@ -73,6 +75,7 @@ async def lifespan(app: FastAPI) -> Any:
     logger.info("Audio Normalization Service iniciado com sucesso")
     yield
     await store.stop_cleanup_task()
+    await store.aclose()
     logger.info("Audio Normalization Service parado graciosamente")
 
 
@@ -163,12 +166,16 @@ async def create_audio_job(
 
     Aceita QUALQUER formato de áudio como entrada e SEMPRE retorna .webm.
     """
+    result_cache = get_result_cache()
     creation_service = JobCreationService(
         job_store=store,
         upload_dir=get_upload_dir(),
-        max_file_size_mb=get_settings_dep()['max_file_size_mb']
+        max_file_size_mb=get_settings_dep()['max_file_size_mb'],
+        content_addressed=result_cache is not None
+    )
+    submission_service = JobSubmissionService(
+        job_store=store, result_cache=result_cache, processed_dir=get_processed_dir()
     )
-    submission_service = JobSubmissionService(job_store=store)
 
     # 1. Validação do arquivo
     try:
@@ -190,16 +197,19 @@ async def create_audio_job(
     try:
         new_job = creation_service.create_job_entity(
             filename=validation_result.original_filename,
-            processing_params=validation_result.processing_params
+            processing_params=validation_result.processing_params,
+            content_hash=validation_result.content_hash
         )
     except Exception as e:
+        validation_result.discard()
         logger.error(f"Erro ao criar job: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Erro ao criar job: {e}")
 
     # 3. Verifica cache
     try:
-        existing_job = submission_service.check_existing_job(new_job)
+        existing_job = await submission_service.check_existing_job(new_job)
         if existing_job:
+            validation_result.discard()
             return existing_job
     except Exception as e:
         logger.warning(f"Erro ao verificar cache: {e}")
@@ -209,20 +219,22 @@ async def create_audio_job(
     try:
         file_path = creation_service.save_file(
             new_job,
-            validation_result.content,
+            validation_result.staged_path,
             validation_result.extension
         )
         new_job.input_file = str(file_path)
-        new_job.file_size_input = file_path.stat().st_size
+        new_job.file_size_input = validation_result.size
     except ValidationError as e:
+        validation_result.discard()
         raise HTTPException(status_code=e.status_code, detail=str(e.detail))
     except Exception as e:
+        validation_result.discard()
         logger.error(f"Erro ao salvar arquivo: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Erro ao salvar arquivo: {e}")
 
     # 5. Salva job e submete
     try:
-        store.save_job(new_job)
+        await store.asave_job(new_job)
         await submission_service.submit_with_fallback(new_job, processor)
         logger.info(f"Job {new_job.id} criado e submetido")
     except RedisError as e:
@@ -255,7 +267,7 @@ async def get_job_status(
 
     # Busca job
     try:
-        job = retrieval_service.get_job(job_id)
+        job = await retrieval_service.get_job(job_id)
     except JobNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job não encontrado: {job_id}")
     except Exception as e:
@@ -285,7 +297,7 @@ async def download_file(
 
     # Busca job
     try:
-        job = retrieval_service.get_job_with_expiration_check(job_id)
+        job = await retrieval_service.get_job_with_expiration_check(job_id)
     except JobNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job não encontrado")
     except JobExpiredError:
@@ -328,7 +340,7 @@ async def list_jobs(
     retrieval_service = JobRetrievalService(job_store=store)
 
     try:
-        return retrieval_service.list_recent_jobs(limit)
+        return await retrieval_service.list_recent_jobs(limit)
     except Exception as e:
         logger.error(f"Erro ao listar jobs: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Erro ao listar jobs: {e}")
@@ -350,7 +362,7 @@ async def delete_job(
 
     # Busca job
     try:
-        job = retrieval_service.get_job(job_id)
+        job = await retrieval_service.get_job(job_id)
     except JobNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job não encontrado")
 
@@ -375,7 +387,7 @@ async def delete_job(
 
     # Remove do Redis
     try:
-        store.delete_job(job_id)
+        await store.adelete_job(job_id)
         logger.info(f"🗑️ Job {job_id} removido do Redis")
     except Exception as e:
         logger.error(f"Erro ao remover job do Redis: {e}")
@@ -402,13 +414,13 @@ async def update_heartbeat(
     retrieval_service = JobRetrievalService(job_store=store)
 
     try:
-        job = retrieval_service.get_job(job_id)
+        job = await retrieval_service.get_job(job_id)
     except JobNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job não encontrado")
 
     # Atualiza heartbeat
     job.update_heartbeat()
-    store.update_job(job)
+    await store.aupdate_job(job)
 
     logger.debug(f"💓 Heartbeat atualizado: {job_id}")
 
@@ -434,7 +446,7 @@ async def get_stats(
 ) -> AdminStatsResponse:
     """Estatísticas do sistema."""
     try:
-        stats = store.get_stats()
+        stats = await store.aget_stats()
     except Exception as e:
         logger.error(f"Erro ao obter stats: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Erro ao obter estatísticas: {e}")
@@ -580,7 +592,7 @@ async def prometheus_metrics(
     svc = "audio_normalization"
 
     try:
-        stats = store.get_stats()
+        stats = await store.aget_stats()
     except Exception as e:
         logger.warning(f"Erro ao obter stats: {e}")
         stats = {"by_status": {}, "total_jobs": 0}
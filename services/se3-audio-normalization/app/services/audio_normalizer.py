@@ -9,15 +9,59 @@ import subprocess
 import tempfile
 from pathlib import Path
 from typing import Any, Callable, Awaitable
-from pydub import AudioSegment
-from pydub.effects import normalize, high_pass_filter
 
+import numpy as np
+
+from . import dsp_pool as dsp
 from ..shared.exceptions import AudioNormalizationException
 from ..core.constants import FILE_CONSTANTS
 from common.log_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Equivalente em loudness ao normalize() do pydub usado no modo multi-etapas
+LOUDNORM_FILTER = "loudnorm=I=-16:TP=-1.5:LRA=11"
+# loudnorm reamostra internamente para 192kHz; volta para a taxa do Opus
+OPUS_SAMPLE_RATE = 48000
+
+
+def build_filter_graph(
+    apply_highpass: bool = False,
+    highpass_cutoff_hz: int = 80,
+    to_mono: bool = False,
+    sample_rate: int | None = None,
+    normalize_loudness: bool = False,
+) -> str:
+    """
+    Monta a cadeia de filtros ffmpeg equivalente às etapas do modo multi-etapas.
+
+    Ordem: highpass → downmix → loudnorm → resample, a mesma das etapas
+    individuais (o filtro high-pass do pydub é de 1 polo).
+
+    Args:
+        apply_highpass: Aplicar filtro high-pass
+        highpass_cutoff_hz: Frequência de corte do high-pass
+        to_mono: Converter para mono
+        sample_rate: Sample rate de saída (None = mantém)
+        normalize_loudness: Normalizar volume
+
+    Returns:
+        Filter graph para ``-af`` (string vazia se não houver filtros)
+    """
+    filters: list[str] = []
+    if apply_highpass:
+        filters.append(f"highpass=f={highpass_cutoff_hz}:poles=1")
+    if to_mono:
+        filters.append("aformat=channel_layouts=mono")
+    if normalize_loudness:
+        filters.append(LOUDNORM_FILTER)
+    if sample_rate:
+        filters.append(f"aresample={sample_rate}")
+    elif normalize_loudness:
+        filters.append(f"aresample={OPUS_SAMPLE_RATE}")
+    return ",".join(filters)
+
+
 class AudioNormalizer:
     """Aplica operações de normalização em arquivos de áudio"""
 
@@ -27,6 +71,8 @@ class AudioNormalizer:
         self.noise_reduction_config = config.get('noise_reduction', {})
         self.highpass_config = config.get('highpass_filter', {})
         self.ffmpeg_config = config.get('ffmpeg', {})
+        self.single_pass = config.get('single_pass', True)
+        self.dsp_pool = dsp.get_dsp_pool(config.get('dsp_pool_workers', 0))
 
     async def normalize_audio(
         self,
@@ -61,6 +107,20 @@ class AudioNormalizer:
             logger.info(f"   Operations: noise={remove_noise}, mono={convert_to_mono}, "
                        f"highpass={apply_highpass}, 16k={set_sample_rate_16k}, vocals={isolate_vocals}")
 
+            if self.single_pass:
+                final_path = await self._normalize_single_pass(
+                    input_path,
+                    output_path,
+                    remove_noise=remove_noise,
+                    convert_to_mono=convert_to_mono,
+                    apply_highpass=apply_highpass,
+                    sample_rate=16000 if set_sample_rate_16k else None,
+                    isolate_vocals=isolate_vocals,
+                    progress_callback=progress_callback,
+                )
+                logger.info(f"✅ Normalization completed: {Path(final_path).name}")
+                return final_path
+
             current_file = input_path
             step = 0
             total_steps = sum([
@@ -120,24 +180,171 @@ class AudioNormalizer:
             logger.error(f"❌ Normalization failed: {e}")
             raise AudioNormalizationException(f"Normalization failed: {str(e)}")
 
-    async def _remove_noise(self, input_path: str) -> str:
-        """Remove ruído de fundo do áudio"""
+    async def _normalize_single_pass(
+        self,
+        input_path: str,
+        output_path: str,
+        remove_noise: bool,
+        convert_to_mono: bool,
+        apply_highpass: bool,
+        sample_rate: int | None,
+        isolate_vocals: bool,
+        progress_callback: Callable[[float, str], Awaitable[None]] | None = None,
+    ) -> str:
+        """
+        Normalização compilada: uma leitura e uma escrita por job.
+
+        Highpass, downmix, resample, normalização de volume e encode viram um
+        único filter graph ffmpeg. Etapas NumPy (redução de ruído, isolamento
+        vocal) só rodam quando solicitadas, sobre o array em memória: o áudio
+        é decodificado por pipe e o resultado é enviado por pipe ao encoder,
+        sem WAVs intermediários em ``temp_dir``.
+        """
+        filter_graph = build_filter_graph(
+            apply_highpass=apply_highpass,
+            highpass_cutoff_hz=self.highpass_config.get('cutoff_hz', 80),
+            to_mono=convert_to_mono,
+            sample_rate=sample_rate,
+            normalize_loudness=convert_to_mono or sample_rate is not None,
+        )
+        numpy_stages = remove_noise or isolate_vocals
+        total_steps = 1 + (1 + remove_noise + isolate_vocals if numpy_stages else 0)
+        step = 0
+
+        async def _progress(message: str) -> None:
+            nonlocal step
+            step += 1
+            if progress_callback:
+                await progress_callback(step / total_steps * 100, message)
+
+        samples: np.ndarray | None = None
+        sr = self.noise_reduction_config.get('sample_rate', 22050)
+        if numpy_stages:
+            await _progress("Decoding audio")
+            samples = await self._decode_to_array(input_path, sr)
+            if remove_noise:
+                await _progress("Removing noise")
+                logger.info("🔇 Removing background noise...")
+                samples = await self.dsp_pool.run(dsp.reduce_noise, samples, sr)
+            if isolate_vocals:
+                await _progress("Isolating vocals")
+                logger.info("🎤 Isolating vocals...")
+                samples = await self.dsp_pool.run(dsp.isolate_vocals, samples)
+
+        await _progress("Encoding output")
+        final_path = await self._encode(
+            output_path,
+            filter_graph,
+            input_path=None if samples is not None else input_path,
+            samples=samples,
+            sample_rate=sr,
+        )
+
+        if progress_callback:
+            await progress_callback(100, "Completed")
+        return final_path
+
+    async def _decode_to_array(self, input_path: str, sample_rate: int) -> np.ndarray:
+        """Decodifica o áudio para float32 mono em memória (ffmpeg → pipe)."""
+        cmd = [
+            "ffmpeg", "-nostdin", "-i", input_path,
+            "-vn", "-ac", "1", "-ar", str(sample_rate),
+            "-f", "f32le", "-acodec", "pcm_f32le", "pipe:1",
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
         try:
-            import noisereduce as nr
-            import soundfile as sf
-            import librosa
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=300)
+        except asyncio.TimeoutError:
+            process.kill()
+            raise AudioNormalizationException("Audio decoding timeout")
 
-            logger.info("🔇 Removing background noise...")
+        if process.returncode != 0:
+            error_msg = stderr.decode(errors="replace")
+            logger.error(f"❌ FFmpeg decoding failed: {error_msg[:500]}")
+            raise AudioNormalizationException(f"Audio decoding failed: {error_msg[:200]}")
+
+        samples = np.frombuffer(stdout, dtype=np.float32)
+        logger.info(f"📥 Decoded {len(samples) / sample_rate:.1f}s of audio at {sample_rate}Hz")
+        return samples
+
+    def _encode_command(
+        self,
+        output_path: str,
+        filter_graph: str,
+        input_path: str | None = None,
+        sample_rate: int | None = None,
+    ) -> list[str]:
+        """Comando ffmpeg de encode final, lendo de arquivo ou de pipe (float32 mono)."""
+        if input_path is not None:
+            cmd = ["ffmpeg", "-nostdin", "-i", input_path]
+        else:
+            cmd = ["ffmpeg", "-f", "f32le", "-ar", str(sample_rate), "-ac", "1", "-i", "pipe:0"]
+        if filter_graph:
+            cmd += ["-af", filter_graph]
+        threads = self.ffmpeg_config.get('threads', 0)
+        if threads:
+            cmd += ["-threads", str(threads)]
+        cmd += [
+            "-c:a", self.ffmpeg_config.get('audio_codec', 'libopus'),
+            "-b:a", self.ffmpeg_config.get('audio_bitrate', '128k'),
+            "-vn",
+            "-y",
+            output_path,
+        ]
+        return cmd
+
+    async def _encode(
+        self,
+        output_path: str,
+        filter_graph: str,
+        input_path: str | None = None,
+        samples: np.ndarray | None = None,
+        sample_rate: int | None = None,
+    ) -> str:
+        """Executa o filter graph e o encode em um único processo ffmpeg."""
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        cmd = self._encode_command(output_path, filter_graph, input_path=input_path, sample_rate=sample_rate)
+        logger.info(f"📦 Single-pass encode: -af '{filter_graph or 'none'}' → {Path(output_path).name}")
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE if samples is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        payload = samples.astype(np.float32).tobytes() if samples is not None else None
+        try:
+            _stdout, stderr = await asyncio.wait_for(process.communicate(input=payload), timeout=300)
+        except asyncio.TimeoutError:
+            process.kill()
+            raise AudioNormalizationException("Output conversion timeout")
+
+        if process.returncode != 0:
+            error_msg = stderr.decode(errors="replace")
+            logger.error(f"❌ FFmpeg conversion failed: {error_msg[:500]}")
+            raise AudioNormalizationException(f"Output conversion failed: {error_msg[:200]}")
 
-            # Load audio
-            y, sr = librosa.load(input_path, sr=self.noise_reduction_config.get('sample_rate', 22050))
+        if not Path(output_path).exists():
+            raise AudioNormalizationException("Output file not created")
 
-            # Apply noise reduction
-            y_denoised = nr.reduce_noise(y=y, sr=sr, prop_decrease=0.8)
+        output_size_mb = Path(output_path).stat().st_size / FILE_CONSTANTS.BYTES_PER_MB
+        logger.info(f"✅ Output file created: {Path(output_path).name} ({output_size_mb:.2f}MB)")
+        return output_path
+
+    async def _remove_noise(self, input_path: str) -> str:
+        """Remove ruído de fundo do áudio"""
+        try:
+            logger.info("🔇 Removing background noise...")
 
-            # Save to temp file
             output_path = self.temp_dir / f"denoised_{Path(input_path).stem}.wav"
-            sf.write(str(output_path), y_denoised, sr)
+            await self.dsp_pool.run(
+                dsp.reduce_noise_file,
+                input_path,
+                str(output_path),
+                self.noise_reduction_config.get('sample_rate', 22050),
+            )
 
             logger.info(f"✅ Noise removed: {output_path.name}")
             return str(output_path)
@@ -149,21 +356,17 @@ class AudioNormalizer:
     async def _isolate_vocals(self, input_path: str) -> str:
         """Isola vocais usando separação de fontes"""
         try:
-            import soundfile as sf
-            import librosa
-
             logger.info("🎤 Isolating vocals...")
 
-            # Load audio
-            y, sr = librosa.load(input_path, sr=self.noise_reduction_config.get('sample_rate', 44100))
-
             # Simple vocal isolation using harmonic-percussive separation
             # For better results, you could use Spleeter or Demucs
-            y_harmonic, y_percussive = librosa.effects.hpss(y)
-
-            # Save harmonic component (vocals are mostly harmonic)
             output_path = self.temp_dir / f"vocals_{Path(input_path).stem}.wav"
-            sf.write(str(output_path), y_harmonic, sr)
+            await self.dsp_pool.run(
+                dsp.isolate_vocals_file,
+                input_path,
+                str(output_path),
+                self.noise_reduction_config.get('sample_rate', 44100),
+            )
 
             logger.info(f"✅ Vocals isolated: {output_path.name}")
             return str(output_path)
@@ -177,16 +380,13 @@ class AudioNormalizer:
         try:
             logger.info("📶 Applying highpass filter...")
 
-            # Load with pydub
-            audio = AudioSegment.from_file(input_path)
-
-            # Apply highpass filter
-            cutoff = self.highpass_config.get('cutoff_hz', 80)
-            filtered = high_pass_filter(audio, cutoff)
-
-            # Save to temp file
             output_path = self.temp_dir / f"highpass_{Path(input_path).stem}.wav"
-            filtered.export(str(output_path), format="wav")
+            await self.dsp_pool.run(
+                dsp.highpass_file,
+                input_path,
+                str(output_path),
+                self.highpass_config.get('cutoff_hz', 80),
+            )
 
             logger.info(f"✅ Highpass filter applied: {output_path.name}")
             return str(output_path)
@@ -205,25 +405,10 @@ class AudioNormalizer:
         try:
             logger.info(f"🔄 Converting audio format (mono={to_mono}, sr={sample_rate})")
 
-            # Load audio
-            audio = AudioSegment.from_file(input_path)
-
-            # Convert to mono if requested
-            if to_mono and audio.channels > 1:
-                audio = audio.set_channels(1)
-                logger.info("   └─ Converted to mono")
-
-            # Change sample rate if requested
-            if sample_rate and audio.frame_rate != sample_rate:
-                audio = audio.set_frame_rate(sample_rate)
-                logger.info(f"   └─ Sample rate changed to {sample_rate}Hz")
-
-            # Normalize volume
-            audio = normalize(audio)
-
-            # Save to temp file
             output_path = self.temp_dir / f"converted_{Path(input_path).stem}.wav"
-            audio.export(str(output_path), format="wav")
+            await self.dsp_pool.run(
+                dsp.convert_format_file, input_path, str(output_path), to_mono, sample_rate
+            )
 
             logger.info(f"✅ Format conversion completed: {output_path.name}")
             return str(output_path)
@@ -216,12 +216,14 @@ class AudioProcessor:
         video_extractor: VideoExtractor | None = None,
         chunker: AudioChunker | None = None,
         normalizer: AudioFilters | None = None,
+        result_cache: Any | None = None,
     ) -> None:
         self.config = config
         self.file_ops = file_ops or FileOperations(config)
         self.video_extractor = video_extractor or VideoExtractor(self.file_ops)
         self.chunker = chunker or AudioChunker(config)
         self.normalizer = normalizer or AudioFilters(config)
+        self.result_cache = result_cache  # ResultCache – None desabilita o cache
         self.job_store: IJobStore | None = None
 
     def set_job_store(self, job_store: IJobStore) -> None:
@@ -277,6 +279,7 @@ class AudioProcessor:
             job.file_size_output = output_path.stat().st_size
             job.completed_at = now_brazil()
             self._update_job(job)
+            self._store_in_result_cache(job, output_path)
 
             logger.info(f"✅ Job {job.id} completado: {output_path.name}")
 
@@ -411,8 +414,7 @@ class AudioProcessor:
         output_dir = Path("./data/processed")
         self.file_ops.ensure_dir(output_dir)
 
-        suffix = f"_{job.processing_operations}" if job.processing_operations != "none" else ""
-        output_path = output_dir / f"{job.id}{suffix}.webm"
+        output_path = output_dir / job.output_filename
 
         audio.export(
             str(output_path),
@@ -424,6 +426,15 @@ class AudioProcessor:
         logger.info(f"💾 Arquivo salvo: {output_path.name}")
         return output_path
 
+    def _store_in_result_cache(self, job: AudioNormJob, output_path: Path) -> None:
+        """Guarda o resultado no cache por conteúdo (falhas não afetam o job)."""
+        if self.result_cache is None or not job.result_key:
+            return
+        try:
+            self.result_cache.put(job.result_key, output_path)
+        except Exception as e:
+            logger.warning(f"Falha ao salvar job {job.id} no cache de resultados: {e}")
+
     def _update_job(self, job: AudioNormJob) -> None:
         """Atualiza job no store se disponível."""
         if self.job_store:
@@ -98,7 +98,7 @@ class CleanupService:
 
         # 1. Flush Redis via store abstraction
         try:
-            report["jobs_removed"] = self.job_store.cleanup_all()
+            report["jobs_removed"] = await asyncio.to_thread(self.job_store.cleanup_all)
             report["redis_flushed"] = True
             logger.info(f"✅ Redis FLUSHDB: {report['jobs_removed']} jobs removidos")
         except Exception as e:
@@ -138,7 +138,7 @@ class CleanupService:
 
     async def _cleanup_expired_jobs(self) -> int:
         """Remove jobs expirados do Redis."""
-        return self.job_store.cleanup_expired()
+        return await self.job_store.acleanup_expired()
 
     async def _cleanup_orphaned_files(self, dir_path: Path) -> tuple[int, float]:
         """
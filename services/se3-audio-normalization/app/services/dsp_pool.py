@@ -0,0 +1,197 @@
+"""
+DSP Pool - Executa as etapas CPU-bound de normalização fora do event loop
+Princípio: Single Responsibility
+
+As funções deste módulo são de nível de módulo para poderem ser enviadas
+(pickle) aos processos do pool. Cada uma faz leitura, processamento e escrita
+dentro do processo filho, para não trafegar arrays grandes entre processos.
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+import numpy as np
+
+from common.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Etapas DSP (executadas nos processos do pool)
+# ---------------------------------------------------------------------------
+
+def reduce_noise(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Redução de ruído (noisereduce) sobre um array em memória."""
+    import noisereduce as nr
+
+    return nr.reduce_noise(y=samples, sr=sample_rate, prop_decrease=0.8).astype(np.float32)
+
+
+def isolate_vocals(samples: np.ndarray) -> np.ndarray:
+    """Componente harmônica (HPSS) de um array em memória."""
+    import librosa
+
+    y_harmonic, _y_percussive = librosa.effects.hpss(samples)
+    return y_harmonic.astype(np.float32)
+
+
+def reduce_noise_file(input_path: str, output_path: str, sample_rate: int) -> str:
+    """Carrega, remove ruído e grava WAV."""
+    import librosa
+    import soundfile as sf
+
+    y, sr = librosa.load(input_path, sr=sample_rate)
+    sf.write(output_path, reduce_noise(y, sr), sr)
+    return output_path
+
+
+def isolate_vocals_file(input_path: str, output_path: str, sample_rate: int) -> str:
+    """Carrega, isola vocais e grava WAV."""
+    import librosa
+    import soundfile as sf
+
+    y, sr = librosa.load(input_path, sr=sample_rate)
+    sf.write(output_path, isolate_vocals(y), sr)
+    return output_path
+
+
+def highpass_file(input_path: str, output_path: str, cutoff_hz: int) -> str:
+    """Aplica o filtro high-pass do pydub e grava WAV."""
+    from pydub import AudioSegment
+    from pydub.effects import high_pass_filter
+
+    audio = AudioSegment.from_file(input_path)
+    high_pass_filter(audio, cutoff_hz).export(output_path, format="wav")
+    return output_path
+
+
+def convert_format_file(
+    input_path: str, output_path: str, to_mono: bool, sample_rate: int | None
+) -> str:
+    """Converte canais/sample rate, normaliza volume e grava WAV."""
+    from pydub import AudioSegment
+    from pydub.effects import normalize
+
+    audio = AudioSegment.from_file(input_path)
+    if to_mono and audio.channels > 1:
+        audio = audio.set_channels(1)
+    if sample_rate and audio.frame_rate != sample_rate:
+        audio = audio.set_frame_rate(sample_rate)
+    normalize(audio).export(output_path, format="wav")
+    return output_path
+
+
+# ---------------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------------
+
+class DSPProcessPool:
+    """
+    Pool de processos limitado para as etapas DSP.
+
+    O tamanho do pool é a concorrência de DSP por worker: com N processos,
+    até N etapas (de jobs diferentes ou do mesmo job) rodam em paralelo,
+    cada uma em um core, sem bloquear o event loop.
+
+    Cancelamento: se a coroutine que aguarda uma etapa é cancelada (ex.:
+    timeout do job), a etapa ainda na fila é descartada; se já está rodando,
+    os processos do pool são encerrados e o pool é recriado na próxima
+    chamada, liberando a CPU imediatamente.
+
+    Dentro de processos daemon (workers prefork do Celery) não é possível
+    criar processos filhos; por isso o worker usa ``--pool=threads``
+    (``CELERY_WORKER_POOL``). Se ainda assim rodar em um processo daemon, o
+    pool degrada para threads e registra um erro.
+    """
+
+    def __init__(self, max_workers: int = 0) -> None:
+        """
+        Args:
+            max_workers: Processos do pool (0 = número de CPUs)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def uses_processes(self) -> bool:
+        return not multiprocessing.current_process().daemon
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.uses_processes:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                    logger.info(f"🧮 DSP pool iniciado com {self.max_workers} processos")
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="dsp"
+                    )
+                    logger.error(
+                        f"❌ Processo daemon: DSP pool usando {self.max_workers} threads em vez de processos "
+                        f"(inicie o worker Celery com --pool=threads)"
+                    )
+            return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Executa ``fn(*args)`` no pool e aguarda o resultado.
+
+        Args:
+            fn: Função de nível de módulo (picklable)
+            *args: Argumentos da função
+
+        Returns:
+            Resultado de ``fn``
+        """
+        executor = self._get_executor()
+        future = executor.submit(fn, *args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if not future.cancel():
+                self._terminate(executor)
+            raise
+
+    def _terminate(self, executor: Executor) -> None:
+        """Encerra à força os processos de um pool com etapa cancelada em execução."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        if isinstance(executor, ProcessPoolExecutor):
+            logger.warning("🛑 Etapa DSP cancelada em execução: encerrando processos do pool")
+            processes = list((getattr(executor, "_processes", None) or {}).values())
+            for process in processes:
+                process.terminate()
+        else:
+            logger.warning("🛑 Etapa DSP cancelada; a thread em execução termina em background")
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Encerra o pool (aguarda etapas em execução)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pools: dict[int, DSPProcessPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_dsp_pool(max_workers: int = 0) -> DSPProcessPool:
+    """Pool compartilhado pelo processo (um por tamanho configurado)."""
+    with _pools_lock:
+        pool = _pools.get(max_workers)
+        if pool is None:
+            pool = _pools[max_workers] = DSPProcessPool(max_workers)
+        return pool
@@ -7,6 +7,9 @@ Segue SRP (Single Responsibility Principle).
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import os
+import uuid
 from pathlib import Path
 from typing import Any
 
@@ -36,19 +39,27 @@ logger = get_logger(__name__)
 
 
 class JobValidationResult:
-    """Resultado da validação de job."""
+    """Resultado da validação de job (upload já gravado em arquivo temporário)."""
 
     def __init__(
         self,
-        content: bytes,
+        staged_path: Path,
+        size: int,
         extension: str,
         processing_params: dict[str, Any],
-        original_filename: str | None
+        original_filename: str | None,
+        content_hash: str | None = None
     ) -> None:
-        self.content = content
+        self.staged_path = staged_path
+        self.size = size
         self.extension = extension
         self.processing_params = processing_params
         self.original_filename = original_filename
+        self.content_hash = content_hash
+
+    def discard(self) -> None:
+        """Remove o arquivo temporário (job existente ou falha antes de salvar)."""
+        self.staged_path.unlink(missing_ok=True)
 
 
 class JobCreationService:
@@ -61,15 +72,22 @@ class JobCreationService:
     - Salvar arquivos de forma segura
     """
 
+    # Tamanho dos blocos lidos do upload (hash calculado durante a leitura)
+    READ_CHUNK_SIZE = 1024 * 1024
+    # Subdiretório de upload_dir onde o upload é gravado enquanto chega
+    INCOMING_DIR = ".incoming"
+
     def __init__(
         self,
         job_store: IJobStore,
         upload_dir: Path,
-        max_file_size_mb: int = FILE_CONSTANTS.DEFAULT_MAX_FILE_SIZE_MB
+        max_file_size_mb: int = FILE_CONSTANTS.DEFAULT_MAX_FILE_SIZE_MB,
+        content_addressed: bool = False
     ) -> None:
         self.job_store = job_store
         self.upload_dir = upload_dir
         self.max_file_size_mb = max_file_size_mb
+        self.content_addressed = content_addressed
         self.file_validator = FileValidator()
 
     async def validate_input(
@@ -80,6 +98,12 @@ class JobCreationService:
         """
         Valida entrada do usuário.
 
+        O upload é gravado em disco em blocos de ``READ_CHUNK_SIZE``, com o
+        SHA-256 e o tamanho calculados durante a escrita; a memória usada não
+        depende do tamanho do arquivo. Um upload acima do limite é rejeitado
+        assim que o limite é ultrapassado (ou antes, se o tamanho for
+        conhecido), sem ler o restante.
+
         Args:
             file: Arquivo enviado
             **processing_params_raw: Parâmetros de processamento em string
@@ -91,32 +115,77 @@ class JobCreationService:
             ValidationError: Se validação falhar
             FileTooLargeError: Se arquivo for muito grande
         """
-        # Valida arquivo
+        # Valida arquivo e parâmetros antes de ler o corpo
         extension = self.file_validator.validate_uploaded_file(file, self.max_file_size_mb)
+        processing_params = ProcessingParamsValidator.validate(**processing_params_raw)
 
-        # Lê conteúdo
-        try:
-            content = await file.read()
-        except Exception as e:
-            raise ValidationError(f"Erro ao ler arquivo: {e}", status_code=400)
-
-        # Valida conteúdo
-        self.file_validator.validate_file_content(content, self.max_file_size_mb)
+        # Tamanho declarado já acima do limite: rejeita sem ler
+        max_bytes = self.max_file_size_mb * FILE_CONSTANTS.BYTES_PER_MB
+        if file.size is not None and file.size > max_bytes:
+            raise FileTooLargeError(file.size / FILE_CONSTANTS.BYTES_PER_MB, self.max_file_size_mb)
 
-        # Valida parâmetros
-        processing_params = ProcessingParamsValidator.validate(**processing_params_raw)
+        staged_path, size, content_hash = await self._stage_upload(file, max_bytes)
+        try:
+            self.file_validator.validate_file_size(size, self.max_file_size_mb)
+        except ValidationError:
+            staged_path.unlink(missing_ok=True)
+            raise
 
         return JobValidationResult(
-            content=content,
+            staged_path=staged_path,
+            size=size,
             extension=extension,
             processing_params=processing_params,
-            original_filename=file.filename
+            original_filename=file.filename,
+            content_hash=content_hash
         )
 
+    async def _stage_upload(self, file: UploadFile, max_bytes: int) -> tuple[Path, int, str]:
+        """
+        Grava o upload em ``upload_dir/.incoming`` calculando hash e tamanho.
+
+        Args:
+            file: Arquivo enviado
+            max_bytes: Tamanho máximo permitido em bytes
+
+        Returns:
+            Tupla (caminho temporário, tamanho em bytes, SHA-256)
+
+        Raises:
+            FileTooLargeError: Assim que o limite é ultrapassado
+            ValidationError: Se não conseguir ler ou gravar o arquivo
+        """
+        incoming_dir = self.upload_dir / self.INCOMING_DIR
+        try:
+            incoming_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            raise ValidationError(f"Erro ao criar diretório: {e}", status_code=500)
+
+        staged_path = incoming_dir / f"{uuid.uuid4().hex}.part"
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with open(staged_path, "wb") as out:
+                while chunk := await file.read(self.READ_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise FileTooLargeError(size / FILE_CONSTANTS.BYTES_PER_MB, self.max_file_size_mb)
+                    hasher.update(chunk)
+                    await asyncio.to_thread(out.write, chunk)
+        except ValidationError:
+            staged_path.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            staged_path.unlink(missing_ok=True)
+            raise ValidationError(f"Erro ao ler arquivo: {e}", status_code=400)
+
+        return staged_path, size, hasher.hexdigest()
+
     def create_job_entity(
         self,
         filename: str,
-        processing_params: dict[str, Any]
+        processing_params: dict[str, Any],
+        content_hash: str | None = None
     ) -> AudioNormJob:
         """
         Cria nova entidade Job.
@@ -124,22 +193,25 @@ class JobCreationService:
         Args:
             filename: Nome do arquivo original
             processing_params: Parâmetros de processamento validados
+            content_hash: SHA-256 do arquivo (usado no ID se content_addressed)
 
         Returns:
             Nova instância de Job
         """
         return AudioNormJob.create_new(
             filename=filename,
+            content_hash=content_hash if self.content_addressed else None,
             **processing_params
         )
 
-    def save_file(self, job: AudioNormJob, content: bytes, extension: str) -> Path:
+    def save_file(self, job: AudioNormJob, content: bytes | Path, extension: str) -> Path:
         """
         Salva arquivo de forma segura.
 
         Args:
             job: AudioNormJob associado
-            content: Conteúdo do arquivo
+            content: Conteúdo do arquivo, ou arquivo temporário do upload
+                (movido para o destino, sem cópia)
             extension: Extensão do arquivo
 
         Returns:
@@ -162,8 +234,11 @@ class JobCreationService:
         # Salva arquivo
         file_path = self.upload_dir / f"{safe_job_id}{extension}"
         try:
-            with open(file_path, "wb") as f:
-                f.write(content)
+            if isinstance(content, Path):
+                os.replace(content, file_path)
+            else:
+                with open(file_path, "wb") as f:
+                    f.write(content)
         except Exception as e:
             raise ValidationError(f"Erro ao salvar arquivo: {e}", status_code=500)
 
@@ -180,27 +255,44 @@ class JobSubmissionService:
     - Fallback para processamento direto
     """
 
-    def __init__(self, job_store: IJobStore) -> None:
+    def __init__(
+        self,
+        job_store: IJobStore,
+        result_cache: Any | None = None,
+        processed_dir: Path | None = None,
+    ) -> None:
         self.job_store = job_store
+        self.result_cache = result_cache
+        self.processed_dir = Path(processed_dir or "./data/processed")
 
-    def check_existing_job(self, job: AudioNormJob) -> AudioNormJob | None:
+    async def check_existing_job(self, job: AudioNormJob) -> AudioNormJob | None:
         """
         Verifica se job já existe no cache.
 
+        Jobs com ID por conteúdo também são procurados no cache de
+        resultados: se o job já expirou no Redis mas o arquivo normalizado
+        continua em cache, o job é concluído na hora, sem passar pelo Celery.
+
         Args:
             job: Novo job a ser verificado
 
+        Jobs falhados ou órfãos não são reaproveitados: retorna None para que
+        o chamador salve o novo upload e submeta o job de novo.
+
         Returns:
             Job existente se encontrado, None caso contrário
         """
-        existing = self.job_store.get_job(job.id)
+        existing = await self.job_store.aget_job(job.id)
 
         if not existing:
-            return None
+            return await self._complete_from_result_cache(job)
 
         # Verifica status
         if existing.status == JobStatus.COMPLETED:
             logger.info(f"Job {job.id} já completado - retornando do cache")
+            if existing.output_file and not Path(existing.output_file).exists():
+                # Saída removida pela limpeza: tenta o cache de resultados
+                return await self._complete_from_result_cache(existing)
             return existing
 
         # Verifica se é órfão (processando há muito tempo)
@@ -210,12 +302,8 @@ class JobSubmissionService:
             job_age = now_brazil() - existing.created_at
 
             if job_age > processing_timeout:
-                logger.warning(f"⚠️ Job {job.id} órfão detectado, reprocessando...")
-                existing.status = JobStatus.QUEUED
-                existing.error_message = f"Job órfão detectado após {job_age}, reiniciando"
-                existing.progress = 0.0
-                self.job_store.update_job(existing)
-                return existing
+                logger.warning(f"⚠️ Job {job.id} órfão detectado (idade: {job_age}), reprocessando...")
+                return None
 
             logger.info(f"Job {job.id} em processamento (idade: {job_age})")
             return existing
@@ -223,14 +311,33 @@ class JobSubmissionService:
         # Job falhou - tenta novamente
         if existing.status == JobStatus.FAILED:
             logger.info(f"Reprocessando job falhado: {job.id}")
-            existing.status = JobStatus.QUEUED
-            existing.error_message = None
-            existing.progress = 0.0
-            self.job_store.update_job(existing)
-            return existing
+            return None
 
         return existing
 
+    async def _complete_from_result_cache(self, job: AudioNormJob) -> AudioNormJob | None:
+        """
+        Conclui o job com o resultado em cache, se houver.
+
+        O resultado é materializado no diretório de saída com o mesmo nome que
+        o processador usaria; o job nunca aponta para o arquivo do cache.
+        """
+        if self.result_cache is None or not job.result_key:
+            return None
+
+        output = self.result_cache.materialize(job.result_key, self.processed_dir / job.output_filename)
+        if output is None:
+            return None
+
+        job.output_file = str(output)
+        job.file_size_output = output.stat().st_size
+        job.status = JobStatus.COMPLETED
+        job.progress = 100.0
+        job.completed_at = now_brazil()
+        await self.job_store.asave_job(job)
+        logger.info(f"⚡ Job {job.id} concluído a partir do cache de resultados")
+        return job
+
     async def submit_for_processing(self, job: AudioNormJob) -> None:
         """
         Submete job para processamento.
@@ -283,7 +390,7 @@ class JobRetrievalService:
     def __init__(self, job_store: IJobStore) -> None:
         self.job_store = job_store
 
-    def get_job(self, job_id: str) -> AudioNormJob:
+    async def get_job(self, job_id: str) -> AudioNormJob:
         """
         Recupera job por ID.
 
@@ -297,7 +404,7 @@ class JobRetrievalService:
             JobNotFoundError: Se job não existir
         """
         try:
-            job = self.job_store.get_job(job_id)
+            job = await self.job_store.aget_job(job_id)
         except Exception as e:
             logger.error(f"Erro ao buscar job {job_id}: {e}")
             raise RedisError(f"Erro ao buscar job: {e}")
@@ -307,7 +414,7 @@ class JobRetrievalService:
 
         return job
 
-    def get_job_with_expiration_check(self, job_id: str) -> AudioNormJob:
+    async def get_job_with_expiration_check(self, job_id: str) -> AudioNormJob:
         """
         Recupera job verificando expiração.
 
@@ -321,7 +428,7 @@ class JobRetrievalService:
             JobNotFoundError: Se job não existir
             JobExpiredError: Se job expirou
         """
-        job = self.get_job(job_id)
+        job = await self.get_job(job_id)
 
         if job.is_expired:
             from ..core.exceptions import JobExpiredError
@@ -329,7 +436,7 @@ class JobRetrievalService:
 
         return job
 
-    def list_recent_jobs(self, limit: int = 20) -> list[AudioNormJob]:
+    async def list_recent_jobs(self, limit: int = 20) -> list[AudioNormJob]:
         """
         Lista jobs recentes.
 
@@ -340,7 +447,7 @@ class JobRetrievalService:
             Lista de jobs
         """
         try:
-            return self.job_store.list_jobs(limit)
+            return await self.job_store.alist_jobs(limit)
         except Exception as e:
             logger.error(f"Erro ao listar jobs: {e}")
             raise RedisError(f"Erro ao listar jobs: {e}")
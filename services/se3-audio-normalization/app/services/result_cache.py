@@ -0,0 +1,174 @@
+"""
+Result Cache - Armazena resultados de normalização por conteúdo + operações
+Princípio: Single Responsibility
+
+O cache vive no sistema de arquivos (compartilhado entre API e workers
+Celery): um arquivo por chave, com o mtime como marcador de último acesso.
+Ao passar do orçamento de disco, os resultados menos usados recentemente
+são removidos primeiro.
+
+Jobs nunca apontam para os arquivos do cache: um acerto é materializado
+(hardlink ou cópia) no diretório de saída, então apagar a saída de um job
+não remove o resultado compartilhado.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any
+
+from common.log_utils import get_logger
+
+from ..core.constants import FILE_CONSTANTS
+
+logger = get_logger(__name__)
+
+
+class ResultCache:
+    """
+    Cache LRU de arquivos normalizados, limitado por tamanho em disco.
+
+    Example:
+        >>> cache = ResultCache(Path("./data/cache"), max_size_mb=2048)
+        >>> cache.put(job.result_key, output_path)
+        >>> cache.get(job.result_key)
+        PosixPath('data/cache/3f2a...webm')
+        >>> cache.materialize(job.result_key, Path("./data/processed/abc.webm"))
+        PosixPath('data/processed/abc.webm')
+    """
+
+    def __init__(self, cache_dir: Path, max_size_mb: int = 2048) -> None:
+        """
+        Args:
+            cache_dir: Diretório dos resultados em cache
+            max_size_mb: Orçamento de disco do cache (0 = sem limite)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_mb * FILE_CONSTANTS.BYTES_PER_MB
+        self._lock = threading.Lock()
+
+    def _path(self, key: str, suffix: str = ".webm") -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return self.cache_dir / f"{digest}{suffix}"
+
+    def get(self, key: str) -> Path | None:
+        """
+        Retorna o resultado em cache para a chave, marcando-o como usado.
+
+        Args:
+            key: Chave do resultado (``AudioNormJob.result_key``)
+
+        Returns:
+            Caminho do arquivo em cache, ou None
+        """
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        logger.info(f"🎯 Resultado em cache: {path.name}")
+        return path
+
+    def put(self, key: str, source: Path) -> Path:
+        """
+        Adiciona um resultado ao cache (hardlink quando possível, senão cópia).
+
+        Args:
+            key: Chave do resultado
+            source: Arquivo normalizado
+
+        Returns:
+            Caminho do arquivo em cache
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        target = self._path(key, Path(source).suffix or ".webm")
+        _link_or_copy(Path(source), target)
+        os.utime(target)
+
+        logger.info(f"💾 Resultado adicionado ao cache: {target.name}")
+        self.evict()
+        return target
+
+    def materialize(self, key: str, target: Path) -> Path | None:
+        """
+        Disponibiliza o resultado em cache em ``target`` (hardlink quando possível, senão cópia).
+
+        Args:
+            key: Chave do resultado
+            target: Caminho de saída do job
+
+        Returns:
+            ``target``, ou None se não houver resultado em cache
+        """
+        cached = self.get(key)
+        if cached is None:
+            return None
+        Path(target).parent.mkdir(parents=True, exist_ok=True)
+        try:
+            _link_or_copy(cached, Path(target))
+        except FileNotFoundError:
+            # Removido por LRU entre o get e o link
+            return None
+        return Path(target)
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.cache_dir.glob("*.*"):
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """
+        Remove os resultados menos usados até o cache caber no orçamento.
+
+        Returns:
+            Quantidade de arquivos removidos
+        """
+        if self.max_size_bytes <= 0 or not self.cache_dir.exists():
+            return 0
+
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _mtime, size, _path in entries)
+            removed = 0
+            for _mtime, size, path in entries:
+                if total <= self.max_size_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+
+        if removed:
+            logger.info(f"🧹 Cache de resultados: {removed} arquivo(s) removido(s) por LRU")
+        return removed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Tamanho e ocupação do cache."""
+        entries = self._entries() if self.cache_dir.exists() else []
+        total = sum(size for _mtime, size, _path in entries)
+        return {
+            "entries": len(entries),
+            "size_mb": round(total / FILE_CONSTANTS.BYTES_PER_MB, 2),
+            "max_size_mb": round(self.max_size_bytes / FILE_CONSTANTS.BYTES_PER_MB, 2),
+        }
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Cria ``target`` atomicamente a partir de ``source``."""
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        os.link(source, tmp)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        shutil.copy2(source, tmp)
+    os.replace(tmp, target)
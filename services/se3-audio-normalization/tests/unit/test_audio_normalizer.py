@@ -0,0 +1,130 @@
+"""
+Unit tests for AudioNormalizer single-pass pipeline and the DSP pool.
+"""
+import asyncio
+import operator
+import time
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services import dsp_pool as dsp
+from app.services.audio_normalizer import AudioNormalizer, build_filter_graph
+
+
+@pytest.fixture
+def normalizer(tmp_path):
+    return AudioNormalizer({
+        'temp_dir': str(tmp_path / "temp"),
+        'noise_reduction': {'sample_rate': 22050},
+        'highpass_filter': {'cutoff_hz': 80},
+        'ffmpeg': {'audio_codec': 'libopus', 'audio_bitrate': '128k'},
+        'single_pass': True,
+    })
+
+
+class TestBuildFilterGraph:
+
+    def test_no_operations_yields_empty_graph(self):
+        assert build_filter_graph() == ""
+
+    def test_all_operations_in_pipeline_order(self):
+        graph = build_filter_graph(
+            apply_highpass=True, to_mono=True, sample_rate=16000, normalize_loudness=True
+        )
+        assert graph == (
+            "highpass=f=80:poles=1,aformat=channel_layouts=mono,"
+            "loudnorm=I=-16:TP=-1.5:LRA=11,aresample=16000"
+        )
+
+    def test_loudnorm_without_target_rate_resamples_back(self):
+        graph = build_filter_graph(to_mono=True, normalize_loudness=True)
+        assert graph.endswith("aresample=48000")
+
+
+class TestEncodeCommand:
+
+    def test_file_input(self, normalizer):
+        cmd = normalizer._encode_command("/out/a.webm", "highpass=f=80:poles=1", input_path="/in/a.mp3")
+        assert cmd[:4] == ["ffmpeg", "-nostdin", "-i", "/in/a.mp3"]
+        assert cmd[cmd.index("-af") + 1] == "highpass=f=80:poles=1"
+        assert cmd[-1] == "/out/a.webm"
+
+    def test_pipe_input_without_filters(self, normalizer):
+        cmd = normalizer._encode_command("/out/a.webm", "", sample_rate=22050)
+        assert cmd[:8] == ["ffmpeg", "-f", "f32le", "-ar", "22050", "-ac", "1", "-i"]
+        assert "pipe:0" in cmd
+        assert "-af" not in cmd
+
+
+class TestSinglePass:
+
+    async def test_ffmpeg_only_operations_run_one_process(self, normalizer, tmp_path):
+        encode = AsyncMock(return_value=str(tmp_path / "out.webm"))
+        decode = AsyncMock()
+        with patch.object(normalizer, "_encode", encode), patch.object(normalizer, "_decode_to_array", decode):
+            await normalizer.normalize_audio(
+                "/in/a.mp3", str(tmp_path / "out.webm"),
+                convert_to_mono=True, apply_highpass=True, set_sample_rate_16k=True,
+            )
+
+        decode.assert_not_awaited()
+        encode.assert_awaited_once()
+        assert encode.await_args.kwargs["input_path"] == "/in/a.mp3"
+        assert "aresample=16000" in encode.await_args.args[1]
+        assert not (tmp_path / "temp").exists()
+
+    async def test_numpy_stages_run_in_memory(self, normalizer, tmp_path):
+        samples = np.zeros(22050, dtype=np.float32)
+        encode = AsyncMock(return_value=str(tmp_path / "out.webm"))
+        run = AsyncMock(side_effect=lambda fn, y, sr: y + 1)
+        with patch.object(normalizer, "_encode", encode), \
+                patch.object(normalizer, "_decode_to_array", AsyncMock(return_value=samples)), \
+                patch.object(normalizer.dsp_pool, "run", run):
+            await normalizer.normalize_audio("/in/a.mp3", str(tmp_path / "out.webm"), remove_noise=True)
+
+        run.assert_awaited_once()
+        assert run.await_args.args[0] is dsp.reduce_noise
+        assert encode.await_args.kwargs["input_path"] is None
+        assert np.all(encode.await_args.kwargs["samples"] == 1)
+        assert encode.await_args.kwargs["sample_rate"] == 22050
+
+
+class TestDSPProcessPool:
+
+    async def test_runs_function_in_child_process(self):
+        pool = dsp.DSPProcessPool(max_workers=1)
+        try:
+            assert await pool.run(operator.add, 2, 3) == 5
+        finally:
+            pool.shutdown()
+
+    async def test_cancel_terminates_running_stage(self):
+        pool = dsp.DSPProcessPool(max_workers=1)
+        try:
+            await pool.run(operator.add, 0, 0)  # warm-up: processo já iniciado
+            executor = pool._executor
+            task = asyncio.create_task(pool.run(time.sleep, 30))
+            await asyncio.sleep(0.5)
+
+            started = time.monotonic()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            assert time.monotonic() - started < 5
+            assert pool._executor is None
+            assert not any(p.is_alive() for p in (executor._processes or {}).values())
+            assert await pool.run(operator.add, 1, 1) == 2
+        finally:
+            pool.shutdown()
+
+    async def test_daemon_process_falls_back_to_threads(self):
+        pool = dsp.DSPProcessPool(max_workers=2)
+        with patch.object(dsp.DSPProcessPool, "uses_processes", new=False):
+            try:
+                assert await pool.run(operator.mul, 3, 4) == 12
+                assert isinstance(pool._executor, dsp.ThreadPoolExecutor)
+            finally:
+                pool.shutdown()
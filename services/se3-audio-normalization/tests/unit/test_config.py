@@ -72,3 +72,14 @@ class TestNormalizationSettings:
         """Taxa de amostragem de redução de ruído deve ser positiva"""
         settings = get_settings()
         assert settings.noise_reduction_sample_rate > 0
+
+
+class TestCeleryWorkerPool:
+    """Testes para o pool do worker Celery"""
+
+    def test_default_pool_is_not_prefork(self):
+        """Workers prefork são daemon e não podem criar o pool de processos DSP"""
+        if os.getenv("CELERY_WORKER_POOL"):
+            pytest.skip("CELERY_WORKER_POOL definido no ambiente")
+        from app.infrastructure.celery_config import celery_app
+        assert celery_app.conf.worker_pool == "threads"
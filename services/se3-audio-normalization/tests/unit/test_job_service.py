@@ -29,8 +29,13 @@ from app.core.exceptions import JobNotFoundError, RedisError
 
 @pytest.fixture
 def mock_job_store():
-    """Fixture para mock de job store."""
-    return Mock()
+    """Fixture para mock de job store (API assíncrona)."""
+    store = Mock()
+    store.aget_job = AsyncMock()
+    store.asave_job = AsyncMock()
+    store.aupdate_job = AsyncMock()
+    store.alist_jobs = AsyncMock()
+    return store
 
 
 @pytest.fixture
@@ -85,64 +90,64 @@ class TestJobCreationService:
 class TestJobSubmissionService:
     """Testes para JobSubmissionService."""
 
-    def test_check_existing_job_returns_none_if_not_exists(self, mock_job_store):
+    async def test_check_existing_job_returns_none_if_not_exists(self, mock_job_store):
         """Deve retornar None se job não existe."""
-        mock_job_store.get_job.return_value = None
+        mock_job_store.aget_job.return_value = None
         service = JobSubmissionService(mock_job_store)
 
         new_job = Mock()
         new_job.id = "new_job"
 
-        result = service.check_existing_job(new_job)
+        result = await service.check_existing_job(new_job)
         assert result is None
 
-    def test_check_existing_job_returns_completed_job(self, mock_job_store):
+    async def test_check_existing_job_returns_completed_job(self, mock_job_store):
         """Deve retornar job completado do cache."""
         existing_job = Mock()
         existing_job.status = JobStatus.COMPLETED
         existing_job.created_at = now_brazil()
 
-        mock_job_store.get_job.return_value = existing_job
+        mock_job_store.aget_job.return_value = existing_job
         service = JobSubmissionService(mock_job_store)
 
         new_job = Mock()
         new_job.id = "existing_job"
 
-        result = service.check_existing_job(new_job)
+        result = await service.check_existing_job(new_job)
         assert result == existing_job
 
-    def test_check_existing_job_detects_orphan(self, mock_job_store):
-        """Deve detectar job órfão."""
+    async def test_check_existing_job_detects_orphan(self, mock_job_store):
+        """Job órfão deve ser resubmetido pelo fluxo normal."""
         old_job = Mock()
         old_job.status = JobStatus.PROCESSING
         # Job criado há mais de 30 minutos
         old_job.created_at = now_brazil() - timedelta(minutes=60)
 
-        mock_job_store.get_job.return_value = old_job
+        mock_job_store.aget_job.return_value = old_job
         service = JobSubmissionService(mock_job_store)
 
         new_job = Mock()
         new_job.id = "orphan_job"
 
-        result = service.check_existing_job(new_job)
-        assert result.status == JobStatus.QUEUED
-        mock_job_store.update_job.assert_called_once()
+        result = await service.check_existing_job(new_job)
+        assert result is None
+        mock_job_store.aupdate_job.assert_not_called()
 
-    def test_check_existing_job_restarts_failed_job(self, mock_job_store):
-        """Deve reiniciar job falhado."""
+    async def test_check_existing_job_restarts_failed_job(self, mock_job_store):
+        """Job falhado deve ser resubmetido pelo fluxo normal."""
         failed_job = Mock()
         failed_job.status = JobStatus.FAILED
         failed_job.created_at = now_brazil()
 
-        mock_job_store.get_job.return_value = failed_job
+        mock_job_store.aget_job.return_value = failed_job
         service = JobSubmissionService(mock_job_store)
 
         new_job = Mock()
         new_job.id = "failed_job"
 
-        result = service.check_existing_job(new_job)
-        assert result.status == JobStatus.QUEUED
-        assert result.error_message is None
+        result = await service.check_existing_job(new_job)
+        assert result is None
+        mock_job_store.aupdate_job.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_submit_for_processing_success(self, mock_job_store):
@@ -162,60 +167,60 @@ class TestJobSubmissionService:
 class TestJobRetrievalService:
     """Testes para JobRetrievalService."""
 
-    def test_get_job_success(self, mock_job_store):
+    async def test_get_job_success(self, mock_job_store):
         """Deve retornar job existente."""
         mock_job = Mock()
-        mock_job_store.get_job.return_value = mock_job
+        mock_job_store.aget_job.return_value = mock_job
 
         service = JobRetrievalService(mock_job_store)
-        result = service.get_job("existing_job")
+        result = await service.get_job("existing_job")
 
         assert result == mock_job
-        mock_job_store.get_job.assert_called_once_with("existing_job")
+        mock_job_store.aget_job.assert_called_once_with("existing_job")
 
-    def test_get_job_not_found_raises_error(self, mock_job_store):
+    async def test_get_job_not_found_raises_error(self, mock_job_store):
         """Deve lançar erro se job não encontrado."""
-        mock_job_store.get_job.return_value = None
+        mock_job_store.aget_job.return_value = None
 
         service = JobRetrievalService(mock_job_store)
         with pytest.raises(JobNotFoundError) as exc:
-            service.get_job("missing_job")
+            await service.get_job("missing_job")
         assert "missing_job" in str(exc.value)
 
-    def test_get_job_redis_error_raises_redis_error(self, mock_job_store):
+    async def test_get_job_redis_error_raises_redis_error(self, mock_job_store):
         """Deve lançar RedisError em erro de conexão."""
-        mock_job_store.get_job.side_effect = Exception("Connection refused")
+        mock_job_store.aget_job.side_effect = Exception("Connection refused")
 
         service = JobRetrievalService(mock_job_store)
         with pytest.raises(RedisError):
-            service.get_job("any_job")
+            await service.get_job("any_job")
 
-    def test_get_job_with_expiration_check_expired(self, mock_job_store):
+    async def test_get_job_with_expiration_check_expired(self, mock_job_store):
         """Deve lançar erro se job expirado."""
         mock_job = Mock()
         mock_job.is_expired = True
-        mock_job_store.get_job.return_value = mock_job
+        mock_job_store.aget_job.return_value = mock_job
 
         service = JobRetrievalService(mock_job_store)
         from app.core.exceptions import JobExpiredError
         with pytest.raises(JobExpiredError):
-            service.get_job_with_expiration_check("expired_job")
+            await service.get_job_with_expiration_check("expired_job")
 
-    def test_list_recent_jobs_success(self, mock_job_store):
+    async def test_list_recent_jobs_success(self, mock_job_store):
         """Deve listar jobs recentes."""
         mock_jobs = [Mock(), Mock()]
-        mock_job_store.list_jobs.return_value = mock_jobs
+        mock_job_store.alist_jobs.return_value = mock_jobs
 
         service = JobRetrievalService(mock_job_store)
-        result = service.list_recent_jobs(limit=10)
+        result = await service.list_recent_jobs(limit=10)
 
         assert result == mock_jobs
-        mock_job_store.list_jobs.assert_called_once_with(10)
+        mock_job_store.alist_jobs.assert_called_once_with(10)
 
-    def test_list_recent_jobs_error_raises_redis_error(self, mock_job_store):
+    async def test_list_recent_jobs_error_raises_redis_error(self, mock_job_store):
         """Deve lançar RedisError em erro."""
-        mock_job_store.list_jobs.side_effect = Exception("Connection lost")
+        mock_job_store.alist_jobs.side_effect = Exception("Connection lost")
 
         service = JobRetrievalService(mock_job_store)
         with pytest.raises(RedisError):
-            service.list_recent_jobs()
+            await service.list_recent_jobs()
@@ -0,0 +1,30 @@
+"""
+Unit tests for AudioNormJobStore (API síncrona e assíncrona).
+"""
+from app.core.models import AudioNormJob
+from common.job_utils.models import JobStatus
+
+
+class TestAudioNormJobStore:
+
+    async def test_async_save_is_visible_to_worker_api(self, mock_job_store):
+        job = AudioNormJob.create_new("a.mp3", content_hash="abc")
+
+        await mock_job_store.asave_job(job)
+
+        assert mock_job_store.get_job(job.id).id == job.id
+        assert [j.id for j in await mock_job_store.alist_jobs()] == [job.id]
+
+    async def test_stats_follow_status_changes(self, mock_job_store):
+        job = AudioNormJob.create_new("a.mp3", content_hash="abc")
+        mock_job_store.save_job(job)
+        job.status = JobStatus.COMPLETED
+        await mock_job_store.aupdate_job(job)
+
+        assert await mock_job_store.aget_stats() == {"total_jobs": 1, "by_status": {"completed": 1}}
+
+    async def test_cleanup_all_clears_indexes(self, mock_job_store):
+        await mock_job_store.asave_job(AudioNormJob.create_new("a.mp3", content_hash="abc"))
+
+        assert mock_job_store.cleanup_all() == 1
+        assert mock_job_store.redis.keys("audio_normalization:*") == []
@@ -0,0 +1,141 @@
+"""
+Unit tests for content-addressed jobs and the normalization result cache.
+"""
+import hashlib
+import io
+import os
+import time
+from pathlib import Path
+
+from unittest.mock import AsyncMock, Mock
+from fastapi import UploadFile
+
+from app.core.models import AudioNormJob
+from app.services.job_service import JobCreationService, JobSubmissionService
+from app.services.result_cache import ResultCache
+from common.job_utils.models import JobStatus
+
+
+class TestContentAddressedJobId:
+
+    def test_same_content_and_flags_share_job_id(self):
+        a = AudioNormJob.create_new("a.mp3", content_hash="abc", remove_noise=True)
+        b = AudioNormJob.create_new("b.mp3", content_hash="abc", remove_noise=True)
+        assert a.id == b.id
+        assert a.result_key == "abc:11010"
+
+    def test_different_flags_change_job_id(self):
+        a = AudioNormJob.create_new("a.mp3", content_hash="abc", isolate_vocals=False)
+        b = AudioNormJob.create_new("a.mp3", content_hash="abc", isolate_vocals=True)
+        assert a.id != b.id
+
+    def test_without_hash_ids_are_unique_per_upload(self):
+        a = AudioNormJob.create_new("a.mp3")
+        time.sleep(0.001)
+        b = AudioNormJob.create_new("a.mp3")
+        assert a.id != b.id
+        assert a.result_key is None
+
+
+class TestResultCache:
+
+    def _file(self, tmp_path, name, size):
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        return path
+
+    def test_put_and_get(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache", max_size_mb=1)
+        cached = cache.put("k1", self._file(tmp_path, "out.webm", 10))
+
+        assert cache.get("k1") == cached
+        assert cached.read_bytes() == b"x" * 10
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache", max_size_mb=1)
+        half_mb = 512 * 1024
+        first = cache.put("k1", self._file(tmp_path, "a.webm", half_mb))
+        second = cache.put("k2", self._file(tmp_path, "b.webm", half_mb))
+        os.utime(first, (1, 1))
+        os.utime(second, (2, 2))
+        cache.get("k1")  # k1 passa a ser o mais recente
+
+        cache.put("k3", self._file(tmp_path, "c.webm", half_mb))
+
+        assert cache.get("k1") is not None
+        assert cache.get("k2") is None
+        assert cache.get("k3") is not None
+
+
+class TestSubmissionWithResultCache:
+
+    async def test_upload_is_hashed_while_read(self, tmp_path):
+        service = JobCreationService(Mock(), tmp_path, content_addressed=True)
+        service.file_validator = Mock()
+        upload = UploadFile(file=io.BytesIO(b"audio" * 1000), filename="a.mp3")
+
+        result = await service.validate_input(upload)
+        job = service.create_job_entity("a.mp3", result.processing_params, result.content_hash)
+
+        assert result.content_hash == hashlib.sha256(b"audio" * 1000).hexdigest()
+        assert job.content_hash == result.content_hash
+        assert result.staged_path.read_bytes() == b"audio" * 1000
+        assert result.size == 5000
+
+    async def test_cache_hit_completes_job_without_queueing(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache")
+        job = AudioNormJob.create_new("a.mp3", content_hash="abc")
+        source = tmp_path / "out.webm"
+        source.write_bytes(b"opus")
+        cache.put(job.result_key, source)
+
+        store = Mock(aget_job=AsyncMock(return_value=None), asave_job=AsyncMock())
+        service = JobSubmissionService(store, result_cache=cache, processed_dir=tmp_path / "processed")
+
+        result = await service.check_existing_job(job)
+
+        assert result.status == JobStatus.COMPLETED
+        assert result.file_size_output == 4
+        store.asave_job.assert_awaited_once_with(job)
+
+    async def test_cache_hit_output_is_not_the_cache_entry(self, tmp_path):
+        """Apagar a saída do job (DELETE /jobs/{id}, limpeza) preserva o cache."""
+        cache = ResultCache(tmp_path / "cache")
+        job = AudioNormJob.create_new("a.mp3", content_hash="abc")
+        source = tmp_path / "out.webm"
+        source.write_bytes(b"opus")
+        cache.put(job.result_key, source)
+
+        store = Mock(aget_job=AsyncMock(return_value=None), asave_job=AsyncMock())
+        service = JobSubmissionService(store, result_cache=cache, processed_dir=tmp_path / "processed")
+
+        result = await service.check_existing_job(job)
+        output = Path(result.output_file)
+
+        assert output.parent == tmp_path / "processed"
+        assert output.read_bytes() == b"opus"
+        output.unlink()
+        assert cache.get(job.result_key).read_bytes() == b"opus"
+
+    async def test_cache_hit_output_named_like_processor_output(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache")
+        job = AudioNormJob.create_new(
+            "a.mp3", content_hash="abc", remove_noise=True, convert_to_mono=True, set_sample_rate_16k=False
+        )
+        source = tmp_path / "out.webm"
+        source.write_bytes(b"opus")
+        cache.put(job.result_key, source)
+
+        store = Mock(aget_job=AsyncMock(return_value=None), asave_job=AsyncMock())
+        service = JobSubmissionService(store, result_cache=cache, processed_dir=tmp_path / "processed")
+
+        result = await service.check_existing_job(job)
+
+        assert Path(result.output_file).name == f"{job.id}_noise_reduction_mono_conversion.webm"
+
+    async def test_cache_miss_returns_none(self, tmp_path):
+        store = Mock(aget_job=AsyncMock(return_value=None))
+        service = JobSubmissionService(store, result_cache=ResultCache(tmp_path / "cache"))
+
+        assert await service.check_existing_job(AudioNormJob.create_new("a.mp3", content_hash="abc")) is None
@@ -0,0 +1,81 @@
+"""
+Unit tests for streaming uploads to disk in JobCreationService.
+"""
+import io
+
+import pytest
+from fastapi import UploadFile
+
+from app.core.models import AudioNormJob
+from app.core.validators import FileTooLargeError, ValidationError
+from app.services.job_service import JobCreationService
+
+
+class _CountingReader(io.BytesIO):
+    """BytesIO que conta quantos bytes foram efetivamente lidos."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = JobCreationService(None, tmp_path / "uploads", max_file_size_mb=1)
+    svc.READ_CHUNK_SIZE = 64 * 1024
+    return svc
+
+
+class TestStreamingUpload:
+
+    async def test_upload_is_staged_on_disk(self, service, tmp_path):
+        upload = UploadFile(file=io.BytesIO(b"a" * 200_000), filename="a.mp3")
+
+        result = await service.validate_input(upload)
+
+        assert result.staged_path.parent == tmp_path / "uploads" / ".incoming"
+        assert result.staged_path.stat().st_size == 200_000
+        assert result.size == 200_000
+
+    async def test_oversized_upload_is_rejected_mid_stream(self, service, tmp_path):
+        reader = _CountingReader(b"a" * (3 * 1024 * 1024))
+        upload = UploadFile(file=reader, filename="a.mp3")
+
+        with pytest.raises(FileTooLargeError):
+            await service.validate_input(upload)
+
+        assert reader.bytes_read < 2 * 1024 * 1024
+        assert list((tmp_path / "uploads" / ".incoming").iterdir()) == []
+
+    async def test_declared_size_over_limit_is_rejected_before_reading(self, service):
+        reader = _CountingReader(b"a" * 10)
+        upload = UploadFile(file=reader, filename="a.mp3", size=5 * 1024 * 1024)
+
+        with pytest.raises(FileTooLargeError):
+            await service.validate_input(upload)
+
+        assert reader.bytes_read == 0
+
+    async def test_empty_upload_is_rejected_and_removed(self, service, tmp_path):
+        upload = UploadFile(file=io.BytesIO(b""), filename="a.mp3")
+
+        with pytest.raises(ValidationError):
+            await service.validate_input(upload)
+
+        assert list((tmp_path / "uploads" / ".incoming").iterdir()) == []
+
+    async def test_save_file_moves_staged_upload(self, service, tmp_path):
+        upload = UploadFile(file=io.BytesIO(b"audio"), filename="a.mp3")
+        result = await service.validate_input(upload)
+        job = AudioNormJob.create_new("a.mp3")
+
+        file_path = service.save_file(job, result.staged_path, result.extension)
+
+        assert file_path.parent == tmp_path / "uploads"
+        assert file_path.read_bytes() == b"audio"
+        assert not result.staged_path.exists()
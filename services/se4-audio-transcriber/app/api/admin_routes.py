@@ -81,7 +81,7 @@ async def manual_cleanup(
 )
 async def get_stats(job_store: IJobStore = Depends(job_store)) -> dict[str, Any]:
     """Retrieve transcription service statistics including job counts and disk usage."""
-    stats: dict[str, Any] = job_store.get_stats()
+    stats: dict[str, Any] = await job_store.aget_stats()
 
     upload_path = Path(settings.get('upload_dir', './data/uploads'))
     transcription_path = Path(settings.get('transcription_dir', './data/transcriptions'))
@@ -105,7 +105,7 @@ async def prometheus_metrics(job_store: IJobStore = Depends(job_store)) -> Respo
     svc = "audio_transcriber"
     stats: dict[str, Any] = {}
     try:
-        stats = job_store.get_stats()
+        stats = await job_store.aget_stats()
     except Exception as _e:
         logger.warning("Metrics: failed to get stats: %s", _e)
 
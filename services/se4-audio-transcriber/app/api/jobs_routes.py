@@ -21,7 +21,7 @@ from app.api.schemas import (
 from app.domain.interfaces import IJobStore
 from app.infrastructure.dependencies import get_job_store as _get_job_store_dep, job_store, processor
 from app.shared.exceptions import AudioTranscriptionException, ServiceException
-from app.shared.file_upload_handler import FileUploadHandler, FileUploadError
+from app.shared.file_upload_handler import FileUploadHandler, FileUploadError, FileUploadTooLargeError
 from app.shared.job_creation_service import JobCreationService
 
 if TYPE_CHECKING:
@@ -48,7 +48,7 @@ def submit_processing_task(job: Job, store: Any) -> None:
         logger.error(f"❌ Erro ao enviar job {job.id} para Celery, fallback direto")
 
 
-@router.post("/jobs", summary="Create transcription job", response_model=Job, responses={400: {"description": "Invalid input or language not supported"}, 500: {"description": "Internal server error"}})
+@router.post("/jobs", summary="Create transcription job", response_model=Job, responses={400: {"description": "Invalid input or language not supported"}, 413: {"description": "File too large"}, 500: {"description": "Internal server error"}})
 async def create_transcription_job(
     request: Request,
     background_tasks: BackgroundTasks,
@@ -69,9 +69,14 @@ async def create_transcription_job(
         if language_out == language_in and language_in != "auto":
             logger.warning(f"language_out='{language_out}' igual a language_in='{language_in}', tradução não será aplicada")
 
-    content = await file.read()
-
     upload_handler = FileUploadHandler(settings['upload_dir'])
+    try:
+        staged = await upload_handler.stage_upload(file, settings['max_file_size_mb'] * BYTES_PER_MB)
+    except FileUploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except FileUploadError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     creation_service = JobCreationService(
         job_store=_get_job_store_dep(),
         upload_handler=upload_handler,
@@ -80,7 +85,7 @@ async def create_transcription_job(
 
     try:
         created_job = await creation_service.create_or_resume_job(
-            file_content=content,
+            file_content=staged,
             original_filename=file.filename,
             language_in=language_in,
             language_out=language_out,
@@ -90,7 +95,10 @@ async def create_transcription_job(
         return created_job
 
     except FileUploadError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST if not content else status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    finally:
+        # Job existente (replay) não consome o upload; remove o arquivo temporário.
+        staged.discard()
 
 
 @router.get("/jobs", summary="List jobs", response_model=list[Job])
@@ -99,7 +107,7 @@ async def list_jobs(
     job_store: IJobStore = Depends(job_store),
 ) -> list[Job]:
     """List recent transcription jobs."""
-    return job_store.list_jobs(limit)
+    return await job_store.alist_jobs(limit)
 
 
 @router.get("/jobs/{job_id}", summary="Get job status", response_model=Job, responses={404: {"description": "Job not found"}, 410: {"description": "Job expired"}})
@@ -108,7 +116,7 @@ async def get_job_status(
     job_store: IJobStore = Depends(job_store),
 ) -> Job:
     """Retrieve the current status and details of a transcription job."""
-    job = job_store.get_job(job_id)
+    job = await job_store.aget_job(job_id)
 
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job não encontrado")
@@ -125,7 +133,7 @@ async def download_file(
     job_store: IJobStore = Depends(job_store),
 ) -> FileResponse:
     """Download the transcription output file for a completed job."""
-    job = job_store.get_job(job_id)
+    job = await job_store.aget_job(job_id)
 
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job não encontrado")
@@ -156,7 +164,7 @@ async def get_transcription_text(
     job_store: IJobStore = Depends(job_store),
 ) -> dict[str, Any]:
     """Retrieve the plain text transcription for a completed job."""
-    job = job_store.get_job(job_id)
+    job = await job_store.aget_job(job_id)
 
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job não encontrado")
@@ -175,7 +183,7 @@ async def get_full_transcription(
     job_id: str = PathParam(..., description="ID do job concluido para retorno completo da transcricao.", examples=["at_abc123"]),
     job_store: IJobStore = Depends(job_store),
 ) -> TranscriptionResponse:
-    job = job_store.get_job(job_id)
+    job = await job_store.aget_job(job_id)
 
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job não encontrado")
@@ -219,7 +227,7 @@ async def delete_job(
     job_store: IJobStore = Depends(job_store),
 ) -> dict[str, Any]:
     """Delete a transcription job and its associated files."""
-    job = job_store.get_job(job_id)
+    job = await job_store.aget_job(job_id)
 
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job não encontrado")
@@ -241,7 +249,7 @@ async def delete_job(
                 files_deleted += 1
                 logger.info(f"🗑️ Arquivo de saída removido: {output_path.name}")
 
-        job_store.delete_job(job_id)
+        await job_store.adelete_job(job_id)
         logger.info(f"🗑️ Job {job_id} removido do Redis")
 
         return {
@@ -347,7 +355,7 @@ def _cleanup_job_files(job: Job) -> tuple[list[dict[str, Any]], float, list[str]
     return files_deleted, space_freed, errors
 
 
-def _process_single_orphan(
+async def _process_single_orphan(
     job: Job, mark_as_failed: bool, job_store: IJobStore,
 ) -> dict[str, Any]:
     """Process one orphaned job: delete files and mark/delete the job."""
@@ -362,9 +370,9 @@ def _process_single_orphan(
             job.error_message = f"Job orphaned: stuck in processing for {age_minutes:.1f} minutes (auto-recovery)"
             job.completed_at = now_brazil()
             job.updated_at = now_brazil()
-            job_store.update_job(job)
+            await job_store.aupdate_job(job)
         else:
-            job_store.delete_job(job.id)
+            await job_store.adelete_job(job.id)
     except Exception as e:
         errors.append(f"Failed to {'mark job as failed' if mark_as_failed else 'delete job'}: {str(e)}")
         logger.error(f"Failed to process job {job.id}: {e}", exc_info=True)
@@ -416,7 +424,7 @@ async def cleanup_orphaned_jobs_endpoint(
         space_freed = 0.0
 
         for job in orphaned:
-            result = _process_single_orphan(job, mark_as_failed, job_store)
+            result = await _process_single_orphan(job, mark_as_failed, job_store)
             actions.append(result)
             space_freed += sum(f["size_mb"] for f in result["files_deleted"])
 
@@ -54,11 +54,32 @@ class CoreSettings(BaseServiceSettings):
     whisper_device: str = "cpu"
     whisper_download_root: str = "./data/models"
 
+    # ===== WHISPER - POOL DE MODELOS RESIDENTES =====
+    whisper_pool_max_resident_mb: int = Field(4096, ge=0)  # 0 = sem limite
+    whisper_pool_idle_timeout_minutes: int = Field(30, ge=1)
+    whisper_pool_reaper_interval_seconds: int = Field(60, ge=1)
+
     # ===== WHISPER - CHUNKS (ACELERAÇÃO) =====
     enable_chunking: bool = True
     chunk_length_seconds: int = Field(30, ge=1)
     chunk_overlap_seconds: float = Field(1.0, ge=0.0)
     whisper_min_duration_for_chunks: int = Field(300, ge=0)
+    chunk_parallel_workers: int = Field(1, ge=1)  # réplicas do modelo transcrevendo chunks em paralelo
+    whisper_cpu_threads: int = Field(0, ge=0)  # threads por réplica (0 = padrão do CTranslate2)
+    chunk_checkpoints_enabled: bool = True  # persiste cada chunk e retoma jobs reprocessados
+
+    # ===== WHISPER - VAD (APENAS FALA) =====
+    vad_speech_only: bool = False  # pré-passo VAD: transcreve só as regiões de fala
+    vad_threshold: float = Field(0.5, gt=0.0, lt=1.0)
+    vad_min_silence_ms: int = Field(500, ge=0)
+    vad_speech_pad_ms: int = Field(200, ge=0)
+
+    # ===== WHISPER - BATCH DE JOBS CURTOS =====
+    batch_inference_size: int = Field(8, ge=1)  # janelas por forward pass
+    batch_max_clip_seconds: float = Field(30.0, gt=0)  # jobs maiores seguem individualmente
+    batch_max_jobs: int = Field(16, ge=1)  # jobs por chamada batched
+    enable_job_batching: bool = True  # jobs curtos aguardam o próximo batch no worker
+    batch_collect_seconds: float = Field(2.0, ge=0)  # janela de coleta antes do dispatch
 
     # ===== WHISPER - OTIMIZAÇÕES =====
     whisper_fp16: bool = False
@@ -18,7 +18,7 @@ from .models import (
 )
 
 # Re-export focused job interfaces (ISP split) for backward compatibility.
-from .job_interfaces import IJobRepository, IJobQuery, IJobStore  # noqa: F401
+from .job_interfaces import IAsyncJobRepository, IJobRepository, IJobQuery, IJobStore  # noqa: F401
 
 
 @dataclass
@@ -329,6 +329,7 @@ __all__ = [
     "IStorageManager",
     "IDeviceManager",
     "IJobRepository",
+    "IAsyncJobRepository",
     "IJobQuery",
     "IJobStore",
     "IHealthChecker",
@@ -4,6 +4,8 @@ Focused job interfaces — ISP split of IJobStore.
 IJobRepository: core CRUD for individual jobs (create, read, update, delete).
 IJobQuery:     read-only queries with filtering, aggregation and queue info.
 IJobStore:     composite interface that inherits both + .redis escape hatch.
+IAsyncJobRepository: coroutine variants used by FastAPI handlers, so a slow
+               Redis does not block the event loop.
 
 The composite is kept so existing code importing IJobStore continues to work
 without changes.  New code may type-hint against the narrower sub-interface
@@ -45,6 +47,42 @@ class IJobRepository(ABC, Generic[JobT]):
         pass
 
 
+class IAsyncJobRepository(ABC, Generic[JobT]):
+    """Async CRUD and listing for code running on the event loop."""
+
+    @abstractmethod
+    async def asave_job(self, job: JobT) -> JobT:
+        """Save (create or update) a single job to the store."""
+        pass
+
+    @abstractmethod
+    async def aget_job(self, job_id: str) -> JobT | None:
+        """Load a single job by ID. Returns None when not found."""
+        pass
+
+    @abstractmethod
+    async def aupdate_job(self, job: JobT) -> JobT:
+        """Update an existing job in the store."""
+        pass
+
+    @abstractmethod
+    async def adelete_job(self, job_id: str) -> bool:
+        """Remove a job from the store. Returns True if it existed and was removed."""
+        pass
+
+    @abstractmethod
+    async def alist_jobs(
+        self, limit: int = 100, status: Any | None = None, offset: int = 0  # noqa: ANN003
+    ) -> list[JobT]:
+        """Return a filtered, paginated list of jobs."""
+        pass
+
+    @abstractmethod
+    async def aget_stats(self) -> dict[str, Any]:
+        """Aggregate job counts (total_jobs, by_status)."""
+        pass
+
+
 class IJobQuery(ABC):
     """Read-only queries with filtering and aggregation."""
 
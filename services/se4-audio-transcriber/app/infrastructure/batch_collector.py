@@ -0,0 +1,78 @@
+"""
+Coletor de jobs curtos para transcrição em batch.
+
+Jobs curtos de faster-whisper não são transcritos pela task ``transcribe_audio``:
+ela os coloca numa lista Redis e agenda uma task ``transcribe_batch`` (uma por
+janela de coleta). Quando essa task roda, retira até ``batch_max_jobs`` jobs
+da lista e os transcreve numa única chamada batched do modelo residente.
+
+O agendamento usa um flag ``SET NX`` com TTL: só o primeiro job de uma janela
+agenda o dispatch; o dispatcher libera o flag ao terminar e reagenda a si mesmo
+se ainda houver jobs na lista.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from common.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+PENDING_KEY = "audio_transcriber:batch:pending"
+DISPATCH_KEY = "audio_transcriber:batch:dispatch"
+
+
+class BatchCollector:
+    """Fila Redis de jobs aguardando a próxima transcrição em batch."""
+
+    def __init__(self, redis_client: Any, dispatch_ttl_seconds: int = 600) -> None:
+        """
+        Args:
+            redis_client: Cliente Redis síncrono
+            dispatch_ttl_seconds: Validade do flag de dispatch (protege contra
+                um dispatcher perdido)
+        """
+        self.redis = redis_client
+        self.dispatch_ttl_seconds = dispatch_ttl_seconds
+
+    def offer(self, job_dict: dict[str, Any]) -> bool:
+        """
+        Enfileira um job para o próximo batch.
+
+        Returns:
+            True se o chamador deve agendar o dispatch desta janela
+        """
+        self.redis.rpush(PENDING_KEY, json.dumps(job_dict, default=str))
+        return self.claim_dispatch()
+
+    def claim_dispatch(self) -> bool:
+        """Reserva o agendamento do dispatch; False se já há um agendado."""
+        return bool(self.redis.set(DISPATCH_KEY, "1", nx=True, ex=self.dispatch_ttl_seconds))
+
+    def take(self, max_jobs: int) -> list[dict[str, Any]]:
+        """Retira até ``max_jobs`` jobs da lista, na ordem de chegada."""
+        job_dicts = []
+        for _ in range(max_jobs):
+            raw = self.redis.lpop(PENDING_KEY)
+            if raw is None:
+                break
+            try:
+                job_dicts.append(json.loads(raw))
+            except (TypeError, ValueError) as e:
+                logger.error(f"❌ Job inválido na fila de batch descartado: {e}")
+        return job_dicts
+
+    def finish_dispatch(self) -> bool:
+        """
+        Libera o flag de dispatch.
+
+        Returns:
+            True se ainda há jobs na lista e o chamador deve agendar outro dispatch
+        """
+        self.redis.delete(DISPATCH_KEY)
+        return self.pending() > 0 and self.claim_dispatch()
+
+    def pending(self) -> int:
+        """Jobs aguardando batch."""
+        return int(self.redis.llen(PENDING_KEY) or 0)
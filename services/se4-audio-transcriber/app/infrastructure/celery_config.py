@@ -15,6 +15,7 @@ celery_app = create_celery_app(
     task_default_queue="audio_transcriber_queue",
     task_routes={
         "transcribe_audio": {"queue": "audio_transcriber_queue"},
+        "transcribe_batch": {"queue": "audio_transcriber_queue"},
         "cleanup_expired_jobs": {"queue": "audio_transcriber_queue"},
         "cleanup_orphan_jobs": {"queue": "audio_transcriber_queue"},
     },
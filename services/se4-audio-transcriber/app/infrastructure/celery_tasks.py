@@ -11,6 +11,7 @@ from celery import signals
 from ..domain.models import Job, JobStatus
 from ..services.processor import TranscriptionProcessor
 from ..infrastructure.redis_store import RedisJobStore
+from .batch_collector import BatchCollector
 from .celery_config import celery_app
 from common.log_utils import get_logger
 
@@ -92,6 +93,10 @@ class TranscriptionTask(Task):
                 self._processor.job_store = self._job_store
         return self._job_store
 
+    @property
+    def batch_collector(self) -> BatchCollector:
+        return BatchCollector(self.job_store.redis)
+
 def _reconstruct_job(job_dict: dict[str, Any], job_id: str) -> Job | None:
     """Reconstruct a Job from a serialized dict. Returns None and marks FAILED on error."""
     from pydantic import ValidationError
@@ -171,6 +176,10 @@ def transcribe_audio_task(self, job_dict: dict[str, Any]) -> None:
         job = _reconstruct_job(job_dict, job_id)
         if job is None:
             raise Ignore()
+
+        if self.processor.is_batchable(job):
+            _offer_to_batch(self.batch_collector, job)
+            return None
         
         job.status = JobStatus.PROCESSING
         job.started_at = now_brazil()
@@ -218,6 +227,76 @@ def transcribe_audio_task(self, job_dict: dict[str, Any]) -> None:
         
         raise Ignore()
 
+def _offer_to_batch(collector: BatchCollector, job: Job) -> None:
+    """Coloca o job na fila de batch e agenda o dispatch da janela, se ainda não agendado."""
+    from ..core.config import get_settings
+
+    if collector.offer(job.model_dump(mode="json")):
+        countdown = float(get_settings().get('batch_collect_seconds', 2.0))
+        transcribe_batch_task.apply_async(countdown=countdown)
+    logger.info(f"📦 Job {job.id} aguardando transcrição em batch ({collector.pending()} na fila)")
+
+
+@celery_app.task(
+    bind=True,
+    base=TranscriptionTask,
+    name='transcribe_batch',
+    soft_time_limit=2700,  # 45 minutos
+    time_limit=3600  # 60 minutos
+)
+def transcribe_batch_task(self) -> dict[str, Any]:
+    """
+    Dispatcher de batch: transcreve os jobs curtos coletados por transcribe_audio_task.
+
+    Retira até ``batch_max_jobs`` jobs da fila Redis, transcreve-os em chamadas
+    batched do modelo residente e reagenda a si mesmo se ainda houver jobs.
+    """
+    from celery.exceptions import SoftTimeLimitExceeded
+    from ..core.config import get_settings
+
+    collector = self.batch_collector
+    jobs: list[Job] = []
+    try:
+        for job_dict in collector.take(int(get_settings().get('batch_max_jobs', 16))):
+            job = _reconstruct_job(job_dict, job_dict.get('id', 'unknown'))
+            if job is None:
+                continue
+            job.status = JobStatus.PROCESSING
+            job.started_at = now_brazil()
+            job.updated_at = now_brazil()
+            job.progress = 0.0
+            self.job_store.update_job(job)
+            jobs.append(job)
+
+        if jobs:
+            logger.info(f"📦 Transcrevendo batch de {len(jobs)} jobs")
+            self.processor.transcribe_batch(jobs)
+            for job in jobs:
+                self.job_store.update_job(job)
+                logger.info(f"✅ Job {job.id} concluído: {job.status}")
+
+    except SoftTimeLimitExceeded:
+        logger.error(f"⏰ Batch de {len(jobs)} jobs excedeu soft time limit")
+        for job in jobs:
+            if job.status != JobStatus.COMPLETED:
+                _mark_job_failed(job, "Transcrição excedeu o tempo limite (45 minutos)", self.job_store)
+
+    except Exception as e:
+        logger.error(f"💥 Erro ao processar batch: {e}")
+        for job in jobs:
+            if job.status != JobStatus.COMPLETED:
+                _mark_job_failed(job, str(e), self.job_store)
+
+    finally:
+        if collector.finish_dispatch():
+            transcribe_batch_task.apply_async()
+
+    return {
+        "status": "completed",
+        "jobs": len(jobs),
+        "completed": sum(1 for job in jobs if job.status == JobStatus.COMPLETED),
+    }
+
 @celery_app.task(name='cleanup_expired_jobs')
 def cleanup_expired_jobs_task() -> dict[str, Any]:
     logger.info("Executando limpeza de jobs expirados")
@@ -249,7 +328,11 @@ def cleanup_orphan_jobs_task() -> dict[str, Any]:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
     
-    stats = loop.run_until_complete(cleaner.cleanup_orphans())
+    try:
+        stats = loop.run_until_complete(cleaner.cleanup_orphans())
+    finally:
+        # Store criado por task: fecha o pool assíncrono para não vazar conexões
+        loop.run_until_complete(store.aclose())
     
     logger.info(
         f"✅ Limpeza de órfãos concluída: {stats['orphans_found']} órfãos, "
@@ -19,6 +19,8 @@ from common.log_utils import get_logger
 
 logger = get_logger(__name__)
 
+CHECKPOINT_TTL_SECONDS = 86400
+
 class TranscriptionStage(str, Enum):
     """Estágios de processamento de transcrição"""
     PREPROCESSING = "preprocessing"  # Normalização, conversão de formato
@@ -78,6 +80,10 @@ class CheckpointManager:
     def _checkpoint_key(self, job_id: str) -> str:
         """Gera chave Redis para checkpoint"""
         return f"checkpoint:{job_id}"
+
+    def _chunks_key(self, job_id: str) -> str:
+        """Gera chave Redis (hash) com os resultados por chunk"""
+        return f"checkpoint_chunks:{job_id}"
     
     async def save_checkpoint(
         self,
@@ -99,6 +105,20 @@ class CheckpointManager:
             segments_completed: Número de segmentos transcritos
             metadata: Dados adicionais (texto parcial, timestamps, etc)
         """
+        self._write_checkpoint(
+            job_id, stage, processed_seconds, total_seconds, segments_completed, metadata
+        )
+
+    def _write_checkpoint(
+        self,
+        job_id: str,
+        stage: TranscriptionStage,
+        processed_seconds: float,
+        total_seconds: float,
+        segments_completed: int,
+        metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Versão síncrona de ``save_checkpoint`` (usada pelas threads de transcrição)."""
         progress = processed_seconds / total_seconds if total_seconds > 0 else 0.0
         
         checkpoint = CheckpointData(
@@ -116,7 +136,7 @@ class CheckpointManager:
         data = json.dumps(checkpoint.to_dict())
         
         # TTL de 24 horas (mesma do job)
-        self.redis_store.redis.setex(key, 86400, data)
+        self.redis_store.redis.setex(key, CHECKPOINT_TTL_SECONDS, data)
         
         logger.info(
             f"💾 Checkpoint saved for job {job_id}: "
@@ -180,8 +200,82 @@ class CheckpointManager:
         """
         key = self._checkpoint_key(job_id)
         self.redis_store.redis.delete(key)
+        self.redis_store.redis.delete(self._chunks_key(job_id))
         logger.info(f"🗑️  Checkpoint deleted for job {job_id}")
     
+    def save_chunk_result(
+        self,
+        job_id: str,
+        plan_id: str,
+        index: int,
+        result: dict[str, Any],
+        total_chunks: int,
+        processed_seconds: float,
+        total_seconds: float,
+    ) -> None:
+        """
+        Persiste o resultado de um chunk transcrito.
+
+        Os resultados ficam num hash Redis (um campo por chunk) e o checkpoint
+        do job é atualizado para TRANSCRIBING com o progresso acumulado.
+
+        Args:
+            job_id: ID do job
+            plan_id: Identificador do plano de chunks (muda se o chunking mudar)
+            index: Índice do chunk
+            result: Resultado do chunk (``text`` e ``segments`` relativos ao chunk)
+            total_chunks: Total de chunks do plano
+            processed_seconds: Segundos de áudio já transcritos
+            total_seconds: Total de segundos
+        """
+        key = self._chunks_key(job_id)
+        payload = json.dumps({"plan_id": plan_id, "result": result}, default=str)
+
+        redis = self.redis_store.redis
+        redis.hset(key, str(index), payload)
+        redis.expire(key, CHECKPOINT_TTL_SECONDS)
+
+        completed = redis.hlen(key)
+        self._write_checkpoint(
+            job_id,
+            TranscriptionStage.TRANSCRIBING,
+            processed_seconds,
+            total_seconds,
+            segments_completed=completed,
+            metadata={"plan_id": plan_id, "chunks_completed": completed, "total_chunks": total_chunks},
+        )
+
+    def get_chunk_results(self, job_id: str, plan_id: str) -> dict[int, dict[str, Any]]:
+        """
+        Recupera os resultados de chunks já transcritos para o plano informado.
+
+        Resultados de outro plano (ex.: chunk_length alterado entre tentativas)
+        são ignorados, pois os índices não correspondem mais ao mesmo áudio.
+
+        Args:
+            job_id: ID do job
+            plan_id: Identificador do plano de chunks atual
+
+        Returns:
+            Dicionário índice do chunk -> resultado
+        """
+        raw = self.redis_store.redis.hgetall(self._chunks_key(job_id)) or {}
+
+        results: dict[int, dict[str, Any]] = {}
+        for field, value in raw.items():
+            try:
+                index = int(field.decode("utf-8") if isinstance(field, bytes) else field)
+                entry = json.loads(value)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"⚠️ Chunk checkpoint inválido para job {job_id}: {e}")
+                continue
+            if entry.get("plan_id") == plan_id:
+                results[index] = entry["result"]
+
+        if raw and not results:
+            logger.info(f"♻️  Checkpoint de chunks do job {job_id} é de outro plano, ignorando")
+        return results
+
     def list_checkpoints(self) -> list[str]:
         """
         Lista todos os job_ids com checkpoints ativos.
@@ -8,27 +8,52 @@ import os
 from datetime import timedelta
 from typing import Any
 
-from common.redis_utils import ResilientRedisStore
+from common.redis_utils import AsyncResilientRedisStore, ResilientRedisStore
 from common.log_utils import get_logger
 from common.datetime_utils import now_brazil
+from common.job_utils.async_store import AsyncJobRedisStore
+from common.job_utils.store import JobRedisStore
 
-from app.domain.interfaces import IJobStore
+from app.domain.interfaces import IAsyncJobRepository, IJobStore
 from app.domain.models import AudioTranscriptionJob, JobStatus
 
 logger = get_logger(__name__)
 
+# Status considerados na busca por jobs órfãos
+_ORPHAN_STATUSES = (JobStatus.PROCESSING, JobStatus.QUEUED)
+
+
+class RedisJobStore(IJobStore[AudioTranscriptionJob], IAsyncJobRepository[AudioTranscriptionJob]):
+    """
+    Store de jobs de transcrição sobre o JobRedisStore comum.
+
+    Os métodos ``a*`` usam a variante asyncio (mesmas chaves e índices por
+    status) e são os usados pelas rotas FastAPI; os síncronos ficam para o
+    worker Celery.
+    """
 
-class RedisJobStore(IJobStore[AudioTranscriptionJob]):
     def __init__(self, redis_url: str = "redis://localhost:6379/0"):
+        store_options: dict[str, Any] = dict(
+            service_name="audio_transcriber",
+            ttl_hours=int(os.getenv("CACHE_TTL_HOURS", "24")),
+            job_model=AudioTranscriptionJob,
+        )
         self._resilient = ResilientRedisStore(
             redis_url=redis_url,
             max_connections=50,
             circuit_breaker_enabled=True,
         )
+        self._store = JobRedisStore(redis_store=self._resilient, **store_options)
+        self._async_resilient = AsyncResilientRedisStore(
+            redis_url=redis_url,
+            max_connections=50,
+            circuit_breaker_enabled=True,
+        )
+        self._async_store = AsyncJobRedisStore(redis_store=self._async_resilient, **store_options)
         self._redis_client = self._resilient.redis
-        self.ttl_seconds = int(os.getenv("CACHE_TTL_HOURS", "24")) * 3600
-        self.key_prefix = "audio_transcriber:job:"
-        self.list_key = "audio_transcriber:jobs:list"
+        self.ttl_seconds = self._store.ttl_seconds
+        self.key_prefix = self._store.key_prefix
+        self.list_key = self._store.list_key
         self.queue_key = os.getenv("CELERY_DEFAULT_QUEUE", "audio_transcriber_queue")
         self._cleanup_task: asyncio.Task[None] | None = None
 
@@ -37,6 +62,10 @@ class RedisJobStore(IJobStore[AudioTranscriptionJob]):
         """Retorna o cliente Redis subjacente (usado por health/metrics/cleanup)."""
         return self._redis_client
 
+    @redis.setter
+    def redis(self, client: Any) -> None:
+        self._redis_client = client
+
     @property
     def _raw_redis(self) -> Any:
         return self.redis.redis if hasattr(self.redis, "redis") else self.redis
@@ -44,32 +73,29 @@ class RedisJobStore(IJobStore[AudioTranscriptionJob]):
     def _job_key(self, job_id: str) -> str:
         return f"{self.key_prefix}{job_id}"
 
-    def save_job(self, job: AudioTranscriptionJob) -> AudioTranscriptionJob:
+    @staticmethod
+    def _touch(job: AudioTranscriptionJob) -> None:
         if hasattr(job, "updated_at"):
             job.updated_at = now_brazil()
-        data = job.model_dump_json()
-        key = self._job_key(job.id)
-        self._raw_redis.setex(key, self.ttl_seconds, data)
-        created_at = job.created_at if job.created_at else now_brazil()
-        self._raw_redis.zadd(self.list_key, {job.id: created_at.timestamp()})
+
+    @staticmethod
+    def _is_orphaned(job: AudioTranscriptionJob, now: Any, threshold: timedelta) -> bool:
+        reference_time = job.started_at or job.updated_at or job.created_at
+        return bool(reference_time) and (now - reference_time) > threshold
+
+    def save_job(self, job: AudioTranscriptionJob) -> AudioTranscriptionJob:
+        self._touch(job)
+        self._store.save_job(job)
         return job
 
     def get_job(self, job_id: str) -> AudioTranscriptionJob | None:
-        data = self._raw_redis.get(self._job_key(job_id))
-        if not data:
-            return None
-        try:
-            return AudioTranscriptionJob.model_validate_json(data)
-        except Exception as exc:
-            logger.error("Error deserializing job %s: %s", job_id, exc)
-            return None
+        return self._store.get_job(job_id)
 
     def update_job(self, job: AudioTranscriptionJob) -> AudioTranscriptionJob:
         return self.save_job(job)
 
     def delete_job(self, job_id: str) -> bool:
-        self._raw_redis.zrem(self.list_key, job_id)
-        return self._raw_redis.delete(self._job_key(job_id)) > 0
+        return self._store.delete_job(job_id)
 
     def list_jobs(
         self,
@@ -77,53 +103,56 @@ class RedisJobStore(IJobStore[AudioTranscriptionJob]):
         status: JobStatus | None = None,
         offset: int = 0,
     ) -> list[AudioTranscriptionJob]:
-        all_ids = self._raw_redis.zrevrange(self.list_key, 0, -1)
-        jobs = []
-        for jid in all_ids:
-            job = self.get_job(str(jid))
-            if job:
-                if status is not None and job.status != status:
-                    continue
-                jobs.append(job)
-            if len(jobs) >= (offset + limit):
-                break
-        return jobs[offset: offset + limit]
+        return self._store.list_jobs(status=status, limit=limit, offset=offset)
 
     def get_stats(self) -> dict[str, Any]:
-        all_ids = self._raw_redis.zrevrange(self.list_key, 0, -1)
-        total = len(all_ids)
-        by_status = {}
-        for jid in all_ids:
-            job = self.get_job(str(jid))
-            if job:
-                s = job.status.value if hasattr(job.status, 'value') else str(job.status)
-                by_status[s] = by_status.get(s, 0) + 1
-        return {"total_jobs": total, "by_status": by_status}
+        return self._store.get_stats()
 
     def cleanup_expired(self) -> int:
-        all_ids = self._raw_redis.zrevrange(self.list_key, 0, -1)
-        removed = 0
-        for jid in all_ids:
-            job = self.get_job(str(jid))
-            if job and job.is_expired:
-                self.delete_job(job.id)
-                removed += 1
-        return removed
+        return self._store.cleanup_expired()
 
     async def find_orphaned_jobs(self, max_age_minutes: int = 30) -> list[AudioTranscriptionJob]:
         now = now_brazil()
         threshold = timedelta(minutes=max_age_minutes)
         orphaned: list[AudioTranscriptionJob] = []
+        for status in _ORPHAN_STATUSES:
+            async for job in self._async_store.iter_jobs(status=status, include_blobs=False):
+                if self._is_orphaned(job, now, threshold):
+                    orphaned.append(job)
+        return orphaned
+
+    # -- API assíncrona ----------------------------------------------------
 
-        for job in self.list_jobs(limit=5000):
-            if job.status not in (JobStatus.PROCESSING, JobStatus.QUEUED):
-                continue
+    async def asave_job(self, job: AudioTranscriptionJob) -> AudioTranscriptionJob:
+        self._touch(job)
+        await self._async_store.save_job(job)
+        return job
 
-            reference_time = job.started_at or job.updated_at or job.created_at
-            if reference_time and (now - reference_time) > threshold:
-                orphaned.append(job)
+    async def aget_job(self, job_id: str) -> AudioTranscriptionJob | None:
+        return await self._async_store.get_job(job_id)
 
-        return orphaned
+    async def aupdate_job(self, job: AudioTranscriptionJob) -> AudioTranscriptionJob:
+        return await self.asave_job(job)
+
+    async def adelete_job(self, job_id: str) -> bool:
+        return await self._async_store.delete_job(job_id)
+
+    async def alist_jobs(
+        self,
+        limit: int = 100,
+        status: JobStatus | None = None,
+        offset: int = 0,
+    ) -> list[AudioTranscriptionJob]:
+        return await self._async_store.list_jobs(status=status, limit=limit, offset=offset)
+
+    async def aget_stats(self) -> dict[str, Any]:
+        return await self._async_store.get_stats()
+
+    async def acleanup_expired(self) -> int:
+        return await self._async_store.cleanup_expired()
+
+    async def aclose(self) -> None:
+        await self._async_resilient.close()
 
     async def get_queue_info(self) -> dict[str, Any]:
         queue_length = self._raw_redis.llen(self.queue_key)
@@ -153,7 +182,7 @@ class RedisJobStore(IJobStore[AudioTranscriptionJob]):
         interval_minutes = int(os.getenv("CACHE_CLEANUP_INTERVAL_MINUTES", "30"))
         while True:
             try:
-                removed = self.cleanup_expired()
+                removed = await self.acleanup_expired()
                 if removed:
                     logger.info("🧹 Cleanup automático removeu %s jobs expirados", removed)
             except Exception as exc:
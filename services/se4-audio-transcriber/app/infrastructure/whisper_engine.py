@@ -9,6 +9,7 @@ lógica de transcrição em uma única classe bem definida.
 """
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 from pathlib import Path
@@ -305,6 +306,61 @@ class WhisperEngine(TranscriptionEngine):
             logger.error(f"Erro na transcrição: {e}")
             raise AudioTranscriptionException(f"Falha na transcrição: {str(e)}")
 
+    async def transcribe_batch(
+        self,
+        clips: list[Any],
+        language: str | None = None,
+        task: str = "transcribe",
+        batch_size: int = 8,
+    ) -> list[TranscriptionResult]:
+        """
+        Transcreve vários clips curtos em passes batched do mesmo modelo.
+
+        Args:
+            clips: Áudios mono float32 a 16 kHz (um por job)
+            language: Código do idioma comum aos clips ou None para detectar por clip
+            task: 'transcribe' ou 'translate'
+            batch_size: Janelas decodificadas por forward pass
+
+        Returns:
+            Um TranscriptionResult por clip, na ordem de entrada
+        """
+        from ..shared.batched_inference import transcribe_clips_batched
+
+        if not self.is_loaded():
+            self.load_model()
+
+        self._last_used_at = now_brazil()
+
+        try:
+            start_time = time.time()
+            beam_size = int(os.getenv("WHISPER_BEAM_SIZE", "5"))
+            raw_results = await asyncio.to_thread(
+                transcribe_clips_batched,
+                self._model,
+                clips,
+                language=language if language != "auto" else None,
+                task=task,
+                batch_size=batch_size,
+                beam_size=beam_size,
+            )
+            processing_time = time.time() - start_time
+            logger.info(f"Batch de {len(clips)} clips transcrito em {processing_time:.2f}s")
+        except Exception as e:
+            logger.error(f"Erro na transcrição em batch: {e}")
+            raise AudioTranscriptionException(f"Falha na transcrição em batch: {str(e)}")
+
+        return [
+            TranscriptionResult(
+                text=result["text"],
+                segments=result["segments"],
+                language=result["language"],
+                processing_time=processing_time / len(clips),
+                word_timestamps=any(len(s.get("words", [])) > 0 for s in result["segments"]),
+            )
+            for result in raw_results
+        ]
+
     def __del__(self) -> None:
         """Destructor para garantir cleanup."""
         try:
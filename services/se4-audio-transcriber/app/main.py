@@ -39,6 +39,7 @@ async def lifespan(app: Any) -> Any:
     try:
         store = job_store()
         await store.stop_cleanup_task()
+        await store.aclose()
         logger.info("Audio Transcription Service stopped")
     except Exception as e:
         logger.error("Error during shutdown: %s", e)
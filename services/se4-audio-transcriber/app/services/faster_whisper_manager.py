@@ -47,6 +47,8 @@ ado
         self.settings = get_settings()
         self.model_dir = model_dir or Path(self.settings.get('whisper_download_root', './models'))
         self.model_name = self.settings.get('whisper_model', 'base')
+        # Threads de inferência por instância (0 = padrão do CTranslate2)
+        self.cpu_threads = int(self.settings.get('whisper_cpu_threads', 0))
         
         self.model: WhisperModel | None = None
         self.device: str | None = None
@@ -89,6 +91,7 @@ ado
                     device=device,
                     compute_type=compute_type,
                     download_root=str(self.model_dir),
+                    cpu_threads=self.cpu_threads,
                 )
                 self.is_loaded = True
                 cb.record_success(service_name)
@@ -225,7 +228,7 @@ ado
         """Build kwargs dict for faster-whisper transcribe call."""
         transcribe_kwargs: dict[str, Any] = {
             "word_timestamps": True,
-            "vad_filter": False,
+            "vad_filter": bool(self.settings.get('vad_speech_only', False)),
             "task": task,
             "beam_size": int(self.settings.get('whisper_beam_size', 5)),
             "best_of": int(self.settings.get('whisper_best_of', 5)),
@@ -259,6 +262,48 @@ ado
             full_text.append(segment.text)
         return segments, full_text
 
+    def transcribe_batch(
+        self,
+        audio_paths: list[Path],
+        language: str = "auto",
+        task: str = "transcribe",
+        batch_size: int = 8,
+    ) -> list[dict[str, Any]]:
+        """
+        Transcreve vários arquivos curtos em passes batched do mesmo modelo.
+
+        Args:
+            audio_paths: Arquivos de áudio (idealmente até 30s cada)
+            language: Código do idioma comum ou 'auto' para detectar por arquivo
+            task: 'transcribe' ou 'translate'
+            batch_size: Janelas decodificadas por forward pass
+
+        Returns:
+            Um resultado por arquivo, no mesmo formato de transcribe()
+        """
+        from faster_whisper import decode_audio
+        from ..shared.batched_inference import SAMPLE_RATE, transcribe_clips_batched
+
+        if not self.is_loaded:
+            self.load_model()
+
+        try:
+            clips = [decode_audio(str(path), sampling_rate=SAMPLE_RATE) for path in audio_paths]
+            results = transcribe_clips_batched(
+                self.model,
+                clips,
+                language=None if language == "auto" else language,
+                task=task,
+                batch_size=batch_size,
+                beam_size=int(self.settings.get('whisper_beam_size', 5)),
+            )
+        except Exception as e:
+            logger.exception(f"❌ Erro na transcrição em batch: {e}")
+            raise AudioTranscriptionException(f"Falha na transcrição em batch: {e}") from e
+
+        logger.info(f"✅ Faster-Whisper batch: {len(results)} arquivos")
+        return results
+
     def transcribe(self, audio_path: Path, language: str = "auto", task: str = "transcribe", **kwargs: Any) -> dict[str, Any]:
         """
         Transcreve áudio usando Faster-Whisper com word timestamps e circuit breaker.
@@ -299,6 +344,15 @@ ado
                 "language": info.language if hasattr(info, 'language') else language,
                 "duration": info.duration if hasattr(info, 'duration') else 0.0,
             }
+
+            if transcribe_kwargs.get("vad_filter") and getattr(info, 'duration_after_vad', None) is not None:
+                skipped = max(info.duration - info.duration_after_vad, 0.0)
+                result["speech_detection"] = {
+                    "total_seconds": round(info.duration, 3),
+                    "speech_seconds": round(info.duration_after_vad, 3),
+                    "skipped_seconds": round(skipped, 3),
+                    "skipped_ratio": round(skipped / info.duration, 4) if info.duration else 0.0,
+                }
             
             logger.info(
                 f"✅ Faster-Whisper transcription: {len(segments)} segments, "
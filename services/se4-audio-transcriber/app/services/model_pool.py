@@ -0,0 +1,322 @@
+"""
+Pool de modelos Whisper residentes entre jobs.
+
+Mantém os model managers (faster-whisper, openai-whisper, WhisperX) carregados
+depois de cada job, para que jobs consecutivos reaproveitem o modelo quente em
+vez de recarregar os pesos do disco. Os modelos são indexados por
+(engine, tamanho, device, compute_type) e descarregados por:
+
+- LRU, quando um novo modelo não cabe no orçamento de RAM
+- Inatividade, seguindo a mesma política de ``ModelManager.unload_idle_engines``
+"""
+from __future__ import annotations
+
+import datetime
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from common.datetime_utils import now_brazil
+from common.log_utils import get_logger
+
+from ..core.constants import (
+    FASTER_WHISPER_MODEL_SIZES,
+    OPENAI_WHISPER_MODEL_SIZES,
+    WHISPERX_MODEL_SIZES,
+)
+from ..domain.models import WhisperEngine
+from ..infrastructure.whisper_engine import ModelManager
+
+logger = get_logger(__name__)
+
+_MODEL_SIZE_TABLES = {
+    WhisperEngine.FASTER_WHISPER: FASTER_WHISPER_MODEL_SIZES,
+    WhisperEngine.OPENAI_WHISPER: OPENAI_WHISPER_MODEL_SIZES,
+    WhisperEngine.WHISPERX: WHISPERX_MODEL_SIZES,
+}
+
+
+def estimate_model_mb(engine: WhisperEngine, model_size: str) -> int:
+    """
+    Estima a RAM ocupada por um modelo carregado.
+
+    Variantes como ``large-v3`` usam a estimativa do tamanho base (``large``).
+
+    Args:
+        engine: Engine do modelo
+        model_size: Nome do modelo (tiny, base, small, medium, large-v3...)
+
+    Returns:
+        Estimativa em MB
+    """
+    table = _MODEL_SIZE_TABLES.get(engine, FASTER_WHISPER_MODEL_SIZES)
+    base_name = model_size.split("-", 1)[0].split(".", 1)[0]
+    return table.get(model_size, table.get(base_name, table["large"]))
+
+
+def default_compute_type(engine: WhisperEngine, device: str) -> str:
+    """Compute type usado por cada engine no device informado."""
+    if device == "cuda":
+        return "float16"
+    return "float32" if engine == WhisperEngine.OPENAI_WHISPER else "int8"
+
+
+@dataclass(frozen=True)
+class ModelPoolKey:
+    """Identifica um modelo residente no pool."""
+
+    engine: WhisperEngine
+    model_size: str
+    device: str
+    compute_type: str
+    replica: int = 0
+
+    def __str__(self) -> str:
+        key = f"{self.engine.value}:{self.model_size}:{self.device}:{self.compute_type}"
+        return f"{key}#{self.replica}" if self.replica else key
+
+
+@dataclass
+class _PoolEntry:
+    manager: Any
+    size_mb: int
+    last_accessed: datetime.datetime
+    leases: int = 0
+    hits: int = 0
+    loading: threading.Event | None = None  # setado ao fim do carregamento em andamento
+
+
+class ResidentModelPool:
+    """
+    Pool LRU de model managers residentes, limitado por orçamento de RAM.
+
+    Um modelo em uso (``acquire`` sem ``release`` correspondente) nunca é
+    descarregado. Quando um novo modelo não cabe no orçamento, os modelos
+    ociosos menos usados recentemente são descarregados primeiro.
+
+    Example:
+        >>> pool = ResidentModelPool(max_resident_mb=4096)
+        >>> manager = pool.acquire(key, lambda: FasterWhisperModelManager())
+        >>> manager.transcribe(audio_path)
+        >>> pool.release(key)
+    """
+
+    def __init__(
+        self,
+        max_resident_mb: int = 0,
+        idle_timeout_minutes: int | None = None,
+        reaper_interval_seconds: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            max_resident_mb: Orçamento de RAM para modelos residentes (0 = sem limite)
+            idle_timeout_minutes: Minutos sem uso até descarregar um modelo
+            reaper_interval_seconds: Intervalo da verificação de inatividade em background
+        """
+        self.max_resident_mb = max_resident_mb
+        self.idle_timeout_minutes = idle_timeout_minutes or ModelManager.DEFAULT_IDLE_TIMEOUT_MINUTES
+        self.reaper_interval_seconds = reaper_interval_seconds
+        self._entries: OrderedDict[ModelPoolKey, _PoolEntry] = OrderedDict()
+        self._lock = threading.RLock()
+        self._reaper: threading.Thread | None = None
+        self._stop_reaper = threading.Event()
+        self.loads = 0
+        self.evictions = 0
+
+    @property
+    def resident_mb(self) -> int:
+        """RAM estimada ocupada pelos modelos residentes."""
+        with self._lock:
+            return sum(entry.size_mb for entry in self._entries.values())
+
+    @property
+    def resident_count(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def fits(self, key: ModelPoolKey) -> bool:
+        """True se o modelo já está no pool ou cabe no orçamento sem evictar nada."""
+        with self._lock:
+            if key in self._entries or self.max_resident_mb <= 0:
+                return True
+            return self.resident_mb + estimate_model_mb(key.engine, key.model_size) <= self.max_resident_mb
+
+    def acquire(self, key: ModelPoolKey, factory: Callable[[], Any]) -> Any:
+        """
+        Retorna o manager do modelo carregado, carregando-o se necessário.
+
+        Cada ``acquire`` deve ter um ``release`` correspondente ao fim do uso.
+        O carregamento roda fora do lock do pool; chamadores concorrentes do
+        mesmo modelo esperam por ele em vez de carregá-lo de novo.
+
+        Args:
+            key: Identificação do modelo
+            factory: Cria o manager (não carregado) quando o modelo não está no pool
+
+        Returns:
+            Model manager com o modelo carregado
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry.loading is not None:
+                    loading = entry.loading
+                elif entry is not None and entry.manager.is_loaded:
+                    entry.hits += 1
+                    logger.info(f"♻️ Reutilizando modelo residente {key}")
+                    return self._lease(key, entry)
+                else:
+                    if entry is None:
+                        size_mb = estimate_model_mb(key.engine, key.model_size)
+                        self._make_room(size_mb)
+                        entry = _PoolEntry(manager=factory(), size_mb=size_mb, last_accessed=now_brazil())
+                        self._entries[key] = entry
+                    # A reserva impede que o modelo seja descarregado durante o carregamento
+                    entry.leases += 1
+                    entry.loading = threading.Event()
+                    break
+            # Outro chamador está carregando este modelo: espera e tenta de novo
+            loading.wait()
+
+        # Carrega fora do lock: outros modelos continuam disponíveis enquanto isso
+        try:
+            entry.manager.load_model()
+        except Exception:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    self._entries.pop(key)
+                entry.loading.set()
+                entry.loading = None
+            raise
+
+        with self._lock:
+            self.loads += 1
+            entry.leases -= 1
+            entry.loading.set()
+            entry.loading = None
+            logger.info(
+                f"📦 Modelo {key} residente no pool "
+                f"({self.resident_mb}MB de {self.max_resident_mb or '∞'}MB)"
+            )
+            return self._lease(key, entry)
+
+    def _lease(self, key: ModelPoolKey, entry: _PoolEntry) -> Any:
+        entry.leases += 1
+        entry.last_accessed = now_brazil()
+        self._entries.move_to_end(key)
+        self._ensure_reaper()
+        return entry.manager
+
+    def release(self, key: ModelPoolKey) -> None:
+        """Devolve o modelo ao pool, mantendo-o carregado."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.leases = max(entry.leases - 1, 0)
+            entry.last_accessed = now_brazil()
+
+    def _make_room(self, size_mb: int) -> None:
+        """Descarrega modelos ociosos (LRU primeiro) até o novo modelo caber."""
+        if self.max_resident_mb <= 0:
+            return
+        for key in list(self._entries):
+            if self.resident_mb + size_mb <= self.max_resident_mb:
+                return
+            if self._entries[key].leases == 0:
+                self._unload(key, reason="LRU (orçamento de RAM)")
+                self.evictions += 1
+        if self.resident_mb + size_mb > self.max_resident_mb:
+            logger.warning(
+                f"⚠️ Orçamento de {self.max_resident_mb}MB excedido: "
+                f"{self.resident_mb}MB em uso + {size_mb}MB do novo modelo"
+            )
+
+    def _unload(self, key: ModelPoolKey, reason: str) -> dict[str, Any]:
+        entry = self._entries.pop(key)
+        logger.info(f"🧹 Descarregando modelo {key}: {reason}")
+        try:
+            return entry.manager.unload_model()
+        except Exception as e:
+            logger.warning(f"Falha ao descarregar modelo {key}: {e}")
+            return {"success": False, "memory_freed": {"ram_mb": 0.0, "vram_mb": 0.0}}
+
+    def unload_idle(self, timeout_minutes: int | None = None) -> int:
+        """
+        Descarrega modelos ociosos há mais de ``timeout_minutes``.
+
+        Returns:
+            Quantidade de modelos descarregados
+        """
+        timeout = timeout_minutes or self.idle_timeout_minutes
+        cutoff = now_brazil() - datetime.timedelta(minutes=timeout)
+
+        unloaded = 0
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.leases == 0 and entry.last_accessed < cutoff:
+                    self._unload(key, reason=f"inativo há mais de {timeout}min")
+                    unloaded += 1
+        return unloaded
+
+    def unload_all(self) -> dict[str, Any]:
+        """
+        Descarrega todos os modelos ociosos do pool.
+
+        Returns:
+            Relatório com a quantidade de modelos e a memória liberada
+        """
+        freed = {"ram_mb": 0.0, "vram_mb": 0.0}
+        unloaded = 0
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.leases > 0:
+                    logger.warning(f"Modelo {key} em uso, mantido no pool")
+                    continue
+                result = self._unload(key, reason="descarregamento explícito")
+                memory = result.get("memory_freed", {})
+                freed["ram_mb"] += memory.get("ram_mb", 0.0)
+                freed["vram_mb"] += memory.get("vram_mb", 0.0)
+                unloaded += 1
+        return {"unloaded": unloaded, "memory_freed": freed}
+
+    def get_status(self) -> dict[str, Any]:
+        """Modelos residentes, orçamento e contadores do pool."""
+        with self._lock:
+            return {
+                "max_resident_mb": self.max_resident_mb,
+                "resident_mb": self.resident_mb,
+                "idle_timeout_minutes": self.idle_timeout_minutes,
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "models": [
+                    {
+                        "key": str(key),
+                        "size_mb": entry.size_mb,
+                        "in_use": entry.leases > 0,
+                        "hits": entry.hits,
+                        "last_accessed": entry.last_accessed.isoformat(),
+                    }
+                    for key, entry in self._entries.items()
+                ],
+            }
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+        self._stop_reaper.clear()
+        self._reaper = threading.Thread(target=self._reap_loop, name="model-pool-reaper", daemon=True)
+        self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        while not self._stop_reaper.wait(self.reaper_interval_seconds):
+            try:
+                self.unload_idle()
+            except Exception as e:
+                logger.warning(f"Falha na verificação de modelos ociosos: {e}")
+
+    def shutdown(self) -> None:
+        """Para a verificação em background e descarrega os modelos."""
+        self._stop_reaper.set()
+        self.unload_all()
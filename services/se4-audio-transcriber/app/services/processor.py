@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import dataclasses
+import functools
 import gc
 import json
 import os
 import asyncio
+import threading
 from pathlib import Path
 from typing import Any
 import torch
@@ -12,14 +15,16 @@ from common.datetime_utils import now_brazil
 from ..domain.models import Job, JobStatus, TranscriptionSegment, WhisperEngine
 from ..shared.audio_chunker import AudioChunker
 from ..shared.chunk_transcriber import ChunkTranscriber
-from ..shared.audio_converter import convert_to_wav, has_audio_stream
+from ..shared.audio_converter import convert_to_wav, has_audio_stream, probe_duration
 from ..shared.caption_formatter import CaptionFormatter
 from ..shared.error_handling import retry_on_transient_error, safe_cleanup
 from ..shared.exceptions import AudioTranscriptionException
 from ..shared.job_state_updater import JobStateUpdater
 from ..core.config import get_settings
 from ..core.constants import BYTES_PER_MB
+from ..infrastructure.checkpoint_manager import CheckpointManager
 from .faster_whisper_manager import FasterWhisperModelManager
+from .model_pool import ModelPoolKey, ResidentModelPool, default_compute_type
 from .openai_whisper_manager import OpenAIWhisperManager
 from .whisperx_manager import WhisperXManager
 import time
@@ -50,8 +55,12 @@ class TranscriptionProcessor:
         self.output_dir = output_dir or self.settings.get('transcription_dir', './transcriptions')
         self.model_dir = model_dir or self.settings.get('whisper_download_root', './models')
         
-        # Managers para diferentes engines
-        self.model_managers = {}
+        # Modelos residentes entre jobs (LRU limitado por RAM + unload por inatividade)
+        self.model_pool = ResidentModelPool(
+            max_resident_mb=int(self.settings.get('whisper_pool_max_resident_mb', 4096)),
+            idle_timeout_minutes=int(self.settings.get('whisper_pool_idle_timeout_minutes', 30)),
+            reaper_interval_seconds=float(self.settings.get('whisper_pool_reaper_interval_seconds', 60)),
+        )
         self.current_engine = WhisperEngine.FASTER_WHISPER
         
         # Backwards compatibility
@@ -69,20 +78,27 @@ class TranscriptionProcessor:
                 f"Timeout ao executar '{operation_name}' após {timeout_seconds}s"
             ) from exc
     
-    def _get_model_manager(self, engine: WhisperEngine) -> Any:
+    def _create_model_manager(self, engine: WhisperEngine) -> Any:
         """
-        Retorna o model manager para o engine especificado.
-        Cria e cacheia managers sob demanda.
+        Cria um model manager (não carregado) para o engine especificado.
+        O cache entre jobs fica a cargo do ResidentModelPool.
         """
-        if engine not in self.model_managers:
-            logger.info(f"🔧 Criando manager para engine: {engine.value}")
-
-            manager_cls = _ENGINE_MAP.get(engine)
-            if manager_cls is None:
-                raise AudioTranscriptionException(f"Engine não suportado: {engine}")
-            self.model_managers[engine] = manager_cls(model_dir=Path(self.model_dir))
-        
-        return self.model_managers[engine]
+        logger.info(f"🔧 Criando manager para engine: {engine.value}")
+
+        manager_cls = _ENGINE_MAP.get(engine)
+        if manager_cls is None:
+            raise AudioTranscriptionException(f"Engine não suportado: {engine}")
+        return manager_cls(model_dir=Path(self.model_dir))
+
+    def _model_pool_key(self, engine: WhisperEngine) -> ModelPoolKey:
+        """Chave do modelo no pool: (engine, tamanho, device, compute_type)."""
+        device = self._detect_device(engine)
+        return ModelPoolKey(
+            engine=engine,
+            model_size=self.settings.get('whisper_model', 'base'),
+            device=device,
+            compute_type=default_compute_type(engine, device),
+        )
     
     def _check_disk_space(self, file_path: str, output_dir: str) -> bool:
         """Verifica se há espaço em disco suficiente para transcrição."""
@@ -121,34 +137,60 @@ class TranscriptionProcessor:
             preferred_device = 'auto'
         return TorchDeviceManager(preferred_device=preferred_device).detect_device()
     
-    def _load_model(self, engine: WhisperEngine = WhisperEngine.FASTER_WHISPER) -> None:
+    def _load_model(self, engine: WhisperEngine = WhisperEngine.FASTER_WHISPER) -> ModelPoolKey:
         """
-        Carrega modelo usando o engine especificado.
-        
+        Obtém do pool o modelo do engine especificado, carregando-o se necessário.
+
+        O modelo fica reservado até ``self.model_pool.release(key)``.
+
         Args:
             engine: Engine a ser usado (faster-whisper, openai-whisper, whisperx)
+
+        Returns:
+            Chave do modelo no pool
         """
-        manager = self._get_model_manager(engine)
-        
-        # Verifica se já está carregado
-        if manager.is_loaded:
-            logger.info(f"ℹ️ Modelo {engine.value} já está carregado")
-            self.model_manager = manager
-            self.current_engine = engine
-            self.model_loaded = True
-            self.device = manager.device
-            return
-        
-        logger.info(f"📦 Carregando modelo {engine.value}...")
-        manager.load_model()
-        
+        key = self._model_pool_key(engine)
+        manager = self.model_pool.acquire(key, lambda: self._create_model_manager(engine))
+
         # Atualiza referências
         self.model_manager = manager
         self.current_engine = engine
         self.device = manager.device
         self.model_loaded = True
-        
-        logger.info(f"✅ Modelo {engine.value} carregado no {self.device.upper()}")
+
+        logger.info(f"✅ Modelo {engine.value} pronto no {self.device.upper()}")
+        return key
+
+    async def _acquire_model(self, engine: WhisperEngine, timeout_seconds: int) -> ModelPoolKey:
+        """
+        Executa ``_load_model`` em uma thread, com timeout.
+
+        Se o chamador desistir (timeout/cancelamento) com o carregamento ainda
+        em andamento, a thread devolve a reserva ao pool ao terminar.
+        """
+        lock = threading.Lock()
+        state: dict[str, Any] = {"abandoned": False, "key": None}
+
+        def load() -> ModelPoolKey:
+            key = self._load_model(engine)
+            with lock:
+                if not state["abandoned"]:
+                    state["key"] = key
+                    return key
+            logger.warning(f"⚠️ Carregamento de {key} terminou após o timeout - liberando reserva")
+            safe_cleanup(lambda: self.model_pool.release(key), label="Liberar modelo abandonado no pool")
+            return key
+
+        try:
+            return await self._run_with_timeout(asyncio.to_thread(load), timeout_seconds, "load_model")
+        except BaseException:
+            with lock:
+                state["abandoned"] = True
+                key = state["key"]
+            if key is not None:
+                # Carregou, mas o resultado não chegou ao chamador
+                safe_cleanup(lambda: self.model_pool.release(key), label="Liberar modelo no pool")
+            raise
 
     def unload_model(self) -> dict[str, Any]:
         """
@@ -175,6 +217,17 @@ class TranscriptionProcessor:
                 "model_name": self.settings.get('whisper_model', 'base')
             }
             
+            model_pool = getattr(self, "model_pool", None)
+            if model_pool is not None and model_pool.resident_count:
+                pool_report = model_pool.unload_all()
+                report["device_was"] = self.device
+                report["memory_freed"] = pool_report["memory_freed"]
+                report["success"] = True
+                report["message"] = f"{pool_report['unloaded']} modelo(s) residente(s) descarregado(s) do pool"
+                self.model_loaded = model_pool.resident_count > 0
+                logger.warning(f"♻️ {report['message']}")
+                return report
+
             if self.model is None or not self.model_loaded:
                 report["message"] = "Modelo já estava descarregado"
                 report["success"] = True
@@ -277,8 +330,8 @@ class TranscriptionProcessor:
             if torch.cuda.is_available():
                 vram_before = torch.cuda.memory_allocated(0) / BYTES_PER_MB  # MB
             
-            # Carrega modelo (usa _load_model que já tem lógica de retry e device detection)
-            self._load_model()
+            # Carrega modelo no pool (usa _load_model que já tem lógica de retry e device detection)
+            self.model_pool.release(self._load_model())
             
             report["success"] = True
             report["device"] = self.device
@@ -320,8 +373,9 @@ class TranscriptionProcessor:
         Returns:
             dict: Status do modelo (loaded/unloaded, device, memory, etc)
         """
+        model_pool = getattr(self, "model_pool", None)
         status = {
-            "loaded": self.model_loaded and self.model is not None,
+            "loaded": self.model_loaded and (self.model is not None or bool(model_pool and model_pool.resident_count)),
             "model_name": self.settings.get('whisper_model', 'base'),
             "device": self.device if self.model_loaded else None,
             "memory": {
@@ -330,6 +384,9 @@ class TranscriptionProcessor:
             }
         }
         
+        if model_pool is not None:
+            status["resident_models"] = model_pool.get_status()
+
         # Se modelo está carregado na GPU, mostra uso de VRAM
         if status["loaded"] and self.device == 'cuda' and torch.cuda.is_available():
             status["memory"]["vram_mb"] = round(torch.cuda.memory_allocated(0) / BYTES_PER_MB, 2)
@@ -350,11 +407,29 @@ class TranscriptionProcessor:
         Converte o processamento assíncrono em síncrono
         """
         timeout_seconds = int(self.settings.get("job_processing_timeout_seconds", 3600))
-        coroutine = self._run_with_timeout(
+        self._run_sync(self._run_with_timeout(
             self.process_transcription_job(job),
             timeout_seconds,
             "process_transcription_job",
-        )
+        ))
+        return job
+
+    def transcribe_batch(self, jobs: list[Job]) -> list[Job]:
+        """
+        Método síncrono para a task Celery de batch: transcreve jobs curtos
+        em chamadas batched do modelo residente (ver process_transcription_batch)
+        """
+        timeout_seconds = int(self.settings.get("job_processing_timeout_seconds", 3600))
+        self._run_sync(self._run_with_timeout(
+            self.process_transcription_batch(jobs),
+            timeout_seconds,
+            "process_transcription_batch",
+        ))
+        return jobs
+
+    @staticmethod
+    def _run_sync(coroutine: Any) -> None:
+        """Executa a coroutine até o fim, mesmo se chamado de dentro de um event loop."""
         try:
             asyncio.get_running_loop()
             loop = asyncio.new_event_loop()
@@ -365,7 +440,26 @@ class TranscriptionProcessor:
         except RuntimeError:
             asyncio.run(coroutine)
 
-        return job
+    def is_batchable(self, job: Job) -> bool:
+        """Job curto de faster-whisper elegível à transcrição em batch."""
+        if not self.settings.get('enable_job_batching', True) or int(self.settings.get('batch_max_jobs', 16)) < 2:
+            return False
+        if getattr(job, 'engine', WhisperEngine.FASTER_WHISPER) != WhisperEngine.FASTER_WHISPER:
+            return False
+        try:
+            input_path = self._validate_input_file(job)
+        except AudioTranscriptionException:
+            return False
+        duration = probe_duration(input_path)
+        return duration is not None and 0 < duration <= float(self.settings.get('batch_max_clip_seconds', 30.0))
+
+    @staticmethod
+    def _whisper_task(language_in: str, language_out: str | None) -> str:
+        """'translate' só quando a saída é inglês (único alvo do Whisper); senão 'transcribe'."""
+        needs_translation = language_out is not None and language_out != language_in and language_in != ''
+        if needs_translation and language_out.lower() in ('en', 'english'):
+            return "translate"
+        return "transcribe"
 
     # ------------------------------------------------------------------
     # Helpers for process_transcription_job
@@ -428,6 +522,46 @@ class TranscriptionProcessor:
             logger.error(f"❌ {error_msg}")
             raise AudioTranscriptionException(error_msg)
 
+    def _acquire_chunk_replicas(self, workers: int) -> tuple[list[ModelPoolKey], list[Any]]:
+        """
+        Reserva réplicas extras do modelo atual no pool para transcrição paralela.
+
+        A réplica 0 é o modelo já carregado para o job. Réplicas que não cabem
+        no orçamento de RAM do pool não são criadas; o paralelismo é reduzido.
+
+        Returns:
+            (chaves das réplicas extras reservadas, funções de transcrição por réplica)
+        """
+        base_key = self._model_pool_key(self.current_engine)
+        keys: list[ModelPoolKey] = []
+        transcribe_fns: list[Any] = [self._transcribe_direct]
+
+        for replica in range(1, workers):
+            key = dataclasses.replace(base_key, replica=replica)
+            if not self.model_pool.fits(key):
+                logger.warning(f"⚠️ Réplica {key} não cabe no orçamento do pool, usando {replica} worker(s)")
+                break
+            try:
+                manager = self.model_pool.acquire(key, lambda: self._create_model_manager(self.current_engine))
+            except Exception as e:
+                logger.warning(f"⚠️ Falha ao carregar réplica {key}: {e} - usando {replica} worker(s)")
+                break
+            keys.append(key)
+            transcribe_fns.append(functools.partial(self._transcribe_direct, model_manager=manager))
+
+        return keys, transcribe_fns
+
+    def _checkpoint_manager(self) -> CheckpointManager | None:
+        """CheckpointManager para retomar chunks já transcritos (None se desabilitado)."""
+        if not self.settings.get('chunk_checkpoints_enabled', True) or getattr(self, 'job_store', None) is None:
+            return None
+        return CheckpointManager(self.job_store)
+
+    def _clear_checkpoint(self, job_id: str) -> None:
+        checkpoints = self._checkpoint_manager()
+        if checkpoints is not None:
+            safe_cleanup(lambda: checkpoints.delete_checkpoint(job_id), label="Remover checkpoint do job")
+
     async def _run_transcription(self, job: Job) -> dict[str, Any]:
         """Run transcription using chunking or direct mode based on settings."""
         enable_chunking = self.settings.get('enable_chunking', False)
@@ -440,19 +574,41 @@ class TranscriptionProcessor:
             if duration_seconds > min_duration_for_chunks:
                 logger.info(f"Áudio longo detectado ({duration_seconds:.1f}s), usando chunking")
                 transcription_timeout = int(self.settings.get("job_processing_timeout_seconds", 3600))
-                chunk_transcriber = ChunkTranscriber(self.settings, self.state)
-                return await self._run_with_timeout(
-                    chunk_transcriber.transcribe(
-                        job.input_file,
-                        job.language_in,
-                        job.language_out,
-                        transcribe_fn=self._transcribe_direct,
-                        job_id=self.current_job_id,
-                        audio=audio,
-                    ),
-                    transcription_timeout,
-                    "transcribe_with_chunking",
+                chunk_transcriber = ChunkTranscriber(
+                    self.settings, self.state, checkpoints=self._checkpoint_manager()
                 )
+
+                workers = int(self.settings.get('chunk_parallel_workers', 1))
+                replica_keys: list[ModelPoolKey] = []
+                transcribe_fn = self._transcribe_direct
+                transcribe_fns = None
+                if workers > 1:
+                    replica_keys, transcribe_fns = await asyncio.to_thread(self._acquire_chunk_replicas, workers)
+
+                if self.settings.get('vad_speech_only', False):
+                    # Chunks já empacotados a partir da fala do Silero: rodar o VAD
+                    # do faster-whisper de novo só custa tempo e pode cortar bordas
+                    transcribe_fn = functools.partial(transcribe_fn, vad_filter=False)
+                    if transcribe_fns:
+                        transcribe_fns = [functools.partial(fn, vad_filter=False) for fn in transcribe_fns]
+
+                try:
+                    return await self._run_with_timeout(
+                        chunk_transcriber.transcribe(
+                            job.input_file,
+                            job.language_in,
+                            job.language_out,
+                            transcribe_fn=transcribe_fn,
+                            job_id=self.current_job_id,
+                            audio=audio,
+                            transcribe_fns=transcribe_fns,
+                        ),
+                        transcription_timeout,
+                        "transcribe_with_chunking",
+                    )
+                finally:
+                    for key in replica_keys:
+                        self.model_pool.release(key)
             else:
                 logger.info(f"Áudio curto ({duration_seconds:.1f}s), transcrição direta")
 
@@ -508,14 +664,102 @@ class TranscriptionProcessor:
             f.write(srt_content)
         return output_path
 
+    def _complete_job(self, job: Job, result: dict[str, Any]) -> None:
+        """Converte segmentos, salva o SRT e marca o job como concluído."""
+        transcription_segments = self._build_segments(result)
+
+        output_path = self._save_srt_file(job, result)
+
+        language_detected = result.get("language")
+        if language_detected:
+            logger.info(f"Idioma detectado pelo Whisper: {language_detected}")
+
+        if result.get("speech_detection"):
+            job.result = {**(job.result or {}), "speech_detection": result["speech_detection"]}
+
+        self.state.mark_completed(
+            job,
+            output_file=str(output_path),
+            text=result["text"],
+            segments=transcription_segments,
+            file_size_output=output_path.stat().st_size,
+            language_detected=language_detected,
+        )
+
+        self._clear_checkpoint(job.id)
+
+        logger.info(f"Job {job.id} transcrito com sucesso")
+        logger.info(f"Total de segmentos: {len(transcription_segments)}")
+
     # ------------------------------------------------------------------
     # Main orchestrator
     # ------------------------------------------------------------------
 
+    async def process_transcription_batch(self, jobs: list[Job]) -> None:
+        """
+        Transcreve jobs curtos de faster-whisper em chamadas batched do mesmo modelo.
+
+        Os jobs são agrupados por (idioma, task). Grupos de um único job, ou
+        cuja chamada batched falhe, seguem por process_transcription_job.
+        Falhas ficam registradas em cada job (status FAILED); nada é propagado.
+        """
+        groups: dict[tuple[str, str], list[Job]] = {}
+        for job in jobs:
+            self.state.mark_processing(job, started_at=job.started_at or now_brazil())
+            key = (job.language_in or "auto", self._whisper_task(job.language_in, job.language_out))
+            groups.setdefault(key, []).append(job)
+
+        individual = [group[0] for group in groups.values() if len(group) == 1]
+        batched = {key: group for key, group in groups.items() if len(group) > 1}
+
+        if batched:
+            load_timeout_seconds = int(self.settings.get("async_timeout_seconds", 1800))
+            model_key = await self._acquire_model(WhisperEngine.FASTER_WHISPER, load_timeout_seconds)
+            manager = self.model_manager
+            batch_size = int(self.settings.get('batch_inference_size', 8))
+            try:
+                for (language, task), group in batched.items():
+                    for job in group:
+                        self.state.set_progress(25.0, job.id)
+                    try:
+                        results = await self._run_with_timeout(
+                            asyncio.to_thread(
+                                manager.transcribe_batch,
+                                [Path(job.input_file) for job in group],
+                                language=language,
+                                task=task,
+                                batch_size=batch_size,
+                            ),
+                            load_timeout_seconds,
+                            "transcribe_batch",
+                        )
+                    except Exception as e:
+                        logger.warning(f"⚠️ Batch de {len(group)} jobs falhou ({e}) - processando individualmente")
+                        individual.extend(group)
+                        continue
+
+                    logger.info(f"📦 Batch: {len(group)} jobs transcritos (language={language}, task={task})")
+                    for job, result in zip(group, results):
+                        self.state.set_progress(75.0, job.id)
+                        try:
+                            self._complete_job(job, result)
+                        except Exception as e:
+                            logger.error("Job %s falhou ao finalizar batch: %s", job.id, e)
+                            self.state.mark_failed(job, str(e))
+            finally:
+                safe_cleanup(lambda: self.model_pool.release(model_key), label="Liberar modelo no pool")
+
+        for job in individual:
+            try:
+                await self.process_transcription_job(job)
+            except AudioTranscriptionException:
+                pass  # já marcado como FAILED por process_transcription_job
+
     async def process_transcription_job(self, job: Job) -> None:
         """Processa um job de transcrição"""
         converted_file = None
         is_temp_file = False
+        model_key: ModelPoolKey | None = None
 
         try:
             logger.info(f"Iniciando processamento do job: {job.id}")
@@ -532,11 +776,7 @@ class TranscriptionProcessor:
             engine = job.engine if hasattr(job, 'engine') else WhisperEngine.FASTER_WHISPER
             logger.info(f"🔧 Usando engine: {engine.value}")
             load_timeout_seconds = int(self.settings.get("async_timeout_seconds", 1800))
-            await self._run_with_timeout(
-                asyncio.to_thread(self._load_model, engine),
-                load_timeout_seconds,
-                "load_model",
-            )
+            model_key = await self._acquire_model(engine, load_timeout_seconds)
 
             self.state.set_progress(25.0, job.id)
 
@@ -544,25 +784,7 @@ class TranscriptionProcessor:
 
             self.state.set_progress(75.0, job.id)
 
-            transcription_segments = self._build_segments(result)
-
-            output_path = self._save_srt_file(job, result)
-
-            language_detected = result.get("language")
-            if language_detected:
-                logger.info(f"Idioma detectado pelo Whisper: {language_detected}")
-
-            self.state.mark_completed(
-                job,
-                output_file=str(output_path),
-                text=result["text"],
-                segments=transcription_segments,
-                file_size_output=output_path.stat().st_size,
-                language_detected=language_detected,
-            )
-
-            logger.info(f"Job {job.id} transcrito com sucesso")
-            logger.info(f"Total de segmentos: {len(transcription_segments)}")
+            self._complete_job(job, result)
 
         except AudioTranscriptionException as e:
             self.state.mark_failed(job, str(e))
@@ -585,18 +807,20 @@ class TranscriptionProcessor:
 
                 safe_cleanup(_remove_temp, label="Remover arquivo temporário")
 
-            def _unload_model():
-                unload_result = self.model_manager.unload_model()
-                if unload_result.get("success"):
-                    logger.info(
-                        "🧹 Modelo descarregado pós-job (freed ~%s MB RAM)",
-                        unload_result["memory_freed"]["ram_mb"],
-                    )
-
-            safe_cleanup(_unload_model, label="Descarregar modelo")
+            if model_key is not None:
+                # Mantém o modelo residente para o próximo job; o pool descarrega
+                # por LRU/inatividade
+                safe_cleanup(lambda: self.model_pool.release(model_key), label="Liberar modelo no pool")
 
     
-    def _transcribe_direct(self, audio_file: str, language_in: str = "auto", language_out: str | None = None) -> dict[str, Any]:
+    def _transcribe_direct(
+        self,
+        audio_file: str,
+        language_in: str = "auto",
+        language_out: str | None = None,
+        model_manager: Any | None = None,
+        vad_filter: bool | None = None,
+    ) -> dict[str, Any]:
         """
         Transcrição ou tradução direta sem chunking
         
@@ -604,6 +828,8 @@ class TranscriptionProcessor:
             audio_file: Caminho do arquivo de áudio
             language_in: Idioma de entrada ("auto" para detecção automática)
             language_out: Idioma de saída para tradução (None = apenas transcrever)
+            model_manager: Réplica do modelo a usar (None = modelo atual do job)
+            vad_filter: Sobrescreve o VAD do faster-whisper (None = usa vad_speech_only)
         
         Returns:
             dict: Resultado com 'text', 'segments' e 'language' detectado
@@ -643,6 +869,8 @@ class TranscriptionProcessor:
         base_options = {
             "beam_size": self.settings.get('whisper_beam_size', 5),
         }
+        if vad_filter is not None and self.current_engine == WhisperEngine.FASTER_WHISPER:
+            base_options["vad_filter"] = vad_filter
         
         from ..core.constants import DEFAULT_MAX_RETRIES, DEFAULT_RETRY_BACKOFF_BASE as _retry_base
 
@@ -651,11 +879,13 @@ class TranscriptionProcessor:
         max_retries = self.settings.get('whisper_max_retries', DEFAULT_MAX_RETRIES)
         retry_delay = float(self.settings.get('whisper_retry_backoff_base', _retry_base))
 
+        manager = model_manager or self.model_manager
+
         @retry_on_transient_error(max_retries=max_retries - 1, base_delay=retry_delay)
         def _do_transcribe():
             if needs_translation:
                 logger.info(f"🌐 Usando {self.current_engine.value} task='translate' para traduzir para inglês")
-                result = self.model_manager.transcribe(
+                result = manager.transcribe(
                     Path(audio_file),
                     language=None if language_in == "auto" else language_in,
                     task="translate",
@@ -664,7 +894,7 @@ class TranscriptionProcessor:
                 logger.info(f"✅ Tradução concluída. Idioma detectado: {result.get('language', 'unknown')}")
             else:
                 logger.info(f"📝 Usando {self.current_engine.value} task='transcribe' para transcrever em {language_in}")
-                result = self.model_manager.transcribe(
+                result = manager.transcribe(
                     Path(audio_file),
                     language=None if language_in == "auto" else language_in,
                     task="transcribe",
@@ -28,7 +28,7 @@ from ..shared.error_handling import safe_cleanup
 from ..shared.exceptions import AudioTranscriptionException
 from ..infrastructure.whisper_engine import WhisperEngine, ModelManager
 from ..infrastructure.storage_manager import LocalFileStorage
-from ..domain.interfaces import IStorageManager, ITranscriptionService
+from ..domain.interfaces import IStorageManager, ITranscriptionService, TranscriptionResult
 from ..core.validators import JobIdValidator, LanguageValidator
 
 logger = get_logger(__name__)
@@ -200,24 +200,8 @@ class TranscriptionService(ITranscriptionService):
             
             self.state.set_progress(75.0, job.id)
             
-            # 4. Converte segmentos
-            transcription_segments = self._convert_segments(result.segments)
-            
-            # 5. Salva arquivo de saída
-            output_path = await self._save_transcription(job, result.text, result.segments)
-            
-            # 6. Finaliza job
-            self.state.mark_completed(
-                job,
-                output_file=str(output_path),
-                text=result.text,
-                segments=transcription_segments,
-                file_size_output=output_path.stat().st_size,
-                language_detected=result.language,
-            )
-            
-            logger.info(f"Job {job_id} concluído: {len(transcription_segments)} segmentos")
-            return job
+            # 4-6. Converte segmentos, salva saída e finaliza job
+            return await self._complete_job(job, result)
             
         except AudioTranscriptionException as e:
             logger.error("Job %s falhou: %s", job_id, e)
@@ -229,6 +213,71 @@ class TranscriptionService(ITranscriptionService):
             self.state.mark_failed(job, str(e))
             raise AudioTranscriptionException(f"Erro no processamento do job: {str(e)}") from e
 
+    async def _complete_job(self, job: Job, result: TranscriptionResult) -> Job:
+        """Converte segmentos, salva o SRT e marca o job como concluído."""
+        transcription_segments = self._convert_segments(result.segments)
+
+        output_path = await self._save_transcription(job, result.text, result.segments)
+
+        self.state.mark_completed(
+            job,
+            output_file=str(output_path),
+            text=result.text,
+            segments=transcription_segments,
+            file_size_output=output_path.stat().st_size,
+            language_detected=result.language,
+        )
+
+        logger.info(f"Job {job.id} concluído: {len(transcription_segments)} segmentos")
+        return job
+
+    async def process_jobs_batched(
+        self,
+        jobs: list[Job],
+        clips: list[Any],
+        language: str | None,
+        task: str,
+        batch_size: int = 8,
+    ) -> list[Job]:
+        """
+        Processa vários jobs curtos em uma única chamada batched do modelo.
+
+        Todos os jobs devem usar o mesmo engine/modelo e a mesma task.
+        Se a chamada batched falhar, a exceção é propagada sem alterar os
+        jobs, para que o chamador possa reprocessá-los individualmente.
+
+        Args:
+            jobs: Jobs a processar
+            clips: Áudio decodificado (16 kHz mono) de cada job, na mesma ordem
+            language: Idioma comum ou None para detectar por job
+            task: 'transcribe' ou 'translate'
+            batch_size: Janelas decodificadas por forward pass
+
+        Returns:
+            Jobs atualizados
+        """
+        model_size = os.getenv("WHISPER_MODEL", "base")
+        engine = self._get_engine_for_job(jobs[0], model_size)
+        if not engine.is_loaded():
+            engine.load_model()
+
+        for job in jobs:
+            self.state.mark_processing(job, started_at=now_brazil())
+            self.state.set_progress(25.0, job.id)
+
+        results = await engine.transcribe_batch(clips, language=language, task=task, batch_size=batch_size)
+
+        processed = []
+        for job, result in zip(jobs, results):
+            self.state.set_progress(75.0, job.id)
+            try:
+                processed.append(await self._complete_job(job, result))
+            except Exception as e:
+                logger.error("Job %s falhou ao finalizar batch: %s", job.id, e)
+                self.state.mark_failed(job, str(e))
+                processed.append(job)
+        return processed
+
     def _get_engine_for_job(
         self,
         job: Job,
@@ -390,10 +439,68 @@ class TranscriptionOrchestrator:
     - Batch processing
     - Retry automático
     - Cleanup de recursos
+
+    Jobs curtos de faster-whisper são agrupados por (idioma, task) e
+    transcritos em passes batched do mesmo modelo, amortizando o overhead
+    por chamada. Os demais seguem pelo ``process_job`` individual.
     """
 
-    def __init__(self, service: TranscriptionService) -> None:
+    def __init__(
+        self,
+        service: TranscriptionService,
+        batch_size: int | None = None,
+        max_clip_seconds: float | None = None,
+        max_jobs_per_batch: int | None = None,
+    ) -> None:
+        from ..core.config import get_settings
+
+        settings = get_settings()
         self.service = service
+        self.batch_size = batch_size or int(settings.get("batch_inference_size", 8))
+        self.max_clip_seconds = max_clip_seconds or float(settings.get("batch_max_clip_seconds", 30.0))
+        self.max_jobs_per_batch = max_jobs_per_batch or int(settings.get("batch_max_jobs", 16))
+
+    async def _load_batchable_clip(self, job: Job) -> Any | None:
+        """Decodifica o áudio do job se ele for elegível a batch; senão retorna None."""
+        if job.engine != WhisperEngineEnum.FASTER_WHISPER:
+            return None
+
+        input_path = await self.service._validate_and_resolve_file(job)
+        if input_path is None:
+            return None
+
+        from faster_whisper import decode_audio
+        from ..shared.batched_inference import SAMPLE_RATE
+
+        try:
+            clip = await asyncio.to_thread(decode_audio, str(input_path), sampling_rate=SAMPLE_RATE)
+        except Exception as e:
+            logger.debug(f"Job {job.id} não decodificável para batch: {e}")
+            return None
+
+        if len(clip) == 0 or len(clip) / SAMPLE_RATE > self.max_clip_seconds:
+            return None
+        return clip
+
+    async def _run_batch_group(
+        self, jobs: list[Job], clips: list[Any], language: str | None, task: str
+    ) -> list[Job]:
+        """Executa um grupo batched; em falha, reprocessa os jobs individualmente."""
+        try:
+            return await self.service.process_jobs_batched(
+                jobs, clips, language=language, task=task, batch_size=self.batch_size,
+            )
+        except Exception as e:
+            logger.warning(f"Batch de {len(jobs)} jobs falhou ({e}) - processando individualmente")
+            return [await self._process_single(job) for job in jobs]
+
+    async def _process_single(self, job: Job) -> Job:
+        try:
+            return await self.service.process_job(job)
+        except Exception as e:
+            logger.error(f"Job {job.id} falhou no batch: {e}")
+            self.service.state.mark_failed(job, str(e))
+            return job
 
     async def process_batch(
         self,
@@ -410,28 +517,47 @@ class TranscriptionOrchestrator:
         Returns:
             Lista de jobs processados
         """
+        clips = await asyncio.gather(*(self._load_batchable_clip(job) for job in jobs))
+
+        groups: dict[tuple[str | None, str], list[tuple[Job, Any]]] = {}
+        individual: list[Job] = []
+        for job, clip in zip(jobs, clips):
+            if clip is None:
+                individual.append(job)
+                continue
+            language = job.language_in if job.language_in != "auto" else None
+            task = "translate" if job.needs_translation else "transcribe"
+            groups.setdefault((language, task), []).append((job, clip))
+
+        processed: list[Job] = []
+        for (language, task), members in groups.items():
+            for start in range(0, len(members), self.max_jobs_per_batch):
+                chunk = members[start:start + self.max_jobs_per_batch]
+                if len(chunk) == 1:
+                    individual.append(chunk[0][0])
+                    continue
+                processed.extend(await self._run_batch_group(
+                    [job for job, _ in chunk], [clip for _, clip in chunk], language, task,
+                ))
+
         semaphore = asyncio.Semaphore(max_concurrent)
         
         async def process_with_semaphore(job: Job) -> Job:
             async with semaphore:
-                try:
-                    return await self.service.process_job(job)
-                except Exception as e:
-                    logger.error(f"Job {job.id} falhou no batch: {e}")
-                    self.state.mark_failed(job, str(e))
-                    return job
+                return await self._process_single(job)
         
-        tasks = [process_with_semaphore(job) for job in jobs]
+        tasks = [process_with_semaphore(job) for job in individual]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Filtra exceções
-        processed = []
         for result in results:
             if isinstance(result, Exception):
                 logger.error(f"Exceção em job do batch: {result}")
             else:
                 processed.append(result)
-        
+
+        order = {job.id: index for index, job in enumerate(jobs)}
+        processed.sort(key=lambda job: order.get(job.id, len(order)))
         return processed
 
     from ..core.constants import DEFAULT_MAX_RETRIES
@@ -1,17 +1,40 @@
 from __future__ import annotations
 
+import bisect
 from pathlib import Path
+from typing import Sequence
 
 from pydub import AudioSegment
 
 
 class AudioChunk:
-    """Represents a single audio chunk with metadata."""
+    """Represents a single audio chunk with metadata.
 
-    def __init__(self, audio: AudioSegment, start_time_s: float, number: int) -> None:
+    Chunks built from speech regions (:meth:`AudioChunker.pack_speech`) are
+    not contiguous on the original timeline; their *time_map* lists the
+    pieces as ``(chunk_offset_s, original_start_s, duration_s)`` tuples so
+    chunk-local timestamps can be mapped back with :func:`map_chunk_time`.
+    """
+
+    def __init__(
+        self,
+        audio: AudioSegment,
+        start_time_s: float,
+        number: int,
+        time_map: list[tuple[float, float, float]] | None = None,
+    ) -> None:
         self.audio = audio
         self.start_time_s = start_time_s
         self.number = number
+        self.time_map = time_map
+
+
+def map_chunk_time(time_map: Sequence[tuple[float, float, float]], t: float) -> float:
+    """Map a chunk-local timestamp to the original timeline using a chunk *time_map*."""
+    offsets = [piece[0] for piece in time_map]
+    index = max(bisect.bisect_right(offsets, t) - 1, 0)
+    chunk_offset, original_start, duration = time_map[index]
+    return original_start + min(max(t - chunk_offset, 0.0), duration)
 
 
 class AudioChunker:
@@ -49,7 +72,7 @@ class AudioChunker:
                 f"(got {self.chunk_length_ms / 1000}s vs {self.overlap_ms / 1000}s)"
             )
 
-        chunks: List[AudioChunk] = []
+        chunks: list[AudioChunk] = []
         current_position = 0
         chunk_number = 0
 
@@ -69,6 +92,59 @@ class AudioChunker:
 
         return chunks
 
+    def pack_speech(self, audio: AudioSegment, regions: Sequence[object]) -> list[AudioChunk]:
+        """Pack speech regions into chunks of up to ``chunk_length_seconds``.
+
+        Silence between regions is dropped: each chunk is the concatenation
+        of consecutive regions, with a *time_map* to restore the original
+        timestamps. Regions longer than a chunk are split at the chunk length.
+
+        Args:
+            audio: Full audio.
+            regions: Objects with ``start``/``end`` attributes in seconds, ordered.
+
+        Returns:
+            Ordered list of packed :class:`AudioChunk` instances.
+        """
+        pieces: list[tuple[int, int]] = []
+        for region in regions:
+            start_ms = max(int(region.start * 1000), 0)
+            end_ms = min(int(region.end * 1000), len(audio))
+            while end_ms - start_ms > self.chunk_length_ms:
+                pieces.append((start_ms, start_ms + self.chunk_length_ms))
+                start_ms += self.chunk_length_ms
+            if end_ms > start_ms:
+                pieces.append((start_ms, end_ms))
+
+        chunks: list[AudioChunk] = []
+        current: list[tuple[int, int]] = []
+        current_ms = 0
+
+        def _flush() -> None:
+            chunk_audio = AudioSegment.empty()
+            time_map: list[tuple[float, float, float]] = []
+            for piece_start, piece_end in current:
+                time_map.append((len(chunk_audio) / 1000.0, piece_start / 1000.0, (piece_end - piece_start) / 1000.0))
+                chunk_audio += audio[piece_start:piece_end]
+            chunks.append(AudioChunk(
+                audio=chunk_audio,
+                start_time_s=current[0][0] / 1000.0,
+                number=len(chunks),
+                time_map=time_map,
+            ))
+
+        for piece in pieces:
+            piece_ms = piece[1] - piece[0]
+            if current and current_ms + piece_ms > self.chunk_length_ms:
+                _flush()
+                current, current_ms = [], 0
+            current.append(piece)
+            current_ms += piece_ms
+        if current:
+            _flush()
+
+        return chunks
+
     def export_chunk(self, index: int, chunk: AudioChunk) -> Path:
         """Export a single ``AudioChunk`` to a temporary WAV file.
 
@@ -60,6 +60,22 @@ def has_audio_stream(input_path: Path) -> tuple[bool, str]:
         return True, f"erro na verificação: {e}, assumindo que tem áudio"
 
 
+def probe_duration(input_path: Path) -> float | None:
+    """Duração do arquivo em segundos via ffprobe (None se não puder ser lida)."""
+    cmd = [
+        'ffprobe', '-v', 'quiet', '-print_format', 'json',
+        '-show_format', str(input_path)
+    ]
+
+    try:
+        result = sp.run(cmd, capture_output=True, text=True, timeout=30)
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        return float(json.loads(result.stdout)['format']['duration'])
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError, FileNotFoundError, sp.TimeoutExpired):
+        return None
+
+
 def _validate_wav_input(input_path: Path) -> None:
     """Raise AudioTranscriptionException if input file doesn't exist."""
     if not input_path.exists():
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import bisect
+from collections import defaultdict
+from typing import Any
+
+import numpy as np
+from faster_whisper import BatchedInferencePipeline
+
+from common.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+SAMPLE_RATE = 16000
+# Janela máxima do Whisper; clips maiores são divididos em várias janelas
+MAX_WINDOW_SECONDS = 30.0
+
+
+def _segment_to_dict(segment: Any, offset: float) -> dict[str, Any]:
+    """Convert a faster-whisper Segment to the service dict format, shifted by -offset."""
+    words = []
+    for word in segment.words or []:
+        words.append({
+            "word": word.word,
+            "start": word.start - offset,
+            "end": word.end - offset,
+            "probability": getattr(word, "probability", 1.0),
+        })
+    return {
+        "text": segment.text,
+        "start": segment.start - offset,
+        "end": segment.end - offset,
+        "words": words,
+    }
+
+
+def _detect_languages(model: Any, clips: list[np.ndarray]) -> list[str]:
+    """Detect the language of each clip individually (first 30s)."""
+    languages = []
+    for clip in clips:
+        language, _probability, _all = model.detect_language(audio=clip)
+        languages.append(language)
+    return languages
+
+
+def _transcribe_group(
+    pipeline: BatchedInferencePipeline,
+    clips: list[np.ndarray],
+    language: str,
+    task: str,
+    batch_size: int,
+    **options: Any,
+) -> list[dict[str, Any]]:
+    """Run one batched call over clips that share language and task."""
+    window_starts: list[float] = []
+    window_clip: list[int] = []
+    clip_offsets: list[float] = []
+    clip_timestamps: list[dict[str, float]] = []
+
+    position = 0.0
+    for index, clip in enumerate(clips):
+        duration = len(clip) / SAMPLE_RATE
+        clip_offsets.append(position)
+        window_start = 0.0
+        while window_start < duration:
+            window_end = min(window_start + MAX_WINDOW_SECONDS, duration)
+            clip_timestamps.append({"start": position + window_start, "end": position + window_end})
+            window_starts.append(position + window_start)
+            window_clip.append(index)
+            window_start = window_end
+        position += duration
+
+    audio = np.concatenate(clips).astype(np.float32) if clips else np.zeros(0, dtype=np.float32)
+    segments_gen, _info = pipeline.transcribe(
+        audio,
+        language=language,
+        task=task,
+        clip_timestamps=clip_timestamps,
+        batch_size=batch_size,
+        word_timestamps=True,
+        **options,
+    )
+
+    per_clip: list[list[dict[str, Any]]] = [[] for _ in clips]
+    for segment in segments_gen:
+        window = max(bisect.bisect_right(window_starts, segment.start + 1e-3) - 1, 0)
+        index = window_clip[window]
+        per_clip[index].append(_segment_to_dict(segment, clip_offsets[index]))
+
+    results = []
+    for index, segments in enumerate(per_clip):
+        results.append({
+            "success": True,
+            "text": " ".join(s["text"] for s in segments).strip(),
+            "segments": segments,
+            "language": language,
+            "duration": len(clips[index]) / SAMPLE_RATE,
+        })
+    return results
+
+
+def transcribe_clips_batched(
+    model: Any,
+    clips: list[np.ndarray],
+    language: str | None = None,
+    task: str = "transcribe",
+    batch_size: int = 8,
+    **options: Any,
+) -> list[dict[str, Any]]:
+    """Transcribe several short clips in batched forward passes of one model.
+
+    The clips are laid end to end and handed to faster-whisper's
+    ``BatchedInferencePipeline`` with one ``clip_timestamps`` window per clip
+    (clips longer than 30s span several windows). Segments are then split
+    back per clip using the window they came from and shifted so that each
+    clip starts at 0.
+
+    Args:
+        model: Loaded ``faster_whisper.WhisperModel``.
+        clips: Mono float32 audio at 16 kHz, one array per clip.
+        language: Language code shared by all clips, or None to detect per clip.
+        task: ``'transcribe'`` or ``'translate'``.
+        batch_size: Windows decoded per forward pass.
+        **options: Extra decoding options (beam_size, best_of, ...).
+
+    Returns:
+        One result dict per clip, in input order, with ``'text'``,
+        ``'segments'``, ``'language'`` and ``'duration'`` keys.
+    """
+    if not clips:
+        return []
+
+    if language and language != "auto":
+        languages = [language] * len(clips)
+    else:
+        languages = _detect_languages(model, clips)
+
+    groups: dict[str, list[int]] = defaultdict(list)
+    for index, clip_language in enumerate(languages):
+        groups[clip_language].append(index)
+
+    pipeline = BatchedInferencePipeline(model=model)
+    results: list[dict[str, Any] | None] = [None] * len(clips)
+    for group_language, indices in groups.items():
+        logger.info(
+            f"Batch: {len(indices)} clips (language={group_language}, task={task}, batch_size={batch_size})"
+        )
+        group_results = _transcribe_group(
+            pipeline, [clips[i] for i in indices], group_language, task, batch_size, **options,
+        )
+        for index, result in zip(indices, group_results):
+            results[index] = result
+
+    return results
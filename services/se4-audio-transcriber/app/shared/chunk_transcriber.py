@@ -1,28 +1,96 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from common.log_utils import get_logger
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
 
 from pydub import AudioSegment
 
-from .audio_chunker import AudioChunker
+from .audio_chunker import AudioChunker, map_chunk_time
+from .speech_detector import SpeechDetector, build_speech_report
 from ..shared.exceptions import AudioTranscriptionException
 
 logger = get_logger(__name__)
 
 
+class _ChunkCheckpoint:
+    """Per-job view over the checkpoint store while chunks are transcribed.
+
+    Loads the chunk results persisted by a previous attempt of the same job
+    and persists each new one as soon as it finishes. Persistence failures
+    are logged and never fail the transcription.
+    """
+
+    def __init__(self, store: Any, job_id: str, plan_id: str, total_chunks: int, total_seconds: float) -> None:
+        self.store = store
+        self.job_id = job_id
+        self.plan_id = plan_id
+        self.total_chunks = total_chunks
+        self.total_seconds = total_seconds
+        self._lock = threading.Lock()
+        try:
+            completed = store.get_chunk_results(job_id, plan_id)
+        except Exception as e:
+            logger.warning(f"Falha ao ler checkpoint de chunks do job {job_id}: {e}")
+            completed = {}
+        self.completed: dict[int, dict[str, Any]] = {
+            index: result for index, result in completed.items() if 0 <= index < total_chunks
+        }
+        if self.completed:
+            logger.info(
+                f"♻️ Retomando job {job_id}: {len(self.completed)}/{total_chunks} chunks já transcritos"
+            )
+
+    def save(self, index: int, result: dict[str, Any]) -> None:
+        with self._lock:
+            self.completed[index] = result
+            done = len(self.completed)
+        try:
+            self.store.save_chunk_result(
+                self.job_id,
+                self.plan_id,
+                index,
+                {"text": result.get("text", ""), "segments": result.get("segments", [])},
+                total_chunks=self.total_chunks,
+                processed_seconds=self.total_seconds * done / self.total_chunks,
+                total_seconds=self.total_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Falha ao salvar checkpoint do chunk {index + 1} (job {self.job_id}): {e}")
+
+
 class ChunkTranscriber:
     """Orchestrate multi-chunk transcription for long audio files.
 
     Accepts a callable *transcribe_fn* that performs the actual transcription
     of individual chunks, keeping this class decoupled from any specific
     transcription engine (Dependency Inversion Principle).
+
+    When several callables are given (one per model replica), chunks are
+    fanned out to a thread pool with one worker per replica. faster-whisper
+    releases the GIL during inference, so replicas scale with CPU cores.
+    Results are reassembled in chunk order either way.
+
+    When a *checkpoints* store is given, each chunk result is persisted as
+    soon as it finishes; a retried job (e.g. after a worker crash) only
+    transcribes the chunks that are still missing.
     """
 
-    def __init__(self, settings: dict[str, Any], state: Any | None = None) -> None:
+    def __init__(
+        self,
+        settings: dict[str, Any],
+        state: Any | None = None,
+        checkpoints: Any | None = None,
+    ) -> None:
         self.settings = settings or {}
         self.state = state  # JobStateUpdater – may be None when no job tracking
+        self.checkpoints = checkpoints  # CheckpointManager – may be None (no resume)
 
     # ------------------------------------------------------------------
     # Public API
@@ -41,6 +109,58 @@ class ChunkTranscriber:
                 f"Erro ao carregar arquivo de áudio com pydub: {str(e)}"
             )
 
+    @staticmethod
+    def _adjust_chunk_segments(
+        chunk_result: dict[str, Any],
+        chunks: list[Any],
+        index: int,
+        overlap_seconds: float,
+    ) -> list[dict[str, Any]]:
+        """Shift chunk segments to absolute time and drop the ones owned by a neighbour.
+
+        Consecutive chunks share *overlap_seconds* of audio. The boundary
+        between chunk ``i`` and ``i + 1`` is the middle of that overlap; a
+        segment is kept only by the chunk whose side of the boundary its
+        midpoint falls on, so words spoken in the overlap are not emitted twice.
+
+        Speech-packed chunks carry a ``time_map`` instead of a single offset;
+        their segment and word timestamps are mapped piece by piece.
+        """
+        offset = chunks[index].start_time_s
+        lower = offset + overlap_seconds / 2 if index > 0 else None
+        upper = chunks[index + 1].start_time_s + overlap_seconds / 2 if index + 1 < len(chunks) else None
+
+        time_map = getattr(chunks[index], "time_map", None)
+        if time_map:
+            def _to_original(t: float) -> float:
+                return map_chunk_time(time_map, t)
+        else:
+            def _to_original(t: float) -> float:
+                return t + offset
+
+        adjusted_segments: list[dict[str, Any]] = []
+        for segment in chunk_result["segments"]:
+            adjusted_segment = segment.copy()
+            adjusted_segment["start"] = _to_original(segment["start"])
+            adjusted_segment["end"] = _to_original(segment["end"])
+            if time_map and segment.get("words"):
+                adjusted_segment["words"] = [
+                    {**word, "start": _to_original(word["start"]), "end": _to_original(word["end"])}
+                    for word in segment["words"]
+                ]
+            midpoint = (adjusted_segment["start"] + adjusted_segment["end"]) / 2
+            if lower is not None and midpoint < lower:
+                continue
+            if upper is not None and midpoint >= upper:
+                continue
+            adjusted_segments.append(adjusted_segment)
+        return adjusted_segments
+
+    def _report_chunk_progress(self, completed: int, total: int, job_id: str | None) -> None:
+        if job_id and self.state:
+            progress = 25.0 + (50.0 * completed / total)
+            self.state.set_progress(progress, job_id)
+
     def _transcribe_chunks(
         self,
         chunks: list[Any],
@@ -49,12 +169,21 @@ class ChunkTranscriber:
         language_in: str,
         language_out: str | None,
         job_id: str | None,
+        overlap_seconds: float = 0.0,
+        checkpoint: _ChunkCheckpoint | None = None,
     ) -> tuple[list[dict[str, Any]], list[str]]:
         """Transcribe each chunk and collect results. Returns (segments, text_parts)."""
         all_segments: list[dict[str, Any]] = []
         full_text_parts: list[str] = []
+        resumed = checkpoint.completed if checkpoint else {}
 
         for i, audio_chunk in enumerate(chunks):
+            if i in resumed:
+                chunk_result = resumed[i]
+                all_segments.extend(self._adjust_chunk_segments(chunk_result, chunks, i, overlap_seconds))
+                full_text_parts.append(chunk_result["text"])
+                continue
+
             chunk_file = chunker.export_chunk(i, audio_chunk)
 
             logger.info(
@@ -63,19 +192,92 @@ class ChunkTranscriber:
             )
 
             chunk_result = transcribe_fn(str(chunk_file), language_in, language_out)
+            if checkpoint:
+                checkpoint.save(i, chunk_result)
 
-            for segment in chunk_result["segments"]:
-                adjusted_segment = segment.copy()
-                adjusted_segment["start"] += audio_chunk.start_time_s
-                adjusted_segment["end"] += audio_chunk.start_time_s
-                all_segments.append(adjusted_segment)
-
+            all_segments.extend(self._adjust_chunk_segments(chunk_result, chunks, i, overlap_seconds))
             full_text_parts.append(chunk_result["text"])
             chunker.cleanup_chunk(chunk_file)
 
-            if job_id and self.state:
-                progress = 25.0 + (50.0 * (i + 1) / len(chunks))
-                self.state.set_progress(progress, job_id)
+            self._report_chunk_progress(i + 1, len(chunks), job_id)
+
+        return all_segments, full_text_parts
+
+    def _transcribe_chunks_parallel(
+        self,
+        chunks: list[Any],
+        chunker: Any,
+        transcribe_fns: Sequence[Callable[[str, str, str | None], dict[str, Any]]],
+        language_in: str,
+        language_out: str | None,
+        job_id: str | None,
+        overlap_seconds: float = 0.0,
+        checkpoint: _ChunkCheckpoint | None = None,
+        stop: threading.Event | None = None,
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Transcribe chunks concurrently, one worker thread per model replica.
+
+        Each worker pulls the next pending chunk from a shared queue and
+        transcribes it with its own replica. Returns (segments, text_parts)
+        in chunk order, exactly like :meth:`_transcribe_chunks`.
+
+        Setting *stop* makes the workers finish their current chunk and exit;
+        the call then raises instead of returning partial results.
+        """
+        resumed = checkpoint.completed if checkpoint else {}
+        results: list[dict[str, Any] | None] = [resumed.get(i) for i in range(len(chunks))]
+
+        pending: queue.Queue[int] = queue.Queue()
+        for i in range(len(chunks)):
+            if results[i] is None:
+                pending.put(i)
+
+        completed = [len(chunks) - pending.qsize()]
+        progress_lock = threading.Lock()
+        failed = stop if stop is not None else threading.Event()
+
+        def _worker(worker_id: int, fn: Callable[[str, str, str | None], dict[str, Any]]) -> None:
+            while not failed.is_set():
+                try:
+                    i = pending.get_nowait()
+                except queue.Empty:
+                    return
+
+                audio_chunk = chunks[i]
+                chunk_file = chunker.export_chunk(i, audio_chunk)
+                logger.info(
+                    f"[worker {worker_id}] Processando chunk {i + 1}/{len(chunks)} "
+                    f"(offset: {audio_chunk.start_time_s:.1f}s)"
+                )
+                try:
+                    results[i] = fn(str(chunk_file), language_in, language_out)
+                    if checkpoint:
+                        checkpoint.save(i, results[i])
+                except Exception:
+                    failed.set()
+                    raise
+                finally:
+                    chunker.cleanup_chunk(chunk_file)
+
+                with progress_lock:
+                    completed[0] += 1
+                    self._report_chunk_progress(completed[0], len(chunks), job_id)
+
+        workers = max(min(len(transcribe_fns), pending.qsize()), 1)
+        logger.info(f"Transcrevendo {pending.qsize()} chunks em paralelo com {workers} réplicas")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chunk-transcriber") as executor:
+            futures = [executor.submit(_worker, n, transcribe_fns[n]) for n in range(workers)]
+            for future in futures:
+                future.result()
+
+        if any(result is None for result in results):
+            raise AudioTranscriptionException("Transcrição em chunks interrompida")
+
+        all_segments: list[dict[str, Any]] = []
+        full_text_parts: list[str] = []
+        for i, chunk_result in enumerate(results):
+            all_segments.extend(self._adjust_chunk_segments(chunk_result, chunks, i, overlap_seconds))
+            full_text_parts.append(chunk_result["text"])
 
         return all_segments, full_text_parts
 
@@ -87,6 +289,7 @@ class ChunkTranscriber:
         transcribe_fn: Callable[[str, str, str | None], dict[str, Any]],
         job_id: str | None = None,
         audio: AudioSegment | None = None,
+        transcribe_fns: Sequence[Callable[[str, str, str | None], dict[str, Any]]] | None = None,
     ) -> dict[str, Any]:
         """Orchestrate chunking + transcription loop + segment merge.
 
@@ -99,6 +302,9 @@ class ChunkTranscriber:
                 engine-level transcription of a single chunk.
             job_id: Optional job identifier for progress tracking via *state*.
             audio: Pre-loaded AudioSegment (avoids re-reading from disk).
+            transcribe_fns: Optional callables, one per model replica. With
+                more than one, chunks are transcribed in parallel and
+                *transcribe_fn* is ignored.
 
         Returns:
             dict with ``'text'`` and ``'segments`` in Whisper format.
@@ -127,27 +333,108 @@ class ChunkTranscriber:
                 overlap_seconds=overlap_seconds,
             )
 
-            chunks = chunker.split(audio)
+            speech_report = None
+            if self.settings.get("vad_speech_only", False):
+                chunks, speech_report = self._speech_chunks(audio, chunker, duration_seconds)
+                overlap_seconds = 0.0
+                if not chunks:
+                    logger.info("VAD não encontrou fala; nada a transcrever")
+                    return {"text": "", "segments": [], "speech_detection": speech_report}
+            else:
+                chunks = chunker.split(audio)
             logger.info(f"Áudio dividido em {len(chunks)} chunks")
 
-            all_segments, full_text_parts = self._transcribe_chunks(
-                chunks, chunker, transcribe_fn, language_in, language_out, job_id,
-            )
+            checkpoint = None
+            if self.checkpoints is not None and job_id:
+                plan_id = self._chunk_plan_id(chunks, duration_seconds, language_in, language_out)
+                checkpoint = _ChunkCheckpoint(self.checkpoints, job_id, plan_id, len(chunks), duration_seconds)
+
+            if transcribe_fns and len(transcribe_fns) > 1 and len(chunks) > 1:
+                stop = threading.Event()
+                work = asyncio.ensure_future(asyncio.to_thread(
+                    self._transcribe_chunks_parallel,
+                    chunks, chunker, transcribe_fns, language_in, language_out, job_id, overlap_seconds,
+                    checkpoint, stop,
+                ))
+                try:
+                    all_segments, _ = await asyncio.shield(work)
+                except asyncio.CancelledError:
+                    # Timeout do chamador: as réplicas só podem ser devolvidas ao
+                    # pool depois que os workers terminarem o chunk em andamento
+                    stop.set()
+                    await asyncio.gather(work, return_exceptions=True)
+                    raise
+            else:
+                all_segments, _ = self._transcribe_chunks(
+                    chunks, chunker, transcribe_fn, language_in, language_out, job_id, overlap_seconds,
+                    checkpoint,
+                )
 
             merged_segments = self._merge_overlapping_segments(all_segments, overlap_seconds)
-            full_text = " ".join(full_text_parts)
+            # Texto a partir dos segmentos ajustados: sem as frases repetidas no overlap
+            full_text = " ".join(
+                segment["text"].strip() for segment in merged_segments if segment.get("text", "").strip()
+            )
 
             logger.info(f"Chunking concluído: {len(merged_segments)} segmentos finais")
 
-            return {
+            result = {
                 "text": full_text,
                 "segments": merged_segments,
             }
+            if speech_report is not None:
+                result["speech_detection"] = speech_report
+            return result
 
         except Exception as e:
             logger.error(f"Erro no chunking (ChunkTranscriber): {e}")
             raise AudioTranscriptionException(f"Falha no chunking: {str(e)}")
 
+    def _chunk_plan_id(
+        self,
+        chunks: list[Any],
+        duration_seconds: float,
+        language_in: str,
+        language_out: str | None,
+    ) -> str:
+        """Fingerprint of the chunk plan, so a retry only reuses results for identical chunks.
+
+        Changing the chunk length, overlap, VAD mode, model or languages
+        between attempts yields a different id and a fresh transcription.
+        """
+        plan = {
+            "duration": round(duration_seconds, 3),
+            "starts": [round(chunk.start_time_s, 3) for chunk in chunks],
+            "chunk_length": self.settings.get("chunk_length_seconds", 30),
+            "overlap": self.settings.get("chunk_overlap_seconds", 1.0),
+            "vad": bool(self.settings.get("vad_speech_only", False)),
+            "model": self.settings.get("whisper_model", "base"),
+            "language_in": language_in,
+            "language_out": language_out,
+        }
+        return hashlib.sha256(json.dumps(plan, sort_keys=True).encode()).hexdigest()[:16]
+
+    def _speech_chunks(
+        self, audio: AudioSegment, chunker: AudioChunker, duration_seconds: float
+    ) -> tuple[list[Any], dict[str, Any]]:
+        """VAD pre-pass: pack only the speech regions into chunks.
+
+        Returns:
+            (chunks, speech_detection report with kept/skipped seconds)
+        """
+        detector = SpeechDetector(
+            threshold=float(self.settings.get("vad_threshold", 0.5)),
+            min_silence_ms=int(self.settings.get("vad_min_silence_ms", 500)),
+            speech_pad_ms=int(self.settings.get("vad_speech_pad_ms", 200)),
+        )
+        regions = detector.detect(audio)
+        report = build_speech_report(regions, duration_seconds)
+        logger.info(
+            f"VAD: {report['speech_seconds']:.1f}s de fala, "
+            f"{report['skipped_seconds']:.1f}s ignorados ({report['skipped_ratio']:.0%})"
+        )
+        return chunker.pack_speech(audio, regions), report
+
     # ------------------------------------------------------------------
     # Segment merge & similarity helpers  (moved from processor.py)
     # ------------------------------------------------------------------
@@ -2,19 +2,57 @@
 
 Validates uploaded content, persists to disk with retry semantics, and returns
 file metadata ready to be attached to a ``Job`` instance.
+
+Uploads are streamed to a staging file in fixed-size chunks (hashed and
+size-checked as they arrive) so the request body is never held in memory;
+:meth:`FileUploadHandler.save_file` then moves the staged file into place.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
 import time
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Protocol, Union
+
+from common.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+#: Size of each read from the incoming request body.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class FileUploadError(Exception):
     """Raised when file upload or persistence fails."""
 
 
+class FileUploadTooLargeError(FileUploadError):
+    """Raised as soon as an upload exceeds the configured size limit."""
+
+
+class _AsyncReadable(Protocol):
+    size: Optional[int]
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+@dataclass
+class StagedUpload:
+    """An upload fully written to a staging file, with its size and SHA-256."""
+
+    path: Path
+    size: int
+    sha256: str
+
+    def discard(self) -> None:
+        """Remove the staging file (no-op once it has been moved into place)."""
+        self.path.unlink(missing_ok=True)
+
+
 class FileUploadHandler:
     """Save uploaded files with retry and fsync guarantees."""
 
@@ -22,21 +60,82 @@ class FileUploadHandler:
         self.upload_dir = Path(upload_dir).resolve()
         self._ensure_upload_dir()
 
+    @property
+    def incoming_dir(self) -> Path:
+        """Staging directory for uploads still being received."""
+        return self.upload_dir / ".incoming"
+
     # -- public API ------------------------------------------------------------
 
+    async def stage_upload(
+        self,
+        upload: _AsyncReadable,
+        max_bytes: int,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ) -> StagedUpload:
+        """Stream *upload* to ``upload_dir/.incoming`` in *chunk_size* pieces.
+
+        Each chunk is hashed and counted before it is written, so peak memory
+        is one chunk regardless of the file size. An upload whose declared
+        size is over *max_bytes* is rejected before reading; otherwise reading
+        stops as soon as the limit is crossed and the partial file is removed.
+
+        Raises :class:`FileUploadTooLargeError` when the limit is exceeded and
+        :class:`FileUploadError` for empty or unreadable uploads.
+        """
+        limit_mb = max_bytes / 1024 / 1024
+        declared = getattr(upload, "size", None)
+        if declared is not None and declared > max_bytes:
+            raise FileUploadTooLargeError(
+                f"Arquivo muito grande ({declared / 1024 / 1024:.1f}MB). Máximo permitido: {limit_mb:.0f}MB"
+            )
+
+        self.incoming_dir.mkdir(parents=True, exist_ok=True)
+        path = self.incoming_dir / f"{uuid.uuid4().hex}.part"
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with open(path, "wb") as fh:
+                while chunk := await upload.read(chunk_size):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise FileUploadTooLargeError(
+                            f"Arquivo excede o tamanho máximo permitido de {limit_mb:.0f}MB"
+                        )
+                    hasher.update(chunk)
+                    await asyncio.to_thread(fh.write, chunk)
+                await asyncio.to_thread(_flush_and_sync, fh)
+        except FileUploadError:
+            path.unlink(missing_ok=True)
+            raise
+        except Exception as exc:
+            path.unlink(missing_ok=True)
+            raise FileUploadError(f"Falha ao receber arquivo: {exc}") from exc
+
+        if size == 0:
+            path.unlink(missing_ok=True)
+            raise FileUploadError("Arquivo enviado está vazio")
+
+        staged = StagedUpload(path=path, size=size, sha256=hasher.hexdigest())
+        logger.debug(f"Upload recebido: {size} bytes (sha256={staged.sha256[:12]})")
+        return staged
+
     async def save_file(
         self,
-        file_content: bytes,
+        file_content: Union[bytes, StagedUpload],
         original_filename: Optional[str],
         job_id: str,
         max_retries: int = 3,
     ) -> Path:
         """Persist *file_content* under ``upload_dir/<job_id><ext>``.
 
+        *file_content* is either the raw bytes or a :class:`StagedUpload`,
+        which is moved into place without copying.
+
         Returns the absolute path to the saved file.
         Raises :class:`FileUploadError` on validation or persistence failure.
         """
-        if not file_content:
+        if not file_content or (isinstance(file_content, StagedUpload) and file_content.size == 0):
             raise FileUploadError("Arquivo enviado está vazio")
 
         original_extension = Path(original_filename).suffix if original_filename else ""
@@ -51,14 +150,18 @@ class FileUploadHandler:
         self.upload_dir.mkdir(parents=True, exist_ok=True)
 
     async def _write_with_retry(
-        self, path: Path, content: bytes, max_retries: int
+        self, path: Path, content: Union[bytes, StagedUpload], max_retries: int
     ) -> Path:
         for attempt in range(max_retries):
             try:
-                with open(path, "wb") as fh:
-                    fh.write(content)
-                    fh.flush()
-                    os.fsync(fh.fileno())
+                if isinstance(content, StagedUpload):
+                    # Already fsynced while staging; same filesystem, so a rename.
+                    if content.path.exists():
+                        os.replace(content.path, path)
+                else:
+                    with open(path, "wb") as fh:
+                        fh.write(content)
+                        _flush_and_sync(fh)
 
                 if path.exists() and path.stat().st_size > 0:
                     return path
@@ -70,3 +173,8 @@ class FileUploadHandler:
             time.sleep(0.5 * (attempt + 1))
 
         raise FileUploadError(f"Falha ao salvar arquivo após {max_retries} tentativas")
+
+
+def _flush_and_sync(fh) -> None:
+    fh.flush()
+    os.fsync(fh.fileno())
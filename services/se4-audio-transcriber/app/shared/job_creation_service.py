@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Callable, Optional
 if TYPE_CHECKING:
     from app.domain.interfaces import IJobStore
     from app.domain.models import Job, WhisperEngine
-    from app.shared.file_upload_handler import FileUploadHandler
+    from app.shared.file_upload_handler import FileUploadHandler, StagedUpload
 
 
 class JobCreationError(Exception):
@@ -47,7 +47,7 @@ class JobCreationService:
 
     async def create_or_resume_job(
         self,
-        file_content: bytes,
+        file_content: "bytes | StagedUpload",
         original_filename: Optional[str],
         language_in: str,
         language_out: Optional[str] = None,
@@ -55,6 +55,9 @@ class JobCreationService:
     ) -> Job:
         """Create a new job or resume an existing one (replay / orphan recovery).
 
+        *file_content* is only persisted when the job is (re)submitted; a
+        :class:`StagedUpload` left unused is discarded by the caller.
+
         Returns the ``Job`` instance ready for processing.
         """
         from app.domain.models import Job, WhisperEngine as WE  # noqa: F811 – local to avoid cycles
@@ -70,7 +73,7 @@ class JobCreationService:
             engine=engine,
         )
 
-        existing_job = self.job_store.get_job(new_job.id)
+        existing_job = await self.job_store.aget_job(new_job.id)
         if existing_job is not None:
             return await self._handle_existing_job(
                 existing_job, file_content, original_filename
@@ -83,7 +86,7 @@ class JobCreationService:
 
         new_job.input_file = str(saved_path.absolute())
         new_job.file_size_input = saved_path.stat().st_size
-        self.job_store.save_job(new_job)
+        await self.job_store.asave_job(new_job)
         self._submit_task(new_job)
         return new_job
 
@@ -92,7 +95,7 @@ class JobCreationService:
     async def _handle_existing_job(
         self,
         existing: Job,
-        file_content: bytes,
+        file_content: "bytes | StagedUpload",
         original_filename: Optional[str],
     ) -> Job:
         from app.domain.models import JobStatus  # noqa: F811 – local to avoid cycles
@@ -117,7 +120,7 @@ class JobCreationService:
     async def _re_submit_job(
         self,
         job: Job,
-        file_content: bytes,
+        file_content: "bytes | StagedUpload",
         original_filename: Optional[str],
     ) -> Job:
         from app.domain.models import JobStatus  # noqa: F811 – local to avoid cycles
@@ -131,7 +134,7 @@ class JobCreationService:
         job.status = JobStatus.QUEUED
         job.error_message = None
         job.progress = 0.0
-        self.job_store.update_job(job)
+        await self.job_store.aupdate_job(job)
         self._submit_task(job)
         return job
 
@@ -145,4 +148,4 @@ class JobCreationService:
                 logger = get_logger(__name__)
                 logger.error("Failed to submit task for job %s: %s", job.id, exc)
         else:
-            asyncio.create_task(self.job_store.update_job(job))
+            asyncio.create_task(self.job_store.aupdate_job(job))
@@ -69,8 +69,8 @@ class OrphanJobCleaner:
         
         try:
             # Snapshot both lists before any mutations to avoid double-processing requeued jobs
-            processing_jobs = list(self.job_store.list_jobs(status=JobStatus.PROCESSING))
-            queued_jobs = list(self.job_store.list_jobs(status=JobStatus.QUEUED))
+            processing_jobs = list(await self.job_store.alist_jobs(status=JobStatus.PROCESSING))
+            queued_jobs = list(await self.job_store.alist_jobs(status=JobStatus.QUEUED))
 
             stats["checked"] += len(processing_jobs)
 
@@ -139,7 +139,7 @@ class OrphanJobCleaner:
             job.progress = 0.0
             job.started_at = None
             
-            self.job_store.update_job(job)
+            await self.job_store.aupdate_job(job)
             stats["requeued"] += 1
             
             logger.warning(f"♻️ Job órfão {job.id} reenfileirado (tentativa {retry_count + 1})")
@@ -149,7 +149,7 @@ class OrphanJobCleaner:
             job.error_message = f"Job órfão após {retry_count} tentativas. Possível crash de worker ou timeout."
             job.progress = 0.0
             
-            self.job_store.update_job(job)
+            await self.job_store.aupdate_job(job)
             stats["failed"] += 1
             
             logger.error(f"❌ Job órfão {job.id} marcado como FAILED após {retry_count} tentativas")
@@ -162,7 +162,7 @@ class OrphanJobCleaner:
         job.error_message = f"Job permaneceu em fila por {age} sem ser processado. Possível problema no worker."
         job.progress = 0.0
         
-        self.job_store.update_job(job)
+        await self.job_store.aupdate_job(job)
         stats["failed"] += 1
         
         logger.error(f"❌ Job em fila órfão {job.id} marcado como FAILED (idade: {age})")
@@ -175,7 +175,7 @@ class DeadLetterQueueManager:
     def __init__(self, job_store: IJobStore) -> None:
         self.job_store = job_store
     
-    def send_to_dlq(self, job: Job, reason: str) -> None:
+    async def send_to_dlq(self, job: Job, reason: str) -> None:
         """
         Envia job para Dead Letter Queue.
         
@@ -190,14 +190,14 @@ class DeadLetterQueueManager:
             
             # Salva o job original com status FAILED e tag [DLQ] no error_message.
             # A tag [DLQ] é usada por list_dlq_jobs para filtrar jobs DLQ.
-            self.job_store.save_job(job)
+            await self.job_store.asave_job(job)
             
             logger.warning(f"📪 Job {job.id} enviado para DLQ: {reason}")
             
         except Exception as e:
             logger.error(f"❌ Erro ao enviar job {job.id} para DLQ: {e}")
     
-    def list_dlq_jobs(self, limit: int = 100) -> list[Job]:
+    async def list_dlq_jobs(self, limit: int = 100) -> list[Job]:
         """
         Lista jobs na Dead Letter Queue.
         
@@ -211,14 +211,14 @@ class DeadLetterQueueManager:
             Lista de jobs na DLQ
         """
         try:
-            failed_jobs = self.job_store.list_jobs(status=JobStatus.FAILED)
+            failed_jobs = await self.job_store.alist_jobs(status=JobStatus.FAILED)
             dlq_jobs = [j for j in failed_jobs if j.error_message and j.error_message.startswith("[DLQ]")]
             return dlq_jobs[:limit]
         except Exception as e:
             logger.error(f"❌ Erro ao listar DLQ: {e}")
             return []
     
-    def retry_dlq_job(self, job_id: str) -> bool:
+    async def retry_dlq_job(self, job_id: str) -> bool:
         """
         Retenta processar job da DLQ.
         
@@ -229,7 +229,7 @@ class DeadLetterQueueManager:
             True se job foi reenfileirado
         """
         try:
-            job = self.job_store.get_job(job_id)
+            job = await self.job_store.aget_job(job_id)
             if not job:
                 logger.error(f"Job {job_id} não encontrado na DLQ")
                 return False
@@ -240,7 +240,7 @@ class DeadLetterQueueManager:
             job.retry_count = getattr(job, 'retry_count', 0) + 1
             job.progress = 0.0
             
-            self.job_store.update_job(job)
+            await self.job_store.aupdate_job(job)
             
             logger.info(f"♻️ Job {job_id} da DLQ reenfileirado manualmente")
             return True
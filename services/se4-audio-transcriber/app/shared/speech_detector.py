@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from pydub import AudioSegment
+
+from common.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+VAD_SAMPLE_RATE = 16000
+
+
+@dataclass(frozen=True)
+class SpeechRegion:
+    """A speech region on the original timeline, in seconds."""
+
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def build_speech_report(regions: list[SpeechRegion], total_seconds: float) -> dict[str, Any]:
+    """Summarise how much of the audio the VAD pre-pass kept and skipped."""
+    speech_seconds = sum(region.duration for region in regions)
+    skipped_seconds = max(total_seconds - speech_seconds, 0.0)
+    return {
+        "regions": len(regions),
+        "total_seconds": round(total_seconds, 3),
+        "speech_seconds": round(speech_seconds, 3),
+        "skipped_seconds": round(skipped_seconds, 3),
+        "skipped_ratio": round(skipped_seconds / total_seconds, 4) if total_seconds else 0.0,
+    }
+
+
+class SpeechDetector:
+    """Find speech regions in an audio file with the Silero VAD bundled in faster-whisper.
+
+    Used as a pre-pass before chunking so that long silences and music beds
+    are never sent to the decoder.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        min_silence_ms: int = 500,
+        speech_pad_ms: int = 200,
+        min_speech_ms: int = 250,
+    ) -> None:
+        self.threshold = threshold
+        self.min_silence_ms = min_silence_ms
+        self.speech_pad_ms = speech_pad_ms
+        self.min_speech_ms = min_speech_ms
+
+    @staticmethod
+    def _to_samples(audio: AudioSegment) -> np.ndarray:
+        """Convert a pydub segment to mono float32 samples at 16 kHz."""
+        mono = audio.set_frame_rate(VAD_SAMPLE_RATE).set_channels(1).set_sample_width(2)
+        return np.frombuffer(mono.raw_data, dtype=np.int16).astype(np.float32) / 32768.0
+
+    def detect(self, audio: AudioSegment) -> list[SpeechRegion]:
+        """Return the speech regions of *audio*, ordered and non-overlapping."""
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        samples = self._to_samples(audio)
+        options = VadOptions(
+            threshold=self.threshold,
+            min_silence_duration_ms=self.min_silence_ms,
+            speech_pad_ms=self.speech_pad_ms,
+            min_speech_duration_ms=self.min_speech_ms,
+        )
+        timestamps = get_speech_timestamps(samples, options, sampling_rate=VAD_SAMPLE_RATE)
+
+        regions = [
+            SpeechRegion(start=ts["start"] / VAD_SAMPLE_RATE, end=ts["end"] / VAD_SAMPLE_RATE)
+            for ts in timestamps
+        ]
+        logger.info(f"VAD: {len(regions)} regiões de fala em {len(samples) / VAD_SAMPLE_RATE:.1f}s de áudio")
+        return regions
@@ -129,6 +129,13 @@ def mock_job_store(mock_redis):
     store.get_stats = MagicMock(return_value={"total_jobs": 0, "by_status": {}})
     store.find_orphaned_jobs = find_orphaned_jobs
     store.get_queue_info = get_queue_info
+    # IAsyncJobRepository (usado pelas rotas)
+    store.aget_job = AsyncMock(side_effect=get_job)
+    store.asave_job = AsyncMock(side_effect=save_job)
+    store.aupdate_job = AsyncMock(side_effect=update_job)
+    store.adelete_job = AsyncMock(side_effect=delete_job)
+    store.alist_jobs = AsyncMock(side_effect=lambda *a, **k: store.list_jobs(*a, **k))
+    store.aget_stats = AsyncMock(side_effect=lambda: store.get_stats())
     # IJobStore (.redis escape hatch — required by health check)
     store.redis = mock_redis
     return store
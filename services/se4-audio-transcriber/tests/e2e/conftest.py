@@ -71,6 +71,30 @@ class MockE2EJobStore:
         statuses = Counter(getattr(j, "status", None) for j in self._jobs.values())
         return {"total_jobs": len(self._jobs), "by_status": dict(statuses)}
 
+    # Async API used by the routes; delegates to the sync methods so
+    # StateTransitionJobStore keeps evolving the status on each poll
+    async def aget_job(self, job_id: str):
+        return self.get_job(job_id)
+
+    async def asave_job(self, job):
+        self.save_job(job)
+        return job
+
+    async def aupdate_job(self, job):
+        self.update_job(job)
+        return job
+
+    async def adelete_job(self, job_id: str):
+        existed = job_id in self._jobs
+        self.delete_job(job_id)
+        return existed
+
+    async def alist_jobs(self, limit=20):
+        return self.list_jobs(limit)
+
+    async def aget_stats(self):
+        return self.get_stats()
+
     async def find_orphaned_jobs(self, max_age_minutes=30):
         cutoff = datetime.now(timezone.utc) - td(minutes=max_age_minutes)
         orphaned = []
@@ -157,30 +157,11 @@ def mock_transcriber_engine_failing():
 @pytest.fixture
 def mock_job_store_fakeredis():
     """Real RedisJobStore backed by fakeredis (not MagicMock)."""
-    import fakeredis
-
-    # Patch ResilientRedisStore *before* importing RedisJobStore so that the
-    # __init__ connection test uses our fake client instead of hitting the network.
-    from unittest.mock import patch, MagicMock
-
-    fake_redis = fakeredis.FakeRedis(decode_responses=True)
-    mock_resilient = MagicMock()
-    mock_resilient.redis = fake_redis
-
-    with patch(
-        "app.infrastructure.redis_store.ResilientRedisStore",
-        return_value=mock_resilient,
-    ):
-        from app.infrastructure.redis_store import RedisJobStore
-
-        store = RedisJobStore(redis_url="redis://fake:6379/0")
-
-    # Ensure the store's internal clients point to fakeredis.
-    # _resilient.redis is used by __init__, but _raw_redis property reads self.redis.redis,
-    # and save_job/get_job use self._redis_client directly (set from self._resilient.redis).
-    store._resilient = mock_resilient
-    store._redis_client = fake_redis
-    return store
+    from common.test_utils.mock_redis import MockRedis
+    from app.infrastructure.redis_store import RedisJobStore
+
+    # Sync and async clients share one fakeredis server.
+    return MockRedis.create_job_store(RedisJobStore, redis_url="redis://fake:6379/0")
 
 
 @pytest.fixture
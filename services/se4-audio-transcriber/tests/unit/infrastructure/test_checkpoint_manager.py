@@ -37,6 +37,19 @@ class StubRedis:
         self.data.pop(key, None)
         return True
     
+    def hset(self, key, field, value):
+        self.data.setdefault(key, {})[field] = value
+        return 1
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hlen(self, key):
+        return len(self.data.get(key, {}))
+
+    def expire(self, key, ttl):
+        return True
+
     def keys(self, pattern):
         # Simple pattern matching
         prefix = pattern.replace('*', '')
@@ -251,3 +264,42 @@ def test_checkpoint_data_from_dict():
     assert checkpoint.stage == 'transcribing'
     assert checkpoint.progress == 0.5
     assert checkpoint.processed_seconds == 150.0
+
+
+def test_save_chunk_result_updates_checkpoint(checkpoint_manager, stub_redis_store):
+    """Cada chunk salvo deve ir para o hash do job e atualizar o progresso"""
+    segments = [{"start": 0.5, "end": 2.0, "text": "olá"}]
+    checkpoint_manager.save_chunk_result(
+        "job_123", "plan-a", 0, {"text": "olá", "segments": segments},
+        total_chunks=4, processed_seconds=30.0, total_seconds=120.0,
+    )
+
+    results = checkpoint_manager.get_chunk_results("job_123", "plan-a")
+    assert results == {0: {"text": "olá", "segments": segments}}
+
+    checkpoint = checkpoint_manager.get_checkpoint("job_123")
+    assert checkpoint.stage == "transcribing"
+    assert checkpoint.progress == 0.25
+    assert checkpoint.metadata["chunks_completed"] == 1
+
+
+def test_get_chunk_results_ignores_other_plan(checkpoint_manager):
+    """Resultados de outro plano de chunks não devem ser reaproveitados"""
+    checkpoint_manager.save_chunk_result(
+        "job_123", "plan-a", 0, {"text": "x", "segments": []},
+        total_chunks=2, processed_seconds=30.0, total_seconds=60.0,
+    )
+
+    assert checkpoint_manager.get_chunk_results("job_123", "plan-b") == {}
+
+
+def test_delete_checkpoint_removes_chunk_results(checkpoint_manager, stub_redis_store):
+    """delete_checkpoint deve remover também os resultados por chunk"""
+    checkpoint_manager.save_chunk_result(
+        "job_123", "plan-a", 0, {"text": "x", "segments": []},
+        total_chunks=2, processed_seconds=30.0, total_seconds=60.0,
+    )
+
+    checkpoint_manager.delete_checkpoint("job_123")
+
+    assert stub_redis_store.redis.data == {}
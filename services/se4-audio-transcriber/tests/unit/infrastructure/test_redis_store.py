@@ -0,0 +1,44 @@
+"""Tests for RedisJobStore sync/async APIs over the shared job store."""
+from datetime import timedelta
+
+import pytest
+
+from common.datetime_utils import now_brazil
+
+from app.domain.models import AudioTranscriptionJob, JobStatus
+
+
+@pytest.fixture
+def store(mock_job_store_with_fake_redis):
+    return mock_job_store_with_fake_redis
+
+
+class TestRedisJobStore:
+
+    async def test_async_save_is_visible_to_worker_api(self, store):
+        job = AudioTranscriptionJob.create_new("a.mp3")
+
+        await store.asave_job(job)
+
+        assert store.get_job(job.id).id == job.id
+        assert [j.id for j in await store.alist_jobs()] == [job.id]
+
+    async def test_list_by_status_uses_index(self, store):
+        queued = AudioTranscriptionJob.create_new("a.mp3")
+        failed = AudioTranscriptionJob.create_new("b.mp3", language_in="pt")
+        failed.status = JobStatus.FAILED
+        store.save_job(queued)
+        await store.asave_job(failed)
+
+        assert [j.id for j in await store.alist_jobs(status=JobStatus.FAILED)] == [failed.id]
+        assert await store.aget_stats() == {"total_jobs": 2, "by_status": {"queued": 1, "failed": 1}}
+
+    async def test_find_orphaned_jobs(self, store):
+        job = AudioTranscriptionJob.create_new("a.mp3")
+        job.status = JobStatus.PROCESSING
+        job.started_at = now_brazil() - timedelta(hours=2)
+        await store.asave_job(job)
+
+        orphaned = await store.find_orphaned_jobs(max_age_minutes=30)
+
+        assert [j.id for j in orphaned] == [job.id]
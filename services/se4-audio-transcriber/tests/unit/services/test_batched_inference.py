@@ -0,0 +1,319 @@
+"""Unit tests for batched multi-clip transcription and the batch scheduler."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from app.domain.models import Job, WhisperEngine
+from app.shared.batched_inference import SAMPLE_RATE, transcribe_clips_batched
+
+
+class FakePipeline:
+    """Emits one segment per clip window, like BatchedInferencePipeline with clip_timestamps."""
+
+    calls: list[dict] = []
+
+    def __init__(self, model):
+        self.model = model
+
+    def transcribe(self, audio, language, task, clip_timestamps, batch_size, **options):
+        FakePipeline.calls.append({"language": language, "windows": len(clip_timestamps), "samples": len(audio)})
+        segments = [
+            SimpleNamespace(
+                text=f" {language}@{window['start']:.1f}",
+                start=window["start"] + 0.5,
+                end=window["end"] - 0.5,
+                words=[SimpleNamespace(word="w", start=window["start"] + 0.5, end=window["start"] + 1.0, probability=0.9)],
+            )
+            for window in clip_timestamps
+        ]
+        return iter(segments), SimpleNamespace(language=language)
+
+
+def _clip(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def fake_pipeline():
+    FakePipeline.calls = []
+    with patch("app.shared.batched_inference.BatchedInferencePipeline", FakePipeline):
+        yield
+
+
+class TestTranscribeClipsBatched:
+
+    def test_results_are_split_back_per_clip_with_local_timestamps(self):
+        results = transcribe_clips_batched(MagicMock(), [_clip(4), _clip(6), _clip(3)], language="pt")
+
+        assert len(FakePipeline.calls) == 1
+        assert [len(r["segments"]) for r in results] == [1, 1, 1]
+        # Second clip starts 4s into the concatenated audio; its segment is shifted back
+        assert results[1]["segments"][0]["start"] == pytest.approx(0.5)
+        assert results[1]["segments"][0]["words"][0]["start"] == pytest.approx(0.5)
+        assert results[1]["text"] == "pt@4.0"
+        assert results[2]["duration"] == pytest.approx(3.0)
+
+    def test_long_clip_spans_several_windows(self):
+        results = transcribe_clips_batched(MagicMock(), [_clip(45), _clip(5)], language="en")
+
+        assert FakePipeline.calls[0]["windows"] == 3
+        assert len(results[0]["segments"]) == 2
+        assert results[0]["segments"][1]["start"] == pytest.approx(30.5)
+        assert len(results[1]["segments"]) == 1
+
+    def test_auto_language_groups_by_detected_language(self):
+        model = MagicMock()
+        model.detect_language.side_effect = [("pt", 0.9, []), ("en", 0.9, []), ("pt", 0.8, [])]
+
+        results = transcribe_clips_batched(model, [_clip(2), _clip(2), _clip(2)], language=None)
+
+        assert sorted(call["language"] for call in FakePipeline.calls) == ["en", "pt"]
+        assert [r["language"] for r in results] == ["pt", "en", "pt"]
+
+    def test_empty_input(self):
+        assert transcribe_clips_batched(MagicMock(), []) == []
+
+
+class TestOrchestratorBatching:
+
+    def _job(self, name: str, language: str = "pt") -> Job:
+        return Job.create_new(filename=name, operation="transcribe", language_in=language)
+
+    @pytest.mark.asyncio
+    async def test_short_jobs_are_batched_and_long_jobs_run_individually(self):
+        from app.services.transcription_service import TranscriptionOrchestrator
+
+        short_a, short_b, long_job = self._job("a.wav"), self._job("b.wav"), self._job("c.wav")
+        service = MagicMock()
+        service.process_jobs_batched = AsyncMock(side_effect=lambda jobs, clips, **kw: jobs)
+        service.process_job = AsyncMock(side_effect=lambda job: job)
+
+        orchestrator = TranscriptionOrchestrator(service, batch_size=4, max_clip_seconds=30, max_jobs_per_batch=8)
+        clips = {short_a.id: _clip(5), short_b.id: _clip(5), long_job.id: None}
+        with patch.object(orchestrator, "_load_batchable_clip", AsyncMock(side_effect=lambda job: clips[job.id])):
+            processed = await orchestrator.process_batch([short_a, long_job, short_b])
+
+        batched_jobs = service.process_jobs_batched.await_args.args[0]
+        assert [j.id for j in batched_jobs] == [short_a.id, short_b.id]
+        assert service.process_jobs_batched.await_args.kwargs["language"] == "pt"
+        service.process_job.assert_awaited_once_with(long_job)
+        assert [j.id for j in processed] == [short_a.id, long_job.id, short_b.id]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_individual_jobs(self):
+        from app.services.transcription_service import TranscriptionOrchestrator
+
+        jobs = [self._job("a.wav"), self._job("b.wav")]
+        service = MagicMock()
+        service.process_jobs_batched = AsyncMock(side_effect=RuntimeError("batch falhou"))
+        service.process_job = AsyncMock(side_effect=lambda job: job)
+
+        orchestrator = TranscriptionOrchestrator(service, batch_size=4, max_clip_seconds=30, max_jobs_per_batch=8)
+        with patch.object(orchestrator, "_load_batchable_clip", AsyncMock(return_value=_clip(5))):
+            processed = await orchestrator.process_batch(jobs)
+
+        assert service.process_job.await_count == 2
+        assert len(processed) == 2
+
+    @pytest.mark.asyncio
+    async def test_non_faster_whisper_jobs_are_not_batched(self):
+        from app.services.transcription_service import TranscriptionOrchestrator
+
+        job = Job.create_new(filename="x.wav", operation="transcribe", engine=WhisperEngine.WHISPERX)
+        orchestrator = TranscriptionOrchestrator(MagicMock())
+
+        assert await orchestrator._load_batchable_clip(job) is None
+
+
+class StubRedisClient:
+    """Lista + SET NX suficientes para o BatchCollector, sem Mock."""
+
+    def __init__(self):
+        self.lists: dict[str, list] = {}
+        self.data: dict[str, str] = {}
+
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+        return len(self.lists[key])
+
+    def lpop(self, key):
+        items = self.lists.get(key) or []
+        return items.pop(0) if items else None
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+
+
+class StubJobStore:
+    def __init__(self):
+        self.redis = StubRedisClient()
+        self.updates: list[tuple[str, str]] = []
+
+    def update_job(self, job):
+        self.updates.append((job.id, job.status.value))
+
+
+class StubBatchProcessor:
+    def __init__(self, batchable: bool = True):
+        self.batchable = batchable
+        self.batches: list[list[str]] = []
+
+    def is_batchable(self, job):
+        return self.batchable
+
+    def transcribe_batch(self, jobs):
+        from app.domain.models import JobStatus
+
+        self.batches.append([job.id for job in jobs])
+        for job in jobs:
+            job.status = JobStatus.COMPLETED
+        return jobs
+
+
+class TestBatchCollector:
+
+    def test_only_first_offer_of_a_window_claims_the_dispatch(self):
+        from app.infrastructure.batch_collector import BatchCollector
+
+        collector = BatchCollector(StubRedisClient())
+
+        assert collector.offer({"id": "a"}) is True
+        assert collector.offer({"id": "b"}) is False
+        assert [job["id"] for job in collector.take(8)] == ["a", "b"]
+        assert collector.finish_dispatch() is False
+
+    def test_finish_dispatch_reclaims_when_jobs_are_left(self):
+        from app.infrastructure.batch_collector import BatchCollector
+
+        collector = BatchCollector(StubRedisClient())
+        for name in "abc":
+            collector.offer({"id": name})
+
+        assert [job["id"] for job in collector.take(2)] == ["a", "b"]
+        assert collector.finish_dispatch() is True
+        assert collector.offer({"id": "d"}) is False
+
+
+class TestBatchDispatchTasks:
+
+    @pytest.fixture
+    def tasks(self):
+        from app.infrastructure import celery_tasks
+
+        store, processor = StubJobStore(), StubBatchProcessor()
+        scheduled = []
+        with patch.object(celery_tasks.transcribe_audio_task, "_job_store", store), \
+             patch.object(celery_tasks.transcribe_audio_task, "_processor", processor), \
+             patch.object(celery_tasks.transcribe_batch_task, "apply_async",
+                          side_effect=lambda **kw: scheduled.append(kw)):
+            yield SimpleNamespace(module=celery_tasks, store=store, processor=processor, scheduled=scheduled)
+
+    def _job_dict(self, name: str) -> dict:
+        return Job.create_new(filename=name, operation="transcribe", language_in="pt").model_dump(mode="json")
+
+    def test_short_jobs_are_collected_into_one_scheduled_batch(self, tasks):
+        first, second = self._job_dict("a.wav"), self._job_dict("b.wav")
+
+        assert tasks.module.transcribe_audio_task.run(first) is None
+        assert tasks.module.transcribe_audio_task.run(second) is None
+
+        assert len(tasks.scheduled) == 1
+        assert tasks.scheduled[0]["countdown"] >= 0
+        assert tasks.processor.batches == []
+        assert tasks.store.redis.llen("audio_transcriber:batch:pending") == 2
+
+    def test_batch_task_transcribes_collected_jobs_and_redispatches_leftovers(self, tasks):
+        job_dicts = [self._job_dict(f"{name}.wav") for name in "abc"]
+        for job_dict in job_dicts:
+            tasks.module.transcribe_audio_task.run(job_dict)
+
+        with patch.object(tasks.module.transcribe_batch_task, "_job_store", tasks.store), \
+             patch.object(tasks.module.transcribe_batch_task, "_processor", tasks.processor), \
+             patch("app.core.config.get_settings", return_value={"batch_max_jobs": 2}):
+            summary = tasks.module.transcribe_batch_task.run()
+
+        assert summary == {"status": "completed", "jobs": 2, "completed": 2}
+        assert tasks.processor.batches == [[job_dicts[0]["id"], job_dicts[1]["id"]]]
+        assert (job_dicts[0]["id"], "completed") in tasks.store.updates
+        # 1 agendamento da janela + 1 reagendamento para o job restante
+        assert tasks.scheduled == [tasks.scheduled[0], {}]
+
+    def test_failed_batch_marks_its_jobs_failed_and_releases_the_dispatch(self, tasks):
+        tasks.module.transcribe_audio_task.run(self._job_dict("a.wav"))
+        tasks.processor.transcribe_batch = MagicMock(side_effect=RuntimeError("GPU caiu"))
+
+        with patch.object(tasks.module.transcribe_batch_task, "_job_store", tasks.store), \
+             patch.object(tasks.module.transcribe_batch_task, "_processor", tasks.processor):
+            summary = tasks.module.transcribe_batch_task.run()
+
+        assert summary["completed"] == 0
+        assert tasks.store.updates[-1][1] == "failed"
+        assert tasks.store.redis.data == {}
+
+
+class TestProcessorBatch:
+
+    @pytest.fixture
+    def processor(self, tmp_path):
+        with patch('app.services.processor.TranscriptionProcessor.__init__', lambda self: None):
+            from app.services.processor import TranscriptionProcessor
+
+            processor = TranscriptionProcessor()
+        processor.settings = {"batch_inference_size": 4, "async_timeout_seconds": 60}
+        processor.state = MagicMock()
+        processor.model_pool = MagicMock()
+        processor.model_manager = MagicMock()
+        processor.model_manager.transcribe_batch.side_effect = lambda paths, **kw: [
+            {"text": path.stem, "segments": [], "language": kw["language"]} for path in paths
+        ]
+        processor._load_model = MagicMock(return_value="key")
+        processor._complete_job = MagicMock()
+        processor.process_transcription_job = AsyncMock()
+        return processor
+
+    def _job(self, name: str, language_in: str = "pt", language_out: str | None = None) -> Job:
+        job = Job.create_new(filename=name, operation="transcribe", language_in=language_in, language_out=language_out)
+        job.input_file = f"/tmp/{name}"
+        return job
+
+    @pytest.mark.asyncio
+    async def test_jobs_sharing_language_are_batched_and_singletons_run_alone(self, processor):
+        short_a, short_b, english = self._job("a.wav"), self._job("b.wav"), self._job("c.wav", "en")
+
+        await processor.process_transcription_batch([short_a, english, short_b])
+
+        call = processor.model_manager.transcribe_batch.call_args
+        assert [p.name for p in call.args[0]] == ["a.wav", "b.wav"]
+        assert call.kwargs == {"language": "pt", "task": "transcribe", "batch_size": 4}
+        assert [c.args[0] for c in processor._complete_job.call_args_list] == [short_a, short_b]
+        processor.process_transcription_job.assert_awaited_once_with(english)
+        processor.model_pool.release.assert_called_once_with("key")
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_call_falls_back_to_individual_jobs(self, processor):
+        jobs = [self._job("a.wav"), self._job("b.wav")]
+        processor.model_manager.transcribe_batch.side_effect = RuntimeError("OOM")
+
+        await processor.process_transcription_batch(jobs)
+
+        assert [c.args[0] for c in processor.process_transcription_job.await_args_list] == jobs
+        processor.model_pool.release.assert_called_once_with("key")
+
+    def test_translation_to_english_uses_the_translate_task(self, processor):
+        assert processor._whisper_task("pt", "en") == "translate"
+        assert processor._whisper_task("pt", "es") == "transcribe"
+        assert processor._whisper_task("pt", None) == "transcribe"
@@ -0,0 +1,231 @@
+"""Unit tests for ResidentModelPool — reuse, LRU eviction under RAM budget, idle unload."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.domain.models import WhisperEngine
+from app.services.model_pool import (
+    ModelPoolKey,
+    ResidentModelPool,
+    default_compute_type,
+    estimate_model_mb,
+)
+
+
+class FakeManager:
+    def __init__(self) -> None:
+        self.is_loaded = False
+        self.device = "cpu"
+        self.load_calls = 0
+        self.unload_calls = 0
+
+    def load_model(self) -> None:
+        self.load_calls += 1
+        self.is_loaded = True
+
+    def unload_model(self) -> dict:
+        self.unload_calls += 1
+        self.is_loaded = False
+        return {"success": True, "memory_freed": {"ram_mb": 10.0, "vram_mb": 0.0}}
+
+
+def _key(model_size: str = "base") -> ModelPoolKey:
+    return ModelPoolKey(WhisperEngine.FASTER_WHISPER, model_size, "cpu", "int8")
+
+
+@pytest.fixture
+def pool():
+    with patch.object(ResidentModelPool, "_ensure_reaper"):
+        yield ResidentModelPool(max_resident_mb=350)
+
+
+class TestHelpers:
+
+    def test_estimate_uses_base_name_for_variants(self):
+        assert estimate_model_mb(WhisperEngine.FASTER_WHISPER, "large-v3") == estimate_model_mb(
+            WhisperEngine.FASTER_WHISPER, "large"
+        )
+
+    def test_default_compute_type(self):
+        assert default_compute_type(WhisperEngine.FASTER_WHISPER, "cuda") == "float16"
+        assert default_compute_type(WhisperEngine.FASTER_WHISPER, "cpu") == "int8"
+        assert default_compute_type(WhisperEngine.OPENAI_WHISPER, "cpu") == "float32"
+
+
+class TestAcquireRelease:
+
+    def test_back_to_back_jobs_reuse_warm_model(self, pool):
+        created = []
+
+        def factory():
+            created.append(FakeManager())
+            return created[-1]
+
+        first = pool.acquire(_key(), factory)
+        pool.release(_key())
+        second = pool.acquire(_key(), factory)
+        pool.release(_key())
+
+        assert first is second
+        assert len(created) == 1
+        assert first.load_calls == 1
+        assert first.is_loaded
+
+    def test_failed_load_is_not_kept(self, pool):
+        class Broken(FakeManager):
+            def load_model(self) -> None:
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            pool.acquire(_key(), Broken)
+
+        assert pool.resident_count == 0
+
+
+class SlowManager(FakeManager):
+    """Bloqueia load_model até ``release_load`` ser setado."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.loading = threading.Event()
+        self.release_load = threading.Event()
+
+    def load_model(self) -> None:
+        self.loading.set()
+        assert self.release_load.wait(5)
+        super().load_model()
+
+
+class TestConcurrentLoad:
+
+    def test_other_models_are_served_while_one_loads(self, pool):
+        warm = FakeManager()
+        pool.acquire(_key("tiny"), lambda: warm)
+        pool.release(_key("tiny"))
+        slow = SlowManager()
+        loader = threading.Thread(target=pool.acquire, args=(_key("base"), lambda: slow))
+        loader.start()
+        assert slow.loading.wait(5)
+
+        served = pool.acquire(_key("tiny"), FakeManager)
+        status = pool.get_status()
+        slow.release_load.set()
+        loader.join(5)
+
+        assert served is warm
+        assert status["loads"] == 1
+
+    def test_concurrent_callers_share_one_load(self, pool):
+        slow = SlowManager()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(pool.acquire(_key(), lambda: slow)))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        assert slow.loading.wait(5)
+        slow.release_load.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert results == [slow, slow, slow]
+        assert slow.load_calls == 1
+        assert pool._entries[_key()].leases == 3
+
+    def test_model_being_loaded_is_not_evicted(self, pool):
+        slow = SlowManager()
+        loader = threading.Thread(target=pool.acquire, args=(_key("small"), lambda: slow))
+        loader.start()
+        assert slow.loading.wait(5)
+
+        assert pool.unload_all()["unloaded"] == 0
+        slow.release_load.set()
+        loader.join(5)
+
+        assert slow.is_loaded
+        assert pool.resident_count == 1
+
+
+class TestAbandonedLoad:
+
+    def test_lease_is_released_when_the_caller_timed_out(self, pool):
+        from app.services.processor import TranscriptionProcessor
+        from app.shared.exceptions import AudioTranscriptionException
+
+        with patch.object(TranscriptionProcessor, "__init__", lambda self: None):
+            processor = TranscriptionProcessor()
+        processor.model_pool = pool
+        slow = SlowManager()
+        processor._load_model = lambda engine: (pool.acquire(_key(), lambda: slow), _key())[1]
+
+        async def run():
+            with pytest.raises(AudioTranscriptionException):
+                await processor._acquire_model(WhisperEngine.FASTER_WHISPER, 1)
+            assert slow.loading.is_set()
+            slow.release_load.set()
+
+        asyncio.run(run())
+
+        assert slow.is_loaded
+        assert pool._entries[_key()].leases == 0
+
+
+class TestEviction:
+
+    def test_lru_model_is_evicted_when_budget_exceeded(self, pool):
+        tiny, base = FakeManager(), FakeManager()
+        pool.acquire(_key("tiny"), lambda: tiny)
+        pool.release(_key("tiny"))
+        pool.acquire(_key("base"), lambda: base)
+        pool.release(_key("base"))
+
+        # small (250MB) não cabe junto com tiny (40MB) + base (75MB) no orçamento de 350MB
+        pool.acquire(_key("small"), FakeManager)
+
+        assert tiny.unload_calls == 1
+        assert base.unload_calls == 0
+        assert pool.evictions == 1
+        assert pool.resident_mb <= 350
+
+    def test_model_in_use_is_never_evicted(self, pool):
+        in_use = FakeManager()
+        pool.acquire(_key("small"), lambda: in_use)
+
+        pool.acquire(_key("base"), FakeManager)
+
+        assert in_use.unload_calls == 0
+        assert in_use.is_loaded
+
+
+class TestIdleUnload:
+
+    def test_unload_idle_skips_recent_and_in_use(self, pool):
+        idle, busy = FakeManager(), FakeManager()
+        pool.acquire(_key("tiny"), lambda: idle)
+        pool.release(_key("tiny"))
+        pool.acquire(_key("base"), lambda: busy)
+
+        old = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        for entry in pool._entries.values():
+            entry.last_accessed = old
+
+        assert pool.unload_idle(timeout_minutes=1) == 1
+        assert idle.unload_calls == 1
+        assert busy.is_loaded
+
+    def test_unload_all_reports_freed_memory(self, pool):
+        pool.acquire(_key(), FakeManager)
+        pool.release(_key())
+
+        report = pool.unload_all()
+
+        assert report["unloaded"] == 1
+        assert report["memory_freed"]["ram_mb"] == 10.0
+        assert pool.resident_count == 0
@@ -289,3 +289,50 @@ class TestChunkMetadata:
 
         for j in range(1, len(chunks)):
             assert chunks[j].start_time_s > chunks[j - 1].start_time_s
+
+
+# ---------------------------------------------------------------------------
+# pack_speech – VAD regions packed into chunks
+# ---------------------------------------------------------------------------
+
+
+class TestPackSpeech:
+
+    @staticmethod
+    def _region(start: float, end: float):
+        from app.shared.speech_detector import SpeechRegion
+        return SpeechRegion(start=start, end=end)
+
+    def test_regions_packed_until_chunk_length(self):
+        audio = _make_real_silent_segment(120)
+        chunker = AudioChunker(chunk_length_seconds=30, overlap_seconds=0)
+
+        chunks = chunker.pack_speech(audio, [
+            self._region(5, 15), self._region(40, 55), self._region(90, 100),
+        ])
+
+        # 10s + 15s fit in one chunk; the third region would exceed 30s
+        assert len(chunks) == 2
+        assert len(chunks[0].audio) == 25_000
+        assert chunks[0].start_time_s == pytest.approx(5.0)
+        assert chunks[0].time_map == [(0.0, 5.0, 10.0), (10.0, 40.0, 15.0)]
+        assert chunks[1].start_time_s == pytest.approx(90.0)
+
+    def test_long_region_is_split(self):
+        audio = _make_real_silent_segment(100)
+        chunker = AudioChunker(chunk_length_seconds=30, overlap_seconds=0)
+
+        chunks = chunker.pack_speech(audio, [self._region(0, 70)])
+
+        assert [len(c.audio) for c in chunks] == [30_000, 30_000, 10_000]
+        assert chunks[2].start_time_s == pytest.approx(60.0)
+
+    def test_map_chunk_time_restores_original_timeline(self):
+        from app.shared.audio_chunker import map_chunk_time
+
+        time_map = [(0.0, 5.0, 10.0), (10.0, 40.0, 15.0)]
+
+        assert map_chunk_time(time_map, 2.0) == pytest.approx(7.0)
+        assert map_chunk_time(time_map, 12.5) == pytest.approx(42.5)
+        # Clamped to the end of the last piece
+        assert map_chunk_time(time_map, 30.0) == pytest.approx(55.0)
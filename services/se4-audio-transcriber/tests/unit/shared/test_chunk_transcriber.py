@@ -183,7 +183,7 @@ class TestAsyncTranscribe:
                     audio=mock_audio_segment,
                 )
 
-        assert result["text"] == "texto transcrito do chunk"
+        assert result["text"] == "palavra um palavra dois"
 
         segments = result["segments"]
         assert len(segments) == 2
@@ -393,7 +393,7 @@ class TestTextJoining:
 
     @pytest.mark.asyncio
     async def test_full_text_joined_with_spaces(self):
-        """Full text should be space-joined from all chunk texts."""
+        """Full text should be space-joined from the kept segment texts."""
         from app.shared.audio_chunker import AudioChunk as RealAudioChunk
 
         settings = {
@@ -420,7 +420,7 @@ class TestTextJoining:
         def transcribe_side_effect(*args):
             t_key = "text"
             s_key = "segments"
-            result = {t_key: texts_returned[idx[0]], s_key: [{"start": 0, "end": 2}]}
+            result = {t_key: texts_returned[idx[0]], s_key: [{"start": 0, "end": 2, "text": texts_returned[idx[0]]}]}
 
             idx[0] += 1
             return result
@@ -447,3 +447,308 @@ class TestTextJoining:
                 )
 
         assert result["text"] == "primeira parte segunda parte"
+
+
+    @pytest.mark.asyncio
+    async def test_full_text_has_no_overlap_duplicates(self):
+        """Sentences spoken in the overlap appear once in the text, like in the segments."""
+        from app.shared.audio_chunker import AudioChunk as RealAudioChunk
+
+        chunk_mocks = []
+        for offset in [0.0, 29.0]:
+            cm = MagicMock(spec=RealAudioChunk)
+            cm.start_time_s = offset
+            chunk_mocks.append(cm)
+        mock_chunker = MagicMock()
+        mock_chunker.export_chunk.side_effect = lambda i, _: Path(f"/tmp/chunk_{i}.wav")
+        mock_chunker.split.return_value = chunk_mocks
+
+        results = [
+            {"text": "começo frase da borda", "segments": [
+                {"start": 1.0, "end": 5.0, "text": "começo"},
+                {"start": 29.2, "end": 29.8, "text": "frase da borda"},
+            ]},
+            {"text": "frase da borda final", "segments": [
+                {"start": 0.2, "end": 0.8, "text": "frase da borda"},
+                {"start": 5.0, "end": 8.0, "text": "final"},
+            ]},
+        ]
+
+        transcriber = ChunkTranscriber(settings={"chunk_overlap_seconds": 1.0})
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch("app.shared.chunk_transcriber.AudioChunker", return_value=mock_chunker):
+            result = await transcriber.transcribe(
+                audio_file="/tmp/test.mp3",
+                language_in="pt",
+                language_out=None,
+                transcribe_fn=lambda path, *args: results[int(Path(path).stem.split("_")[1])],
+                audio=self._make_mock_segment(),
+            )
+
+        assert result["text"] == "começo frase da borda final"
+        assert result["text"] == " ".join(s["text"] for s in result["segments"])
+
+
+# ---------------------------------------------------------------------------
+# Parallel mode & overlap ownership
+# ---------------------------------------------------------------------------
+
+
+class TestParallelChunks:
+
+    def _chunks(self, offsets):
+        from app.shared.audio_chunker import AudioChunk as RealAudioChunk
+
+        chunks = []
+        for offset in offsets:
+            cm = MagicMock(spec=RealAudioChunk)
+            cm.start_time_s = offset
+            chunks.append(cm)
+        return chunks
+
+    def _chunker(self):
+        mock_chunker = MagicMock()
+        mock_chunker.export_chunk.side_effect = lambda i, _: Path(f"/tmp/chunk_{i}.wav")
+        return mock_chunker
+
+    @staticmethod
+    def _fn(path, language_in, language_out):
+        index = int(Path(path).stem.split("_")[1])
+        return {
+            "text": f"chunk {index}",
+            "segments": [
+                {"start": 1.0, "end": 5.0, "text": f"inicio {index}"},
+                # Falls in the 1s overlap shared with the next chunk
+                {"start": 28.8, "end": 29.8, "text": f"fim {index}"},
+            ],
+        }
+
+    def test_overlap_segment_kept_by_one_chunk_only(self):
+        chunks = self._chunks([0.0, 29.0])
+        result = ChunkTranscriber._adjust_chunk_segments(
+            {"segments": [{"start": 0.1, "end": 0.9, "text": "fim 0"}]}, chunks, 1, 1.0
+        )
+        # Midpoint 29.5 lies exactly on the boundary -> owned by chunk 1
+        assert [s["text"] for s in result] == ["fim 0"]
+
+        result = ChunkTranscriber._adjust_chunk_segments(
+            {"segments": [{"start": 29.1, "end": 29.9, "text": "fim 0"}]}, chunks, 0, 1.0
+        )
+        assert result == []
+
+    def test_parallel_matches_serial_order(self):
+        offsets = [0.0, 29.0, 58.0, 87.0, 116.0]
+        transcriber = ChunkTranscriber(settings={})
+
+        serial = transcriber._transcribe_chunks(
+            self._chunks(offsets), self._chunker(), self._fn, "pt", None, None, 1.0
+        )
+        parallel = transcriber._transcribe_chunks_parallel(
+            self._chunks(offsets), self._chunker(), [self._fn, self._fn, self._fn], "pt", None, None, 1.0
+        )
+
+        assert parallel == serial
+        assert parallel[1] == [f"chunk {i}" for i in range(len(offsets))]
+
+    def test_parallel_reports_progress_for_every_chunk(self):
+        state_updater = MagicMock()
+        transcriber = ChunkTranscriber(settings={}, state=state_updater)
+
+        transcriber._transcribe_chunks_parallel(
+            self._chunks([0.0, 29.0, 58.0]), self._chunker(), [self._fn, self._fn], "pt", None, "job-1", 1.0
+        )
+
+        progress = [c[0][0] for c in state_updater.set_progress.call_args_list]
+        assert progress[-1] == pytest.approx(75.0)
+        assert len(progress) == 3
+
+    def test_parallel_propagates_worker_errors(self):
+        def broken(path, language_in, language_out):
+            raise RuntimeError("replica falhou")
+
+        transcriber = ChunkTranscriber(settings={})
+        with pytest.raises(RuntimeError):
+            transcriber._transcribe_chunks_parallel(
+                self._chunks([0.0, 29.0]), self._chunker(), [broken, broken], "pt", None, None, 1.0
+            )
+
+
+    @pytest.mark.asyncio
+    async def test_timeout_waits_for_workers_before_returning(self):
+        """Replicas are released by the caller right after the timeout: no worker may still use them."""
+        import asyncio
+        import threading
+        import time
+
+        active = [0]
+        lock = threading.Lock()
+        started = []
+
+        def slow(path, language_in, language_out):
+            with lock:
+                active[0] += 1
+                started.append(path)
+            time.sleep(0.3)
+            with lock:
+                active[0] -= 1
+            return self._fn(path, language_in, language_out)
+
+        mock_chunker = self._chunker()
+        mock_chunker.split.return_value = self._chunks([0.0, 29.0, 58.0, 87.0, 116.0, 145.0])
+        audio = MagicMock()
+        type(audio).__len__ = lambda self: 180_000
+
+        transcriber = ChunkTranscriber(settings={})
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch("app.shared.chunk_transcriber.AudioChunker", return_value=mock_chunker):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    transcriber.transcribe(
+                        "/tmp/test.mp3", "pt", None, transcribe_fn=slow, audio=audio,
+                        transcribe_fns=[slow, slow],
+                    ),
+                    timeout=0.1,
+                )
+
+        assert active[0] == 0
+        # Os workers param após o chunk em andamento
+        assert len(started) == 2
+
+
+class TestChunkCheckpoints:
+
+    class _Store:
+        """In-memory stand-in for CheckpointManager's chunk API."""
+
+        def __init__(self, completed=None):
+            self.completed = dict(completed or {})
+            self.saved = []
+
+        def get_chunk_results(self, job_id, plan_id):
+            return dict(self.completed)
+
+        def save_chunk_result(self, job_id, plan_id, index, result, **progress):
+            self.saved.append(index)
+            self.completed[index] = result
+
+    _chunks = TestParallelChunks._chunks
+    _chunker = TestParallelChunks._chunker
+    _fn = staticmethod(TestParallelChunks._fn)
+
+    def _checkpoint(self, store, total_chunks):
+        from app.shared.chunk_transcriber import _ChunkCheckpoint
+
+        return _ChunkCheckpoint(store, "job-1", "plan", total_chunks, 90.0)
+
+    def test_each_chunk_is_persisted(self):
+        store = self._Store()
+        transcriber = ChunkTranscriber(settings={})
+
+        transcriber._transcribe_chunks(
+            self._chunks([0.0, 29.0, 58.0]), self._chunker(), self._fn, "pt", None, "job-1", 1.0,
+            self._checkpoint(store, 3),
+        )
+
+        assert store.saved == [0, 1, 2]
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_resume_skips_completed_chunks_with_same_output(self, parallel):
+        offsets = [0.0, 29.0, 58.0, 87.0]
+        transcriber = ChunkTranscriber(settings={})
+        fresh = transcriber._transcribe_chunks(
+            self._chunks(offsets), self._chunker(), self._fn, "pt", None, None, 1.0
+        )
+
+        store = self._Store({0: self._fn("/tmp/chunk_0.wav", "pt", None), 1: self._fn("/tmp/chunk_1.wav", "pt", None)})
+        calls = []
+
+        def counting_fn(path, language_in, language_out):
+            calls.append(Path(path).stem)
+            return self._fn(path, language_in, language_out)
+
+        chunker = self._chunker()
+        if parallel:
+            resumed = transcriber._transcribe_chunks_parallel(
+                self._chunks(offsets), chunker, [counting_fn, counting_fn], "pt", None, "job-1", 1.0,
+                self._checkpoint(store, 4),
+            )
+        else:
+            resumed = transcriber._transcribe_chunks(
+                self._chunks(offsets), chunker, counting_fn, "pt", None, "job-1", 1.0,
+                self._checkpoint(store, 4),
+            )
+
+        assert sorted(calls) == ["chunk_2", "chunk_3"]
+        assert sorted(store.saved) == [2, 3]
+        assert resumed == fresh
+
+    def test_plan_id_changes_with_chunking_settings(self):
+        chunks = self._chunks([0.0, 29.0])
+        base = ChunkTranscriber(settings={"chunk_length_seconds": 30})._chunk_plan_id(chunks, 60.0, "pt", None)
+
+        assert base == ChunkTranscriber(settings={"chunk_length_seconds": 30})._chunk_plan_id(chunks, 60.0, "pt", None)
+        assert base != ChunkTranscriber(settings={"chunk_length_seconds": 60})._chunk_plan_id(chunks, 60.0, "pt", None)
+        assert base != ChunkTranscriber(settings={"chunk_length_seconds": 30})._chunk_plan_id(chunks, 60.0, "en", None)
+
+
+# ---------------------------------------------------------------------------
+# VAD speech-only mode
+# ---------------------------------------------------------------------------
+
+
+class TestSpeechOnlyMode:
+
+    @pytest.mark.asyncio
+    async def test_timestamps_mapped_back_and_skipped_audio_reported(self, tmp_path):
+        from pydub import AudioSegment
+        from app.shared.speech_detector import SpeechRegion
+
+        audio_file = tmp_path / "podcast.wav"
+        audio_file.write_bytes(b"x")
+        audio = AudioSegment.silent(duration=100_000)
+        settings = {"chunk_length_seconds": 30, "vad_speech_only": True, "temp_dir": str(tmp_path)}
+
+        transcribe_fn = MagicMock(return_value={
+            "text": "fala",
+            "segments": [
+                {"start": 1.0, "end": 3.0, "text": "primeira", "words": [{"word": "primeira", "start": 1.0, "end": 3.0}]},
+                {"start": 11.0, "end": 13.0, "text": "segunda", "words": []},
+            ],
+        })
+
+        with patch("app.shared.chunk_transcriber.SpeechDetector") as detector_cls:
+            detector_cls.return_value.detect.return_value = [
+                SpeechRegion(start=20.0, end=30.0),
+                SpeechRegion(start=70.0, end=80.0),
+            ]
+            result = await ChunkTranscriber(settings=settings).transcribe(
+                str(audio_file), "pt", None, transcribe_fn=transcribe_fn, audio=audio,
+            )
+
+        assert transcribe_fn.call_count == 1
+        starts = [s["start"] for s in result["segments"]]
+        assert starts == [pytest.approx(21.0), pytest.approx(71.0)]
+        assert result["segments"][0]["words"][0]["end"] == pytest.approx(23.0)
+        report = result["speech_detection"]
+        assert report["speech_seconds"] == pytest.approx(20.0)
+        assert report["skipped_seconds"] == pytest.approx(80.0)
+        assert report["skipped_ratio"] == pytest.approx(0.8)
+
+    @pytest.mark.asyncio
+    async def test_no_speech_skips_transcription(self, tmp_path):
+        from pydub import AudioSegment
+
+        audio_file = tmp_path / "silence.wav"
+        audio_file.write_bytes(b"x")
+        transcribe_fn = MagicMock()
+
+        with patch("app.shared.chunk_transcriber.SpeechDetector") as detector_cls:
+            detector_cls.return_value.detect.return_value = []
+            result = await ChunkTranscriber(settings={"vad_speech_only": True}).transcribe(
+                str(audio_file), "pt", None, transcribe_fn=transcribe_fn,
+                audio=AudioSegment.silent(duration=60_000),
+            )
+
+        transcribe_fn.assert_not_called()
+        assert result["segments"] == []
+        assert result["speech_detection"]["skipped_seconds"] == pytest.approx(60.0)
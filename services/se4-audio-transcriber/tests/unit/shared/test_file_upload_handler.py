@@ -5,6 +5,8 @@ and exponential backoff on OSError — retries with increasing delay, eventual s
 """
 from __future__ import annotations
 
+import hashlib
+import io
 import os
 import time
 from pathlib import Path
@@ -12,7 +14,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.shared.file_upload_handler import FileUploadError, FileUploadHandler
+from app.shared.file_upload_handler import (
+    FileUploadError,
+    FileUploadHandler,
+    FileUploadTooLargeError,
+)
 
 
 # --------------------------------------------------------------------------- #
@@ -229,6 +235,73 @@ class TestExponentialBackoffOnOSError:
         assert path.read_bytes() == b"eventual-success"
 
 
+# --------------------------------------------------------------------------- #
+# Streaming uploads — stage_upload                                            #
+# --------------------------------------------------------------------------- #
+
+class _FakeUpload:
+    """Async reader over bytes that records how much was read."""
+
+    def __init__(self, data: bytes, size: int | None = None) -> None:
+        self._buf = io.BytesIO(data)
+        self.size = size
+        self.bytes_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        chunk = self._buf.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class TestStageUpload:
+    """Uploads are streamed to a staging file, hashed and size-checked."""
+
+    @pytest.mark.asyncio
+    async def test_stages_hashes_and_moves_into_place(self, handler, upload_dir):
+        payload = os.urandom(300_000)
+        staged = await handler.stage_upload(_FakeUpload(payload), max_bytes=1_000_000, chunk_size=64 * 1024)
+
+        assert staged.size == len(payload)
+        assert staged.sha256 == hashlib.sha256(payload).hexdigest()
+        assert staged.path.parent == Path(upload_dir).resolve() / ".incoming"
+
+        path = await handler.save_file(staged, "clip.mp4", "job-600")
+        assert path.read_bytes() == payload
+        assert not staged.path.exists()
+
+    @pytest.mark.asyncio
+    async def test_over_limit_stops_reading_and_removes_partial(self, handler):
+        upload = _FakeUpload(b"x" * 1_000_000)
+
+        with pytest.raises(FileUploadTooLargeError):
+            await handler.stage_upload(upload, max_bytes=100_000, chunk_size=32 * 1024)
+
+        assert upload.bytes_read < 200_000
+        assert list(handler.incoming_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_declared_size_over_limit_rejected_before_reading(self, handler):
+        upload = _FakeUpload(b"x" * 10, size=5_000_000)
+
+        with pytest.raises(FileUploadTooLargeError):
+            await handler.stage_upload(upload, max_bytes=100_000)
+
+        assert upload.bytes_read == 0
+
+    @pytest.mark.asyncio
+    async def test_empty_upload_raises(self, handler):
+        with pytest.raises(FileUploadError, match="Arquivo enviado está vazio"):
+            await handler.stage_upload(_FakeUpload(b""), max_bytes=100)
+        assert list(handler.incoming_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_discard_removes_unused_staging_file(self, handler):
+        staged = await handler.stage_upload(_FakeUpload(b"data"), max_bytes=100)
+        staged.discard()
+        staged.discard()
+        assert not staged.path.exists()
+
+
 # --------------------------------------------------------------------------- #
 # Edge cases                                                                  #
 # --------------------------------------------------------------------------- #
@@ -60,6 +60,15 @@ class _MockJobStore:
     def delete_job(self, job_id: str) -> bool:
         return False
 
+    async def aget_job(self, job_id: str):  # noqa: ANN401 – matches interface
+        return self.get_job(job_id)
+
+    async def asave_job(self, job):  # noqa: ANN401 – matches interface
+        self.save_job(job)
+
+    async def aupdate_job(self, job):  # noqa: ANN401 – matches interface
+        await self.update_job(job)
+
 
 class _MockUploadHandler:
     """Minimal FileUploadHandler mock that writes to a temp directory."""
@@ -43,6 +43,20 @@ class MockJobStore:
             jobs = [j for j in jobs if j.status == status]
         return sorted(jobs, key=lambda j: j.created_at)
 
+    async def aget_job(self, job_id):
+        return self.get_job(job_id)
+
+    async def asave_job(self, job):
+        self.save_job(job)
+        return job
+
+    async def aupdate_job(self, job):
+        self.update_job(job)
+        return job
+
+    async def alist_jobs(self, status=None):
+        return self.list_jobs(status=status)
+
 
 def _make_job(
     store,
@@ -241,7 +255,7 @@ class TestDeadLetterQueueManager:
     async def test_send_to_dlq(self, store):
         job = _make_job(store, status=JobStatus.QUEUED)
         manager = DeadLetterQueueManager(store)
-        manager.send_to_dlq(job, "test reason")
+        await manager.send_to_dlq(job, "test reason")
 
         updated = store.get_job("job_1")
         assert updated.status == JobStatus.FAILED
@@ -252,7 +266,7 @@ class TestDeadLetterQueueManager:
         _make_job(store, "f1", status=JobStatus.FAILED)
         _make_job(store, "f2", status=JobStatus.FAILED)
         manager = DeadLetterQueueManager(store)
-        dlq = manager.list_dlq_jobs()
+        dlq = await manager.list_dlq_jobs()
         assert len(dlq) == 0  # FAILED without [DLQ] prefix are not DLQ jobs
 
     @pytest.mark.asyncio
@@ -265,7 +279,7 @@ class TestDeadLetterQueueManager:
         store.save_job(j2)
         store.save_job(j3)
         manager = DeadLetterQueueManager(store)
-        dlq = manager.list_dlq_jobs()
+        dlq = await manager.list_dlq_jobs()
         assert len(dlq) == 2
         assert all(j.error_message.startswith("[DLQ]") for j in dlq)
 
@@ -273,7 +287,7 @@ class TestDeadLetterQueueManager:
     async def test_retry_dlq_success(self, store):
         job = _make_job(store, "r1", status=JobStatus.FAILED)
         manager = DeadLetterQueueManager(store)
-        ok = manager.retry_dlq_job("r1")
+        ok = await manager.retry_dlq_job("r1")
         assert ok is True
 
         updated = store.get_job("r1")
@@ -283,7 +297,7 @@ class TestDeadLetterQueueManager:
     @pytest.mark.asyncio
     async def test_retry_dlq_not_found(self, store):
         manager = DeadLetterQueueManager(store)
-        ok = manager.retry_dlq_job("nonexistent")
+        ok = await manager.retry_dlq_job("nonexistent")
         assert ok is False
 
 
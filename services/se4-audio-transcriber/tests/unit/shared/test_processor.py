@@ -154,3 +154,60 @@ class TestCheckDiskSpace:
                 result = processor._check_disk_space(str(file_path), str(tmp_path))
 
         assert result is False
+
+
+# --------------------------------------------------------------------------- #
+# vad_filter em chunks de fala                                                 #
+# --------------------------------------------------------------------------- #
+
+
+class TestSpeechChunksSkipWhisperVad:
+
+    def _processor(self, proc, tmp_path, settings):
+        from app.domain.models import WhisperEngine
+        proc.settings = settings
+        proc.current_engine = WhisperEngine.FASTER_WHISPER
+        proc.model_manager = MagicMock()
+        proc.model_manager.transcribe.return_value = {"text": "", "segments": []}
+        proc.state = MagicMock()
+        proc.current_job_id = "job-1"
+        audio_file = tmp_path / "chunk.wav"
+        audio_file.write_bytes(b"RIFF")
+        return proc, audio_file
+
+    def test_vad_filter_override_reaches_model(self, proc_with_mocked_init, tmp_path):
+        processor, audio_file = self._processor(proc_with_mocked_init, tmp_path, {})
+
+        processor._transcribe_direct(str(audio_file), "pt", vad_filter=False)
+
+        assert processor.model_manager.transcribe.call_args.kwargs["vad_filter"] is False
+
+    def test_default_leaves_vad_to_manager(self, proc_with_mocked_init, tmp_path):
+        processor, audio_file = self._processor(proc_with_mocked_init, tmp_path, {})
+
+        processor._transcribe_direct(str(audio_file), "pt")
+
+        assert "vad_filter" not in processor.model_manager.transcribe.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_speech_packed_chunks_disable_vad_filter(self, proc_with_mocked_init, tmp_path):
+        settings = {
+            "enable_chunking": True,
+            "vad_speech_only": True,
+            "whisper_min_duration_for_chunks": 300,
+            "chunk_checkpoints_enabled": False,
+        }
+        processor, audio_file = self._processor(proc_with_mocked_init, tmp_path, settings)
+        job = MagicMock(input_file=str(audio_file), language_in="pt", language_out=None)
+        audio = MagicMock()
+        audio.__len__.return_value = 600_000
+
+        with patch('app.services.processor.AudioSegment.from_file', return_value=audio), \
+                patch('app.services.processor.ChunkTranscriber') as chunk_transcriber_cls:
+            async def fake_transcribe(*args, transcribe_fn, **kwargs):
+                return transcribe_fn(str(audio_file), "pt", None)
+
+            chunk_transcriber_cls.return_value.transcribe = fake_transcribe
+            await processor._run_transcription(job)
+
+        assert processor.model_manager.transcribe.call_args.kwargs["vad_filter"] is False
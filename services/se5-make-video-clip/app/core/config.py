@@ -60,6 +60,7 @@ class Settings(BaseServiceSettings):
     cleanup_temp_after_hours: int = 1
     cleanup_output_after_hours: int = 24
     cleanup_shorts_cache_after_days: int = 30
+    shorts_library_max_size_mb: int = 20480
 
     # Video Compatibility
     target_video_height: int = 720
@@ -85,6 +86,8 @@ class Settings(BaseServiceSettings):
     ocr_confidence_threshold: float = 0.50
     ocr_frames_per_second: int = 3
     ocr_max_frames: int = 240
+    # Processos do pool de validação OCR por worker; 0 = um por núcleo
+    ocr_validation_workers: int = 0
 
     # TRSD
     trsd_enabled: bool = True
@@ -113,6 +116,12 @@ class Settings(BaseServiceSettings):
     ffmpeg_audio_codec: str = "aac"
     ffmpeg_preset: str = "fast"
     ffmpeg_crf: int = 23
+    # Compor o vídeo final num único encode (concat + áudio + legendas + trim)
+    render_single_pass: bool = True
+    # Concatenação em segmentos paralelos (um encode por short); 0 = um único processo
+    parallel_concat_workers: int = 0
+    # Normalizar cada short para o spec canônico ao ser aprovado
+    normalize_shorts_on_ingest: bool = True
 
     # Video Trimming
     video_trim_padding_ms: int = 1000
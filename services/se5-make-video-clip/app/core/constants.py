@@ -278,6 +278,8 @@ TITLE_FONT_SIZE = 48
 TITLE_BORDER_WIDTH = 3
 STEREO_CHANNELS = 2
 DEFAULT_AUDIO_SAMPLE_RATE = 48000
+# Timescale MP4 fixo dos shorts normalizados (concat demuxer com -c copy)
+MEZZANINE_TIMESCALE = 15360
 
 # ---------------------------------------------------------------------------
 # Duration / Timing Defaults
@@ -307,6 +309,8 @@ SQLITE_CONNECTION_TIMEOUT = 10.0
 SQLITE_BUSY_TIMEOUT_MS = 10000
 SQLITE_BLACKLIST_CONNECTION_TIMEOUT = 5.0
 SQLITE_BLACKLIST_BUSY_TIMEOUT_MS = 5000
+# Sondagens ffprobe mantidas em memória por processo (ProbeCache, LRU)
+PROBE_CACHE_MAX_ENTRIES = 4096
 
 # ---------------------------------------------------------------------------
 # Circuit Breaker
@@ -105,6 +105,7 @@ class StageContext:
     temp_video_path: Path | None = None
     video_with_audio_path: Path | None = None
     final_video_path: Path | None = None
+    single_pass_render: bool = False  # concat deferred to a single-encode final composition
     
     # Subtitles
     subtitle_path: Path | None = None
@@ -3,9 +3,12 @@ AssembleVideoStage - Concatenate shorts into single video
 
 🎯 Responsibilities:
     - Extract video file paths
-    - Concatenate with aspect ratio handling
+    - Concatenate with aspect ratio handling (stream copy when every short
+      is already in the mezzanine spec recorded at ingest)
     - Remove audio from shorts
     - Create temporary video file
+    - Defer concatenation to FinalCompositionStage when single-pass
+      rendering is enabled (one encode for the whole composition)
 """
 
 from __future__ import annotations
@@ -60,6 +63,17 @@ class AssembleVideoStage(JobStage):
         video_files = [short['file_path'] for short in context.selected_shorts]
         expected_duration = sum(s.get('duration_seconds', 0) for s in context.selected_shorts)
 
+        # Title cards need the concatenated video, so they keep the staged path
+        if context.settings.get('render_single_pass', False) and not context.hook_text:
+            logger.info("⏭️  Single-pass render enabled: concatenation deferred to final composition")
+            context.single_pass_render = True
+            return {
+                'temp_video_path': None,
+                'video_count': len(video_files),
+                'aspect_ratio': context.aspect_ratio,
+                'single_pass': True,
+            }
+
         # Create output path
         temp_video_path = Path(context.settings['temp_dir']) / context.job_id / "video_no_audio.mp4"
         temp_video_path.parent.mkdir(parents=True, exist_ok=True)
@@ -70,7 +84,8 @@ class AssembleVideoStage(JobStage):
             output_path=str(temp_video_path),
             aspect_ratio=context.aspect_ratio,
             crop_position=context.crop_position,
-            remove_audio=True
+            remove_audio=True,
+            mezzanine_specs=[short.get('mezzanine_spec') for short in context.selected_shorts],
         )
 
         # Validate concatenated duration
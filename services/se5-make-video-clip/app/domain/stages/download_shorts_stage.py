@@ -7,25 +7,70 @@ DownloadShortsStage - Download and validate shorts with OCR detection
     - Validate with OCR (reject embedded subtitles)
     - Handle blacklist
     - Retry logic with multiple rounds
+    - Approved shorts go to the shared ShortsLibrary and are hard-linked
+      into the job workspace, so each short is downloaded once
+    - Ingest: approved shorts are normalized to the canonical mezzanine
+      spec once, before entering the cache (spec recorded in metadata)
+
+⚙️ Downloads and OCR validation run as a producer/consumer pipeline:
+    downloads stay concurrent, validation runs off the event loop (on a
+    ValidationPool when one is given) and the batch stops as soon as the
+    approved shorts cover the target duration.
 """
 
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from pathlib import Path
 from typing import Any
 
 from ..job_stage import JobStage, StageContext
 from ...shared.events import EventType
 from ...shared.exceptions import VideoProcessingException, ErrorCode
+from ...video_processing.validation_pool import ValidationPool, validate_short
 from common.log_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Downloads simultâneos por job
+DOWNLOAD_CONCURRENCY = 5
+# Tentativas de download/validação por short
+MAX_ATTEMPTS = 3
+
+
+class _BatchProgress:
+    """Download/validation counters of one batch, reported as progress events"""
+
+    def __init__(self, context: StageContext, total: int) -> None:
+        self.context = context
+        self.total = total
+        self.done = 0
+        self.approved = 0
+
+    async def report_done(self) -> None:
+        self.done += 1
+        try:
+            await self.context.publish_event(
+                EventType.VIDEO_DOWNLOADING,
+                {'progress': 30.0 + 40.0 * self.done / self.total}
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Progress event failed: {e}")
+
+
 class DownloadShortsStage(JobStage):
     """Stage 3: Download and validate shorts"""
     
-    def __init__(self, api_client, shorts_cache, video_validator, blacklist) -> None:
+    def __init__(
+        self,
+        api_client,
+        shorts_cache,
+        video_validator,
+        blacklist,
+        validation_pool: ValidationPool | None = None,
+        video_builder=None,
+    ) -> None:
         """
         Initialize stage
         
@@ -34,6 +79,10 @@ class DownloadShortsStage(JobStage):
             shorts_cache: ShortsCache for caching
             video_validator: VideoValidator for OCR validation
             blacklist: Blacklist for rejected videos
+            validation_pool: Process pool for OCR validation (optional;
+                without it validation runs in a thread with video_validator)
+            video_builder: VideoBuilder used to normalize shorts at ingest
+                (optional; without it shorts are cached as downloaded)
         """
         super().__init__(
             name="download_shorts",
@@ -44,6 +93,9 @@ class DownloadShortsStage(JobStage):
         self.shorts_cache = shorts_cache
         self.video_validator = video_validator
         self.blacklist = blacklist
+        self.validation_pool = validation_pool
+        self.video_builder = video_builder
+        self.validation_workers = validation_pool.max_workers if validation_pool else 1
     
     def validate(self, context: StageContext) -> None:
         """Validate shorts list exists"""
@@ -79,12 +131,14 @@ class DownloadShortsStage(JobStage):
             cached = self.shorts_cache.get(video_id)
             if cached:
                 try:
-                    file_path = Path(cached['file_path'])
+                    file_path = self.shorts_cache.materialize(
+                        video_id, self._job_shorts_dir(context) / f"{video_id}.mp4", context.job_id
+                    )
+                    if file_path is None:
+                        raise FileNotFoundError("not in shorts library")
                     logger.debug(f"💾 Cache hit: {video_id}, validating...")
 
-                    self.video_validator.validate_video_integrity(str(file_path), timeout=5)
-
-                    has_subs, confidence, reason = self.video_validator.has_embedded_subtitles(str(file_path))
+                    has_subs, confidence, reason = await self._run_validation(str(file_path), timeout=5)
                     if has_subs:
                         logger.warning(
                             f"🚫 EMBEDDED SUBTITLES (cache): {video_id} (conf: {confidence:.2f})"
@@ -93,11 +147,12 @@ class DownloadShortsStage(JobStage):
                             'title': short.get('title', ''),
                             'duration': short.get('duration_seconds', 0)
                         })
+                        file_path.unlink(missing_ok=True)
                         self.shorts_cache.remove(video_id)
                         continue
 
                     self.shorts_cache.mark_validated(video_id, False, confidence)
-                    downloaded.append(cached)
+                    downloaded.append({**cached, 'file_path': str(file_path)})
                     cache_hits += 1
                     logger.info(f"✅ Cache HIT: {video_id} (conf={confidence:.2f})")
 
@@ -116,31 +171,134 @@ class DownloadShortsStage(JobStage):
         context: StageContext,
         downloaded: list[dict[str, Any]],
     ) -> int:
-        """Download a batch of shorts. Returns number of successful downloads."""
-        downloads = 0
-        batch_size = 5
-        for i in range(0, len(to_download), batch_size):
-            batch = to_download[i:i+batch_size]
-            tasks = [self._download_with_retry(short, context) for short in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in results:
-                if result and not isinstance(result, Exception):
-                    downloaded.append(result)
-                    downloads += 1
-                elif isinstance(result, Exception):
-                    logger.debug(f"Download failed: {result}")
-
-            if to_download:
-                progress = 30.0 + (40.0 * min(i + batch_size, len(to_download)) / len(to_download))
-            else:
-                progress = 70.0
+        """
+        Download and validate shorts as a producer/consumer pipeline.
 
-            await context.publish_event(
-                EventType.VIDEO_DOWNLOADING,
-                {'progress': progress}
+        Producers download concurrently and queue the files; consumers
+        validate them (bounded by the validation pool size). Once the shorts
+        in *downloaded* cover the target duration, pending downloads and
+        validations are cancelled.
+
+        Returns number of approved downloads (appended to *downloaded*).
+        """
+        if not to_download:
+            return 0
+
+        pending = deque(to_download)
+        queue: asyncio.Queue[tuple[dict[str, Any], Path]] = asyncio.Queue(maxsize=self.validation_workers)
+        enough = asyncio.Event()
+        progress = _BatchProgress(context, total=len(to_download))
+
+        producers = [
+            asyncio.create_task(self._produce_downloads(pending, queue, enough, progress, context))
+            for _ in range(min(DOWNLOAD_CONCURRENCY, len(to_download)))
+        ]
+        consumers = [
+            asyncio.create_task(self._consume_downloads(queue, enough, progress, context, downloaded))
+            for _ in range(self.validation_workers)
+        ]
+        await self._run_download_pipeline(producers, consumers, queue, enough, context)
+
+        if enough.is_set():
+            logger.info(
+                f"⏹️  Target duration covered - stopped with {len(pending)} shorts not downloaded"
             )
-        return downloads
+        return progress.approved
+
+    async def _produce_downloads(
+        self,
+        pending: deque[dict[str, Any]],
+        queue: asyncio.Queue[tuple[dict[str, Any], Path]],
+        enough: asyncio.Event,
+        progress: _BatchProgress,
+        context: StageContext,
+    ) -> None:
+        """Producer: download pending shorts and queue them for validation"""
+        while pending and not enough.is_set():
+            short = pending.popleft()
+            output_path = await self._download_with_retry(short, context)
+            if output_path is None:
+                await progress.report_done()
+                continue
+            await queue.put((short, output_path))
+
+    async def _consume_downloads(
+        self,
+        queue: asyncio.Queue[tuple[dict[str, Any], Path]],
+        enough: asyncio.Event,
+        progress: _BatchProgress,
+        context: StageContext,
+        downloaded: list[dict[str, Any]],
+    ) -> None:
+        """Consumer: validate and cache queued downloads until cancelled"""
+        while True:
+            short, output_path = await queue.get()
+            try:
+                try:
+                    short_data = await self._validate_download(short, output_path, context)
+                except Exception as e:
+                    # Only this short is dropped; the pipeline keeps consuming
+                    logger.error(f"❌ Failed to validate/cache {short['video_id']}: {e}", exc_info=True)
+                    output_path.unlink(missing_ok=True)
+                    short_data = None
+                if short_data:
+                    downloaded.append(short_data)
+                    progress.approved += 1
+                    if self._covers_target(downloaded, context):
+                        enough.set()
+                await progress.report_done()
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    async def _run_download_pipeline(
+        producers: list[asyncio.Task],
+        consumers: list[asyncio.Task],
+        queue: asyncio.Queue[tuple[dict[str, Any], Path]],
+        enough: asyncio.Event,
+        context: StageContext,
+    ) -> None:
+        """Wait until all downloads are validated or the target is covered, then cancel the rest"""
+        async def drain() -> None:
+            await asyncio.gather(*producers)
+            await queue.join()
+
+        waiters = [asyncio.create_task(enough.wait()), asyncio.create_task(drain())]
+        tasks = [*producers, *consumers, *waiters]
+        try:
+            done, _ = await asyncio.wait([*waiters, *consumers], return_when=asyncio.FIRST_COMPLETED)
+            # Consumers only return by failing; without them producers would block forever
+            dead = [task for task in consumers if task in done]
+            if dead:
+                error = dead[0].exception()
+                raise VideoProcessingException(
+                    f"Shorts validation stopped: {error}",
+                    error_code=ErrorCode.VIDEO_VALIDATION_FAILED,
+                    job_id=context.job_id,
+                    cause=error,
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Downloads that were never validated are not usable
+            while not queue.empty():
+                _, output_path = queue.get_nowait()
+                output_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _covers_target(shorts: list[dict[str, Any]], context: StageContext) -> bool:
+        """True when *shorts* already cover the target video duration"""
+        if not context.target_video_duration:
+            return False
+        total_duration = sum(s.get('duration_seconds', 0) for s in shorts)
+        return total_duration >= context.target_video_duration
+
+    async def _run_validation(self, video_path: str, timeout: int = 10) -> tuple[bool, float, str]:
+        """Integrity check + subtitle detection, off the event loop"""
+        if self.validation_pool is not None:
+            return await self.validation_pool.validate(video_path, timeout)
+        return await asyncio.to_thread(validate_short, self.video_validator, video_path, timeout)
 
     async def execute(self, context: StageContext) -> dict[str, Any]:
         """
@@ -225,56 +383,121 @@ class DownloadShortsStage(JobStage):
             'total_duration': sum(s.get('duration_seconds', 0) for s in downloaded_shorts),
         }
     
-    async def _download_with_retry(self, short_info: dict[str, Any], context: StageContext) -> dict[str, Any]:
-        """Download single video with retry logic"""
-        video_id = short_info['video_id']
+    @staticmethod
+    def _job_shorts_dir(context: StageContext) -> Path:
+        """Job workspace for shorts (files are hard links into the shorts library)"""
         # FIXED: Organizar shorts por job_id para evitar arquivos soltos
         job_shorts_dir = Path(context.settings['shorts_cache_dir']) / context.job_id
         job_shorts_dir.mkdir(parents=True, exist_ok=True)
-        output_path = job_shorts_dir / f"{video_id}.mp4"
+        return job_shorts_dir
+    
+    async def _download_with_retry(
+        self,
+        short_info: dict[str, Any],
+        context: StageContext,
+        attempts: int = MAX_ATTEMPTS,
+    ) -> Path | None:
+        """Download single video with retry logic. Returns the file path or None."""
+        video_id = short_info['video_id']
+        output_path = self._job_shorts_dir(context) / f"{video_id}.mp4"
         
         # Check blacklist before download
         if self.blacklist.is_blacklisted(video_id):
             logger.warning(f"🚫 BLACKLIST: {video_id}")
             return None
         
-        for attempt in range(3):
+        for attempt in range(attempts):
             try:
-                # Download video
                 await self.api_client.download_short(video_id, str(output_path))
-                
-                # Validate integrity
-                self.video_validator.validate_video_integrity(str(output_path), timeout=10)
-                
-                # Check for embedded subtitles
-                has_subs, confidence, reason = self.video_validator.has_embedded_subtitles(str(output_path))
-                
-                if has_subs:
-                    logger.warning(f"🚫 EMBEDDED SUBTITLES: {video_id} (conf: {confidence:.2f})")
-                    self.blacklist.add(video_id, reason, confidence, metadata=short_info)
-                    if output_path.exists():
-                        output_path.unlink()
-                    return None
-                
-                # Valid video - cache it
-                short_data = {
-                    **short_info,
-                    'file_path': str(output_path),
-                    'has_embedded_subtitles': False,
-                    'ocr_confidence': confidence,
-                }
-                
-                self.shorts_cache.add(video_id, short_data)
-                self.shorts_cache.mark_validated(video_id, False, confidence)
-                
-                logger.info(f"✅ Downloaded: {video_id} (conf={confidence:.2f})")
-                return short_data
-                
+                return output_path
+            
+            except asyncio.CancelledError:
+                output_path.unlink(missing_ok=True)
+                raise
             except Exception as e:
-                logger.warning(f"⚠️ Download attempt {attempt+1}/3 failed for {video_id}: {e}")
-                if attempt == 2:
-                    logger.error(f"❌ Download failed after 3 attempts: {video_id}")
+                logger.warning(f"⚠️ Download attempt {attempt+1}/{attempts} failed for {video_id}: {e}")
+                if attempt == attempts - 1:
+                    logger.error(f"❌ Download failed after {attempts} attempts: {video_id}")
                     return None
                 await asyncio.sleep(1 * (attempt + 1))
         
         return None
+    
+    async def _validate_download(
+        self,
+        short_info: dict[str, Any],
+        output_path: Path,
+        context: StageContext,
+    ) -> dict[str, Any] | None:
+        """Validate a downloaded short (re-downloading corrupted files) and cache it"""
+        video_id = short_info['video_id']
+        
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                has_subs, confidence, reason = await self._run_validation(str(output_path), timeout=10)
+                break
+            
+            except asyncio.CancelledError:
+                output_path.unlink(missing_ok=True)
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Validation attempt {attempt+1}/{MAX_ATTEMPTS} failed for {video_id}: {e}")
+                output_path.unlink(missing_ok=True)
+                if attempt == MAX_ATTEMPTS - 1:
+                    logger.error(f"❌ Validation failed after {MAX_ATTEMPTS} attempts: {video_id}")
+                    return None
+                if await self._download_with_retry(short_info, context, attempts=1) is None:
+                    return None
+        
+        if has_subs:
+            logger.warning(f"🚫 EMBEDDED SUBTITLES: {video_id} (conf: {confidence:.2f})")
+            self.blacklist.add(video_id, reason, confidence, metadata=short_info)
+            output_path.unlink(missing_ok=True)
+            return None
+        
+        # Valid video - cache it
+        short_data = {
+            **short_info,
+            'file_path': str(output_path),
+            'has_embedded_subtitles': False,
+            'ocr_confidence': confidence,
+        }
+        
+        mezzanine_spec = await self._normalize_for_cache(video_id, output_path, context)
+        if mezzanine_spec:
+            short_data['mezzanine_spec'] = mezzanine_spec
+
+        # Move into the shared library and hard-link it back into the job workspace
+        self.shorts_cache.add(video_id, str(output_path), short_data)
+        self.shorts_cache.mark_validated(video_id, False, confidence)
+        self.shorts_cache.materialize(video_id, output_path, context.job_id)
+        
+        logger.info(f"✅ Downloaded: {video_id} (conf={confidence:.2f})")
+        return short_data
+
+    async def _normalize_for_cache(
+        self,
+        video_id: str,
+        output_path: Path,
+        context: StageContext,
+    ) -> str | None:
+        """Transcode an approved short to the mezzanine spec in place. Returns the spec key or None."""
+        if self.video_builder is None or not context.settings.get('normalize_shorts_on_ingest', True):
+            return None
+
+        normalized_path = output_path.with_name(f"{output_path.stem}.mezzanine.mp4")
+        try:
+            spec = await self.video_builder.normalize_short(
+                str(output_path), str(normalized_path), context.aspect_ratio, context.crop_position
+            )
+            normalized_path.replace(output_path)
+            return spec.key
+
+        except asyncio.CancelledError:
+            normalized_path.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            # Cached as downloaded; assembly falls back to per-job compatibility
+            logger.warning(f"⚠️ Normalization failed for {video_id}: {e}")
+            normalized_path.unlink(missing_ok=True)
+            return None
@@ -6,6 +6,8 @@ FinalCompositionStage - Add audio, optional title card, and burn subtitles
     - Add audio track to video
     - Conditionally burn subtitles (FIX-ERROS Fase 2)
     - Create final video file
+    - Single-pass mode: concat + audio + subtitles + trim in one encode,
+      falling back to the staged path on failure
 """
 
 from __future__ import annotations
@@ -32,7 +34,14 @@ class FinalCompositionStage(JobStage):
     
     def validate(self, context: StageContext) -> None:
         """Validate all required files exist"""
-        if not context.temp_video_path or not context.temp_video_path.exists():
+        if context.single_pass_render:
+            if not context.selected_shorts:
+                raise VideoProcessingException(
+                    "No selected shorts available",
+                    error_code=ErrorCode.NO_VALID_SHORTS,
+                    job_id=context.job_id,
+                )
+        elif not context.temp_video_path or not context.temp_video_path.exists():
             raise VideoProcessingException(
                 "Temporary video file not found",
                 error_code=ErrorCode.VIDEO_FILE_NOT_FOUND,
@@ -66,6 +75,14 @@ class FinalCompositionStage(JobStage):
             4. (Optional) Burn subtitles
         """
         job_dir = Path(context.settings['temp_dir']) / context.job_id
+
+        if context.single_pass_render:
+            try:
+                return await self._compose_single_pass(context)
+            except Exception as e:
+                logger.warning(f"⚠️ Single-pass composition failed, falling back to staged render: {e}")
+                await self._assemble_fallback(context, job_dir)
+
         base_video_path = context.temp_video_path
 
         # ── Fase 1: Title card + circleopen transition ──────────────────────
@@ -115,11 +132,7 @@ class FinalCompositionStage(JobStage):
         logger.info(f"✅ Audio added")
         
         # ── Fase 2: Conditional subtitle burn ───────────────────────────────
-        srt_has_content = (
-            context.subtitle_path
-            and context.subtitle_path.exists()
-            and context.subtitle_path.stat().st_size > 0
-        )
+        srt_has_content = self._srt_has_content(context)
 
         if context.burn_subtitles and srt_has_content:
             final_video_path = Path(context.settings['output_dir']) / f"{context.job_id}_final.mp4"
@@ -158,6 +171,59 @@ class FinalCompositionStage(JobStage):
             'burn_subtitles': context.burn_subtitles,
         }
 
+    @staticmethod
+    def _srt_has_content(context: StageContext) -> bool:
+        return bool(
+            context.subtitle_path
+            and context.subtitle_path.exists()
+            and context.subtitle_path.stat().st_size > 0
+        )
+
+    async def _compose_single_pass(self, context: StageContext) -> dict[str, Any]:
+        """Concat + audio + subtitles + trim in a single encode"""
+        final_video_path = Path(context.settings['output_dir']) / f"{context.job_id}_final.mp4"
+        burn = context.burn_subtitles and self._srt_has_content(context)
+        style = context.subtitle_style if isinstance(context.subtitle_style, str) else "dynamic"
+
+        logger.info(f"🎬 Single-pass composition (subtitles={'on' if burn else 'off'})...")
+        await self.video_builder.compose_single_pass(
+            video_files=[short['file_path'] for short in context.selected_shorts],
+            audio_path=str(context.audio_path),
+            output_path=str(final_video_path),
+            aspect_ratio=context.aspect_ratio,
+            crop_position=context.crop_position,
+            subtitle_path=str(context.subtitle_path) if burn else None,
+            style=style,
+            max_duration=context.target_video_duration,
+        )
+        logger.info(f"✅ Final video created: {final_video_path}")
+
+        context.final_video_path = final_video_path
+
+        return {
+            'video_with_audio_path': None,
+            'final_video_path': str(final_video_path),
+            'title_card': False,
+            'burn_subtitles': burn,
+            'single_pass': True,
+        }
+
+    async def _assemble_fallback(self, context: StageContext, job_dir: Path) -> None:
+        """Produce the concatenated video that AssembleVideoStage deferred"""
+        temp_video_path = job_dir / "video_no_audio.mp4"
+        temp_video_path.parent.mkdir(parents=True, exist_ok=True)
+
+        await self.video_builder.concatenate_videos(
+            video_files=[short['file_path'] for short in context.selected_shorts],
+            output_path=str(temp_video_path),
+            aspect_ratio=context.aspect_ratio,
+            crop_position=context.crop_position,
+            remove_audio=True
+        )
+
+        context.temp_video_path = temp_video_path
+        context.single_pass_render = False
+
     async def _extract_first_frame(self, video_path: str, output_path: str) -> str:
         """Extract first frame as JPEG image for title card background."""
         logger.info(f"🖼️  Extracting first frame from {video_path}")
@@ -2,7 +2,8 @@
 LoadApprovedVideosStage - Load pre-approved videos from disk
 
 Replaces FetchShortsStage + DownloadShortsStage for the legacy workflow.
-Reads video files from data/approved/videos/ and loads metadata.
+Reads video files from data/approved/videos/ and loads metadata, including
+the mezzanine spec recorded when the short was approved.
 """
 
 from __future__ import annotations
@@ -22,13 +23,27 @@ CONCAT_TOLERANCE = 2.0
 class LoadApprovedVideosStage(JobStage):
     """Stage 2-3 combined: Load approved videos from disk."""
 
-    def __init__(self, video_builder) -> None:
+    def __init__(self, video_builder, status_store=None) -> None:
         super().__init__(
             name="load_approved",
             progress_start=15.0,
             progress_end=30.0,
         )
         self.video_builder = video_builder
+        self.status_store = status_store
+
+    def _mezzanine_spec(self, video_id: str, video_file: Path) -> str | None:
+        """Spec recorded at approval, if the record still refers to this file."""
+        if self.status_store is None:
+            return None
+        try:
+            record = self.status_store.get_approved(video_id)
+        except Exception as exc:
+            logger.debug("Approved record unavailable for %s: %s", video_id, exc)
+            return None
+        if not record or Path(record.get('file_path') or '').name != video_file.name:
+            return None
+        return (record.get('metadata') or {}).get('mezzanine_spec')
 
     def validate(self, context: StageContext) -> None:
         approved_dir = Path(context.settings.get('approved_dir', './data/approved/videos'))
@@ -66,6 +81,7 @@ class LoadApprovedVideosStage(JobStage):
                     'resolution': info.get('resolution', '1080x1920'),
                     'fps': int(info.get('fps', 30)),
                     'title': f'Approved short: {video_id}',
+                    'mezzanine_spec': self._mezzanine_spec(video_id, video_file),
                 })
             except Exception as exc:
                 logger.warning("Error reading video %s: %s", video_id, exc)
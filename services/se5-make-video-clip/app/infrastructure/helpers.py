@@ -1,6 +1,7 @@
 """Video transform/crop/validate helper."""
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any
 
@@ -77,15 +78,22 @@ async def _validate_ocr(
     video_validator: Any,
     blacklist: Any,
     job_logger: Any,
+    validation_pool: Any = None,
 ) -> tuple[bool, float, str, int]:
     """Run OCR validation on video. Returns (approved, confidence, reason, frames_processed)."""
     job_logger.info(f"   🔍 [4/5] Validating (OCR 100% frames): {video_id}")
     logger.info(f"🔍 Validating {video_id} (OCR 100% frames)...")
 
-    has_text, confidence, reason, frames_processed = video_validator.has_embedded_subtitles(
-        video_path=validation_path,
-        force_revalidation=True
-    )
+    if validation_pool is not None:
+        has_text, confidence, reason, frames_processed = await validation_pool.detect(
+            validation_path, video_id=video_id, force_revalidation=True,
+        )
+    else:
+        has_text, confidence, reason, frames_processed = video_validator.has_embedded_subtitles(
+            video_path=validation_path,
+            force_revalidation=True,
+            video_id=video_id,
+        )
 
     if frames_processed == 0:
         logger.error(f"❌ ZERO FRAMES: {video_id} - corrupto")
@@ -104,6 +112,53 @@ async def _validate_ocr(
     return approved, confidence, reason, frames_processed
 
 
+async def _normalize_for_approval(
+    video_id: str,
+    validation_path: str,
+    aspect_ratio: str,
+    crop_position: str,
+    video_builder: Any,
+    job_logger: Any,
+) -> str | None:
+    """Transcode the approved short to the mezzanine spec in place (before it enters approved/). Returns the spec key or None."""
+    from ..core.config import get_settings
+
+    if not get_settings().get('normalize_shorts_on_ingest', True):
+        return None
+
+    tagged_path = Path(validation_path)
+    normalized_path = tagged_path.with_name(f"{tagged_path.stem}.mezzanine.mp4")
+    try:
+        spec = await video_builder.normalize_short(
+            str(tagged_path), str(normalized_path), aspect_ratio, crop_position
+        )
+        normalized_path.replace(tagged_path)
+        job_logger.info(f"      🎞️  Mezzanine: {spec.key}")
+        return spec.key
+
+    except asyncio.CancelledError:
+        normalized_path.unlink(missing_ok=True)
+        raise
+    except Exception as e:
+        # Approved as cropped; assembly falls back to per-job compatibility
+        logger.warning(f"⚠️ Normalization failed for {video_id}: {e}")
+        normalized_path.unlink(missing_ok=True)
+        return None
+
+
+def _record_approved(video_id: str, final_path: str, mezzanine_spec: str | None, blacklist: Any) -> None:
+    """Register the approved short (and its mezzanine spec) in the video status store."""
+    try:
+        blacklist.add_approved(
+            video_id=video_id,
+            url=f"https://www.youtube.com/watch?v={video_id}",
+            file_path=final_path,
+            metadata={'mezzanine_spec': mezzanine_spec},
+        )
+    except Exception as e:
+        logger.warning(f"⚠️ Could not record approved video {video_id}: {e}")
+
+
 def _cleanup_on_error(
     video_id: str,
     validation_path: str | None,
@@ -131,9 +186,14 @@ async def transform_crop_and_validate_video(
     video_validator: Any,
     blacklist: Any,
     job_logger: Any,
+    validation_pool: Any = None,
 ) -> str | None:
     """
-    Helper: Transform → Crop → Move → Validate → Finalize
+    Helper: Transform → Crop → Move → Validate → Normalize → Finalize
+
+    Approved shorts are transcoded to the mezzanine spec before they enter
+    data/approved/videos, and the spec is recorded in the video status store
+    so assembly can join them with -c copy.
 
     Args:
         video_id: ID do vídeo
@@ -145,6 +205,8 @@ async def transform_crop_and_validate_video(
         video_validator: VideoValidator instance
         blacklist: Blacklist instance
         job_logger: Logger do job
+        validation_pool: ValidationPool para o OCR (opcional; sem ele o OCR
+            roda no processo atual com video_validator)
 
     Returns:
         Path do vídeo aprovado, ou None se rejeitado
@@ -171,14 +233,18 @@ async def transform_crop_and_validate_video(
         job_logger.info(f"      🏷️  Tagged: {Path(validation_path).name}")
 
         approved, confidence, reason, _ = await _validate_ocr(
-            video_id, validation_path, video_validator, blacklist, job_logger
+            video_id, validation_path, video_validator, blacklist, job_logger, validation_pool
         )
 
         job_logger.info(f"   ✅ [5/5] Finalizing: {video_id}")
 
         if approved:
+            mezzanine_spec = await _normalize_for_approval(
+                video_id, validation_path, aspect_ratio, crop_position, video_builder, job_logger
+            )
             final_path = pipeline.finalize_validation(validation_path, video_id, approved=True, job_id=job_id)
             if final_path:
+                _record_approved(video_id, final_path, mezzanine_spec, blacklist)
                 job_logger.info(f"      ✅ APPROVED: {video_id}")
                 logger.info(f"✅ APPROVED: {video_id} → {final_path}")
                 return final_path
@@ -10,6 +10,7 @@ from ..services.video_builder import VideoBuilder
 from ..services.shorts_manager import ShortsCache
 from ..services.subtitle_generator import SubtitleGenerator
 from ..video_processing.video_validator import VideoValidator
+from ..video_processing.validation_pool import ValidationPool
 from ..services.blacklist_factory import get_blacklist
 from ..core.constants import ValidationThresholds
 from common.log_utils import get_logger
@@ -24,6 +25,7 @@ shorts_cache = None
 subtitle_gen = None
 video_validator = None
 blacklist = None
+validation_pool = None
 
 
 def get_instances() -> tuple[Any, Any, Any, Any, Any]:
@@ -49,7 +51,8 @@ def get_instances() -> tuple[Any, Any, Any, Any, Any]:
             video_codec=settings['ffmpeg_video_codec'],
             audio_codec=settings['ffmpeg_audio_codec'],
             preset=settings['ffmpeg_preset'],
-            crf=settings['ffmpeg_crf']
+            crf=settings['ffmpeg_crf'],
+            parallel_workers=settings.get('parallel_concat_workers', 0),
         )
 
         shorts_cache = ShortsCache(
@@ -69,3 +72,32 @@ def get_instances() -> tuple[Any, Any, Any, Any, Any]:
         logger.info("✅ Video validator and blacklist initialized")
 
     return redis_store, api_client, video_builder, shorts_cache, subtitle_gen
+
+
+def get_validation_pool() -> ValidationPool:
+    """Pool de processos da validação OCR (um por worker, criado sob demanda)"""
+    global validation_pool
+
+    if validation_pool is None:
+        settings = get_settings()
+        validation_pool = ValidationPool(
+            max_workers=settings.get('ocr_validation_workers') or None,
+            validator_kwargs={
+                'min_confidence': ValidationThresholds.OCR_MIN_CONFIDENCE,
+                'frames_per_second': settings.get('ocr_frames_per_second', 3),
+                'max_frames': settings.get('ocr_max_frames', 240),
+            },
+            redis_url=settings['redis_url'],
+        )
+
+    return validation_pool
+
+
+def shutdown_validation_pool() -> None:
+    """Encerra o pool de validação OCR (chamado no shutdown do worker)"""
+    global validation_pool
+
+    if validation_pool is not None:
+        validation_pool.shutdown(wait=False)
+        validation_pool = None
+        logger.info("🛑 Validation pool stopped")
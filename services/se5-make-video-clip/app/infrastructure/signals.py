@@ -14,3 +14,12 @@ def task_failure_handler(task_id, exception, args, kwargs, traceback, einfo, **k
         "Celery task_failure | task_id=%s error=%s",
         task_id, exception, exc_info=einfo.exc_info if einfo else None
     )
+
+
+@signals.worker_process_shutdown.connect
+@signals.worker_shutdown.connect
+def shutdown_worker_pools(**kwargs) -> None:
+    """Stop the OCR validation pool when the worker (or pool process) exits."""
+    from .instances import shutdown_validation_pool
+
+    shutdown_validation_pool()
@@ -12,6 +12,8 @@ class SimpleMetrics:
         self.orphans_detected = 0
         self.orphans_recovered = 0
         self.orphans_failed = 0
+        self.ffprobe_calls = 0
+        self.ffprobe_cache_hits = 0
 
     def reset(self) -> None:
         self.__init__()
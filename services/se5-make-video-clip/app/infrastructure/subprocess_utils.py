@@ -48,6 +48,9 @@ async def run_subprocess_with_timeout(
     Raises:
         SubprocessTimeoutException: If process exceeds timeout
         subprocess.CalledProcessError: If check=True and returncode != 0
+
+    If the awaiting task is cancelled, the process is killed before the
+    CancelledError propagates.
     """
     cmd_str = ' '.join(cmd[:3]) + ('...' if len(cmd) > 3 else '')
     logger.debug(f"Running subprocess: {cmd_str} (timeout: {timeout}s)")
@@ -111,9 +114,9 @@ async def run_subprocess_with_timeout(
                 pid=process.pid
             )
     
-    except Exception as e:
+    except (Exception, asyncio.CancelledError) as e:
         if process and process.returncode is None:
-            # Process still running, kill it
+            # Process still running (error or caller cancelled), kill it
             try:
                 process.kill()
                 await process.wait()
@@ -12,6 +12,7 @@ from ..celery_config import celery_app
 from ...core.config import get_settings
 from ...core.models import JobStatus
 from ..instances import get_instances
+from ...services.probe_cache import get_probe_cache
 
 logger = get_logger(__name__)
 
@@ -67,6 +68,11 @@ def cleanup_old_shorts() -> None:
     _, _, _, shorts_cache, _ = get_instances()
 
     days = settings['cleanup_shorts_cache_after_days']
-    removed_count = shorts_cache.cleanup_old(days=days)
+    removed_count = shorts_cache.cleanup_old(
+        days=days,
+        max_size_mb=settings['shorts_library_max_size_mb'],
+    )
 
-    logger.info(f"✅ Cleanup complete: {removed_count} old shorts removed")
+    pruned_probes = get_probe_cache().prune()
+
+    logger.info(f"✅ Cleanup complete: {removed_count} old shorts removed, {pruned_probes} stale probes pruned")
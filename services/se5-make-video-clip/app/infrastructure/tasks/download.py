@@ -135,59 +135,65 @@ async def _validate_downloaded_shorts(
     video_builder: Any,
     job_logger: Any,
 ) -> tuple[list[str], list[str]]:
-    """Validate each downloaded video. Returns (approved_ids, rejected_ids)."""
+    """Validate downloaded videos concurrently on the OCR pool. Returns (approved_ids, rejected_ids)."""
     job_logger.info(f"🔍 [3/3] Validating {len(downloaded_ids)} shorts...")
     await update_job_status(job_id, JobStatus.PROCESSING, progress=55.0)
 
     from .. import instances
     if instances.video_validator is None or instances.blacklist is None:
         get_instances()
+    validation_pool = instances.get_validation_pool()
 
     raw_dir = Path("data/raw/shorts")
-    approved_ids: list[str] = []
-    rejected_ids: list[str] = []
     total_to_validate = len(downloaded_ids)
+    # Shorts validados ao mesmo tempo: um por processo do pool OCR
+    semaphore = asyncio.Semaphore(validation_pool.max_workers)
+    results: dict[str, bool] = {}
 
-    for i, video_id in enumerate(downloaded_ids):
+    async def validate_one(video_id: str) -> None:
         raw_path = raw_dir / f"{video_id}.mp4"
         if not raw_path.exists():
-            continue
+            return
+
+        async with semaphore:
+            job_logger.info(f"   Validating {video_id}...")
+            final_path = await transform_crop_and_validate_video(
+                video_id=video_id,
+                raw_video_path=str(raw_path),
+                job_id=job_id,
+                aspect_ratio=aspect_ratio,
+                crop_position=crop_position,
+                video_builder=video_builder,
+                video_validator=instances.video_validator,
+                blacklist=instances.blacklist,
+                job_logger=job_logger,
+                validation_pool=validation_pool,
+            )
+        results[video_id] = final_path is not None
 
-        job_logger.info(f"   Validating {video_id} ({i+1}/{total_to_validate})...")
-
-        final_path = await transform_crop_and_validate_video(
-            video_id=video_id,
-            raw_video_path=str(raw_path),
-            job_id=job_id,
-            aspect_ratio=aspect_ratio,
-            crop_position=crop_position,
-            video_builder=video_builder,
-            video_validator=instances.video_validator,
-            blacklist=instances.blacklist,
-            job_logger=job_logger,
-        )
-
-        if final_path:
-            approved_ids.append(video_id)
-        else:
-            rejected_ids.append(video_id)
-
-        progress = 55.0 + (i + 1) / total_to_validate * 40.0
-        if (i + 1) % 5 == 0 or (i + 1) == total_to_validate:
+        validated = len(results)
+        approved = sum(results.values())
+        progress = 55.0 + validated / total_to_validate * 40.0
+        if validated % 5 == 0 or validated == total_to_validate:
             await update_job_status(
                 job_id, JobStatus.PROCESSING, progress=progress,
                 stage_updates={
                     "validating_shorts": {
                         "status": "processing",
                         "metadata": {
-                            "approved": len(approved_ids),
-                            "rejected": len(rejected_ids),
-                            "total_validated": i + 1,
+                            "approved": approved,
+                            "rejected": validated - approved,
+                            "total_validated": validated,
                         }
                     }
                 }
             )
 
+    await asyncio.gather(*(validate_one(video_id) for video_id in downloaded_ids))
+
+    approved_ids = [video_id for video_id in downloaded_ids if results.get(video_id) is True]
+    rejected_ids = [video_id for video_id in downloaded_ids if results.get(video_id) is False]
+
     job_logger.info(f"📊 Validation results:")
     job_logger.info(f"   ├─ Approved: {len(approved_ids)}")
     job_logger.info(f"   ├─ Rejected: {len(rejected_ids)}")
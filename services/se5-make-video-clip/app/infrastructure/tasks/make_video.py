@@ -30,6 +30,7 @@ from ..base import update_job_status
 from ..checkpoint import save_checkpoint, delete_checkpoint
 from ..file_logger import FileLogger
 from ..simple_metrics import simple_metrics as _metrics
+from ...services.probe_cache import get_probe_cache
 
 logger = get_logger(__name__)
 
@@ -67,10 +68,14 @@ def process_make_video(self, job_id: str) -> None:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
 
-        if use_domain:
-            loop.run_until_complete(_process_make_video_with_domain(job_id))
-        else:
-            loop.run_until_complete(_process_make_video_async(job_id))
+        with get_probe_cache().job_scope(job_id) as probe_stats:
+            try:
+                if use_domain:
+                    loop.run_until_complete(_process_make_video_with_domain(job_id))
+                else:
+                    loop.run_until_complete(_process_make_video_async(job_id))
+            finally:
+                _record_probe_stats(job_id, probe_stats)
 
     except Exception as e:
         logger.error("Job %s failed: %s", job_id, e, exc_info=True)
@@ -103,6 +108,16 @@ def process_make_video(self, job_id: str) -> None:
         ))
 
 
+def _record_probe_stats(job_id: str, probe_stats: dict[str, int]) -> None:
+    """Log ffprobe calls made (and avoided by the probe cache) for a job."""
+    _metrics.ffprobe_calls += probe_stats["probe_calls"]
+    _metrics.ffprobe_cache_hits += probe_stats["cache_hits"]
+    logger.info(
+        "Job %s ffprobe: %d calls, %d served from probe cache",
+        job_id, probe_stats["probe_calls"], probe_stats["cache_hits"]
+    )
+
+
 async def _process_make_video_with_domain(job_id: str) -> Any:
     """Processamento assíncrono usando Domain-Driven Design."""
     store, api_client, video_builder, shorts_cache, subtitle_gen = get_instances()
@@ -9,6 +9,8 @@ from .video_builder import VideoBuilder
 from .subtitle_generator import SubtitleGenerator
 from .subtitle_postprocessor import process_subtitles_with_vad
 from .shorts_manager import ShortsCache
+from .shorts_library import ShortsLibrary
+from .probe_cache import ProbeCache, get_probe_cache
 from .blacklist_factory import get_blacklist
 
 __all__ = [
@@ -16,5 +18,8 @@ __all__ = [
     'SubtitleGenerator',
     'process_subtitles_with_vad',
     'ShortsCache',
+    'ShortsLibrary',
+    'ProbeCache',
+    'get_probe_cache',
     'get_blacklist',
 ]
@@ -16,6 +16,7 @@ import shutil
 from common.datetime_utils import now_brazil
 from common.log_utils import get_logger
 from ..core.constants import BYTES_PER_MB
+from .shorts_library import ShortsLibrary
 
 logger = get_logger(__name__)
 
@@ -40,6 +41,7 @@ class CacheManager:
         self.cache_dir = Path(cache_dir)
         self.approved_dir = Path("data/approved/videos")
         self.stats_file = self.cache_dir / "cache_stats.json"
+        self.library = ShortsLibrary(self.cache_dir / "library")
 
         # Criar diretórios se não existirem
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -75,6 +77,11 @@ class CacheManager:
                     list(self.approved_dir.glob("*.mp4"))
                 )
 
+            # Shorts na biblioteca deduplicada
+            library_stats = self.library.stats()
+            stats["total_shorts"] += library_stats["objects"]
+            stats["total_size_mb"] += library_stats["total_size_bytes"] / BYTES_PER_MB
+
             stats["total_size_mb"] = round(stats["total_size_mb"], 2)
 
         except Exception as e:
@@ -82,12 +89,17 @@ class CacheManager:
 
         return stats
 
-    def cleanup_old(self, days: int = 30) -> int:
+    def cleanup_old(self, days: int = 30, max_size_mb: float | None = None) -> int:
         """
         Remove shorts não usados há X dias.
 
+        Na biblioteca, só remove shorts sem referências de jobs e, se
+        max_size_mb for dado, também os menos usados recentemente (LRU) até
+        a biblioteca caber nesse tamanho.
+
         Args:
             days: Número de dias
+            max_size_mb: Tamanho máximo da biblioteca (opcional)
 
         Returns:
             Número de shorts removidos
@@ -110,6 +122,12 @@ class CacheManager:
                     except Exception as e:
                         logger.warning(f"Failed to remove {item.name}: {e}")
 
+            max_bytes = int(max_size_mb * BYTES_PER_MB) if max_size_mb is not None else None
+            removed_count += self.library.evict(
+                max_bytes=max_bytes,
+                idle_seconds=days * 24 * 60 * 60,
+            )
+
             logger.info(f"Cache cleanup: {removed_count} old shorts removed")
 
         except Exception as e:
@@ -210,6 +228,8 @@ class CacheManager:
                     if item.is_file():
                         total_bytes += item.stat().st_size
 
+            total_bytes += self.library.stats()["total_size_bytes"]
+
             if self.approved_dir.exists():
                 for item in self.approved_dir.iterdir():
                     if item.is_file():
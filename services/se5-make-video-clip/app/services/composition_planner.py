@@ -0,0 +1,111 @@
+"""
+Composition Planner
+
+Monta UM filter graph FFmpeg para a composicao final inteira
+(normalize -> crop -> concat -> subtitles -> audio mux -> trim), de forma que
+os pixels sejam codificados uma unica vez. O caminho por etapas do
+VideoBuilder (compatibility fix, concatenate_videos, add_audio,
+burn_subtitles, trim_video) continua sendo o fallback.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from ..core.constants import (
+    AUDIO_BITRATE,
+    DEFAULT_VIDEO_FPS,
+    FFMPEG_B_FRAMES,
+    FFMPEG_GOP_SIZE,
+)
+from .ffmpeg_helpers import escape_filter_path, get_subtitle_style
+
+
+@dataclass
+class CompositionPlan:
+    """Comando FFmpeg de passada unica para a composicao final"""
+
+    inputs: list[str]
+    filter_complex: str
+    output_args: list[str] = field(default_factory=list)
+
+    def to_command(self, ffmpeg_path: str, output_path: str) -> list[str]:
+        cmd = [ffmpeg_path, "-y"]
+        for path in self.inputs:
+            cmd.extend(["-i", path])
+        cmd.extend(["-filter_complex", self.filter_complex])
+        cmd.extend(self.output_args)
+        cmd.append(str(output_path))
+        return cmd
+
+
+def plan_composition(
+    video_files: list[str],
+    audio_path: str,
+    target_width: int,
+    target_height: int,
+    crop_filter: str,
+    subtitle_path: str | None = None,
+    subtitle_style: str = "dynamic",
+    max_duration: float | None = None,
+    video_codec: str = "libx264",
+    audio_codec: str = "aac",
+    preset: str = "fast",
+    crf: int = 23,
+) -> CompositionPlan:
+    """
+    Planeja a composicao final como um unico filter graph.
+
+    Cada short e normalizado no proprio grafo (scale/crop/SAR/fps/pix_fmt),
+    por isso nao precisa de conversao previa de compatibilidade.
+
+    Args:
+        video_files: Shorts na ordem de montagem
+        audio_path: Narracao (vira a unica trilha de audio)
+        target_width: Largura final
+        target_height: Altura final
+        crop_filter: Filtro crop para a posicao escolhida
+        subtitle_path: SRT a queimar (None = sem legendas)
+        subtitle_style: Estilo de legenda (ver get_subtitle_style)
+        max_duration: Duracao final (trim); None = sem trim
+    """
+    normalize = (
+        f"scale={target_width}:{target_height}:force_original_aspect_ratio=increase,"
+        f"{crop_filter},setsar=1,fps={DEFAULT_VIDEO_FPS},format=yuv420p"
+    )
+
+    filter_parts = [f"[{i}:v]{normalize}[v{i}]" for i in range(len(video_files))]
+    concat_inputs = "".join(f"[v{i}]" for i in range(len(video_files)))
+    video_label = "vcat"
+    filter_parts.append(f"{concat_inputs}concat=n={len(video_files)}:v=1:a=0[{video_label}]")
+
+    if subtitle_path:
+        style = get_subtitle_style(subtitle_style)
+        filter_parts.append(
+            f"[{video_label}]subtitles={escape_filter_path(subtitle_path)}:force_style='{style}'[vout]"
+        )
+        video_label = "vout"
+
+    audio_index = len(video_files)
+    output_args = [
+        "-map", f"[{video_label}]",
+        "-map", f"{audio_index}:a:0",
+        "-c:v", video_codec,
+        "-profile:v", "main",
+        "-level", "4.0",
+        "-g", str(FFMPEG_GOP_SIZE),
+        "-bf", str(FFMPEG_B_FRAMES),
+        "-preset", preset,
+        "-crf", str(crf),
+        "-c:a", audio_codec,
+        "-profile:a", "aac_low",
+        "-b:a", AUDIO_BITRATE,
+    ]
+    if max_duration is not None:
+        output_args.extend(["-t", f"{max_duration:.3f}"])
+    output_args.extend(["-movflags", "+faststart"])
+
+    return CompositionPlan(
+        inputs=[*video_files, str(audio_path)],
+        filter_complex=";".join(filter_parts),
+        output_args=output_args,
+    )
@@ -134,6 +134,11 @@ def validate_srt(subtitle_path: str) -> None:
         )
 
 
+def escape_filter_path(path: str) -> str:
+    """Escape a file path for use as an FFmpeg filter argument (e.g. subtitles=)."""
+    return str(path).replace("\\", "\\\\").replace(":", "\\:").replace("'", "\\'")
+
+
 SUBTITLE_STYLES: dict[str, str] = {
     "static": "FontSize=20,PrimaryColour=&HFFFFFF&,OutlineColour=&H000000&,Outline=2,Bold=1,Alignment=10,MarginV=280",
     "dynamic": "FontSize=22,PrimaryColour=&H00FFFF&,OutlineColour=&H000000&,Outline=2,Bold=1,Alignment=10,MarginV=280",
@@ -141,6 +146,17 @@ SUBTITLE_STYLES: dict[str, str] = {
 }
 
 
+def write_concat_list(video_files: list[str], list_path: str | Path) -> Path:
+    """Write an FFmpeg concat demuxer list file (absolute paths, quotes escaped)."""
+    list_path = Path(list_path)
+    lines = []
+    for video_file in video_files:
+        escaped = str(Path(video_file).resolve()).replace("'", "'\\''")
+        lines.append(f"file '{escaped}'\n")
+    list_path.write_text("".join(lines), encoding="utf-8")
+    return list_path
+
+
 def get_subtitle_style(style_name: str) -> str:
     """Get ASS style string for subtitle burning."""
     return SUBTITLE_STYLES.get(style_name, SUBTITLE_STYLES["dynamic"])
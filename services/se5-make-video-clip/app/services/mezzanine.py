@@ -0,0 +1,114 @@
+"""
+Mezzanine Spec
+
+Spec canonico dos shorts no cache: cada short aprovado e transcodificado
+uma unica vez (ao entrar no cache) para codec, fps, SAR, GOP, pix_fmt,
+timescale e resolucao fixos. Shorts com o mesmo spec podem ser concatenados
+pelo concat demuxer com -c copy, sem nova compatibilizacao por job.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ..core.constants import (
+    AUDIO_BITRATE,
+    DEFAULT_AUDIO_SAMPLE_RATE,
+    DEFAULT_VIDEO_FPS,
+    FFMPEG_B_FRAMES,
+    FFMPEG_GOP_SIZE,
+    MEZZANINE_TIMESCALE,
+    STEREO_CHANNELS,
+)
+
+
+@dataclass(frozen=True)
+class MezzanineSpec:
+    """Spec canonico de um short normalizado"""
+
+    width: int
+    height: int
+    crop_position: str = "center"
+    fps: int = DEFAULT_VIDEO_FPS
+    codec: str = "h264"
+    pix_fmt: str = "yuv420p"
+    sar: str = "1:1"
+    gop: int = FFMPEG_GOP_SIZE
+    timescale: int = MEZZANINE_TIMESCALE
+
+    @property
+    def key(self) -> str:
+        """Identificador gravado no metadata do short (igual = concatenavel com -c copy)"""
+        return (
+            f"{self.codec}/{self.pix_fmt}/{self.width}x{self.height}@{self.fps}"
+            f"/sar{self.sar}/gop{self.gop}/tb{self.timescale}/{self.crop_position}"
+        )
+
+
+def build_mezzanine_command(
+    ffmpeg_path: str,
+    input_path: str,
+    output_path: str,
+    spec: MezzanineSpec,
+    crop_filter: str,
+    preset: str = "fast",
+    crf: int = 23,
+    include_audio: bool = True,
+    threads: int | None = None,
+) -> list[str]:
+    """
+    Comando FFmpeg que transcodifica um short para o spec canonico.
+
+    GOP fechado e de tamanho fixo (sem keyframes por troca de cena) e
+    timescale fixo garantem que os arquivos possam ser emendados pelo
+    concat demuxer sem reencode.
+
+    Args:
+        include_audio: False = segmento so de video (-an)
+        threads: Threads do encoder (None = automatico)
+    """
+    video_filter = (
+        f"scale={spec.width}:{spec.height}:force_original_aspect_ratio=increase,"
+        f"{crop_filter},setsar={spec.sar.replace(':', '/')},fps={spec.fps},format={spec.pix_fmt}"
+    )
+    cmd = [
+        ffmpeg_path, "-y",
+        "-i", str(input_path),
+        "-map", "0:v:0",
+    ]
+    if include_audio:
+        cmd.extend(["-map", "0:a:0?"])
+    cmd.extend([
+        "-vf", video_filter,
+        "-c:v", "libx264",
+        "-profile:v", "main",
+        "-level", "4.0",
+        "-g", str(spec.gop),
+        "-keyint_min", str(spec.gop),
+        "-sc_threshold", "0",
+        "-flags", "+cgop",
+        "-bf", str(FFMPEG_B_FRAMES),
+        "-preset", preset,
+        "-crf", str(crf),
+    ])
+    if threads:
+        cmd.extend(["-threads", str(threads)])
+    if include_audio:
+        cmd.extend([
+            "-c:a", "aac",
+            "-ar", str(DEFAULT_AUDIO_SAMPLE_RATE),
+            "-ac", str(STEREO_CHANNELS),
+            "-b:a", AUDIO_BITRATE,
+        ])
+    else:
+        cmd.append("-an")
+    cmd.extend([
+        "-video_track_timescale", str(spec.timescale),
+        "-movflags", "+faststart",
+        str(output_path),
+    ])
+    return cmd
+
+
+def specs_match(spec_keys: list[str | None], spec: MezzanineSpec) -> bool:
+    """True quando todos os shorts ja estao no spec *spec*"""
+    return bool(spec_keys) and all(key == spec.key for key in spec_keys)
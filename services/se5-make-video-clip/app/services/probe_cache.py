@@ -0,0 +1,317 @@
+"""
+Probe Cache
+
+Cache de metadata ffprobe compartilhado pelo processo. Cada arquivo é
+sondado UMA vez (todos os streams + format numa única chamada) e o resultado
+é reutilizado por VideoBuilder, VideoCompatibilityFixer, VideoValidator e VAD.
+
+A chave é (path, size, mtime, inode): qualquer reescrita do arquivo gera uma
+chave nova. Sondagens de arquivos do cache de shorts também ficam na tabela
+`probes` do metadata.db (WAL); um hard link da ShortsLibrary num workspace
+de job reaproveita a sondagem do mesmo inode feita por outro job.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import subprocess
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterator
+
+from common.log_utils import get_logger
+from common.datetime_utils import now_brazil
+from ..core.constants import (
+    PROBE_CACHE_MAX_ENTRIES,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CONNECTION_TIMEOUT,
+)
+from ..shared.exceptions_v2 import FFprobeFailedException, VideoCorruptedException
+
+logger = get_logger(__name__)
+
+ProbeKey = tuple[str, int, int, int]
+
+# Job ao qual as sondagens atuais são contabilizadas (ver job_scope)
+_current_job: ContextVar[str | None] = ContextVar("probe_cache_job", default=None)
+
+
+class ProbeCache:
+    """Cache de resultados ffprobe (memória + SQLite opcional)"""
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        persist_root: str | Path | None = None,
+        max_entries: int = PROBE_CACHE_MAX_ENTRIES,
+        ffprobe_path: str = "ffprobe",
+    ) -> None:
+        """
+        Args:
+            db_path: metadata.db onde as sondagens são persistidas (None = só memória)
+            persist_root: Só arquivos sob este diretório são persistidos
+            max_entries: Entradas mantidas em memória (LRU)
+            ffprobe_path: Binário do ffprobe
+        """
+        self.db_path = Path(db_path) if db_path else None
+        self.persist_root = Path(persist_root).resolve() if persist_root else None
+        self.max_entries = max_entries
+        self.ffprobe_path = ffprobe_path
+
+        self._entries: OrderedDict[ProbeKey, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._totals = {"probe_calls": 0, "cache_hits": 0}
+        self._job_stats: dict[str, dict[str, int]] = {}
+
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._get_conn() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS probes (
+                        path TEXT NOT NULL,
+                        size INTEGER NOT NULL,
+                        mtime_ns INTEGER NOT NULL,
+                        inode INTEGER NOT NULL,
+                        probe JSON NOT NULL,
+                        probed_at TEXT NOT NULL,
+                        PRIMARY KEY (path, size, mtime_ns, inode)
+                    )
+                    """
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_probes_inode ON probes(inode, size, mtime_ns)")
+
+    @contextmanager
+    def _get_conn(self) -> Any:
+        """Context manager para conexões SQLite"""
+        conn = sqlite3.connect(str(self.db_path), timeout=SQLITE_CONNECTION_TIMEOUT)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def probe(self, path: str | Path, timeout: int = 30) -> dict[str, Any]:
+        """Metadata ffprobe completa (streams + format) de *path*, síncrona
+
+        Raises:
+            FFprobeFailedException: ffprobe falhou ou estourou o timeout
+            VideoCorruptedException: Saída do ffprobe não é JSON válido
+        """
+        key = self._file_key(path)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        self._count("probe_calls")
+        try:
+            result = subprocess.run(self._command(path), capture_output=True, timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            raise FFprobeFailedException(
+                video_path=str(path),
+                stderr=f"FFprobe timeout after {timeout}s",
+                returncode=-1,
+                cause=e,
+            )
+        info = self._parse(path, result.returncode, result.stdout, result.stderr)
+        self._store(key, info)
+        return info
+
+    async def aprobe(self, path: str | Path, timeout: int = 30) -> dict[str, Any]:
+        """Versão assíncrona de probe()"""
+        from .ffmpeg_helpers import run_ffprobe_cmd
+
+        key = self._file_key(path)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        self._count("probe_calls")
+        returncode, stdout, stderr = await run_ffprobe_cmd(
+            cmd=self._command(path), timeout=timeout, operation="probe", video_path=str(path),
+        )
+        info = self._parse(path, returncode, stdout, stderr)
+        self._store(key, info)
+        return info
+
+    @contextmanager
+    def job_scope(self, job_id: str) -> Iterator[dict[str, int]]:
+        """Contabiliza as sondagens feitas dentro do bloco (e das tasks/threads
+        criadas nele) para *job_id*; o dict retornado acumula os contadores"""
+        with self._lock:
+            stats = self._job_stats.setdefault(job_id, {"probe_calls": 0, "cache_hits": 0})
+        token = _current_job.set(job_id)
+        try:
+            yield stats
+        finally:
+            _current_job.reset(token)
+            with self._lock:
+                self._job_stats.pop(job_id, None)
+
+    def job_stats(self, job_id: str) -> dict[str, int]:
+        """Contadores do job (probe_calls = ffprobe executados, cache_hits = evitados)"""
+        return dict(self._job_stats.get(job_id, {"probe_calls": 0, "cache_hits": 0}))
+
+    def stats(self) -> dict[str, int]:
+        """Contadores do processo"""
+        with self._lock:
+            return {**self._totals, "entries": len(self._entries)}
+
+    def prune(self) -> int:
+        """Remove do metadata.db sondagens de arquivos que não existem mais"""
+        if not self.db_path:
+            return 0
+        with self._get_conn() as conn:
+            rows = conn.execute("SELECT path, size, mtime_ns, inode FROM probes").fetchall()
+            stale = [tuple(row) for row in rows if self._file_key(row["path"]) != tuple(row)]
+            conn.executemany(
+                "DELETE FROM probes WHERE path = ? AND size = ? AND mtime_ns = ? AND inode = ?", stale
+            )
+        return len(stale)
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    def _command(self, path: str | Path) -> list[str]:
+        return [
+            self.ffprobe_path,
+            "-v", "error",
+            "-print_format", "json",
+            "-show_format",
+            "-show_streams",
+            str(path),
+        ]
+
+    @staticmethod
+    def _file_key(path: str | Path) -> ProbeKey | None:
+        """(path, size, mtime_ns, inode); None se o arquivo não existe (sem cache)"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (str(Path(path).resolve()), st.st_size, st.st_mtime_ns, st.st_ino)
+
+    @staticmethod
+    def _parse(path: str | Path, returncode: int, stdout: bytes, stderr: bytes) -> dict[str, Any]:
+        if returncode != 0:
+            raise FFprobeFailedException(
+                video_path=str(path),
+                stderr=stderr.decode(errors="replace") if stderr else "Unknown error",
+                returncode=returncode,
+            )
+        try:
+            return json.loads(stdout.decode())
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise VideoCorruptedException(
+                video_path=str(path),
+                reason="Failed to parse ffprobe JSON output",
+                details={"json_error": str(e)},
+            )
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._totals[counter] += 1
+            job_id = _current_job.get()
+            if job_id is not None and job_id in self._job_stats:
+                self._job_stats[job_id][counter] += 1
+
+    def _lookup(self, key: ProbeKey | None) -> dict[str, Any] | None:
+        if key is None:
+            return None
+        with self._lock:
+            info = self._entries.get(key)
+            if info is not None:
+                self._entries.move_to_end(key)
+        if info is None and self._persists(key):
+            info = self._load(key)
+            if info is not None:
+                self._remember(key, info)
+        if info is not None:
+            self._count("cache_hits")
+        return info
+
+    def _store(self, key: ProbeKey | None, info: dict[str, Any]) -> None:
+        if key is None:
+            return
+        self._remember(key, info)
+        if self._persists(key):
+            try:
+                with self._get_conn() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO probes (path, size, mtime_ns, inode, probe, probed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (*key, json.dumps(info), now_brazil().isoformat()),
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Probe cache write failed for {key[0]}: {e}")
+
+    def _remember(self, key: ProbeKey, info: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = info
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _persists(self, key: ProbeKey) -> bool:
+        if not self.db_path or self.persist_root is None:
+            return False
+        return self.persist_root in Path(key[0]).parents
+
+    def _load(self, key: ProbeKey) -> dict[str, Any] | None:
+        """Sondagem persistida deste arquivo, ou de um hard link vivo do mesmo inode"""
+        path, size, mtime_ns, inode = key
+        try:
+            with self._get_conn() as conn:
+                rows = conn.execute(
+                    "SELECT path, probe FROM probes WHERE inode = ? AND size = ? AND mtime_ns = ? "
+                    "ORDER BY path = ? DESC",
+                    (inode, size, mtime_ns, path),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Probe cache read failed for {path}: {e}")
+            return None
+
+        for row in rows:
+            if row["path"] == path or self._same_file(row["path"], path):
+                return json.loads(row["probe"])
+        return None
+
+    @staticmethod
+    def _same_file(other: str, path: str) -> bool:
+        try:
+            return os.path.samefile(other, path)
+        except OSError:
+            return False
+
+
+_probe_cache: ProbeCache | None = None
+_probe_cache_lock = threading.Lock()
+
+
+def get_probe_cache() -> ProbeCache:
+    """ProbeCache do processo (persistido no metadata.db do cache de shorts)"""
+    global _probe_cache
+    if _probe_cache is None:
+        with _probe_cache_lock:
+            if _probe_cache is None:
+                from ..core.config import get_settings
+
+                shorts_dir = Path(get_settings()['shorts_cache_dir'])
+                _probe_cache = ProbeCache(db_path=shorts_dir / "metadata.db", persist_root=shorts_dir)
+    return _probe_cache
@@ -0,0 +1,264 @@
+"""
+Shorts Library - armazenamento global deduplicado de shorts
+
+Cada short aprovado é guardado uma única vez, endereçado pelo SHA-256 do
+conteúdo, e materializado nos workspaces dos jobs via hard link (ou reflink /
+cópia quando o link não é possível). Layout em ``root``:
+
+    objects/<ab>/<sha256>.mp4   conteúdo
+    by_id/<video_id>            symlink → objeto (índice video_id → conteúdo)
+    refs/<sha256>/<job_id>      referência de um job (contém o path materializado)
+    used/<sha256>               marcador de último uso (mtime = LRU)
+
+Uma referência é considerada viva enquanto o arquivo materializado existir,
+então jobs que morrem ou workspaces removidos liberam seus objetos sem
+precisar de ``release``. A eviction só remove objetos sem referências vivas,
+em ordem LRU (mtime do marcador em ``used/``, atualizado a cada uso). O
+objeto em si nunca é tocado: seu (size, mtime, inode) compõe a chave do
+ProbeCache, compartilhada pelos hard links de todos os jobs.
+
+Arquivos materializados compartilham o inode com o objeto: devem ser tratados
+como somente-leitura (gerar saídas em arquivos novos, nunca editar in-place).
+"""
+from __future__ import annotations
+
+import errno
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any
+
+from common.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# ioctl FICLONE (Linux): reflink copy-on-write em btrfs/xfs
+_FICLONE = 0x40049409
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 do conteúdo do arquivo"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(src: Path, dest: Path) -> bool:
+    """Tenta um reflink (copy-on-write); False se o filesystem não suporta"""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(src, 'rb') as s, open(dest, 'wb') as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        return True
+    except OSError:
+        dest.unlink(missing_ok=True)
+        return False
+
+
+class ShortsLibrary:
+    """Biblioteca de shorts endereçada por conteúdo, compartilhada entre jobs"""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.by_id_dir = self.root / "by_id"
+        self.refs_dir = self.root / "refs"
+        self.used_dir = self.root / "used"
+        for directory in (self.objects_dir, self.by_id_dir, self.refs_dir, self.used_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def object_path(self, content_hash: str) -> Path:
+        return self.objects_dir / content_hash[:2] / f"{content_hash}.mp4"
+
+    def lookup(self, video_id: str) -> Path | None:
+        """Retorna o objeto de um video_id, ou None se não está na biblioteca"""
+        link = self.by_id_dir / video_id
+        try:
+            target = Path(os.readlink(link))
+        except OSError:
+            return None
+        if not target.exists():
+            link.unlink(missing_ok=True)
+            return None
+        return target
+
+    def ingest(self, video_id: str, src_path: str | Path) -> str:
+        """
+        Move um short baixado para a biblioteca
+
+        Se o mesmo conteúdo já existe, o arquivo de origem é descartado.
+
+        Args:
+            video_id: ID do vídeo
+            src_path: Arquivo baixado (será movido/removido)
+
+        Returns:
+            Hash do conteúdo
+        """
+        src = Path(src_path)
+        content_hash = file_sha256(src)
+        obj = self.object_path(content_hash)
+
+        if obj.exists():
+            src.unlink(missing_ok=True)
+            logger.info(f"♻️ Library dedup: {video_id} → {content_hash[:12]}")
+        else:
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            tmp = obj.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                os.replace(src, tmp)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.copyfile(src, tmp)
+                src.unlink(missing_ok=True)
+            os.replace(tmp, obj)
+            logger.info(f"📚 Library ingest: {video_id} → {content_hash[:12]}")
+
+        self._link_id(video_id, obj)
+        self._touch(content_hash)
+        return content_hash
+
+    def _touch(self, content_hash: str) -> None:
+        """Marca o uso de um objeto para o LRU sem alterar o objeto"""
+        (self.used_dir / content_hash).touch()
+
+    def _last_used(self, obj: Path, st: os.stat_result) -> float:
+        try:
+            return (self.used_dir / obj.stem).stat().st_mtime
+        except FileNotFoundError:
+            return st.st_mtime
+
+    def _link_id(self, video_id: str, obj: Path) -> None:
+        link = self.by_id_dir / video_id
+        tmp = link.with_name(f".{video_id}.{os.getpid()}.tmp")
+        tmp.unlink(missing_ok=True)
+        os.symlink(obj.resolve(), tmp)
+        os.replace(tmp, link)
+
+    def materialize(self, video_id: str, dest_path: str | Path, job_id: str) -> Path | None:
+        """
+        Materializa um short da biblioteca no workspace de um job
+
+        Tenta hard link, depois reflink e por fim cópia. Registra a referência
+        do job e atualiza o LRU.
+
+        Returns:
+            Path materializado, ou None se o vídeo não está na biblioteca
+        """
+        obj = self.lookup(video_id)
+        if obj is None:
+            return None
+
+        dest = Path(dest_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists() or dest.is_symlink():
+            dest.unlink()
+
+        try:
+            os.link(obj, dest)
+        except OSError:
+            if not _reflink(obj, dest):
+                shutil.copyfile(obj, dest)
+
+        ref = self.refs_dir / obj.stem / job_id
+        ref.parent.mkdir(parents=True, exist_ok=True)
+        ref.write_text(str(dest.resolve()), encoding='utf-8')
+
+        self._touch(obj.stem)
+        return dest
+
+    def release(self, job_id: str) -> int:
+        """Remove as referências de um job. Retorna quantas foram removidas"""
+        released = 0
+        for ref in self.refs_dir.glob(f"*/{job_id}"):
+            ref.unlink(missing_ok=True)
+            released += 1
+        return released
+
+    def refcount(self, content_hash: str) -> int:
+        """Número de referências vivas (podando as que perderam o arquivo)"""
+        ref_dir = self.refs_dir / content_hash
+        if not ref_dir.is_dir():
+            return 0
+        alive = 0
+        for ref in ref_dir.iterdir():
+            try:
+                materialized = Path(ref.read_text(encoding='utf-8'))
+            except OSError:
+                continue
+            if materialized.exists():
+                alive += 1
+            else:
+                ref.unlink(missing_ok=True)
+        if not alive:
+            shutil.rmtree(ref_dir, ignore_errors=True)
+        return alive
+
+    def _objects(self) -> list[tuple[Path, os.stat_result]]:
+        objects = []
+        for obj in self.objects_dir.glob("*/*.mp4"):
+            try:
+                objects.append((obj, obj.stat()))
+            except FileNotFoundError:
+                continue
+        return objects
+
+    def evict(self, max_bytes: int | None = None, idle_seconds: float | None = None) -> int:
+        """
+        Remove objetos sem referências vivas, do menos para o mais recente
+
+        Args:
+            max_bytes: Remove até a biblioteca caber nesse tamanho
+            idle_seconds: Remove também objetos sem uso há mais que isso
+
+        Returns:
+            Número de objetos removidos
+        """
+        objects = sorted(
+            ((obj, st, self._last_used(obj, st)) for obj, st in self._objects()),
+            key=lambda item: item[2],
+        )
+        total = sum(st.st_size for _, st, _ in objects)
+        cutoff = time.time() - idle_seconds if idle_seconds is not None else None
+
+        removed: set[Path] = set()
+        for obj, st, last_used in objects:
+            over_size = max_bytes is not None and total > max_bytes
+            idle = cutoff is not None and last_used < cutoff
+            if not (over_size or idle):
+                # Ordenado por último uso: os próximos também não são elegíveis
+                break
+            if self.refcount(obj.stem):
+                continue
+            obj.unlink(missing_ok=True)
+            (self.used_dir / obj.stem).unlink(missing_ok=True)
+            total -= st.st_size
+            removed.add(obj.resolve())
+
+        if removed:
+            for link in self.by_id_dir.iterdir():
+                try:
+                    if Path(os.readlink(link)) in removed:
+                        link.unlink(missing_ok=True)
+                except OSError:
+                    continue
+            logger.info(f"🧹 Library eviction: {len(removed)} shorts removed")
+        return len(removed)
+
+    def stats(self) -> dict[str, Any]:
+        """Número de objetos e tamanho total"""
+        objects = self._objects()
+        total = sum(st.st_size for _, st in objects)
+        return {
+            "objects": len(objects),
+            "total_size_bytes": total,
+        }
@@ -3,159 +3,375 @@ Shorts Cache Manager
 
 Gerencia cache LOCAL de shorts baixados via video-downloader API.
 NÃO baixa vídeos diretamente - apenas armazena e reutiliza.
+
+Os arquivos ficam na ShortsLibrary (deduplicada por conteúdo) e são
+materializados nos workspaces dos jobs por hard link. A metadata fica num
+índice SQLite (WAL): cada escrita é um upsert de um registro e as consultas
+por validação, duração e último uso usam índices.
 """
 from __future__ import annotations
 
 import json
+import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 from datetime import datetime, timedelta
 from common.log_utils import get_logger
 from common.datetime_utils import now_brazil
+from ..core.constants import SQLITE_CONNECTION_TIMEOUT, SQLITE_BUSY_TIMEOUT_MS
+from .shorts_library import ShortsLibrary
 
 logger = get_logger(__name__)
 
+# Colunas indexáveis; demais chaves do short ficam no JSON `metadata`
+_COLUMNS = (
+    "video_id", "file_path", "content_hash", "size_bytes", "duration_seconds",
+    "downloaded_at", "downloaded_via", "last_used", "usage_count",
+    "validated_at", "has_embedded_subtitles", "ocr_confidence", "ocr_reason",
+    "mezzanine_spec",
+)
+
+
+def _row_to_short(row: sqlite3.Row) -> dict[str, Any]:
+    """Converte uma linha do índice no dict de short (formato do antigo metadata.json)"""
+    short = json.loads(row["metadata"]) if row["metadata"] else {}
+    for column in _COLUMNS:
+        value = row[column]
+        if value is None and column not in short:
+            continue
+        if column == "has_embedded_subtitles" and value is not None:
+            value = bool(value)
+        short[column] = value
+    return short
+
+
 class ShortsCache:
     """Gerencia cache LOCAL de shorts já baixados via video-downloader.
-    
-    NÃO baixa vídeos diretamente - apenas armazena resultado de 
+
+    NÃO baixa vídeos diretamente - apenas armazena resultado de
     chamadas à API do video-downloader para reutilização.
     """
-    
+
     def __init__(self, cache_dir: str) -> None:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        
+
+        self.db_path = self.cache_dir / "metadata.db"
         self.metadata_file = self.cache_dir / "metadata.json"
-        self.metadata = self._load_metadata()
-        
+        self.library = ShortsLibrary(self.cache_dir / "library")
+
+        self._init_schema()
+        self._migrate_json_metadata()
+
         logger.info(f"💾 Shorts cache initialized: {self.cache_dir}")
-        logger.info(f"📊 Current cache size: {len(self.metadata)} shorts")
-    
-    def _load_metadata(self) -> dict[str, Any]:
-        """Carrega metadata do cache"""
-        if self.metadata_file.exists():
-            try:
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Error loading metadata: {e}")
-                return {}
-        return {}
-    
-    def _save_metadata(self) -> None:
-        """Salva metadata do cache"""
+        logger.info(f"📊 Current cache size: {self.count()} shorts")
+
+    def _init_schema(self) -> None:
+        """Cria schema se não existir"""
+        with self._get_conn() as conn:
+            self._ensure_schema(conn)
+
+    @contextmanager
+    def _get_conn(self) -> Any:
+        """Context manager para conexões SQLite"""
+        conn = sqlite3.connect(str(self.db_path), timeout=SQLITE_CONNECTION_TIMEOUT)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Database error: {e}")
+            raise
+        finally:
+            conn.close()
+
+    def _ensure_schema(self, conn: Any) -> None:
+        """Garante que pragmas, tabela e índices existam (idempotente)"""
+        # Habilitar WAL mode (persistente no arquivo)
+        conn.execute("PRAGMA journal_mode=WAL")
+
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS shorts (
+                video_id TEXT PRIMARY KEY,
+                file_path TEXT NOT NULL,
+                content_hash TEXT,
+                size_bytes INTEGER,
+                duration_seconds REAL,
+                downloaded_at TEXT NOT NULL,
+                downloaded_via TEXT,
+                last_used TEXT NOT NULL,
+                usage_count INTEGER NOT NULL DEFAULT 0,
+                validated_at TEXT,
+                has_embedded_subtitles INTEGER,
+                ocr_confidence REAL,
+                ocr_reason TEXT,
+                mezzanine_spec TEXT,
+                metadata JSON
+            )
+            """
+        )
+
+        # Bancos criados antes do spec canônico (mezzanine) ganham a coluna
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(shorts)")}
+        if "mezzanine_spec" not in existing:
+            conn.execute("ALTER TABLE shorts ADD COLUMN mezzanine_spec TEXT")
+
+        # Índices para consultas por validação, duração e último uso
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_shorts_validation "
+            "ON shorts(has_embedded_subtitles, duration_seconds)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_shorts_duration ON shorts(duration_seconds)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_shorts_last_used ON shorts(last_used)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_shorts_downloaded ON shorts(downloaded_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_shorts_usage ON shorts(usage_count)")
+
+    def _migrate_json_metadata(self) -> None:
+        """Importa o antigo metadata.json (uma vez) e o renomeia"""
+        if not self.metadata_file.exists():
+            return
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, indent=2)
+            with open(self.metadata_file, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
         except Exception as e:
-            logger.error(f"Error saving metadata: {e}")
-    
+            logger.error(f"Error loading legacy metadata: {e}")
+            return
+
+        for short in legacy.values():
+            file_path = Path(short.get("file_path", ""))
+            if "size_bytes" not in short and file_path.is_file():
+                short["size_bytes"] = file_path.stat().st_size
+
+        with self._get_conn() as conn:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO shorts ({', '.join(_COLUMNS)}, metadata) "
+                f"VALUES ({', '.join('?' * (len(_COLUMNS) + 1))})",
+                [self._to_params(short) for short in legacy.values()]
+            )
+        self.metadata_file.rename(self.metadata_file.with_suffix(".json.migrated"))
+        logger.info(f"📦 Migrated {len(legacy)} shorts from metadata.json to {self.db_path.name}")
+
+    @staticmethod
+    def _to_params(short: dict[str, Any]) -> tuple[Any, ...]:
+        """Valores das colunas + JSON com as chaves restantes"""
+        extra = {k: v for k, v in short.items() if k not in _COLUMNS}
+        values = [short.get(column) for column in _COLUMNS]
+        has_subs = short.get("has_embedded_subtitles")
+        values[_COLUMNS.index("has_embedded_subtitles")] = None if has_subs is None else int(bool(has_subs))
+        values[_COLUMNS.index("usage_count")] = short.get("usage_count", 0)
+        return (*values, json.dumps(extra))
+
     def get(self, video_id: str) -> dict[str, Any] | None:
         """Retorna metadata se short existe em cache LOCAL
-        
+
         Args:
             video_id: ID do vídeo
-        
+
         Returns:
             Metadata do short ou None
         """
-        if video_id in self.metadata:
-            short = self.metadata[video_id]
-            
+        with self._get_conn() as conn:
+            row = conn.execute("SELECT * FROM shorts WHERE video_id = ?", (video_id,)).fetchone()
+            if row is None:
+                logger.info(f"❌ Cache MISS: {video_id}")
+                return None
+
             # Verificar se arquivo ainda existe
-            file_path = Path(short["file_path"])
-            if not file_path.exists():
+            if not Path(row["file_path"]).exists():
                 logger.warning(f"⚠️ Cache inconsistente: {video_id} no metadata mas arquivo não existe")
-                del self.metadata[video_id]
-                self._save_metadata()
+                conn.execute("DELETE FROM shorts WHERE video_id = ?", (video_id,))
                 return None
-            
+
             # Atualizar estatísticas de uso
-            short["last_used"] = now_brazil().isoformat()
-            short["usage_count"] = short.get("usage_count", 0) + 1
-            self._save_metadata()
-            
-            logger.info(f"✅ Cache HIT: {video_id} (usado {short['usage_count']} vezes)")
-            return short
-        
-        logger.info(f"❌ Cache MISS: {video_id}")
-        return None
-    
+            last_used = now_brazil().isoformat()
+            conn.execute(
+                "UPDATE shorts SET last_used = ?, usage_count = usage_count + 1 WHERE video_id = ?",
+                (last_used, video_id)
+            )
+            short = _row_to_short(row)
+            short["last_used"] = last_used
+            short["usage_count"] += 1
+
+        logger.info(f"✅ Cache HIT: {video_id} (usado {short['usage_count']} vezes)")
+        return short
+
     def add(self, video_id: str, file_path: str, metadata: dict[str, Any]) -> None:
         """Adiciona short ao cache LOCAL (após download via video-downloader API)
-        
+
+        O arquivo é movido para a ShortsLibrary; use materialize() para
+        colocá-lo de volta no workspace do job.
+
         Args:
             video_id: ID do vídeo
-            file_path: Caminho do arquivo local
-            metadata: Metadados adicionais (duration, resolution, etc)
+            file_path: Caminho do arquivo baixado
+            metadata: Metadados adicionais (duration, resolution, etc);
+                `mezzanine_spec` registra o spec canônico se o arquivo já
+                foi normalizado na ingestão
         """
-        self.metadata[video_id] = {
+        content_hash = self.library.ingest(video_id, file_path)
+        object_path = self.library.object_path(content_hash)
+        short = {
             "video_id": video_id,
-            "file_path": file_path,
             "downloaded_at": now_brazil().isoformat(),
             "downloaded_via": "video-downloader-api",  # Origem: API externa
             "last_used": now_brazil().isoformat(),
             "usage_count": 1,
-            **metadata
+            **metadata,
+            "file_path": str(object_path),
+            "content_hash": content_hash,
+            "size_bytes": object_path.stat().st_size,
         }
-        self._save_metadata()
-        
+        with self._get_conn() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO shorts ({', '.join(_COLUMNS)}, metadata) "
+                f"VALUES ({', '.join('?' * (len(_COLUMNS) + 1))})",
+                self._to_params(short)
+            )
+
         logger.info(f"💾 Short adicionado ao cache: {video_id}")
 
+    def materialize(self, video_id: str, dest_path: str | Path, job_id: str) -> Path | None:
+        """Materializa um short do cache no workspace de um job (hard link)
+
+        Args:
+            video_id: ID do vídeo
+            dest_path: Destino no workspace do job
+            job_id: Job que passa a referenciar o short
+
+        Returns:
+            Path materializado ou None se o short não está na biblioteca
+        """
+        return self.library.materialize(video_id, dest_path, job_id)
+
     def remove(self, video_id: str) -> bool:
         """Remove short do cache (arquivo + metadata)"""
-        if video_id not in self.metadata:
-            return False
-        file_path = Path(self.metadata[video_id].get("file_path", ""))
-        try:
-            if file_path.exists():
-                file_path.unlink(missing_ok=True)
-        except Exception as e:
-            logger.warning(f"Erro ao remover arquivo do cache {video_id}: {e}")
-        del self.metadata[video_id]
-        self._save_metadata()
+        with self._get_conn() as conn:
+            row = conn.execute("SELECT file_path FROM shorts WHERE video_id = ?", (video_id,)).fetchone()
+            if row is None:
+                return False
+            file_path = Path(row["file_path"] or "")
+            try:
+                if file_path.exists():
+                    file_path.unlink(missing_ok=True)
+            except Exception as e:
+                logger.warning(f"Erro ao remover arquivo do cache {video_id}: {e}")
+            conn.execute("DELETE FROM shorts WHERE video_id = ?", (video_id,))
         logger.info(f"🗑️ Short removido do cache: {video_id}")
         return True
 
     def mark_validated(self, video_id: str, has_subtitles: bool, confidence: float, reason: str = "") -> bool:
         """Marca um short como validado (OCR/integridade) no metadata"""
-        short = self.metadata.get(video_id)
-        if not short:
-            return False
-        short["validated_at"] = now_brazil().isoformat()
-        short["has_embedded_subtitles"] = has_subtitles
-        short["ocr_confidence"] = confidence
-        if reason:
-            short["ocr_reason"] = reason
-        self._save_metadata()
-        return True
-    
+        with self._get_conn() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE shorts
+                SET validated_at = ?, has_embedded_subtitles = ?, ocr_confidence = ?,
+                    ocr_reason = COALESCE(NULLIF(?, ''), ocr_reason)
+                WHERE video_id = ?
+                """,
+                (now_brazil().isoformat(), int(has_subtitles), confidence, reason, video_id)
+            )
+            return cursor.rowcount > 0
+
     def exists(self, video_id: str) -> bool:
         """Verifica se short existe no cache
-        
+
         Args:
             video_id: ID do vídeo
-        
+
         Returns:
             True se existe, False caso contrário
         """
-        return video_id in self.metadata
-    
+        with self._get_conn() as conn:
+            row = conn.execute("SELECT 1 FROM shorts WHERE video_id = ?", (video_id,)).fetchone()
+            return row is not None
+
+    def count(self) -> int:
+        """Número de shorts no índice"""
+        with self._get_conn() as conn:
+            return conn.execute("SELECT COUNT(*) FROM shorts").fetchone()[0]
+
     def get_path(self, video_id: str) -> Path:
         """Retorna o caminho onde um short será/está armazenado
-        
+
         Args:
             video_id: ID do vídeo
-        
+
         Returns:
             Path do arquivo de vídeo
         """
         return self.cache_dir / f"{video_id}.mp4"
-    
+
+    def find(
+        self,
+        has_subtitles: bool | None = None,
+        validated: bool | None = None,
+        min_duration: float | None = None,
+        max_duration: float | None = None,
+        last_used_before: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Consulta shorts pelo índice (ordenados do menos para o mais recentemente usado)
+
+        Args:
+            has_subtitles: Filtra pelo resultado da validação OCR
+            validated: True = só validados, False = só não validados
+            min_duration: Duração mínima (segundos)
+            max_duration: Duração máxima (segundos)
+            last_used_before: Só shorts sem uso desde essa data
+            limit: Máximo de resultados
+
+        Returns:
+            Lista de metadados dos shorts
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if has_subtitles is not None:
+            clauses.append("has_embedded_subtitles = ?")
+            params.append(int(has_subtitles))
+        if validated is not None:
+            clauses.append("validated_at IS NOT NULL" if validated else "validated_at IS NULL")
+        if min_duration is not None:
+            clauses.append("duration_seconds >= ?")
+            params.append(min_duration)
+        if max_duration is not None:
+            clauses.append("duration_seconds <= ?")
+            params.append(max_duration)
+        if last_used_before is not None:
+            clauses.append("last_used < ?")
+            params.append(last_used_before.isoformat())
+
+        query = "SELECT * FROM shorts"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY last_used"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._get_conn() as conn:
+            return [_row_to_short(row) for row in conn.execute(query, params).fetchall()]
+
     def get_cache_stats(self) -> dict[str, Any]:
-        """Retorna estatísticas do cache"""
-        if not self.metadata:
+        """Retorna estatísticas do cache (servidas pelo índice, sem varrer o disco)"""
+        with self._get_conn() as conn:
+            totals = conn.execute(
+                """
+                SELECT COUNT(*) AS total, COALESCE(SUM(size_bytes), 0) AS size,
+                       MIN(downloaded_at) AS oldest, MAX(downloaded_at) AS newest
+                FROM shorts
+                """
+            ).fetchone()
+            most_used = conn.execute(
+                "SELECT video_id, usage_count FROM shorts ORDER BY usage_count DESC LIMIT 1"
+            ).fetchone()
+
+        if not totals["total"]:
             return {
                 "total_shorts": 0,
                 "total_size_bytes": 0,
@@ -164,91 +380,79 @@ class ShortsCache:
                 "newest_short": None,
                 "most_used": None,
             }
-        
-        # Calcular tamanho total
-        total_size = 0
-        for short in self.metadata.values():
-            file_path = Path(short["file_path"])
-            if file_path.exists():
-                total_size += file_path.stat().st_size
-        
-        # Encontrar mais usado
-        most_used = max(
-            self.metadata.values(),
-            key=lambda s: s.get("usage_count", 0)
-        )
-        
-        # Ordenar por data
-        sorted_by_date = sorted(
-            self.metadata.values(),
-            key=lambda s: s["downloaded_at"]
-        )
-        
+
+        total_size = totals["size"]
         return {
-            "total_shorts": len(self.metadata),
+            "total_shorts": totals["total"],
             "total_size_bytes": total_size,
             "total_size_gb": round(total_size / (1024**3), 2),
-            "oldest_short": sorted_by_date[0]["downloaded_at"] if sorted_by_date else None,
-            "newest_short": sorted_by_date[-1]["downloaded_at"] if sorted_by_date else None,
+            "oldest_short": totals["oldest"],
+            "newest_short": totals["newest"],
             "most_used": {
                 "video_id": most_used["video_id"],
-                "usage_count": most_used.get("usage_count", 0)
+                "usage_count": most_used["usage_count"]
             }
         }
-    
-    def cleanup_old(self, days: int = 30) -> int:
-        """Remove shorts não usados há X dias
-        
+
+    def cleanup_old(self, days: int = 30, max_size_mb: float | None = None) -> int:
+        """Remove shorts não usados há X dias (e, se preciso, os menos usados
+        recentemente até caber em max_size_mb)
+
+        Shorts ainda referenciados por workspaces de jobs não são removidos.
+
         Args:
             days: Número de dias de inatividade
-        
+            max_size_mb: Tamanho máximo da biblioteca (opcional)
+
         Returns:
             Número de shorts removidos
         """
         cutoff = now_brazil() - timedelta(days=days)
-        to_remove = []
-        
-        for video_id, short in self.metadata.items():
-            last_used = datetime.fromisoformat(short["last_used"])
-            if last_used < cutoff:
-                to_remove.append(video_id)
-        
-        removed_count = 0
-        for video_id in to_remove:
-            file_path = Path(self.metadata[video_id]["file_path"])
+        library_root = self.library.root.resolve()
+
+        # Entradas antigas, anteriores à biblioteca
+        for short in self.find(last_used_before=cutoff):
+            file_path = Path(short["file_path"])
+            if library_root in file_path.resolve().parents:
+                continue
             if file_path.exists():
                 try:
                     file_path.unlink()
-                    logger.info(f"🗑️ Removed old short: {video_id}")
-                    removed_count += 1
+                    logger.info(f"🗑️ Removed old short: {short['video_id']}")
                 except Exception as e:
                     logger.error(f"Error removing file {file_path}: {e}")
-            
-            del self.metadata[video_id]
-        
+
+        max_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb is not None else None
+        self.library.evict(max_bytes=max_bytes, idle_seconds=days * 24 * 60 * 60)
+
+        with self._get_conn() as conn:
+            rows = conn.execute("SELECT video_id, file_path FROM shorts").fetchall()
+            to_remove = [(row["video_id"],) for row in rows if not Path(row["file_path"]).exists()]
+            conn.executemany("DELETE FROM shorts WHERE video_id = ?", to_remove)
+
+        removed_count = len(to_remove)
         if removed_count > 0:
-            self._save_metadata()
             logger.info(f"🧹 Cleanup: {removed_count} old shorts removed (>{days} days)")
-        
+
         return removed_count
-    
+
     def list_all(self) -> list[dict[str, Any]]:
         """Lista todos os shorts no cache
-        
+
         Returns:
             Lista de metadados dos shorts
         """
-        return list(self.metadata.values())
-    
+        return self.find()
+
     def get_stats(self) -> dict[str, Any]:
         """Retorna estatísticas do cache (alias para get_cache_stats)
-        
+
         Returns:
             Estatísticas do cache
         """
         stats = self.get_cache_stats()
-        
+
         # Adicionar informações extras
         stats["cache_dir"] = str(self.cache_dir)
-        
+
         return stats
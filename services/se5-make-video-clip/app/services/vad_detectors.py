@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import subprocess
-import json
 import wave
 import os
 from dataclasses import dataclass
@@ -9,6 +7,7 @@ from dataclasses import dataclass
 import numpy as np
 
 from common.log_utils import get_logger
+from .probe_cache import get_probe_cache
 
 logger = get_logger(__name__)
 
@@ -41,12 +40,7 @@ class SpeechSegment:
 
 def _get_audio_duration_ffprobe(audio_path: str) -> float:
     try:
-        cmd = [
-            'ffprobe', '-v', 'error', '-show_entries',
-            'format=duration', '-of', 'json', audio_path,
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        data = json.loads(result.stdout)
+        data = get_probe_cache().probe(audio_path, timeout=10)
         return float(data['format']['duration'])
     except Exception:
         return 300.0
@@ -6,7 +6,9 @@ Implementa APENAS processamento de video - NAO baixa videos.
 """
 from __future__ import annotations
 
-import json
+import asyncio
+import os
+import shutil
 from pathlib import Path
 from typing import Any
 
@@ -16,7 +18,6 @@ from ..shared.exceptions_v2 import (
     VideoInvalidResolutionException,
     ConcatenationException,
     FFmpegFailedException,
-    FFprobeFailedException,
 )
 from common.log_utils import get_logger
 from ..core.constants import (
@@ -43,11 +44,14 @@ from ..core.constants import (
 )
 from .ffmpeg_helpers import (
     run_ffmpeg_cmd,
-    run_ffprobe_cmd,
     get_audio_duration_ffprobe,
     validate_srt,
     get_subtitle_style,
+    escape_filter_path,
+    write_concat_list,
 )
+from .mezzanine import MezzanineSpec, build_mezzanine_command, specs_match
+from .probe_cache import get_probe_cache
 
 logger = get_logger(__name__)
 
@@ -111,7 +115,8 @@ class VideoBuilder:
                  video_codec: str = "libx264",
                  audio_codec: str = "aac",
                  preset: str = "fast",
-                 crf: int = DEFAULT_CRF) -> None:
+                 crf: int = DEFAULT_CRF,
+                 parallel_workers: int = 0) -> None:
         self.output_dir = Path(output_dir)
         self.ffmpeg_path = "ffmpeg"
         self.ffprobe_path = "ffprobe"
@@ -119,6 +124,8 @@ class VideoBuilder:
         self.audio_codec = audio_codec
         self.preset = preset
         self.crf = crf
+        # >1 = concatenate_videos encodes one segment per short concurrently
+        self.parallel_workers = parallel_workers
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -128,6 +135,7 @@ class VideoBuilder:
         logger.info(f"   Audio codec: {self.audio_codec}")
         logger.info(f"   Preset: {self.preset}")
         logger.info(f"   CRF: {self.crf}")
+        logger.info(f"   Parallel concat workers: {self.parallel_workers or 'off'}")
 
     async def convert_to_h264(self, input_path: str, output_path: str) -> str:
         """Converte video para H264 mantendo resolucao e proporcao originais."""
@@ -171,44 +179,48 @@ class VideoBuilder:
                                  output_path: str,
                                  aspect_ratio: str = "9:16",
                                  crop_position: str = "center",
-                                 remove_audio: bool = True) -> str:
-        """Concatena multiplos videos aplicando crop para aspect ratio."""
+                                 remove_audio: bool = True,
+                                 mezzanine_specs: list[str | None] | None = None) -> str:
+        """Concatena multiplos videos aplicando crop para aspect ratio.
+
+        Se todos os shorts ja estao no spec canonico deste aspect ratio/crop
+        (mezzanine_specs, gravado no cache na ingestao), emenda com o concat
+        demuxer e -c copy, sem compatibilizacao nem reencode.
+
+        Com parallel_workers > 1 (e sem audio), cada short vira um segmento
+        no spec canonico, codificados em paralelo e emendados com -c copy.
+        Se esse caminho falhar, cai para o concat com filter_complex.
+        """
         logger.info(f"Concatenating {len(video_files)} videos")
         logger.info(f"   Aspect ratio: {aspect_ratio}")
         logger.info(f"   Crop position: {crop_position}")
         logger.info(f"   Remove audio: {remove_audio}")
 
-        video_files = await self._ensure_compatibility(video_files)
+        target_spec = self.mezzanine_spec(aspect_ratio, crop_position)
+        all_mezzanine = (
+            remove_audio
+            and mezzanine_specs is not None
+            and len(mezzanine_specs) == len(video_files)
+            and specs_match(mezzanine_specs, target_spec)
+        )
+        if all_mezzanine:
+            return await self._concatenate_copy(video_files, output_path)
 
-        if aspect_ratio not in ASPECT_MAP:
-            raise VideoInvalidResolutionException(
-                aspect_ratio=aspect_ratio,
-                valid_ratios=list(ASPECT_MAP.keys()),
-            )
+        if remove_audio and self.parallel_workers > 1 and len(video_files) > 1:
+            try:
+                return await self._concatenate_parallel(video_files, output_path, aspect_ratio, crop_position)
+            except Exception as parallel_error:
+                logger.warning(f"Parallel concat failed, falling back to filter concat: {parallel_error}")
 
-        target_width, target_height = ASPECT_MAP[aspect_ratio]
+        video_files = await self._ensure_compatibility(video_files)
+
+        target_width, target_height = target_spec.width, target_spec.height
 
         scale_filter = f"scale={target_width}:{target_height}:force_original_aspect_ratio=increase"
         crop_filter = _build_crop_filter(crop_position, target_width, target_height)
         video_filter = f"{scale_filter},{crop_filter},setsar=1"
 
-        expected_duration = 0.0
-        resolved_video_files: list[str] = []
-        logger.info(f"Input videos for concatenation:")
-
-        for i, video_file in enumerate(video_files):
-            abs_path = str(Path(video_file).resolve())
-            resolved_video_files.append(abs_path)
-
-            try:
-                input_info = await self.get_video_info(str(video_file))
-                input_duration = input_info["duration"]
-                expected_duration += input_duration
-                logger.info(f"  [{i+1}] {Path(video_file).name}: {input_duration:.2f}s")
-            except Exception as e:
-                logger.warning(f"  [{i+1}] {Path(video_file).name}: Could not get duration - {e}")
-
-        logger.info(f"Expected output duration: {expected_duration:.2f}s (sum of {len(video_files)} videos)")
+        resolved_video_files, expected_duration = await self._expected_concat_duration(video_files)
 
         cmd = [self.ffmpeg_path, "-y"]
         for video_file in resolved_video_files:
@@ -257,6 +269,243 @@ class VideoBuilder:
         logger.info(f"Video concatenated successfully: {output_path}")
         return output_path
 
+    def mezzanine_spec(self, aspect_ratio: str = "9:16", crop_position: str = "center") -> MezzanineSpec:
+        """Spec canonico dos shorts para um aspect ratio/crop (ver ASPECT_MAP)."""
+        if aspect_ratio not in ASPECT_MAP:
+            raise VideoInvalidResolutionException(
+                aspect_ratio=aspect_ratio,
+                valid_ratios=list(ASPECT_MAP.keys()),
+            )
+
+        target_width, target_height = ASPECT_MAP[aspect_ratio]
+        return MezzanineSpec(width=target_width, height=target_height, crop_position=crop_position)
+
+    async def normalize_short(self,
+                              input_path: str,
+                              output_path: str,
+                              aspect_ratio: str = "9:16",
+                              crop_position: str = "center",
+                              include_audio: bool = True,
+                              threads: int | None = None) -> MezzanineSpec:
+        """Transcodifica um short para o spec canonico (uma vez, na ingestao no cache)."""
+        spec = self.mezzanine_spec(aspect_ratio, crop_position)
+        logger.info(f"Normalizing {Path(input_path).name} to {spec.key}")
+
+        cmd = build_mezzanine_command(
+            self.ffmpeg_path,
+            input_path,
+            output_path,
+            spec,
+            crop_filter=_build_crop_filter(crop_position, spec.width, spec.height),
+            preset=self.preset,
+            crf=self.crf,
+            include_audio=include_audio,
+            threads=threads,
+        )
+
+        returncode, stdout, stderr = await run_ffmpeg_cmd(
+            cmd=cmd, timeout=TimeoutConstants.VIDEO_PROCESSING, operation="short normalization",
+            details={"input": input_path, "output": output_path},
+        )
+
+        if returncode != 0:
+            error_msg = stderr.decode() if stderr else "Unknown error"
+            raise FFmpegFailedException(
+                operation="short normalization",
+                stderr=error_msg,
+                returncode=returncode,
+                details={"input": input_path, "output": output_path},
+            )
+
+        return spec
+
+    async def _expected_concat_duration(self, video_files: list[str]) -> tuple[list[str], float]:
+        """Resolve input paths and sum their durations (expected concat output)."""
+        expected_duration = 0.0
+        resolved_video_files: list[str] = []
+        logger.info(f"Input videos for concatenation:")
+
+        for i, video_file in enumerate(video_files):
+            abs_path = str(Path(video_file).resolve())
+            resolved_video_files.append(abs_path)
+
+            try:
+                input_info = await self.get_video_info(str(video_file))
+                input_duration = input_info["duration"]
+                expected_duration += input_duration
+                logger.info(f"  [{i+1}] {Path(video_file).name}: {input_duration:.2f}s")
+            except Exception as e:
+                logger.warning(f"  [{i+1}] {Path(video_file).name}: Could not get duration - {e}")
+
+        logger.info(f"Expected output duration: {expected_duration:.2f}s (sum of {len(video_files)} videos)")
+        return resolved_video_files, expected_duration
+
+    async def _concatenate_copy(self, video_files: list[str], output_path: str) -> str:
+        """Concatenate same-spec videos with the concat demuxer (-c copy, no re-encode)."""
+        logger.info(f"All {len(video_files)} videos share the mezzanine spec: stream copy concat")
+
+        resolved_video_files, expected_duration = await self._expected_concat_duration(video_files)
+        await self._stitch_copy(resolved_video_files, output_path)
+        await self._validate_concat_duration(output_path, expected_duration, video_files)
+
+        logger.info(f"Video concatenated successfully (stream copy): {output_path}")
+        return output_path
+
+    async def _concatenate_parallel(self,
+                                    video_files: list[str],
+                                    output_path: str,
+                                    aspect_ratio: str,
+                                    crop_position: str) -> str:
+        """Encode one closed-GOP segment per short concurrently, then stitch with -c copy.
+
+        Segments are stitched in input order regardless of which finishes first.
+        If any encode fails, the remaining ones are cancelled (killing their
+        ffmpeg) and awaited before the segment directory is removed.
+        """
+        workers = min(self.parallel_workers, len(video_files))
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        logger.info(f"Parallel concat: {len(video_files)} segments, {workers} workers x {threads} threads")
+
+        resolved_video_files, expected_duration = await self._expected_concat_duration(video_files)
+
+        segment_dir = Path(output_path).parent / f".{Path(output_path).stem}_segments"
+        segment_dir.mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(workers)
+
+        async def encode_segment(index: int, video_file: str) -> str:
+            segment_path = segment_dir / f"{index:04d}.mp4"
+            async with semaphore:
+                await self.normalize_short(
+                    video_file, str(segment_path), aspect_ratio, crop_position,
+                    include_audio=False, threads=threads,
+                )
+            return str(segment_path)
+
+        tasks = [
+            asyncio.create_task(encode_segment(i, vf))
+            for i, vf in enumerate(resolved_video_files)
+        ]
+        try:
+            segments = await asyncio.gather(*tasks)
+            await self._stitch_copy(segments, output_path)
+        finally:
+            # gather does not cancel siblings when one fails
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            shutil.rmtree(segment_dir, ignore_errors=True)
+
+        await self._validate_concat_duration(output_path, expected_duration, video_files)
+
+        logger.info(f"Video concatenated successfully (parallel segments): {output_path}")
+        return output_path
+
+    async def _stitch_copy(self, video_files: list[str], output_path: str) -> None:
+        """Join same-spec files with the concat demuxer, video only, without re-encoding."""
+        list_path = write_concat_list(video_files, Path(output_path).with_suffix(".concat.txt"))
+        cmd = [
+            self.ffmpeg_path, "-y",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(list_path),
+            "-map", "0:v",
+            "-c", "copy",
+            "-an",
+            "-movflags", "+faststart",
+            str(output_path),
+        ]
+
+        try:
+            returncode, stdout, stderr = await run_ffmpeg_cmd(
+                cmd=cmd, timeout=TimeoutConstants.VIDEO_PROCESSING, operation="stream copy concatenation",
+                details={"video_count": len(video_files)},
+            )
+        finally:
+            list_path.unlink(missing_ok=True)
+
+        if returncode != 0:
+            error_msg = stderr.decode()
+            logger.error(f"FFmpeg error: {error_msg}")
+            raise FFmpegFailedException(
+                operation="stream copy concatenation",
+                stderr=error_msg,
+                returncode=returncode,
+                details={"video_count": len(video_files)},
+            )
+
+    async def compose_single_pass(self,
+                                  video_files: list[str],
+                                  audio_path: str,
+                                  output_path: str,
+                                  aspect_ratio: str = "9:16",
+                                  crop_position: str = "center",
+                                  subtitle_path: str | None = None,
+                                  style: str = "dynamic",
+                                  max_duration: float | None = None) -> str:
+        """Compoe o video final (concat + audio + legendas + trim) com um unico encode."""
+        from .composition_planner import plan_composition
+
+        logger.info(f"Single-pass composition of {len(video_files)} videos")
+
+        if aspect_ratio not in ASPECT_MAP:
+            raise VideoInvalidResolutionException(
+                aspect_ratio=aspect_ratio,
+                valid_ratios=list(ASPECT_MAP.keys()),
+            )
+
+        target_width, target_height = ASPECT_MAP[aspect_ratio]
+
+        if subtitle_path:
+            validate_srt(subtitle_path)
+            subtitle_path = str(Path(subtitle_path).resolve())
+
+        resolved_video_files = [str(Path(vf).resolve()) for vf in video_files]
+        expected_duration = 0.0
+        for video_file in resolved_video_files:
+            expected_duration += (await self.get_video_info(video_file))["duration"]
+        if max_duration is not None:
+            expected_duration = min(expected_duration, max_duration)
+
+        plan = plan_composition(
+            video_files=resolved_video_files,
+            audio_path=str(Path(audio_path).resolve()),
+            target_width=target_width,
+            target_height=target_height,
+            crop_filter=_build_crop_filter(crop_position, target_width, target_height),
+            subtitle_path=subtitle_path,
+            subtitle_style=style,
+            max_duration=max_duration,
+            video_codec=self.video_codec,
+            audio_codec=self.audio_codec,
+            preset=self.preset,
+            crf=self.crf,
+        )
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"Running FFmpeg single-pass composition (expected {expected_duration:.2f}s)...")
+
+        returncode, stdout, stderr = await run_ffmpeg_cmd(
+            cmd=plan.to_command(self.ffmpeg_path, str(output_path)),
+            timeout=TimeoutConstants.VIDEO_PROCESSING * 3, operation="single-pass composition",
+            details={"video_count": len(resolved_video_files)},
+        )
+
+        if returncode != 0:
+            error_msg = stderr.decode()
+            logger.error(f"FFmpeg error: {error_msg}")
+            raise FFmpegFailedException(
+                operation="single-pass composition",
+                stderr=error_msg,
+                returncode=returncode,
+                details={"video_count": len(resolved_video_files)},
+            )
+
+        await self._validate_concat_duration(output_path, expected_duration, video_files)
+
+        logger.info(f"Single-pass composition complete: {output_path}")
+        return output_path
+
     async def _ensure_compatibility(self, video_files: list[str]) -> list[str]:
         """Ensure all videos are compatible for concatenation."""
         logger.info(f"Ensuring video compatibility before concatenation...")
@@ -443,7 +692,7 @@ class VideoBuilder:
 
         subtitle_style = get_subtitle_style(style)
 
-        subtitle_path_escaped = str(subtitle_path_obj).replace("\\", "\\\\").replace(":", "\\:").replace("'", "\\'")
+        subtitle_path_escaped = escape_filter_path(str(subtitle_path_obj))
 
         cmd = [
             self.ffmpeg_path,
@@ -695,38 +944,8 @@ class VideoBuilder:
         return output_path
 
     async def get_video_info(self, video_path: str) -> dict[str, Any]:
-        """Extrai informacoes do video usando ffprobe."""
-        cmd = [
-            self.ffprobe_path,
-            "-v", "quiet",
-            "-print_format", "json",
-            "-show_format",
-            "-show_streams",
-            str(video_path),
-        ]
-
-        returncode, stdout, stderr = await run_ffprobe_cmd(
-            cmd=cmd, timeout=30, operation="video info extraction",
-            video_path=str(video_path),
-        )
-
-        if returncode != 0:
-            error_msg = stderr.decode()
-            logger.error(f"FFprobe error: {error_msg}")
-            raise FFprobeFailedException(
-                video_path=str(video_path),
-                stderr=error_msg,
-                returncode=returncode,
-            )
-
-        try:
-            info = json.loads(stdout.decode())
-        except json.JSONDecodeError as e:
-            raise VideoCorruptedException(
-                video_path=str(video_path),
-                reason="Failed to parse ffprobe JSON output",
-                details={"json_error": str(e)},
-            )
+        """Extrai informacoes do video usando ffprobe (via ProbeCache do processo)."""
+        info = await get_probe_cache().aprobe(str(video_path), timeout=30)
 
         video_stream = next((s for s in info.get("streams", []) if s["codec_type"] == "video"), None)
 
@@ -11,7 +11,6 @@ Corrige automaticamente:
 from __future__ import annotations
 
 import asyncio
-import json
 from pathlib import Path
 from typing import Any
 from dataclasses import dataclass
@@ -22,6 +21,7 @@ from app.shared.exceptions_v2 import (
     FFmpegTimeoutException
 )
 from app.core.config import get_settings
+from app.services.probe_cache import get_probe_cache
 from common.log_utils import get_logger
 
 logger = get_logger(__name__)
@@ -183,31 +183,7 @@ class VideoCompatibilityFixer:
     async def _detect_specs(self, video_path: Path) -> VideoSpec:
         """Detecta especificações de um vídeo."""
         try:
-            # Executar ffprobe
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
-                str(video_path)
-            ]
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=30
-            )
-
-            if process.returncode != 0:
-                raise Exception(f"FFprobe failed: {stderr.decode()}")
-
-            metadata = json.loads(stdout.decode())
+            metadata = await get_probe_cache().aprobe(video_path, timeout=30)
 
             # Encontrar stream de vídeo
             video_stream = None
@@ -148,7 +148,8 @@ class DomainJobProcessor:
                 video_builder=self.video_builder
             ),
             LoadApprovedVideosStage(
-                video_builder=self.video_builder
+                video_builder=self.video_builder,
+                status_store=self.blacklist
             ),
             SelectShortsStage(),
             AssembleVideoStage(
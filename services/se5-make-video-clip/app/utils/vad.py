@@ -5,11 +5,13 @@ Detecta segmentos de fala em áudio usando WebRTC VAD e análise de energia
 """
 from __future__ import annotations
 
+import math
 import wave
-import struct
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 from app.infrastructure.metrics import vad_method_used_total
 from common.log_utils import get_logger
 
@@ -218,46 +220,60 @@ class VoiceActivityDetector:
         """
         # Calcular tamanho do frame
         frame_size = int(sample_rate * self.frame_duration_ms / 1000) * 2
+        bytes_per_second = sample_rate * 2
         
-        segments = []
-        speech_start = None
+        # Energia RMS de todos os frames numa passada
+        energies = self._frame_rms_energies(audio_data, frame_size)
+        is_speech = energies > self.energy_threshold
         
-        # Processar frames
-        for i in range(0, len(audio_data) - frame_size, frame_size):
-            frame = audio_data[i:i + frame_size]
-            
-            # Calcular energia RMS
-            energy = self._calculate_rms_energy(frame)
-            
-            is_speech = energy > self.energy_threshold
-            
-            timestamp = i / (sample_rate * 2)
-            
-            if is_speech and speech_start is None:
-                # Início de fala
-                speech_start = timestamp
-            elif not is_speech and speech_start is not None:
-                # Fim de fala
-                confidence = min(energy / self.energy_threshold, 1.0)
-                segments.append(SpeechSegment(
-                    start_time=speech_start,
-                    end_time=timestamp,
-                    confidence=confidence,
-                    method=VADMethod.ENERGY
-                ))
-                speech_start = None
+        # Runs de fala: +1 = início, -1 = fim (frame que encerra o run)
+        edges = np.diff(np.concatenate(([0], is_speech.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
         
-        # Adicionar último segmento
-        if speech_start is not None:
+        segments = []
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            if end < len(energies):
+                # Fim de fala
+                end_time = end * frame_size / bytes_per_second
+                confidence = min(float(energies[end]) / self.energy_threshold, 1.0)
+            else:
+                # Último segmento (fala até o fim do áudio)
+                end_time = len(audio_data) / bytes_per_second
+                confidence = 0.7
             segments.append(SpeechSegment(
-                start_time=speech_start,
-                end_time=len(audio_data) / (sample_rate * 2),
-                confidence=0.7,
+                start_time=start * frame_size / bytes_per_second,
+                end_time=end_time,
+                confidence=confidence,
                 method=VADMethod.ENERGY
             ))
         
         return segments
     
+    def _frame_rms_energies(self, audio_data: bytes, frame_size: int) -> np.ndarray:
+        """
+        Calcula a energia RMS normalizada de todos os frames (mesmos frames
+        e mesma aritmética de _calculate_rms_energy)
+        
+        Args:
+            audio_data: Dados de áudio raw (16-bit PCM)
+            frame_size: Tamanho do frame em bytes
+        
+        Returns:
+            Array com a energia de cada frame (0.0 - 1.0)
+        """
+        num_frames = max(0, -(-(len(audio_data) - frame_size) // frame_size))
+        samples_per_frame = frame_size // 2
+        
+        # View (sem cópia) dos frames como matriz int16
+        samples = np.frombuffer(audio_data, dtype='<i2', count=num_frames * samples_per_frame)
+        frames = samples.reshape(num_frames, samples_per_frame)
+        
+        # Soma dos quadrados exata em int64, como a soma de ints do Python
+        sum_squares = np.einsum('ij,ij->i', frames, frames, dtype=np.int64)
+        rms = np.sqrt(sum_squares / samples_per_frame)
+        return rms / 32768.0
+    
     def _calculate_rms_energy(self, frame: bytes) -> float:
         """
         Calcula energia RMS do frame
@@ -274,12 +290,11 @@ class VoiceActivityDetector:
         if num_samples == 0:
             return 0.0
         
-        # Unpack como shorts (16-bit signed integers)
-        samples = struct.unpack(f'<{num_samples}h', frame)
+        samples = np.frombuffer(frame, dtype='<i2', count=num_samples).astype(np.int64)
         
         # Calcular RMS
-        sum_squares = sum(s * s for s in samples)
-        rms = (sum_squares / num_samples) ** 0.5
+        sum_squares = int(np.dot(samples, samples))
+        rms = math.sqrt(sum_squares / num_samples)
         
         # Normalizar (max 16-bit = 32768)
         normalized = rms / 32768.0
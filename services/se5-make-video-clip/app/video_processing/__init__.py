@@ -6,12 +6,17 @@ Video Processing module - Frame extraction, OCR, validation
 Components for video analysis and validation.
 """
 
-from .frame_extractor import FFmpegFrameExtractor, ExtractionResult
+from .frame_extractor import FFmpegFrameExtractor, ExtractionResult, SharedFrameBuffer
 from .ocr_detector import OCRDetector
 from .video_validator import VideoValidator
+from .validation_pool import ValidationPool
+from .detection_cache import SubtitleDetectionCache
 
 __all__ = [
     'FrameExtractor',
+    'SharedFrameBuffer',
     'OCRDetector',
     'VideoValidator',
+    'ValidationPool',
+    'SubtitleDetectionCache',
 ]
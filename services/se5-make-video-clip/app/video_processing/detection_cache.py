@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+"""
+Cache de detecção de legendas endereçado por conteúdo
+
+A chave é ``video_id`` + hash SHA-256 do conteúdo do arquivo, então o mesmo
+short baixado por outro job (ou movido de diretório) reaproveita o resultado.
+Junto com a decisão é guardada a evidência do OCR (tracks do TRSD ou
+detecções por frame do detector legado), o que permite re-pontuar com
+thresholds novos sem rodar o OCR de novo.
+"""
+
+import hashlib
+import json
+import time
+from typing import Any
+
+from app.subtitle_processing.temporal_tracker import Track
+from app.trsd_models.text_region import ROIType, TextLine
+from common.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "subtitle_detection"
+# 7 dias
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+_CHUNK_SIZE = 1024 * 1024
+
+
+def content_fingerprint(video_path: str) -> str:
+    """SHA-256 do conteúdo do arquivo (lido em blocos de 1 MiB)"""
+    digest = hashlib.sha256()
+    with open(video_path, 'rb') as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tracks_to_evidence(tracks: list[Track]) -> list[dict[str, Any]]:
+    """Serializa tracks do TRSD (sem as palavras individuais, que são só debug)"""
+    return [
+        {
+            'track_id': track.track_id,
+            'roi_type': track.roi_type.value,
+            'detections': [
+                {
+                    'frame_ts': d.frame_ts,
+                    'frame_idx': d.frame_idx,
+                    'roi_type': d.roi_type.value,
+                    'text': d.text,
+                    'bbox': list(d.bbox),
+                    'confidence': float(d.confidence),
+                }
+                for d in track.detections
+            ],
+        }
+        for track in tracks
+    ]
+
+
+def tracks_from_evidence(evidence: list[dict[str, Any]], frames_analyzed: int) -> list[Track]:
+    """Reconstrói tracks serializados e recalcula suas métricas"""
+    tracks = []
+    for item in evidence:
+        track = Track(track_id=item['track_id'], roi_type=ROIType(item['roi_type']))
+        for d in item['detections']:
+            track.add_detection(TextLine(
+                frame_ts=d['frame_ts'],
+                frame_idx=d['frame_idx'],
+                roi_type=ROIType(d['roi_type']),
+                text=d['text'],
+                bbox=tuple(d['bbox']),
+                confidence=d['confidence'],
+                words=[],
+            ))
+        track.compute_metrics(max(frames_analyzed, 1))
+        tracks.append(track)
+    return tracks
+
+
+class SubtitleDetectionCache:
+    """
+    Resultados + evidência de detecção no Redis, compartilhados entre jobs
+
+    Cada entrada guarda: decisão (has_subtitles, confidence, reason,
+    frames_analyzed), método (TRSD/legacy), os parâmetros de pontuação usados
+    e a evidência necessária para re-pontuar.
+    """
+
+    def __init__(self, redis_client: Any, ttl_seconds: int = DEFAULT_TTL_SECONDS) -> None:
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def key(video_id: str, fingerprint: str) -> str:
+        return f"{KEY_PREFIX}:{video_id}:{fingerprint}"
+
+    def get(self, video_id: str, fingerprint: str) -> dict[str, Any] | None:
+        """Retorna a entrada em cache ou None (falhas do Redis contam como miss)"""
+        try:
+            data = self.redis.get(self.key(video_id, fingerprint))
+            return json.loads(data) if data else None
+        except Exception as e:
+            logger.warning(f"⚠️ Cache check failed: {e}")
+            return None
+
+    def put(self, video_id: str, fingerprint: str, entry: dict[str, Any]) -> None:
+        """Salva a entrada com TTL"""
+        try:
+            self.redis.setex(
+                self.key(video_id, fingerprint),
+                self.ttl_seconds,
+                json.dumps({**entry, 'video_id': video_id, 'cached_at': time.time()}),
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Cache save failed: {e}")
@@ -10,6 +10,8 @@ All subtitle detectors must implement this interface.
 from abc import ABC, abstractmethod
 from typing import Any
 
+import numpy as np
+
 
 class BaseSubtitleDetector(ABC):
     """
@@ -43,6 +45,36 @@ class BaseSubtitleDetector(ABC):
         """
         pass
     
+    def frame_indices(self, total_frames: int, fps: float) -> list[int]:
+        """
+        Frame indices this detector wants from a shared frame buffer.
+        
+        Detectors that return indices here must implement
+        :meth:`detect_frames`; the ensemble then decodes the union of all
+        requested frames once and hands each detector its own subset.
+        
+        Args:
+            total_frames: Number of frames in the video
+            fps: Video frame rate
+        
+        Returns:
+            Frame indices, or an empty list if the detector decodes
+            the video itself (the default).
+        """
+        return []
+    
+    def detect_frames(self, frames: list[np.ndarray]) -> dict[str, Any]:
+        """
+        Detect subtitles in already decoded frames.
+        
+        Args:
+            frames: Read-only BGR frames, in the order of :meth:`frame_indices`
+        
+        Returns:
+            Same dictionary as :meth:`detect`
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not accept shared frames")
+    
     @abstractmethod
     def get_model_name(self) -> str:
         """
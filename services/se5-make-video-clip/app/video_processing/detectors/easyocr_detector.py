@@ -79,7 +79,29 @@ class EasyOCRDetector(BaseSubtitleDetector):
         
         # Extract frames from video
         frames = self._extract_frames(video_path, n_frames=self.n_frames)
+        return self.detect_frames(frames)
+    
+    def frame_indices(self, total_frames: int, fps: float) -> list[int]:
+        """
+        Frame indices for the shared buffer.
+        
+        Same 20%-95% temporal sampling as :meth:`_extract_frames`.
+        """
+        if fps <= 0 or total_frames <= 0:
+            return []
+        steps = max(self.n_frames - 1, 1)
+        return [
+            min(int(total_frames * (0.2 + (i / steps) * 0.75)), total_frames - 1)
+            for i in range(self.n_frames)
+        ]
+    
+    def detect_frames(self, frames: list[np.ndarray]) -> dict[str, Any]:
+        """
+        Run OCR on already decoded frames (see :meth:`detect`).
         
+        Args:
+            frames: BGR frames
+        """
         if not frames:
             return {
                 'has_subtitles': False,
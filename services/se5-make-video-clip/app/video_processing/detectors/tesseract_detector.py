@@ -78,7 +78,26 @@ class TesseractDetector(BaseSubtitleDetector):
         
         # Extract frames
         frames = self._extract_frames(video_path, n_frames=self.n_frames)
+        return self.detect_frames(frames)
+    
+    def frame_indices(self, total_frames: int, fps: float) -> list[int]:
+        """
+        Frame indices for the shared buffer.
         
+        Same evenly distributed indices as :meth:`_extract_frames`.
+        """
+        if total_frames <= 0:
+            return []
+        n_frames = min(self.n_frames, total_frames)
+        return [int(i) for i in np.linspace(0, total_frames - 1, n_frames, dtype=int)]
+    
+    def detect_frames(self, frames: list[np.ndarray]) -> dict[str, Any]:
+        """
+        Run OCR on already decoded frames (see :meth:`detect`).
+        
+        Args:
+            frames: BGR frames
+        """
         if not frames:
             return {
                 'has_subtitles': False,
@@ -9,14 +9,13 @@ Sprint 07 - Advanced Voting & Conflict Detection
 Combines PaddleOCR, CLIP, and EasyOCR with weighted voting for robust detection.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 import time
 
 from common.log_utils import get_logger
 from .detectors.base_detector import BaseSubtitleDetector
-from .detectors.paddle_detector import PaddleDetector
-from .detectors.clip_classifier import CLIPClassifier
-from .detectors.easyocr_detector import EasyOCRDetector
+from .frame_extractor import DEFAULT_FRAME_BUFFER_MAX_BYTES, SharedFrameBuffer
 
 # Sprint 07: Advanced voting strategies
 from .voting import (
@@ -42,10 +41,17 @@ class EnsembleSubtitleDetector:
     
     Voting: Weighted average of confidence scores
     
+    Frames are decoded once per video into a :class:`SharedFrameBuffer`
+    (union of every detector's ``frame_indices``, downscaled once) and
+    the detectors run concurrently on that buffer. Detectors that do not
+    request frames (e.g. Paddle, which scans full-resolution frames
+    sequentially) keep decoding the video themselves.
+    
     Attributes:
         detectors: List of detector instances
         voting_method: Method for aggregating predictions
         weights: Custom weights (optional, overrides detector defaults)
+        max_workers: Detectors run in parallel (1 = sequential)
     """
     
     def __init__(
@@ -54,7 +60,10 @@ class EnsembleSubtitleDetector:
         voting_method: str = 'weighted',
         custom_weights: dict[str, float] | None = None,
         enable_conflict_detection: bool = False,
-        enable_uncertainty_estimation: bool = False
+        enable_uncertainty_estimation: bool = False,
+        max_workers: int | None = None,
+        frame_width: int = 640,
+        frame_buffer_max_bytes: int = DEFAULT_FRAME_BUFFER_MAX_BYTES
     ) -> None:
         """
         Initialize ensemble detector.
@@ -65,8 +74,16 @@ class EnsembleSubtitleDetector:
             custom_weights: Custom weights dict (e.g., {'paddle': 0.4, 'clip': 0.35, ...})
             enable_conflict_detection: Enable conflict detection (Sprint 07)
             enable_uncertainty_estimation: Enable uncertainty estimation (Sprint 07)
+            max_workers: Detectors run concurrently (default: one thread per detector)
+            frame_width: Width the shared frames are downscaled to
+            frame_buffer_max_bytes: Memory limit of the shared frame buffer
         """
         if detectors is None:
+            # Heavy model dependencies are only needed for the default set
+            from .detectors.paddle_detector import PaddleDetector
+            from .detectors.clip_classifier import CLIPClassifier
+            from .detectors.easyocr_detector import EasyOCRDetector
+            
             # Create default detectors
             logger.info("[Ensemble] Initializing default detectors...")
             self.paddle = PaddleDetector(roi_mode='multi')
@@ -88,6 +105,9 @@ class EnsembleSubtitleDetector:
         
         self.voting_method = voting_method
         self.custom_weights = custom_weights
+        self.max_workers = max_workers or len(self.detectors)
+        self.frame_width = frame_width
+        self.frame_buffer_max_bytes = frame_buffer_max_bytes
         
         # Sprint 07: Advanced voting features
         self.enable_conflict_detection = enable_conflict_detection
@@ -122,32 +142,28 @@ class EnsembleSubtitleDetector:
         logger.info("[Ensemble] Processing video: %s", video_path)
         start_time = time.time()
         
-        # Run all detectors
-        votes = {}
-        for detector in self.detectors:
-            model_name = detector.get_model_name()
-            
-            logger.info("[Ensemble] Running %s...", model_name)
-            detector_start = time.time()
-            
-            try:
-                result = detector.detect(video_path)
-                detector_time = time.time() - detector_start
-                
-                votes[model_name] = {
-                    'has_subtitles': result['has_subtitles'],
-                    'confidence': result['confidence'],
-                    'weight': self.custom_weights.get(model_name, detector.get_weight()) if self.custom_weights else detector.get_weight(),
-                    'metadata': result['metadata'],
-                    'time': detector_time
-                }
-                
-                logger.info("[Ensemble]   %s: %s (conf: %.2f, time: %.2fs)", model_name, result['has_subtitles'], result['confidence'], detector_time)
-                
-            except Exception as e:
-                logger.warning("[Ensemble]   %s: ERROR - %s", model_name, e)
-                # Skip failed detectors (don't add to votes)
-                continue
+        # Decode shared frames once, then run all detectors concurrently
+        frame_buffer, requested = self._decode_shared_frames(video_path)
+        
+        if self.max_workers > 1 and len(self.detectors) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='ensemble') as pool:
+                futures = [
+                    pool.submit(self._run_detector, detector, video_path, frame_buffer, requested)
+                    for detector in self.detectors
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [
+                self._run_detector(detector, video_path, frame_buffer, requested)
+                for detector in self.detectors
+            ]
+        
+        # Skip failed detectors (don't add to votes)
+        votes = {
+            detector.get_model_name(): vote
+            for detector, vote in zip(self.detectors, results)
+            if vote is not None
+        }
         
         # Aggregate votes
         if self.voting_method == 'weighted':
@@ -188,11 +204,90 @@ class EnsembleSubtitleDetector:
         final_result['metadata']['voting_method'] = self.voting_method
         final_result['metadata']['total_time'] = total_time
         final_result['metadata']['num_detectors'] = len(self.detectors)
+        final_result['metadata']['shared_frames'] = len(frame_buffer) if frame_buffer else 0
+        final_result['metadata']['frame_decode_time_ms'] = frame_buffer.decode_time_ms if frame_buffer else 0.0
         
         logger.info("[Ensemble] Final decision: %s (conf: %.2f, time: %.2fs)", final_result['has_subtitles'], final_result['confidence'], total_time)
         
         return final_result
     
+    def _decode_shared_frames(
+        self,
+        video_path: str
+    ) -> tuple[SharedFrameBuffer | None, dict[str, list[int]]]:
+        """
+        Decode the frames requested by all detectors in a single pass.
+        
+        Args:
+            video_path: Path to video file
+        
+        Returns:
+            (buffer, requested) where requested maps model names to the frame
+            indices each detector asked for. The buffer is None when no
+            detector requested frames or the video could not be opened.
+        """
+        fps, total_frames = SharedFrameBuffer.probe(video_path)
+        if total_frames <= 0:
+            return None, {}
+        
+        requested = {}
+        for detector in self.detectors:
+            indices = detector.frame_indices(total_frames, fps)
+            if indices:
+                requested[detector.get_model_name()] = indices
+        if not requested:
+            return None, {}
+        
+        frame_buffer = SharedFrameBuffer.decode(
+            video_path,
+            [i for indices in requested.values() for i in indices],
+            downscale_width=self.frame_width,
+            max_bytes=self.frame_buffer_max_bytes
+        )
+        if not len(frame_buffer):
+            return None, {}
+        return frame_buffer, requested
+    
+    def _run_detector(
+        self,
+        detector: BaseSubtitleDetector,
+        video_path: str,
+        frame_buffer: SharedFrameBuffer | None,
+        requested: dict[str, list[int]]
+    ) -> dict[str, Any] | None:
+        """
+        Run one detector and build its vote.
+        
+        Uses the shared frames when the detector requested them, otherwise
+        lets the detector read the video itself.
+        
+        Returns:
+            Vote dictionary, or None if the detector failed
+        """
+        model_name = detector.get_model_name()
+        logger.info("[Ensemble] Running %s...", model_name)
+        detector_start = time.time()
+        
+        try:
+            if frame_buffer is not None and model_name in requested:
+                result = detector.detect_frames(frame_buffer.get_frames(requested[model_name]))
+            else:
+                result = detector.detect(video_path)
+        except Exception as e:
+            logger.warning("[Ensemble]   %s: ERROR - %s", model_name, e)
+            return None
+        
+        detector_time = time.time() - detector_start
+        logger.info("[Ensemble]   %s: %s (conf: %.2f, time: %.2fs)", model_name, result['has_subtitles'], result['confidence'], detector_time)
+        
+        return {
+            'has_subtitles': result['has_subtitles'],
+            'confidence': result['confidence'],
+            'weight': self.custom_weights.get(model_name, detector.get_weight()) if self.custom_weights else detector.get_weight(),
+            'metadata': result['metadata'],
+            'time': detector_time
+        }
+    
     def _weighted_voting(self, votes: dict[str, Any]) -> dict[str, Any]:
         """
         Weighted average voting.
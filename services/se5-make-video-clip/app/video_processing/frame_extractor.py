@@ -17,6 +17,29 @@ from common.log_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Orçamento padrão de memória do SharedFrameBuffer (frames já reduzidos)
+DEFAULT_FRAME_BUFFER_MAX_BYTES = 256 * 1024 * 1024
+
+# Acima deste salto (em frames) é mais barato fazer seek do que grab() sequencial
+MAX_SEQUENTIAL_GRAB_GAP = 120
+
+
+def downscale_frame(frame: np.ndarray, target_width: int) -> np.ndarray:
+    """Reduz o frame para a largura alvo mantendo o aspect ratio"""
+    h, w = frame.shape[:2]
+    
+    if w <= target_width:
+        return frame
+    
+    scale_factor = target_width / w
+    new_h = int(h * scale_factor)
+    
+    return cv2.resize(
+        frame,
+        (target_width, new_h),
+        interpolation=cv2.INTER_AREA
+    )
+
 @dataclass
 class ExtractionResult:
     """Resultado da extração de frames"""
@@ -238,21 +261,7 @@ class FFmpegFrameExtractor:
     
     def _downscale_frame(self, frame: np.ndarray) -> np.ndarray:
         """Downscale frame para largura target"""
-        h, w = frame.shape[:2]
-        
-        if w <= self.downscale_width:
-            return frame
-        
-        scale_factor = self.downscale_width / w
-        new_h = int(h * scale_factor)
-        
-        frame_scaled = cv2.resize(
-            frame,
-            (self.downscale_width, new_h),
-            interpolation=cv2.INTER_AREA
-        )
-        
-        return frame_scaled
+        return downscale_frame(frame, self.downscale_width)
 
 
 class FrameExtractor:
@@ -333,3 +342,152 @@ class FrameExtractor:
         )
         
         return all_indices
+
+
+class SharedFrameBuffer:
+    """
+    Buffer de frames decodificados compartilhado entre detectores
+    
+    Decodifica uma única vez, numa passada sequencial com um único
+    ``cv2.VideoCapture``, a união dos frames pedidos por vários
+    consumidores. Os frames são reduzidos uma vez (``downscale_frame``) e
+    ficam somente-leitura, para que detectores rodando em threads
+    diferentes possam lê-los sem cópia.
+    
+    A memória é limitada por ``max_bytes``: se a união dos frames pedidos
+    não couber, os índices são raleados uniformemente antes da decodificação.
+    """
+    
+    def __init__(
+        self,
+        frames: dict[int, np.ndarray],
+        fps: float,
+        total_frames: int,
+        decode_time_ms: float = 0.0
+    ) -> None:
+        self.frames = frames
+        self.fps = fps
+        self.total_frames = total_frames
+        self.decode_time_ms = decode_time_ms
+    
+    @classmethod
+    def probe(cls, video_path: str) -> tuple[float, int]:
+        """
+        Lê fps e número de frames do vídeo
+        
+        Returns:
+            Tupla (fps, total_frames); (0.0, 0) se o vídeo não abrir
+        """
+        cap = cv2.VideoCapture(video_path)
+        try:
+            if not cap.isOpened():
+                return 0.0, 0
+            return cap.get(cv2.CAP_PROP_FPS), int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        finally:
+            cap.release()
+    
+    @classmethod
+    def decode(
+        cls,
+        video_path: str,
+        frame_indices: list[int],
+        downscale_width: int = 640,
+        max_bytes: int = DEFAULT_FRAME_BUFFER_MAX_BYTES
+    ) -> SharedFrameBuffer:
+        """
+        Decodifica os frames pedidos numa única passada
+        
+        Args:
+            video_path: Caminho do vídeo
+            frame_indices: Índices de frame pedidos (duplicados são ignorados)
+            downscale_width: Largura máxima dos frames armazenados
+            max_bytes: Limite de memória do buffer
+        
+        Returns:
+            SharedFrameBuffer (vazio se o vídeo não abrir)
+        """
+        import time
+        start_time = time.time()
+        
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            cap.release()
+            logger.warning(f"OpenCV failed to open video: {video_path}")
+            return cls({}, 0.0, 0)
+        
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        
+        wanted = sorted({i for i in frame_indices if 0 <= i < total_frames})
+        wanted = cls._fit_budget(wanted, width, height, downscale_width, max_bytes)
+        
+        frames: dict[int, np.ndarray] = {}
+        position = 0
+        try:
+            for idx in wanted:
+                if idx - position > MAX_SEQUENTIAL_GRAB_GAP:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+                    position = idx
+                while position < idx and cap.grab():
+                    position += 1
+                if position < idx:
+                    break
+                
+                ret, frame = cap.read()
+                if not ret or frame is None:
+                    break
+                position += 1
+                
+                frame = downscale_frame(frame, downscale_width)
+                frame.setflags(write=False)
+                frames[idx] = frame
+        finally:
+            cap.release()
+        
+        decode_time_ms = (time.time() - start_time) * 1000
+        logger.info(
+            f"Decoded {len(frames)}/{len(wanted)} shared frames "
+            f"in {decode_time_ms:.0f}ms ({video_path})"
+        )
+        return cls(frames, fps, total_frames, decode_time_ms)
+    
+    @staticmethod
+    def _fit_budget(
+        indices: list[int],
+        width: int,
+        height: int,
+        downscale_width: int,
+        max_bytes: int
+    ) -> list[int]:
+        """Raleia os índices uniformemente até caberem em max_bytes"""
+        if not indices or width <= 0 or height <= 0:
+            return indices
+        
+        if width > downscale_width:
+            height = int(height * downscale_width / width)
+            width = downscale_width
+        frame_bytes = width * height * 3
+        max_frames = max(1, max_bytes // frame_bytes)
+        
+        if len(indices) <= max_frames:
+            return indices
+        
+        logger.warning(
+            f"Frame buffer budget allows {max_frames}/{len(indices)} frames - thinning"
+        )
+        picks = np.linspace(0, len(indices) - 1, max_frames).astype(int)
+        return [indices[i] for i in sorted(set(picks))]
+    
+    def get_frames(self, frame_indices: list[int]) -> list[np.ndarray]:
+        """Frames disponíveis para os índices pedidos, na ordem pedida"""
+        return [self.frames[i] for i in frame_indices if i in self.frames]
+    
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelos frames armazenados"""
+        return sum(frame.nbytes for frame in self.frames.values())
+    
+    def __len__(self) -> int:
+        return len(self.frames)
@@ -16,6 +16,7 @@ from app.subtitle_processing.subtitle_classifier_v2 import SubtitleClassifierV2
 from app.infrastructure.telemetry import TRSDTelemetry, DebugArtifactSaver, PerformanceMetrics
 from app.core.config import Settings
 from .frame_extractor import FFmpegFrameExtractor
+from .detection_cache import tracks_to_evidence
 from common.log_utils import get_logger
 
 logger = get_logger(__name__)
@@ -152,7 +153,8 @@ class TRSDDetector:
                 'method': 'TRSD',
                 'early_exit': early_exit,
                 'frames_analyzed': frames_analyzed,
-                'tracks_by_category': result.tracks_by_category
+                'tracks_by_category': result.tracks_by_category,
+                'evidence': tracks_to_evidence(tracks),
             }
         )
 
@@ -262,7 +264,85 @@ class LegacyOCRDetector:
         self.max_frames = max_frames
         self._ensure_supported_codec = ensure_supported_codec
 
+    def score(
+        self,
+        detections: list[tuple[str, float, float]],
+        frames_analyzed: int,
+        min_confidence: float | None = None,
+    ) -> tuple[bool, float, str, int]:
+        """Decide from per-frame detections (text, confidence, timestamp)."""
+        threshold = self.min_confidence if min_confidence is None else min_confidence
+        for text, conf, _ts in detections:
+            if conf >= threshold:
+                return True, conf, text, frames_analyzed
+        return False, 0.0, "", frames_analyzed
+
     def detect(self, video_path: str, timeout: int = 300) -> tuple[bool, float, str, int]:
+        return self.detect_with_evidence(video_path, timeout)[0]
+
+    def _frame_text(self, frame: np.ndarray) -> tuple[str, float] | None:
+        """OCR one frame: (joined text, max confidence) or None without text."""
+        with self._ocr_lock:
+            ocr_results = self.ocr_detector.detect_text(frame)
+
+        texts = [result for result in ocr_results or [] if result.text.strip()]
+        if not texts:
+            return None
+        return ' '.join(result.text for result in texts).strip(), max(result.confidence for result in texts)
+
+    def _scan_frames(
+        self,
+        cap: Any,
+        frame_step: int,
+        max_frames_to_process: int,
+        total_frames: int,
+        fps: float,
+    ) -> tuple[int, list[tuple[str, float, float]], tuple[str, float, float] | None]:
+        """Read sampled frames: (frames analyzed, detections, first confident detection)."""
+        frames_analyzed = 0
+        all_detections: list[tuple[str, float, float]] = []
+        first_text_detected = None
+        frame_count = 0
+
+        while frames_analyzed < max_frames_to_process:
+            ret, frame = cap.read()
+            if not ret:
+                break
+
+            frame_count += 1
+            if frame_count % frame_step != 0:
+                continue
+
+            frames_analyzed += 1
+
+            if frames_analyzed % 100 == 0:
+                logger.debug(f"   Processing frame {frames_analyzed}/{total_frames}...")
+
+            try:
+                detection = self._frame_text(frame)
+            except Exception as e:
+                logger.debug(f"Error at frame {frames_analyzed}: {e}")
+                continue
+            if detection is None:
+                continue
+
+            text, max_conf = detection
+            timestamp = frames_analyzed / fps if fps > 0 else frames_analyzed
+            all_detections.append((text, max_conf, timestamp))
+
+            if first_text_detected is None and max_conf >= self.min_confidence:
+                first_text_detected = (text, max_conf, timestamp)
+                logger.warning(
+                    f"TEXT DETECTED at frame {frames_analyzed}/{total_frames} "
+                    f"(ts={timestamp:.1f}s, conf={max_conf:.2f}): {text[:80]}"
+                )
+
+        return frames_analyzed, all_detections, first_text_detected
+
+    def detect_with_evidence(
+        self, video_path: str, timeout: int = 300
+    ) -> tuple[tuple[bool, float, str, int], dict[str, Any] | None]:
+        """Run OCR and return (result, evidence); evidence is None on error."""
         start_time = time.time()
         working_path = video_path
         cleanup_path = None
@@ -286,62 +366,18 @@ class LegacyOCRDetector:
                 f"(step={frame_step}, {fps:.2f} fps, {duration:.1f}s video)"
             )
 
-            frames_analyzed = 0
-            all_detections = []
-            first_text_detected = None
-            frame_count = 0
-
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                frame_count += 1
-                if frame_count % frame_step != 0:
-                    continue
-
-                if frames_analyzed >= max_frames_to_process:
-                    break
-
-                frames_analyzed += 1
-
-                if frames_analyzed % 100 == 0:
-                    logger.debug(f"   Processing frame {frames_analyzed}/{total_frames}...")
-
-                try:
-                    with self._ocr_lock:
-                        ocr_results = self.ocr_detector.detect_text(frame)
-
-                    if ocr_results:
-                        all_texts = []
-                        max_conf = 0.0
-
-                        for result in ocr_results:
-                            if result.text.strip():
-                                all_texts.append(result.text)
-                                max_conf = max(max_conf, result.confidence)
-
-                        if all_texts:
-                            text = ' '.join(all_texts).strip()
-                            timestamp = frames_analyzed / fps if fps > 0 else frames_analyzed
-
-                            all_detections.append((text, max_conf, timestamp))
-
-                            if first_text_detected is None and max_conf >= self.min_confidence:
-                                first_text_detected = (text, max_conf, timestamp)
-                                logger.warning(
-                                    f"TEXT DETECTED at frame {frames_analyzed}/{total_frames} "
-                                    f"(ts={timestamp:.1f}s, conf={max_conf:.2f}): {text[:80]}"
-                                )
-
-                except Exception as e:
-                    logger.debug(f"Error at frame {frames_analyzed}: {e}")
-                    continue
-
+            frames_analyzed, all_detections, first_text_detected = self._scan_frames(
+                cap, frame_step, max_frames_to_process, total_frames, fps
+            )
             cap.release()
 
             elapsed_ms = (time.time() - start_time) * 1000
 
+            evidence = {
+                'detections': [[text, float(conf), float(ts)] for text, conf, ts in all_detections],
+                'frames_analyzed': frames_analyzed,
+            }
+
             if first_text_detected:
                 text, conf, ts = first_text_detected
                 logger.error(
@@ -352,7 +388,7 @@ class LegacyOCRDetector:
                     f"   Text: {text[:100]}\n"
                     f"   Time: {elapsed_ms:.0f}ms"
                 )
-                return True, conf, text, frames_analyzed
+                return (True, conf, text, frames_analyzed), evidence
 
             logger.info(
                 f"Video APPROVED - No text detected\n"
@@ -360,11 +396,11 @@ class LegacyOCRDetector:
                 f"   Low confidence detections: {len(all_detections)}\n"
                 f"   Time: {elapsed_ms:.0f}ms"
             )
-            return False, 0.0, "", frames_analyzed
+            return (False, 0.0, "", frames_analyzed), evidence
 
         except Exception as e:
             logger.error(f"OCR detection error: {e}", exc_info=True)
-            return False, 0.0, f"Error: {e}", 0
+            return (False, 0.0, f"Error: {e}", 0), None
 
         finally:
             if cleanup_path:
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+"""
+Pool de processos dedicado à validação OCR de shorts
+
+A detecção de legendas é CPU-bound (PaddleOCR + features visuais) e, rodando
+no event loop, serializa todos os downloads de um job. O ValidationPool
+executa ``validate_short`` em processos separados, cada um com seu próprio
+VideoValidator (criado uma única vez no initializer do worker).
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from common.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+# VideoValidator do processo worker (criado por _init_worker)
+_worker_validator: Any = None
+
+
+def validate_short(validator: Any, video_path: str, timeout: int = 10) -> tuple[bool, float, str]:
+    """
+    Valida integridade e verifica legendas embutidas de um short
+
+    Args:
+        validator: VideoValidator
+        video_path: Caminho do vídeo
+        timeout: Timeout da checagem de integridade (segundos)
+
+    Returns:
+        Tupla (has_subtitles, confidence, reason)
+
+    Raises:
+        VideoIntegrityError: Se o vídeo está corrompido
+    """
+    validator.validate_video_integrity(video_path, timeout=timeout)
+    has_subs, confidence, reason = validator.has_embedded_subtitles(video_path)[:3]
+    return has_subs, confidence, reason
+
+
+def _init_worker(validator_kwargs: dict[str, Any], redis_url: str | None) -> None:
+    """Cria o VideoValidator do processo worker"""
+    global _worker_validator
+    from .video_validator import VideoValidator
+
+    redis_store = None
+    if redis_url:
+        from app.infrastructure.redis_store import MakeVideoJobStore
+        redis_store = MakeVideoJobStore(redis_url=redis_url)
+
+    _worker_validator = VideoValidator(redis_store=redis_store, **validator_kwargs)
+
+
+def _validate_in_worker(video_path: str, timeout: int) -> tuple[bool, float, str]:
+    return validate_short(_worker_validator, video_path, timeout)
+
+
+def _detect_in_worker(
+    video_path: str, video_id: str | None, force_revalidation: bool
+) -> tuple[bool, float, str, int]:
+    return _worker_validator.has_embedded_subtitles(
+        video_path, force_revalidation=force_revalidation, video_id=video_id
+    )
+
+
+class ValidationPool:
+    """
+    Pool limitado de processos para validação OCR
+
+    Usa o contexto 'spawn' (PaddleOCR/Torch não são seguros após fork) e,
+    por padrão, um worker por núcleo.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        validator_kwargs: dict[str, Any] | None = None,
+        redis_url: str | None = None
+    ) -> None:
+        """
+        Args:
+            max_workers: Número de processos (padrão: os.cpu_count())
+            validator_kwargs: Argumentos do VideoValidator de cada worker
+            redis_url: Redis do cache de detecção (opcional)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(validator_kwargs or {}, redis_url),
+        )
+        logger.info(f"🧵 Validation pool started ({self.max_workers} workers)")
+
+    async def validate(self, video_path: str, timeout: int = 10) -> tuple[bool, float, str]:
+        """
+        Valida um short num processo do pool sem bloquear o event loop
+
+        Returns:
+            Tupla (has_subtitles, confidence, reason)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _validate_in_worker, video_path, timeout)
+
+    async def detect(
+        self,
+        video_path: str,
+        video_id: str | None = None,
+        force_revalidation: bool = False,
+    ) -> tuple[bool, float, str, int]:
+        """
+        Detecção de legendas (VideoValidator.has_embedded_subtitles) num processo do pool
+
+        Returns:
+            Tupla (has_subtitles, confidence, reason, frames_processed)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, _detect_in_worker, video_path, video_id, force_revalidation
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Encerra os processos do pool"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
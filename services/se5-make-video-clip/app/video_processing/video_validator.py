@@ -7,12 +7,10 @@ Valida integridade de vídeo e detecta legendas embutidas usando OCR + TRSD
 """
 
 import subprocess
-import json
 import time
 import cv2
 import os
 import re
-import hashlib
 import threading
 from typing import Any
 from pathlib import Path
@@ -25,6 +23,9 @@ from app.core.config import Settings
 from .ocr_detector_advanced import get_ocr_detector
 from .visual_features import VisualFeaturesAnalyzer
 from .ocr_detectors import TRSDDetector, LegacyOCRDetector, VideoIntegrityError
+from .detection_cache import SubtitleDetectionCache, content_fingerprint, tracks_from_evidence
+from app.services.probe_cache import get_probe_cache
+from app.shared.exceptions_v2 import VideoCorruptedException
 from common.log_utils import get_logger
 
 logger = get_logger(__name__)
@@ -73,6 +74,7 @@ class VideoValidator:
         self.frames_per_second = frames_per_second
         self.max_frames = max_frames
         self.redis_store = redis_store
+        self._detection_cache = SubtitleDetectionCache(redis_store.redis) if redis_store else None
         
         self._ocr_lock = threading.Lock()
         
@@ -162,13 +164,21 @@ class VideoValidator:
             logger.error(f"❌ Video integrity check failed: {video_path} - {e}")
             raise VideoIntegrityError(f"Video validation failed: {e}")
     
-    def has_embedded_subtitles(self, video_path: str, timeout: int = 300, force_revalidation: bool = False) -> tuple[bool, float, str, int]:
+    def has_embedded_subtitles(
+        self,
+        video_path: str,
+        timeout: int = 300,
+        force_revalidation: bool = False,
+        video_id: str | None = None,
+    ) -> tuple[bool, float, str, int]:
+        video_id = video_id or Path(video_path).stem
+        # Revalidação forçada não lê nem grava o cache: não há o que hashear
+        fingerprint = None if force_revalidation else self._fingerprint(video_path)
+        
         if not force_revalidation:
-            cached_result = self._check_cache(video_path)
+            cached_result = self._check_cache(video_id, fingerprint)
             if cached_result is not None:
-                logger.info(f"Cache hit: {video_path}")
-                if len(cached_result) == 3:
-                    return cached_result + (-1,)
+                logger.info(f"Cache hit: {video_id} ({video_path})")
                 return cached_result
         else:
             logger.info(f"REVALIDATION FORCED: Ignoring cache")
@@ -182,17 +192,21 @@ class VideoValidator:
                 result = (has_subs, conf, reason, -1)
                 
                 if not force_revalidation:
-                    self._save_cache(video_path, result)
+                    self._save_cache(video_id, fingerprint, result, 'TRSD', {
+                        'tracks': debug_info['evidence'],
+                        'frames_analyzed': debug_info['frames_analyzed'],
+                        'early_exit': debug_info['early_exit'],
+                    })
                 
                 return result
             
             except Exception as e:
                 logger.warning(f"TRSD detection failed, falling back to legacy: {e}")
         
-        result = self._legacy_detector.detect(video_path, timeout)
+        result, evidence = self._legacy_detector.detect_with_evidence(video_path, timeout)
         
-        if not force_revalidation:
-            self._save_cache(video_path, result)
+        if not force_revalidation and evidence is not None:
+            self._save_cache(video_id, fingerprint, result, 'legacy', evidence)
         
         return result
     
@@ -248,79 +262,122 @@ class VideoValidator:
     
     # ===== P2 Optimization: Cache Methods =====
     
-    def _check_cache(self, video_path: str) -> tuple[bool, float, str] | None:
+    def _fingerprint(self, video_path: str) -> str | None:
+        """Hash do conteúdo do vídeo (None sem cache ou se o arquivo não puder ser lido)"""
+        if self._detection_cache is None:
+            return None
+        try:
+            return content_fingerprint(video_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not fingerprint {video_path}: {e}")
+            return None
+    
+    def _scoring_params(self, method: str) -> dict[str, Any] | None:
         """
-        Verifica cache de validação de legendas no Redis
+        Parâmetros que afetam a decisão a partir da evidência
         
-        P2 Optimization: Evita reprocessamento do mesmo vídeo
-        - Hash do video_path como chave
-        - TTL de 7 dias
+        Returns:
+            Dict comparável com o salvo no cache, ou None se o método
+            não pode ser re-pontuado nesta configuração (TRSD desabilitado)
+        """
+        if method == 'legacy':
+            return {'min_confidence': self.min_confidence}
+        if not self.trsd_enabled:
+            return None
+        return {
+            name: value for name, value in vars(self.classifier).items()
+            if isinstance(value, (int, float))
+        }
+    
+    def _rescore(self, entry: dict[str, Any]) -> tuple[bool, float, str, int] | None:
+        """
+        Recalcula a decisão a partir da evidência salva, sem rodar OCR
+        
+        Returns:
+            Nova decisão, ou None se a evidência não basta (early exit do
+            TRSD cobre só parte do vídeo e não pode aprovar)
+        """
+        evidence = entry['evidence']
+        if entry['method'] == 'legacy':
+            detections = [tuple(d) for d in evidence['detections']]
+            return self._legacy_detector.score(detections, evidence['frames_analyzed'])
+        
+        tracks = tracks_from_evidence(evidence['tracks'], evidence['frames_analyzed'])
+        decision = self.classifier.decide(tracks)
+        if evidence['early_exit'] and not (decision.has_subtitles and decision.confidence >= 0.85):
+            return None
+        return (decision.has_subtitles, decision.confidence, decision.reason, -1)
+    
+    def _check_cache(self, video_id: str, fingerprint: str | None) -> tuple[bool, float, str, int] | None:
+        """
+        Verifica cache de detecção de legendas no Redis
+        
+        Chave: video_id + hash do conteúdo, então o mesmo short em outro job
+        ou outro diretório é hit. Se os thresholds mudaram desde a detecção,
+        a decisão é re-pontuada a partir da evidência salva.
         
         Args:
-            video_path: Caminho do vídeo
+            video_id: ID do vídeo
+            fingerprint: Hash do conteúdo (ver _fingerprint)
         
         Returns:
-            Tuple (has_subtitles, confidence, reason) se encontrado, None caso contrário
+            Tuple (has_subtitles, confidence, reason, frames) se encontrado, None caso contrário
         """
-        if not self.redis_store:
+        if self._detection_cache is None or fingerprint is None:
+            return None
+        
+        entry = self._detection_cache.get(video_id, fingerprint)
+        if entry is None:
             return None
         
         try:
-            # Gerar hash do video_path
-            cache_key = f"subtitle_detection:{hashlib.sha256(video_path.encode()).hexdigest()}"
+            params = self._scoring_params(entry['method'])
+            if params is None:
+                return None
+            if entry['scoring'] == params:
+                return tuple(entry['result'])
             
-            # Verificar no Redis
-            cached_data = self.redis_store.redis.get(cache_key)
-            if cached_data:
-                result = json.loads(cached_data)
-                logger.debug(f"✅ Cache hit: {video_path} -> {result}")
-                return (result['has_subtitles'], result['confidence'], result['reason'])
+            result = self._rescore(entry)
+            if result is None:
+                return None
             
-            return None
+            logger.info(f"♻️ Re-scored {video_id} from cached evidence: {result[:3]}")
+            self._detection_cache.put(video_id, fingerprint, {**entry, 'result': list(result), 'scoring': params})
+            return result
         
         except Exception as e:
-            logger.warning(f"⚠️ Cache check failed: {e}")
+            logger.warning(f"⚠️ Cached evidence unusable for {video_id}: {e}")
             return None
     
-    def _save_cache(self, video_path: str, result: tuple[bool, float, str]) -> None:
+    def _save_cache(
+        self,
+        video_id: str,
+        fingerprint: str | None,
+        result: tuple[bool, float, str, int],
+        method: str,
+        evidence: dict[str, Any],
+    ) -> None:
         """
-        Salva resultado de detecção no cache Redis
-        
-        P2 Optimization: Cache com TTL de 7 dias
+        Salva decisão + evidência no cache Redis (TTL de 7 dias)
         
         Args:
-            video_path: Caminho do vídeo
-            result: Tuple (has_subtitles, confidence, reason)
+            video_id: ID do vídeo
+            fingerprint: Hash do conteúdo
+            result: Tuple (has_subtitles, confidence, reason, frames)
+            method: 'TRSD' ou 'legacy'
+            evidence: Tracks/detecções necessárias para re-pontuar
         """
-        if not self.redis_store:
+        if self._detection_cache is None or fingerprint is None:
             return
         
-        try:
-            # Gerar hash do video_path
-            cache_key = f"subtitle_detection:{hashlib.sha256(video_path.encode()).hexdigest()}"
-            
-            # Preparar dados
-            has_subtitles, confidence, reason = result
-            cache_data = {
-                'has_subtitles': has_subtitles,
-                'confidence': confidence,
-                'reason': reason,
-                'video_path': video_path,  # Para debugging
-                'cached_at': time.time()
-            }
-            
-            # Salvar com TTL de 7 dias
-            ttl_seconds = 7 * 24 * 60 * 60
-            self.redis_store.redis.setex(
-                cache_key,
-                ttl_seconds,
-                json.dumps(cache_data)
-            )
-            
-            logger.debug(f"💾 Cache saved: {video_path} -> {result}")
-        
-        except Exception as e:
-            logger.warning(f"⚠️ Cache save failed: {e}")
+        has_subtitles, confidence, reason, frames = result
+        self._detection_cache.put(video_id, fingerprint, {
+            'result': [bool(has_subtitles), float(confidence), reason, frames],
+            'method': method,
+            'scoring': self._scoring_params(method),
+            'evidence': evidence,
+        })
+        logger.debug(f"💾 Cache saved: {video_id} -> {result}")
 
     def _ensure_supported_codec(self, video_path: str) -> tuple[str, str | None]:
         """
@@ -453,31 +510,14 @@ class VideoValidator:
     
     def _validate_metadata(self, video_path: str, timeout: int) -> dict[str, Any]:
         """
-        Valida metadata do vídeo com ffprobe
+        Valida metadata do vídeo com ffprobe (via ProbeCache do processo)
         
         Returns:
             Dict com metadata do vídeo
         """
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_streams',
-            video_path
-        ]
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=True
-        )
-        
         try:
-            metadata = json.loads(result.stdout)
-        except json.JSONDecodeError as e:
+            metadata = get_probe_cache().probe(video_path, timeout=timeout)
+        except VideoCorruptedException as e:
             raise VideoIntegrityError(f"Invalid ffprobe output: {e}")
         
         # Validar que tem pelo menos um stream de vídeo
@@ -527,33 +567,18 @@ class VideoValidator:
     
     def get_video_info(self, video_path: str, timeout: int = 5) -> dict[str, Any]:
         """
-        Obtém informações do vídeo
+        Obtém informações do vídeo (via ProbeCache do processo)
         
         Returns:
             Dict com: duration, width, height, codec, fps
         """
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_streams',
-            '-select_streams', 'v:0',  # Primeiro stream de vídeo
-            video_path
-        ]
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=True
-        )
-        
-        metadata = json.loads(result.stdout)
+        metadata = get_probe_cache().probe(video_path, timeout=timeout)
         
         format_info = metadata.get('format', {})
-        stream_info = metadata.get('streams', [{}])[0]
+        # Primeiro stream de vídeo
+        stream_info = next(
+            (s for s in metadata.get('streams', []) if s.get('codec_type') == 'video'), {}
+        )
         
         fps_str = stream_info.get('r_frame_rate', '0/1')
         try:
@@ -0,0 +1,173 @@
+"""Unit tests for DownloadShortsStage download/validation pipeline."""
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.stages.download_shorts_stage import DownloadShortsStage
+from app.domain.job_stage import StageContext
+from app.shared.exceptions import VideoProcessingException
+from app.video_processing.ocr_detectors import VideoIntegrityError
+
+
+def _make_context(tmp_path: Path, target: float) -> StageContext:
+    return StageContext(
+        job_id="test_download_01",
+        query="test",
+        max_shorts=10,
+        aspect_ratio="9:16",
+        crop_position="center",
+        subtitle_language="pt",
+        subtitle_style="dynamic",
+        settings={"shorts_cache_dir": str(tmp_path)},
+        target_video_duration=target,
+    )
+
+
+def _shorts(n: int) -> list[dict]:
+    return [{"video_id": f"vid{i}", "duration_seconds": 10} for i in range(n)]
+
+
+class FakeApiClient:
+    def __init__(self):
+        self.downloads: list[str] = []
+
+    async def download_short(self, video_id, output_path):
+        self.downloads.append(video_id)
+        Path(output_path).write_bytes(b"\x00" * 10)
+
+
+class FakeValidator:
+    """Synchronous validator; records the threads it runs on"""
+
+    def __init__(self, with_subtitles=(), corrupted_once=()):
+        self.with_subtitles = set(with_subtitles)
+        self.corrupted_once = set(corrupted_once)
+        self.threads: set[int] = set()
+
+    def validate_video_integrity(self, video_path, timeout=10):
+        self.threads.add(threading.get_ident())
+        video_id = Path(video_path).stem
+        if video_id in self.corrupted_once:
+            self.corrupted_once.discard(video_id)
+            raise VideoIntegrityError("corrupted")
+        return True
+
+    def has_embedded_subtitles(self, video_path):
+        has_subs = Path(video_path).stem in self.with_subtitles
+        return has_subs, 0.9 if has_subs else 0.1, "ocr", -1
+
+
+def _stage(api_client, validator, blacklisted=()):
+    blacklist = MagicMock()
+    blacklist.is_blacklisted.side_effect = lambda vid: vid in blacklisted
+    return DownloadShortsStage(api_client, MagicMock(), validator, blacklist)
+
+
+class TestDownloadShortsPipeline:
+    @pytest.mark.asyncio
+    async def test_rejects_subtitled_shorts_and_validates_off_loop(self, tmp_path):
+        api, validator = FakeApiClient(), FakeValidator(with_subtitles={"vid1"})
+        stage = _stage(api, validator)
+        downloaded: list[dict] = []
+
+        approved = await stage._download_shorts_batch(_shorts(3), _make_context(tmp_path, 100), downloaded)
+
+        assert approved == 2
+        assert sorted(s["video_id"] for s in downloaded) == ["vid0", "vid2"]
+        assert not (tmp_path / "test_download_01" / "vid1.mp4").exists()
+        assert threading.get_ident() not in validator.threads
+        stage.blacklist.add.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stops_once_target_duration_is_covered(self, tmp_path):
+        api = FakeApiClient()
+        stage = _stage(api, FakeValidator())
+        downloaded: list[dict] = []
+
+        await stage._download_shorts_batch(_shorts(40), _make_context(tmp_path, 20), downloaded)
+
+        assert sum(s["duration_seconds"] for s in downloaded) >= 20
+        assert len(api.downloads) < 40
+
+    @pytest.mark.asyncio
+    async def test_corrupted_download_is_fetched_again(self, tmp_path):
+        api = FakeApiClient()
+        stage = _stage(api, FakeValidator(corrupted_once={"vid0"}))
+        downloaded: list[dict] = []
+
+        approved = await stage._download_shorts_batch(_shorts(1), _make_context(tmp_path, 100), downloaded)
+
+        assert approved == 1
+        assert api.downloads == ["vid0", "vid0"]
+
+
+class FakeBuilder:
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    async def normalize_short(self, input_path, output_path, aspect_ratio, crop_position):
+        if self.fail:
+            raise RuntimeError("ffmpeg failed")
+        Path(output_path).write_bytes(b"mezzanine")
+        return MagicMock(key=f"h264/{aspect_ratio}/{crop_position}")
+
+
+class TestIngestNormalization:
+    @pytest.mark.asyncio
+    async def test_approved_short_is_normalized_before_caching(self, tmp_path):
+        stage = _stage(FakeApiClient(), FakeValidator())
+        stage.video_builder = FakeBuilder()
+        downloaded: list[dict] = []
+
+        await stage._download_shorts_batch(_shorts(1), _make_context(tmp_path, 100), downloaded)
+
+        video_id, file_path, metadata = stage.shorts_cache.add.call_args.args
+        assert metadata["mezzanine_spec"] == "h264/9:16/center"
+        assert Path(file_path).read_bytes() == b"mezzanine"
+        assert not list(tmp_path.rglob("*.mezzanine.mp4"))
+
+    @pytest.mark.asyncio
+    async def test_failed_normalization_caches_download_as_is(self, tmp_path):
+        stage = _stage(FakeApiClient(), FakeValidator())
+        stage.video_builder = FakeBuilder(fail=True)
+        downloaded: list[dict] = []
+
+        approved = await stage._download_shorts_batch(_shorts(1), _make_context(tmp_path, 100), downloaded)
+
+        assert approved == 1
+        assert "mezzanine_spec" not in stage.shorts_cache.add.call_args.args[2]
+
+
+class TestPipelineFailures:
+    @pytest.mark.asyncio
+    async def test_cache_failure_drops_only_that_short(self, tmp_path):
+        stage = _stage(FakeApiClient(), FakeValidator())
+
+        def add(video_id, file_path, metadata):
+            if video_id == "vid1":
+                raise OSError("disk full")
+
+        stage.shorts_cache.add.side_effect = add
+        downloaded: list[dict] = []
+
+        approved = await asyncio.wait_for(
+            stage._download_shorts_batch(_shorts(5), _make_context(tmp_path, 100), downloaded), timeout=5
+        )
+
+        assert approved == 4
+        assert "vid1" not in {s["video_id"] for s in downloaded}
+
+    @pytest.mark.asyncio
+    async def test_dead_consumer_fails_the_batch(self, tmp_path, monkeypatch):
+        stage = _stage(FakeApiClient(), FakeValidator())
+        monkeypatch.setattr(stage, "_covers_target", MagicMock(side_effect=RuntimeError("boom")))
+
+        with pytest.raises(VideoProcessingException, match="boom"):
+            await asyncio.wait_for(
+                stage._download_shorts_batch(_shorts(5), _make_context(tmp_path, 100), []), timeout=5
+            )
@@ -0,0 +1,85 @@
+"""Unit tests for FinalCompositionStage single-pass rendering."""
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.domain.stages.assemble_video_stage import AssembleVideoStage
+from app.domain.stages.final_composition_stage import FinalCompositionStage
+from app.domain.job_stage import StageContext
+
+
+def _make_context(tmp_path: Path) -> StageContext:
+    ctx = StageContext(
+        job_id="test_final_01",
+        query="test",
+        max_shorts=10,
+        aspect_ratio="9:16",
+        crop_position="center",
+        subtitle_language="pt",
+        subtitle_style="dynamic",
+        settings={"temp_dir": str(tmp_path), "output_dir": str(tmp_path), "render_single_pass": True},
+    )
+    ctx.audio_path = tmp_path / "audio.mp3"
+    ctx.audio_path.write_bytes(b"\x00" * 100)
+    ctx.target_video_duration = 31.0
+    ctx.selected_shorts = [{"file_path": str(tmp_path / "a.mp4"), "duration_seconds": 20}]
+    ctx.subtitle_path = tmp_path / "subs.srt"
+    ctx.subtitle_path.write_text("1\n00:00:00,000 --> 00:00:01,000\nola\n")
+    return ctx
+
+
+def _builder() -> MagicMock:
+    builder = MagicMock()
+    builder.compose_single_pass = AsyncMock()
+    builder.concatenate_videos = AsyncMock()
+    builder.add_audio = AsyncMock()
+    builder.burn_subtitles = AsyncMock()
+    return builder
+
+
+class TestSinglePassComposition:
+    @pytest.mark.asyncio
+    async def test_assemble_defers_and_final_composition_encodes_once(self, tmp_path):
+        ctx = _make_context(tmp_path)
+        builder = _builder()
+
+        await AssembleVideoStage(builder).execute(ctx)
+        FinalCompositionStage(builder).validate(ctx)
+        result = await FinalCompositionStage(builder).execute(ctx)
+
+        builder.concatenate_videos.assert_not_called()
+        builder.add_audio.assert_not_called()
+        kwargs = builder.compose_single_pass.await_args.kwargs
+        assert kwargs["subtitle_path"] == str(ctx.subtitle_path)
+        assert kwargs["max_duration"] == 31.0
+        assert result["single_pass"] is True
+        assert ctx.final_video_path == tmp_path / "test_final_01_final.mp4"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_staged_render(self, tmp_path):
+        ctx = _make_context(tmp_path)
+        ctx.single_pass_render = True
+        builder = _builder()
+        builder.compose_single_pass.side_effect = RuntimeError("filter graph failed")
+
+        await FinalCompositionStage(builder).execute(ctx)
+
+        builder.concatenate_videos.assert_awaited_once()
+        builder.add_audio.assert_awaited_once()
+        builder.burn_subtitles.assert_awaited_once()
+        assert ctx.single_pass_render is False
+
+    @pytest.mark.asyncio
+    async def test_hook_text_keeps_staged_path(self, tmp_path):
+        ctx = _make_context(tmp_path)
+        ctx.hook_text = "Olha isso"
+        builder = _builder()
+        builder.get_video_info = AsyncMock(return_value={"duration": 20})
+
+        await AssembleVideoStage(builder).execute(ctx)
+
+        builder.concatenate_videos.assert_awaited_once()
+        assert ctx.single_pass_render is False
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from app.domain.stages.load_approved_stage import LoadApprovedVideosStage
 from app.domain.job_stage import StageContext
@@ -75,3 +75,33 @@ class TestLoadApprovedVideosStage:
         stage = LoadApprovedVideosStage(video_builder=MagicMock())
         with pytest.raises(VideoProcessingException):
             stage.validate(ctx)
+
+
+class StubStatusStore:
+    def __init__(self, records: dict):
+        self.records = records
+
+    def get_approved(self, video_id):
+        return self.records.get(video_id)
+
+
+class TestMezzanineSpecPassthrough:
+    @pytest.mark.asyncio
+    async def test_recorded_spec_is_passed_to_assembly(self, tmp_path):
+        ctx = _make_context(tmp_path)
+        approved_dir = Path(ctx.settings["approved_dir"])
+        for name in ("a", "b", "c"):
+            (approved_dir / f"{name}.mp4").write_bytes(b"\x00" * 100)
+
+        builder = MagicMock()
+        builder.get_video_info = AsyncMock(return_value={"duration": 5.0})
+        store = StubStatusStore({
+            "a": {"file_path": str(approved_dir / "a.mp4"), "metadata": {"mezzanine_spec": "h264/spec"}},
+            "b": {"file_path": "/elsewhere/old_b.mp4", "metadata": {"mezzanine_spec": "h264/spec"}},
+        })
+
+        stage = LoadApprovedVideosStage(video_builder=builder, status_store=store)
+        await stage.execute(ctx)
+
+        specs = {short["video_id"]: short["mezzanine_spec"] for short in ctx.downloaded_shorts}
+        assert specs == {"a": "h264/spec", "b": None, "c": None}
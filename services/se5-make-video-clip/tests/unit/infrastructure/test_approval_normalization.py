@@ -0,0 +1,94 @@
+"""Normalização mezzanine dos shorts aprovados pelo pipeline de download"""
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.infrastructure import helpers
+from app.services.mezzanine import MezzanineSpec
+
+
+class StubJobLogger:
+    def info(self, *args, **kwargs):
+        pass
+
+    error = warning = info
+
+
+class StubVideoBuilder:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = []
+
+    async def normalize_short(self, input_path, output_path, aspect_ratio, crop_position):
+        self.calls.append((input_path, aspect_ratio, crop_position))
+        if self.fail:
+            Path(output_path).write_bytes(b"partial")
+            raise RuntimeError("ffmpeg failed")
+        Path(output_path).write_bytes(b"mezzanine")
+        return MezzanineSpec(width=1080, height=1920, crop_position=crop_position)
+
+
+class StubStatusStore:
+    def __init__(self):
+        self.approved = {}
+
+    def add_approved(self, video_id, url=None, file_path=None, metadata=None, title=None):
+        self.approved[video_id] = {"file_path": file_path, "metadata": metadata}
+
+
+@pytest.fixture
+def tagged(tmp_path):
+    path = tmp_path / "job1_vid1_PROCESSING_.mp4"
+    path.write_bytes(b"cropped")
+    return path
+
+
+class TestNormalizeForApproval:
+    @pytest.mark.asyncio
+    async def test_short_is_normalized_in_place_before_approval(self, tagged):
+        builder = StubVideoBuilder()
+
+        with patch("app.core.config.get_settings", return_value={"normalize_shorts_on_ingest": True}):
+            key = await helpers._normalize_for_approval(
+                "vid1", str(tagged), "9:16", "center", builder, StubJobLogger()
+            )
+
+        assert key == MezzanineSpec(width=1080, height=1920).key
+        assert tagged.read_bytes() == b"mezzanine"
+        assert list(tagged.parent.iterdir()) == [tagged]
+
+    @pytest.mark.asyncio
+    async def test_failed_normalization_keeps_the_cropped_short(self, tagged):
+        with patch("app.core.config.get_settings", return_value={"normalize_shorts_on_ingest": True}):
+            key = await helpers._normalize_for_approval(
+                "vid1", str(tagged), "9:16", "center", StubVideoBuilder(fail=True), StubJobLogger()
+            )
+
+        assert key is None
+        assert tagged.read_bytes() == b"cropped"
+        assert list(tagged.parent.iterdir()) == [tagged]
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_setting(self, tagged):
+        builder = StubVideoBuilder()
+
+        with patch("app.core.config.get_settings", return_value={"normalize_shorts_on_ingest": False}):
+            key = await helpers._normalize_for_approval(
+                "vid1", str(tagged), "9:16", "center", builder, StubJobLogger()
+            )
+
+        assert key is None
+        assert builder.calls == []
+
+    def test_spec_is_recorded_with_the_approved_file(self, tmp_path):
+        store = StubStatusStore()
+
+        helpers._record_approved("vid1", str(tmp_path / "vid1.mp4"), "h264/spec", store)
+
+        assert store.approved["vid1"] == {
+            "file_path": str(tmp_path / "vid1.mp4"),
+            "metadata": {"mezzanine_spec": "h264/spec"},
+        }
@@ -0,0 +1,25 @@
+"""Unit tests for run_subprocess_with_timeout cancellation."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.subprocess_utils import run_subprocess_with_timeout
+
+
+class TestCancellation:
+    @pytest.mark.asyncio
+    async def test_cancel_kills_the_process(self, tmp_path):
+        marker = tmp_path / "written"
+        task = asyncio.create_task(
+            run_subprocess_with_timeout(["sh", "-c", f"sleep 0.5; touch {marker}"], timeout=10)
+        )
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.8)
+
+        assert not marker.exists()
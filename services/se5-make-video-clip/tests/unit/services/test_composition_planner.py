@@ -0,0 +1,36 @@
+"""Unit tests for the single-pass composition planner."""
+from __future__ import annotations
+
+from app.services.composition_planner import plan_composition
+
+
+def _plan(**kwargs):
+    defaults = dict(
+        video_files=["/v/a.mp4", "/v/b.mp4"],
+        audio_path="/a/narration.mp3",
+        target_width=1080,
+        target_height=1920,
+        crop_filter="crop=1080:1920",
+    )
+    return plan_composition(**{**defaults, **kwargs})
+
+
+class TestPlanComposition:
+    def test_single_graph_normalizes_concats_and_maps_narration(self):
+        plan = _plan()
+        cmd = plan.to_command("ffmpeg", "/out/final.mp4")
+
+        assert cmd.count("-filter_complex") == 1
+        assert cmd[-1] == "/out/final.mp4"
+        assert plan.inputs == ["/v/a.mp4", "/v/b.mp4", "/a/narration.mp3"]
+        assert "[0:v]scale=1080:1920:force_original_aspect_ratio=increase,crop=1080:1920,setsar=1" in plan.filter_complex
+        assert "[v0][v1]concat=n=2:v=1:a=0[vcat]" in plan.filter_complex
+        assert plan.output_args[:4] == ["-map", "[vcat]", "-map", "2:a:0"]
+        assert "-t" not in plan.output_args
+
+    def test_subtitles_and_trim_are_part_of_the_same_encode(self):
+        plan = _plan(subtitle_path="/s/sub:1.srt", subtitle_style="minimal", max_duration=61.5)
+
+        assert "[vcat]subtitles=/s/sub\\:1.srt:force_style=" in plan.filter_complex
+        assert plan.output_args[:2] == ["-map", "[vout]"]
+        assert plan.output_args[plan.output_args.index("-t") + 1] == "61.500"
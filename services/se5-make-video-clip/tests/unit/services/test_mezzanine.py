@@ -0,0 +1,170 @@
+"""Unit tests for the mezzanine spec and stream copy concatenation."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services import video_builder as video_builder_module
+from app.services.mezzanine import MezzanineSpec, build_mezzanine_command, specs_match
+from app.services.video_builder import VideoBuilder
+
+
+class TestMezzanineSpec:
+    def test_command_pins_gop_sar_fps_and_timescale(self):
+        spec = MezzanineSpec(width=1080, height=1920)
+
+        cmd = build_mezzanine_command("ffmpeg", "/in.mp4", "/out.mp4", spec, crop_filter="crop=1080:1920")
+
+        assert "setsar=1/1,fps=30,format=yuv420p" in cmd[cmd.index("-vf") + 1]
+        assert cmd[cmd.index("-g") + 1] == cmd[cmd.index("-keyint_min") + 1] == "30"
+        assert cmd[cmd.index("-sc_threshold") + 1] == "0"
+        assert cmd[cmd.index("-video_track_timescale") + 1] == "15360"
+        assert cmd[-1] == "/out.mp4"
+
+    def test_specs_match_requires_every_short_in_the_same_spec(self):
+        spec = MezzanineSpec(width=1080, height=1920)
+        top = MezzanineSpec(width=1080, height=1920, crop_position="top")
+
+        assert specs_match([spec.key, spec.key], spec)
+        assert not specs_match([spec.key, top.key], spec)
+        assert not specs_match([spec.key, None], spec)
+        assert not specs_match([], spec)
+
+
+class TestConcatenateWithMezzanine:
+    @pytest.fixture
+    def builder(self, tmp_path, monkeypatch):
+        builder = VideoBuilder(output_dir=str(tmp_path / "out"))
+        builder.get_video_info = AsyncMock(return_value={"duration": 10.0})
+        builder._ensure_compatibility = AsyncMock(side_effect=lambda files: files)
+        run = AsyncMock(return_value=(0, b"", b""))
+        monkeypatch.setattr(video_builder_module, "run_ffmpeg_cmd", run)
+        return builder, run
+
+    @pytest.mark.asyncio
+    async def test_matching_specs_use_stream_copy(self, builder, tmp_path):
+        builder, run = builder
+        key = builder.mezzanine_spec("9:16", "center").key
+        builder.get_video_info.side_effect = [{"duration": 10.0}, {"duration": 10.0}, {"duration": 20.0}]
+
+        await builder.concatenate_videos(
+            ["/v/a.mp4", "/v/b.mp4"], str(tmp_path / "out.mp4"), mezzanine_specs=[key, key]
+        )
+
+        cmd = run.call_args.kwargs["cmd"]
+        assert cmd[cmd.index("-f") + 1] == "concat"
+        assert cmd[cmd.index("-c") + 1] == "copy"
+        builder._ensure_compatibility.assert_not_called()
+        assert not (tmp_path / "out.concat.txt").exists()
+
+    @pytest.mark.asyncio
+    async def test_mismatched_specs_fall_back_to_filter_concat(self, builder, tmp_path):
+        builder, run = builder
+        key = builder.mezzanine_spec("9:16", "top").key
+        builder.get_video_info.side_effect = [{"duration": 10.0}, {"duration": 10.0}, {"duration": 20.0}]
+
+        await builder.concatenate_videos(
+            ["/v/a.mp4", "/v/b.mp4"], str(tmp_path / "out.mp4"), mezzanine_specs=[key, key]
+        )
+
+        assert "-filter_complex" in run.call_args.kwargs["cmd"]
+        builder._ensure_compatibility.assert_awaited_once()
+
+
+class TestParallelConcatenation:
+    @pytest.mark.asyncio
+    async def test_segments_encode_concurrently_then_stitch_with_copy(self, tmp_path, monkeypatch):
+        builder = VideoBuilder(output_dir=str(tmp_path / "out"), parallel_workers=3)
+        builder.get_video_info = AsyncMock(side_effect=[{"duration": 5.0}] * 4 + [{"duration": 20.0}])
+        builder._ensure_compatibility = AsyncMock()
+        commands: list[list[str]] = []
+        running = {"now": 0, "peak": 0}
+
+        async def fake_run(cmd, timeout, operation, details=None):
+            commands.append(cmd)
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return 0, b"", b""
+
+        monkeypatch.setattr(video_builder_module, "run_ffmpeg_cmd", fake_run)
+
+        await builder.concatenate_videos([f"/v/{i}.mp4" for i in range(4)], str(tmp_path / "out.mp4"))
+
+        segment_cmds, stitch_cmd = commands[:-1], commands[-1]
+        assert len(segment_cmds) == 4
+        assert running["peak"] == 3
+        assert all("-an" in cmd and "-threads" in cmd for cmd in segment_cmds)
+        assert stitch_cmd[stitch_cmd.index("-c") + 1] == "copy"
+        assert not (tmp_path / ".out_segments").exists()
+        builder._ensure_compatibility.assert_not_called()
+
+    @pytest.fixture
+    def parallel_builder(self, tmp_path):
+        builder = VideoBuilder(output_dir=str(tmp_path / "out"), parallel_workers=4)
+        builder.get_video_info = AsyncMock(
+            side_effect=lambda path: {"duration": 20.0 if path.endswith("out.mp4") else 5.0}
+        )
+        builder._ensure_compatibility = AsyncMock(side_effect=lambda files: files)
+        return builder
+
+    @pytest.mark.asyncio
+    async def test_segments_are_stitched_in_input_order(self, parallel_builder, tmp_path, monkeypatch):
+        stitched: list[str] = []
+
+        async def fake_run(cmd, timeout, operation, details=None):
+            if "concat" in cmd:
+                lines = open(cmd[cmd.index("-i") + 1]).read().splitlines()
+                stitched.extend(line.split("/")[-1].rstrip("'") for line in lines)
+            else:
+                # Later shorts finish first
+                await asyncio.sleep(0.01 * (4 - int(details["input"].split("/")[-1][0])))
+            return 0, b"", b""
+
+        monkeypatch.setattr(video_builder_module, "run_ffmpeg_cmd", fake_run)
+
+        await parallel_builder.concatenate_videos([f"/v/{i}.mp4" for i in range(4)], str(tmp_path / "out.mp4"))
+
+        assert stitched == ["0000.mp4", "0001.mp4", "0002.mp4", "0003.mp4"]
+
+    @pytest.mark.asyncio
+    async def test_failed_segment_cancels_siblings_before_cleanup(self, parallel_builder, tmp_path, monkeypatch):
+        running = {"now": 0}
+        cancelled: list[str] = []
+        commands: list[list[str]] = []
+        segment_dir = tmp_path / ".out_segments"
+
+        async def fake_run(cmd, timeout, operation, details=None):
+            commands.append(cmd)
+            if operation != "short normalization":
+                return 0, b"", b""
+            running["now"] += 1
+            try:
+                if details["input"].endswith("/1.mp4"):
+                    return 1, b"", b"encoder error"
+                await asyncio.sleep(5)
+                return 0, b"", b""
+            except asyncio.CancelledError:
+                cancelled.append(details["input"])
+                raise
+            finally:
+                running["now"] -= 1
+
+        real_rmtree = video_builder_module.shutil.rmtree
+
+        def checked_rmtree(path, *args, **kwargs):
+            assert running["now"] == 0, "segment directory removed while encodes were running"
+            real_rmtree(path, *args, **kwargs)
+
+        monkeypatch.setattr(video_builder_module, "run_ffmpeg_cmd", fake_run)
+        monkeypatch.setattr(video_builder_module.shutil, "rmtree", checked_rmtree)
+
+        await parallel_builder.concatenate_videos([f"/v/{i}.mp4" for i in range(4)], str(tmp_path / "out.mp4"))
+
+        assert len(cancelled) == 3
+        assert not segment_dir.exists()
+        assert "-filter_complex" in commands[-1]
+        parallel_builder._ensure_compatibility.assert_awaited_once()
@@ -0,0 +1,132 @@
+"""
+Unit tests for ProbeCache
+
+Uses a REAL SQLite metadata.db in tmp_path and a stand-in ffprobe script
+that logs each invocation (no mocks).
+"""
+from __future__ import annotations
+
+import json
+import os
+import stat
+
+import pytest
+
+from app.services.probe_cache import ProbeCache
+from app.shared.exceptions_v2 import FFprobeFailedException
+
+PROBE_OUTPUT = {"streams": [{"codec_type": "video", "width": 1080}], "format": {"duration": "12.5"}}
+
+
+@pytest.fixture
+def ffprobe(tmp_path):
+    """Executable that prints PROBE_OUTPUT (or fails for *.bad files) and logs calls"""
+    calls = tmp_path / "calls.log"
+    script = tmp_path / "ffprobe"
+    script.write_text(
+        "#!/bin/sh\n"
+        f'for last; do :; done\necho "$last" >> {calls}\n'
+        'case "$last" in *.bad) echo "Invalid data found" >&2; exit 1;; esac\n'
+        f"echo '{json.dumps(PROBE_OUTPUT)}'\n"
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return script, calls
+
+
+def _cache(tmp_path, ffprobe):
+    root = tmp_path / "shorts"
+    root.mkdir(exist_ok=True)
+    return ProbeCache(db_path=root / "metadata.db", persist_root=root, ffprobe_path=str(ffprobe[0]))
+
+
+def _calls(ffprobe) -> int:
+    return len(ffprobe[1].read_text().splitlines()) if ffprobe[1].exists() else 0
+
+
+class TestProbeCache:
+    def test_same_file_is_probed_once_and_counted_per_job(self, tmp_path, ffprobe):
+        cache = _cache(tmp_path, ffprobe)
+        video = tmp_path / "shorts" / "a.mp4"
+        video.write_bytes(b"v")
+
+        with cache.job_scope("job_1") as stats:
+            first = cache.probe(video)
+            second = cache.probe(str(video))
+
+        assert first == second == PROBE_OUTPUT
+        assert _calls(ffprobe) == 1
+        assert stats == {"probe_calls": 1, "cache_hits": 1}
+
+    def test_rewritten_file_is_probed_again(self, tmp_path, ffprobe):
+        cache = _cache(tmp_path, ffprobe)
+        video = tmp_path / "shorts" / "a.mp4"
+        video.write_bytes(b"v")
+        cache.probe(video)
+
+        video.write_bytes(b"longer")
+        cache.probe(video)
+
+        assert _calls(ffprobe) == 2
+
+    def test_persisted_probe_serves_new_process_and_hard_links(self, tmp_path, ffprobe):
+        video = tmp_path / "shorts" / "library" / "a.mp4"
+        video.parent.mkdir(parents=True)
+        video.write_bytes(b"v")
+        _cache(tmp_path, ffprobe).probe(video)
+        link = tmp_path / "shorts" / "job_2" / "a.mp4"
+        link.parent.mkdir()
+        os.link(video, link)
+
+        fresh = _cache(tmp_path, ffprobe)
+
+        assert fresh.probe(video) == PROBE_OUTPUT
+        assert fresh.probe(link) == PROBE_OUTPUT
+        assert _calls(ffprobe) == 1
+
+    def test_library_materializations_share_one_probe(self, tmp_path, ffprobe):
+        from app.services.shorts_library import ShortsLibrary
+
+        library = ShortsLibrary(tmp_path / "shorts" / "library")
+        download = tmp_path / "a.mp4"
+        download.write_bytes(b"v")
+        library.ingest("vidA", download)
+        workspace = tmp_path / "shorts" / "jobs"
+        first = library.materialize("vidA", workspace / "job_1" / "vidA.mp4", "job_1")
+        _cache(tmp_path, ffprobe).probe(first)
+
+        second = library.materialize("vidA", workspace / "job_2" / "vidA.mp4", "job_2")
+        fresh = _cache(tmp_path, ffprobe)
+
+        assert fresh.probe(second) == PROBE_OUTPUT
+        assert fresh.probe(first) == PROBE_OUTPUT
+        assert _calls(ffprobe) == 1
+
+    def test_files_outside_persist_root_stay_in_memory(self, tmp_path, ffprobe):
+        video = tmp_path / "tmp_output.mp4"
+        video.write_bytes(b"v")
+        _cache(tmp_path, ffprobe).probe(video)
+
+        _cache(tmp_path, ffprobe).probe(video)
+
+        assert _calls(ffprobe) == 2
+
+    def test_failures_raise_and_are_not_cached(self, tmp_path, ffprobe):
+        cache = _cache(tmp_path, ffprobe)
+        video = tmp_path / "shorts" / "broken.bad"
+        video.write_bytes(b"x")
+
+        for _ in range(2):
+            with pytest.raises(FFprobeFailedException):
+                cache.probe(video)
+
+        assert _calls(ffprobe) == 2
+
+    def test_prune_drops_probes_of_deleted_files(self, tmp_path, ffprobe):
+        cache = _cache(tmp_path, ffprobe)
+        video = tmp_path / "shorts" / "a.mp4"
+        video.write_bytes(b"v")
+        cache.probe(video)
+        video.unlink()
+
+        assert cache.prune() == 1
+        assert cache.prune() == 0
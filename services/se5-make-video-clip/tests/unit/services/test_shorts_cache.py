@@ -0,0 +1,116 @@
+"""
+Unit tests for ShortsCache
+
+Uses a REAL SQLite index and ShortsLibrary in tmp_path (no mocks).
+"""
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+
+import pytest
+
+from common.datetime_utils import now_brazil
+from app.services.shorts_manager import ShortsCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ShortsCache(str(tmp_path / "shorts"))
+
+
+def _add(cache, tmp_path, video_id: str, duration: float, content: bytes | None = None):
+    path = tmp_path / "job" / f"{video_id}.mp4"
+    path.parent.mkdir(exist_ok=True)
+    path.write_bytes(content or video_id.encode() * 10)
+    cache.add(video_id, str(path), {"video_id": video_id, "duration_seconds": duration, "title": "t"})
+
+
+class TestShortsCacheIndex:
+    def test_add_and_get_round_trip(self, cache, tmp_path):
+        _add(cache, tmp_path, "vid1", 12.5)
+
+        short = cache.get("vid1")
+
+        assert short["duration_seconds"] == 12.5
+        assert short["title"] == "t"
+        assert short["usage_count"] == 2
+        assert cache.exists("vid1")
+        assert cache.get("missing") is None
+
+    def test_mark_validated_and_find_by_status_and_duration(self, cache, tmp_path):
+        _add(cache, tmp_path, "short", 5)
+        _add(cache, tmp_path, "long", 40)
+        _add(cache, tmp_path, "subbed", 30)
+        cache.mark_validated("short", False, 0.1)
+        cache.mark_validated("long", False, 0.2)
+        cache.mark_validated("subbed", True, 0.9, reason="ocr")
+
+        clean_long = cache.find(has_subtitles=False, min_duration=10)
+
+        assert [s["video_id"] for s in clean_long] == ["long"]
+        assert clean_long[0]["has_embedded_subtitles"] is False
+        assert cache.find(has_subtitles=True)[0]["ocr_reason"] == "ocr"
+        assert cache.mark_validated("missing", False, 0.0) is False
+
+    def test_stats_come_from_index(self, cache, tmp_path):
+        _add(cache, tmp_path, "vid1", 10, b"a" * 100)
+        _add(cache, tmp_path, "vid2", 10, b"b" * 50)
+        cache.get("vid2")
+
+        stats = cache.get_cache_stats()
+
+        assert stats["total_shorts"] == 2
+        assert stats["total_size_bytes"] == 150
+        assert stats["most_used"] == {"video_id": "vid2", "usage_count": 2}
+
+    def test_remove_deletes_record(self, cache, tmp_path):
+        _add(cache, tmp_path, "vid1", 10)
+
+        assert cache.remove("vid1") is True
+        assert not cache.exists("vid1")
+        assert cache.remove("vid1") is False
+
+    def test_migrates_legacy_metadata_json(self, tmp_path):
+        cache_dir = tmp_path / "shorts"
+        cache_dir.mkdir()
+        video = cache_dir / "old.mp4"
+        video.write_bytes(b"x" * 10)
+        now = now_brazil().isoformat()
+        (cache_dir / "metadata.json").write_text(json.dumps({
+            "old": {
+                "video_id": "old", "file_path": str(video), "downloaded_at": now,
+                "last_used": now, "usage_count": 3, "duration_seconds": 8,
+            }
+        }))
+
+        cache = ShortsCache(str(cache_dir))
+
+        assert cache.get("old")["usage_count"] == 4
+        assert not (cache_dir / "metadata.json").exists()
+        assert cache.get_cache_stats()["total_size_bytes"] == 10
+
+    def test_cleanup_old_drops_stale_legacy_entries(self, tmp_path):
+        cache_dir = tmp_path / "shorts"
+        cache_dir.mkdir()
+        video = cache_dir / "old.mp4"
+        video.write_bytes(b"x")
+        stale = (now_brazil() - timedelta(days=60)).isoformat()
+        (cache_dir / "metadata.json").write_text(json.dumps({
+            "old": {"video_id": "old", "file_path": str(video), "downloaded_at": stale, "last_used": stale}
+        }))
+        cache = ShortsCache(str(cache_dir))
+
+        assert cache.cleanup_old(days=30) == 1
+        assert not video.exists()
+        assert cache.count() == 0
+
+    def test_mezzanine_spec_is_recorded(self, cache, tmp_path):
+        path = tmp_path / "job" / "vid1.mp4"
+        path.parent.mkdir()
+        path.write_bytes(b"x")
+        cache.add("vid1", str(path), {"duration_seconds": 5, "mezzanine_spec": "h264/spec"})
+        _add(cache, tmp_path, "vid2", 5)
+
+        assert cache.get("vid1")["mezzanine_spec"] == "h264/spec"
+        assert "mezzanine_spec" not in cache.get("vid2")
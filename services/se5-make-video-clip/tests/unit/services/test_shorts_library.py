@@ -0,0 +1,83 @@
+"""Unit tests for the content-addressed ShortsLibrary."""
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from app.services.shorts_library import ShortsLibrary
+
+
+@pytest.fixture
+def library(tmp_path):
+    return ShortsLibrary(tmp_path / "library")
+
+
+def _download(tmp_path, name: str, content: bytes):
+    path = tmp_path / "downloads" / name
+    path.parent.mkdir(exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+class TestShortsLibrary:
+    def test_ingest_deduplicates_identical_content(self, library, tmp_path):
+        h1 = library.ingest("vidA", _download(tmp_path, "a.mp4", b"same"))
+        h2 = library.ingest("vidB", _download(tmp_path, "b.mp4", b"same"))
+
+        assert h1 == h2
+        assert library.stats()["objects"] == 1
+        assert library.lookup("vidA") == library.lookup("vidB")
+        assert not (tmp_path / "downloads" / "a.mp4").exists()
+
+    def test_materialize_hard_links_into_job_workspace(self, library, tmp_path):
+        content_hash = library.ingest("vidA", _download(tmp_path, "a.mp4", b"video"))
+        dest = tmp_path / "job_1" / "vidA.mp4"
+
+        assert library.materialize("vidA", dest, "job_1") == dest
+        assert dest.read_bytes() == b"video"
+        assert os.stat(dest).st_ino == os.stat(library.object_path(content_hash)).st_ino
+        assert library.refcount(content_hash) == 1
+
+    def test_materialize_unknown_video_returns_none(self, library, tmp_path):
+        assert library.materialize("missing", tmp_path / "x.mp4", "job_1") is None
+
+    def test_evict_skips_referenced_and_removes_lru_first(self, library, tmp_path):
+        old = library.ingest("old", _download(tmp_path, "old.mp4", b"o" * 100))
+        used = library.ingest("used", _download(tmp_path, "used.mp4", b"u" * 100))
+        new = library.ingest("new", _download(tmp_path, "new.mp4", b"n" * 100))
+        past = time.time() - 3600
+        for i, content_hash in enumerate((old, used)):
+            os.utime(library.used_dir / content_hash, (past + i, past + i))
+        library.materialize("used", tmp_path / "job_1" / "used.mp4", "job_1")
+        os.utime(library.used_dir / used, (past + 1, past + 1))
+
+        removed = library.evict(max_bytes=150)
+
+        assert removed == 2
+        assert library.lookup("old") is None
+        assert library.lookup("new") is None
+        assert not library.object_path(new).exists()
+        assert library.lookup("used") is not None
+
+    def test_materialize_keeps_the_object_stat_stable(self, library, tmp_path):
+        content_hash = library.ingest("vidA", _download(tmp_path, "a.mp4", b"video"))
+        obj = library.object_path(content_hash)
+        past = time.time() - 3600
+        os.utime(obj, (past, past))
+        before = os.stat(obj).st_mtime_ns
+
+        library.materialize("vidA", tmp_path / "job_1" / "vidA.mp4", "job_1")
+        library.materialize("vidA", tmp_path / "job_2" / "vidA.mp4", "job_2")
+
+        assert os.stat(obj).st_mtime_ns == before
+        assert (library.used_dir / content_hash).stat().st_mtime > past
+
+    def test_deleted_workspace_releases_reference(self, library, tmp_path):
+        content_hash = library.ingest("vidA", _download(tmp_path, "a.mp4", b"video"))
+        dest = library.materialize("vidA", tmp_path / "job_1" / "vidA.mp4", "job_1")
+        dest.unlink()
+
+        assert library.refcount(content_hash) == 0
+        assert library.evict(max_bytes=0) == 1
@@ -0,0 +1,101 @@
+"""Testes do VAD por energia vetorizado (NumPy) contra o loop por frame original"""
+from __future__ import annotations
+
+import math
+import struct
+import time
+
+import numpy as np
+import pytest
+
+from app.utils.vad import SpeechSegment, VADMethod, VoiceActivityDetector
+
+SAMPLE_RATE = 16000
+
+
+def _reference_rms(frame: bytes) -> float:
+    num_samples = len(frame) // 2
+    if num_samples == 0:
+        return 0.0
+    samples = struct.unpack(f'<{num_samples}h', frame)
+    sum_squares = sum(s * s for s in samples)
+    return math.sqrt(sum_squares / num_samples) / 32768.0
+
+
+def _reference_detect_energy(vad: VoiceActivityDetector, audio_data: bytes, sample_rate: int) -> list[SpeechSegment]:
+    """Implementação anterior (frame a frame em Python)"""
+    frame_size = int(sample_rate * vad.frame_duration_ms / 1000) * 2
+    segments = []
+    speech_start = None
+    for i in range(0, len(audio_data) - frame_size, frame_size):
+        energy = _reference_rms(audio_data[i:i + frame_size])
+        is_speech = energy > vad.energy_threshold
+        timestamp = i / (sample_rate * 2)
+        if is_speech and speech_start is None:
+            speech_start = timestamp
+        elif not is_speech and speech_start is not None:
+            segments.append(SpeechSegment(
+                speech_start, timestamp, min(energy / vad.energy_threshold, 1.0), VADMethod.ENERGY
+            ))
+            speech_start = None
+    if speech_start is not None:
+        segments.append(SpeechSegment(
+            speech_start, len(audio_data) / (sample_rate * 2), 0.7, VADMethod.ENERGY
+        ))
+    return segments
+
+
+def _narration(seconds: float, seed: int = 0, end_in_speech: bool = False) -> bytes:
+    """PCM 16-bit com rajadas de "fala" (ruído alto) separadas por silêncio com ruído baixo"""
+    rng = np.random.default_rng(seed)
+    total = int(seconds * SAMPLE_RATE)
+    audio = rng.normal(0, 200, total)
+    pos = 0
+    while pos < total:
+        pos += int(rng.uniform(0.1, 1.5) * SAMPLE_RATE)
+        length = int(rng.uniform(0.05, 3.0) * SAMPLE_RATE)
+        audio[pos:pos + length] = rng.normal(0, rng.uniform(500, 12000), len(audio[pos:pos + length]))
+        pos += length
+    if end_in_speech:
+        audio[-SAMPLE_RATE:] = rng.normal(0, 8000, SAMPLE_RATE)
+    # +1 byte: buffer que não fecha em frame inteiro
+    return np.clip(audio, -32768, 32767).astype('<i2').tobytes() + b'\x00'
+
+
+@pytest.fixture
+def vad() -> VoiceActivityDetector:
+    return VoiceActivityDetector(frame_duration_ms=30, energy_threshold=0.02)
+
+
+class TestVectorizedEnergyVAD:
+    @pytest.mark.parametrize("seed,end_in_speech", [(0, False), (1, True), (2, False)])
+    def test_segments_identical_to_frame_loop(self, vad, seed, end_in_speech):
+        audio = _narration(60, seed=seed, end_in_speech=end_in_speech)
+
+        assert vad._detect_energy(audio, SAMPLE_RATE) == _reference_detect_energy(vad, audio, SAMPLE_RATE)
+
+    def test_rms_matches_reference_including_full_scale(self, vad):
+        frame = np.array([-32768, 32767, 0, -1] * 120, dtype='<i2').tobytes()
+
+        assert vad._calculate_rms_energy(frame) == _reference_rms(frame)
+        assert vad._calculate_rms_energy(b'') == 0.0
+
+    def test_audio_shorter_than_a_frame_has_no_segments(self, vad):
+        assert vad._detect_energy(b'\x01\x00' * 10, SAMPLE_RATE) == []
+
+    @pytest.mark.slow
+    def test_benchmark_ten_minute_narration(self, vad):
+        audio = _narration(600)
+
+        start = time.perf_counter()
+        vectorized = vad._detect_energy(audio, SAMPLE_RATE)
+        vectorized_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = _reference_detect_energy(vad, audio, SAMPLE_RATE)
+        reference_s = time.perf_counter() - start
+
+        print(f"\nenergy VAD 10 min: numpy {vectorized_s * 1000:.1f}ms, "
+              f"loop {reference_s * 1000:.1f}ms ({reference_s / vectorized_s:.0f}x)")
+        assert vectorized == reference
+        assert vectorized_s < reference_s
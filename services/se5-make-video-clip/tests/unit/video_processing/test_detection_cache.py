@@ -0,0 +1,174 @@
+"""Testes unitários para o cache de detecção de legendas endereçado por conteúdo"""
+from __future__ import annotations
+
+import shutil
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.subtitle_processing.temporal_tracker import Track
+from app.trsd_models.text_region import ROIType, TextLine
+from app.video_processing.detection_cache import (
+    SubtitleDetectionCache,
+    content_fingerprint,
+    tracks_from_evidence,
+    tracks_to_evidence,
+)
+from app.video_processing.ocr_detectors import LegacyOCRDetector
+from app.video_processing.video_validator import VideoValidator
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+
+def _legacy_detector(min_confidence: float) -> LegacyOCRDetector:
+    return LegacyOCRDetector(
+        ocr_detector=MagicMock(), visual_analyzer=MagicMock(), ocr_lock=MagicMock(),
+        min_confidence=min_confidence, frames_per_second=None, max_frames=None,
+        ensure_supported_codec=MagicMock(),
+    )
+
+
+def _validator(redis: FakeRedis, min_confidence: float) -> VideoValidator:
+    """VideoValidator sem OCR real: só o detector legado, com OCR mockado"""
+    validator = VideoValidator.__new__(VideoValidator)
+    validator.min_confidence = min_confidence
+    validator.trsd_enabled = False
+    validator._detection_cache = SubtitleDetectionCache(redis)
+    validator._legacy_detector = _legacy_detector(min_confidence)
+    validator._legacy_detector.detect_with_evidence = MagicMock(return_value=(
+        (False, 0.0, "", 30),
+        {'detections': [["LIKE AND SUBSCRIBE", 0.4, 1.0]], 'frames_analyzed': 30},
+    ))
+    return validator
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    path = tmp_path / "job_a" / "abc123.mp4"
+    path.parent.mkdir()
+    path.write_bytes(b"\x00\x01" * 1000)
+    return path
+
+
+class TestEvidenceSerialization:
+    def test_tracks_round_trip(self):
+        track = Track(track_id=1, roi_type=ROIType.BOTTOM)
+        for idx, text in enumerate(["hello", "world", "again"]):
+            track.add_detection(TextLine(
+                frame_ts=idx * 0.5, frame_idx=idx, roi_type=ROIType.BOTTOM,
+                text=text, bbox=(10, 500, 200, 40), confidence=0.9, words=[{'w': text}],
+            ))
+        track.compute_metrics(3)
+
+        restored = tracks_from_evidence(tracks_to_evidence([track]), frames_analyzed=3)
+
+        assert len(restored) == 1
+        assert [d.text for d in restored[0].detections] == ["hello", "world", "again"]
+        assert restored[0].detections[0].bbox == (10, 500, 200, 40)
+        assert restored[0].presence_ratio == pytest.approx(track.presence_ratio)
+        assert restored[0].text_change_rate == pytest.approx(track.text_change_rate)
+
+    def test_legacy_score_applies_threshold(self):
+        detector = _legacy_detector(min_confidence=0.5)
+        detections = [("noise", 0.2, 0.0), ("SUBTITLE", 0.7, 1.0)]
+
+        assert detector.score(detections, 10) == (True, 0.7, "SUBTITLE", 10)
+        assert detector.score(detections, 10, min_confidence=0.8) == (False, 0.0, "", 10)
+
+
+class TestContentAddressedCache:
+    def test_hit_survives_file_move(self, video_file, tmp_path):
+        redis = FakeRedis()
+        validator = _validator(redis, min_confidence=0.5)
+        validator.has_embedded_subtitles(str(video_file))
+
+        moved = tmp_path / "job_b" / "abc123.mp4"
+        moved.parent.mkdir()
+        shutil.copy(video_file, moved)
+        result = validator.has_embedded_subtitles(str(moved))
+
+        assert result == (False, 0.0, "", 30)
+        assert validator._legacy_detector.detect_with_evidence.call_count == 1
+        assert list(redis.data) == [f"subtitle_detection:abc123:{content_fingerprint(str(video_file))}"]
+
+    def test_changed_content_is_a_miss(self, video_file):
+        validator = _validator(FakeRedis(), min_confidence=0.5)
+        validator.has_embedded_subtitles(str(video_file))
+
+        video_file.write_bytes(b"\x02" * 1000)
+        validator.has_embedded_subtitles(str(video_file))
+
+        assert validator._legacy_detector.detect_with_evidence.call_count == 2
+
+    def test_threshold_change_rescores_without_ocr(self, video_file):
+        redis = FakeRedis()
+        _validator(redis, min_confidence=0.5).has_embedded_subtitles(str(video_file))
+
+        stricter = _validator(redis, min_confidence=0.3)
+        result = stricter.has_embedded_subtitles(str(video_file))
+
+        assert result == (True, 0.4, "LIKE AND SUBSCRIBE", 30)
+        stricter._legacy_detector.detect_with_evidence.assert_not_called()
+
+    def test_forced_revalidation_does_not_hash_the_file(self, video_file, monkeypatch):
+        validator = _validator(FakeRedis(), min_confidence=0.5)
+        monkeypatch.setattr(validator, "_fingerprint", MagicMock(side_effect=AssertionError("hashed")))
+
+        validator.has_embedded_subtitles(str(video_file), force_revalidation=True)
+
+        validator._legacy_detector.detect_with_evidence.assert_called_once()
+
+
+class FakeCapture:
+    def __init__(self, frames: int):
+        self.frames = iter(range(frames))
+
+    def read(self):
+        frame = next(self.frames, None)
+        return frame is not None, frame
+
+
+class TestLegacyFrameScan:
+    def test_scan_collects_detections_and_first_confident_text(self):
+        detector = _legacy_detector(min_confidence=0.5)
+        ocr_by_frame = {
+            1: [MagicMock(text="  ", confidence=0.9)],
+            3: [MagicMock(text="like", confidence=0.3), MagicMock(text="this", confidence=0.4)],
+            5: [MagicMock(text="SUBTITLE", confidence=0.8)],
+        }
+        detector.ocr_detector.detect_text.side_effect = lambda frame: ocr_by_frame.get(frame, [])
+
+        frames_analyzed, detections, first = detector._scan_frames(
+            FakeCapture(8), frame_step=1, max_frames_to_process=6, total_frames=8, fps=2.0
+        )
+
+        assert frames_analyzed == 6
+        assert detections == [("like this", 0.4, 2.0), ("SUBTITLE", 0.8, 3.0)]
+        assert first == ("SUBTITLE", 0.8, 3.0)
+
+    def test_ocr_error_skips_only_that_frame(self):
+        detector = _legacy_detector(min_confidence=0.5)
+
+        def detect_text(frame):
+            if frame == 1:
+                raise RuntimeError("ocr crashed")
+            return [MagicMock(text="TEXT", confidence=0.9)]
+
+        detector.ocr_detector.detect_text.side_effect = detect_text
+
+        frames_analyzed, detections, first = detector._scan_frames(
+            FakeCapture(4), frame_step=2, max_frames_to_process=10, total_frames=4, fps=0.0
+        )
+
+        assert frames_analyzed == 2
+        assert detections == [("TEXT", 0.9, 2)]
+        assert first == ("TEXT", 0.9, 2)
@@ -0,0 +1,109 @@
+"""Testes do EnsembleSubtitleDetector com buffer de frames compartilhado"""
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from app.video_processing.detectors.base_detector import BaseSubtitleDetector
+from app.video_processing.ensemble_detector import EnsembleSubtitleDetector
+from app.video_processing.frame_extractor import SharedFrameBuffer
+
+
+@pytest.fixture
+def synthetic_video(tmp_path):
+    """Vídeo 1280x720 de 30 frames; o frame n tem intensidade n * 8"""
+    path = tmp_path / "video.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10, (1280, 720))
+    for n in range(30):
+        writer.write(np.full((720, 1280, 3), n * 8, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+
+class FrameDetector(BaseSubtitleDetector):
+    """Detector fake que consome frames compartilhados"""
+
+    def __init__(self, name, indices, barrier=None):
+        super().__init__()
+        self.name = name
+        self.indices = indices
+        self.barrier = barrier
+        self.received = None
+        self.decoded_video = False
+
+    def detect(self, video_path):
+        self.decoded_video = True
+        return {'has_subtitles': False, 'confidence': 0.5, 'metadata': {}}
+
+    def frame_indices(self, total_frames, fps):
+        return self.indices
+
+    def detect_frames(self, frames):
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        self.received = frames
+        return {'has_subtitles': True, 'confidence': 0.9, 'metadata': {'frames': len(frames)}}
+
+    def get_model_name(self):
+        return self.name
+
+    def _get_default_weight(self):
+        return 0.5
+
+
+class VideoDetector(FrameDetector):
+    """Detector fake que lê o vídeo por conta própria"""
+
+    def frame_indices(self, total_frames, fps):
+        return []
+
+
+class TestSharedFrameBuffer:
+
+    def test_decodes_union_once_and_downscales(self, synthetic_video):
+        buffer = SharedFrameBuffer.decode(synthetic_video, [20, 5, 5, 29, 99], downscale_width=320)
+
+        assert sorted(buffer.frames) == [5, 20, 29]
+        frame = buffer.get_frames([20])[0]
+        assert frame.shape == (180, 320, 3)
+        assert abs(int(frame.mean()) - 160) <= 4
+        assert not frame.flags.writeable
+
+    def test_memory_budget_thins_frames(self, synthetic_video):
+        frame_bytes = 320 * 180 * 3
+
+        buffer = SharedFrameBuffer.decode(
+            synthetic_video, list(range(30)), downscale_width=320, max_bytes=frame_bytes * 4
+        )
+
+        assert len(buffer) == 4
+        assert buffer.nbytes <= frame_bytes * 4
+
+    def test_missing_video_returns_empty_buffer(self, tmp_path):
+        assert len(SharedFrameBuffer.decode(str(tmp_path / "nope.mp4"), [0])) == 0
+
+
+class TestEnsembleSharedFrames:
+
+    def test_detectors_share_one_buffer_and_run_concurrently(self, synthetic_video):
+        barrier = threading.Barrier(2)
+        first = FrameDetector('first', [2, 10], barrier)
+        second = FrameDetector('second', [10, 25], barrier)
+        ensemble = EnsembleSubtitleDetector(detectors=[first, second])
+
+        result = ensemble.detect(synthetic_video)
+
+        assert result['has_subtitles'] is True
+        assert result['metadata']['shared_frames'] == 3
+        assert first.received[1] is second.received[0]
+        assert not first.decoded_video and not second.decoded_video
+
+    def test_detectors_without_frame_request_read_video(self, synthetic_video):
+        reader = VideoDetector('reader', [])
+        ensemble = EnsembleSubtitleDetector(detectors=[reader, FrameDetector('frames', [0])], max_workers=1)
+
+        result = ensemble.detect(synthetic_video)
+
+        assert reader.decoded_video
+        assert set(result['votes']) == {'reader', 'frames'}
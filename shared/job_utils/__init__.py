@@ -28,6 +28,7 @@ from common.job_utils.exceptions import (
     WorkerUnavailableError,
 )
 from common.job_utils.store import JobRedisStore
+from common.job_utils.async_store import AsyncJobRedisStore
 from common.job_utils.manager import JobManager
 from common.job_utils.celery_utils import (
     CallbackTask,
@@ -56,6 +57,7 @@ __all__ = [
     "JobValidationError",
     "WorkerUnavailableError",
     "JobRedisStore",
+    "AsyncJobRedisStore",
     "JobManager",
     "CallbackTask",
     "submit_task",
@@ -0,0 +1,263 @@
+"""
+Asyncio-native job store.
+
+:class:`AsyncJobRedisStore` is the coroutine counterpart of
+:class:`~common.job_utils.store.JobRedisStore`, on top of
+:class:`~common.redis_utils.AsyncResilientRedisStore`. Key layout, status
+indexes, binary serialization and blob handling come from the same base
+class, so a FastAPI process using this store and a Celery worker using the
+synchronous one read and write exactly the same keys.
+
+Every multi-command operation is one pipeline executed through the circuit
+breaker; on a Redis error or an open circuit, reads return empty results
+and writes return False instead of raising.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+from common.datetime_utils import now_brazil
+from common.redis_utils import AsyncResilientRedisStore
+from common.job_utils.models import StandardJob
+from common.job_utils.store import SCAN_BATCH_SIZE, BaseJobRedisStore
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJobRedisStore(BaseJobRedisStore):
+    """Asynchronous job store; same constructor as ``JobRedisStore``."""
+
+    redis: AsyncResilientRedisStore
+
+    def _pipeline(self, transaction: bool = False) -> Any:
+        return self.redis.redis.pipeline(transaction=transaction)
+
+    # -- persistence -----------------------------------------------------------
+
+    async def save_job(self, job: StandardJob) -> bool:
+        """Write *job* and update its indexes in a single round trip."""
+        pipe = self._pipeline(transaction=True)
+        write = None
+        if self.serializer is not None:
+            write = self._queue_binary_write(pipe, job)
+        else:
+            pipe.setex(self._job_key(job.id), self.ttl_seconds, job.model_dump_json())
+        self._queue_index(pipe, job)
+
+        results = await self.redis.execute_pipeline(pipe, f"SAVE {job.id}")
+        if results is None:
+            return False
+        if write is not None:
+            lost = self._lost_blobs(write, results)
+            if lost:
+                pipe = self._pipeline(transaction=True)
+                self._queue_blob_restore(pipe, write, lost)
+                if await self.redis.execute_pipeline(pipe, f"SAVE {job.id} blobs") is None:
+                    return False
+            self._remember_blob_digests(write.digests)
+        if self.events is not None:
+            await self.events.apublish_job(job)
+        return True
+
+    async def index_job(self, job: Any) -> None:
+        """Add *job* to the listing and to the index of its current status."""
+        pipe = self._pipeline()
+        self._queue_index(pipe, job)
+        await self.redis.execute_pipeline(pipe, f"INDEX {job.id}")
+
+    async def unindex_jobs(self, job_ids: Iterable[str]) -> None:
+        """Remove *job_ids* from the listing and from every status index."""
+        ids = list(job_ids)
+        if not ids:
+            return
+        pipe = self._pipeline()
+        self._queue_unindex(pipe, ids)
+        await self.redis.execute_pipeline(pipe, "UNINDEX")
+
+    async def get_job(self, job_id: str) -> StandardJob | None:
+        if self.serializer is not None:
+            jobs = await self.get_jobs([job_id], prune_missing=False)
+            return jobs[0] if jobs else None
+        data = await self.redis.get(self._job_key(job_id))
+        if not data:
+            return None
+        return self._parse(job_id, data)
+
+    async def get_jobs(
+        self,
+        job_ids: list[str],
+        include_blobs: bool = True,
+        prune_missing: bool = True,
+    ) -> list[StandardJob]:
+        """Fetch *job_ids* in one round trip, preserving order.
+
+        See :meth:`JobRedisStore.get_jobs`.
+        """
+        if not job_ids:
+            return []
+        if self.serializer is not None:
+            pipe = self._pipeline()
+            read_blobs = self._queue_binary_read(pipe, job_ids, include_blobs)
+            results = await self.redis.execute_pipeline(pipe, f"MGET ({len(job_ids)} jobs)")
+            if results is None:
+                return []
+            values, blobs = results[0], (results[1:] if read_blobs else None)
+        else:
+            values, blobs = await self.redis.mget([self._job_key(jid) for jid in job_ids]), None
+        if values is None:
+            return []
+
+        jobs, missing = self._build_jobs(job_ids, values, blobs)
+        if missing and prune_missing:
+            await self.unindex_jobs(missing)
+        return jobs
+
+    async def update_job(self, job: StandardJob) -> bool:
+        return await self.save_job(job)
+
+    async def delete_job(self, job_id: str) -> bool:
+        pipe = self._pipeline()
+        self._queue_unindex(pipe, [job_id])
+        pipe.delete(self._job_key(job_id))
+        if self.blob_fields:
+            pipe.delete(self._blobs_key(job_id))
+        results = await self.redis.execute_pipeline(pipe, f"DELETE {job_id}")
+        self._forget_blob_digests([job_id])
+        if results is None:
+            return False
+        return results[len(self.statuses) + 1] > 0
+
+    # -- listing ---------------------------------------------------------------
+
+    async def list_job_ids(
+        self,
+        start: int = 0,
+        stop: int = -1,
+        status: str | None = None,
+    ) -> list[str]:
+        ids = await self.redis.zrevrange(self._index_key(status), start, stop)
+        return [str(jid) for jid in ids]
+
+    async def list_jobs(
+        self,
+        status: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        include_blobs: bool = True,
+    ) -> list[StandardJob]:
+        """Return one page of jobs, newest first, optionally for one status."""
+        if limit <= 0:
+            return []
+        ids = await self.list_job_ids(offset, offset + limit - 1, status=status)
+        return await self.get_jobs(ids, include_blobs=include_blobs)
+
+    async def iter_jobs(
+        self,
+        status: str | None = None,
+        batch_size: int = SCAN_BATCH_SIZE,
+        include_blobs: bool = True,
+    ) -> AsyncIterator[StandardJob]:
+        """Yield every indexed job, fetching *batch_size* jobs per round trip."""
+        ids = await self.list_job_ids(status=status)
+        for i in range(0, len(ids), batch_size):
+            for job in await self.get_jobs(ids[i : i + batch_size], include_blobs=include_blobs):
+                yield job
+
+    # -- stats and maintenance -------------------------------------------------
+
+    async def get_stats(self) -> dict[str, int | dict[str, int]]:
+        await self._prune_expired_entries()
+        counts = await self._index_counts()
+        if counts is None:
+            return {"total_jobs": 0, "by_status": {}}
+        if self._needs_index_rebuild(counts):
+            await self.rebuild_status_index()
+            counts = await self._index_counts() or counts
+        return self._stats_from_counts(counts)
+
+    async def _index_counts(self) -> dict[str, int] | None:
+        """ZCARD of every index."""
+        pipe = self._pipeline()
+        keys = self._queue_index_counts(pipe)
+        results = await self.redis.execute_pipeline(pipe, "ZCARD")
+        if results is None:
+            return None
+        return dict(zip(keys, (int(n or 0) for n in results)))
+
+    async def _prune_expired_entries(self) -> None:
+        """Drop index entries whose job key has expired."""
+        pipe = self._pipeline()
+        self._queue_prune_candidates(pipe)
+        results = await self.redis.execute_pipeline(pipe, "PRUNE CANDIDATES")
+        candidates = self._prune_candidates(results or [])
+        if not candidates:
+            return
+        pipe = self._pipeline()
+        self._queue_exists(pipe, candidates)
+        exists = await self.redis.execute_pipeline(pipe, "PRUNE EXISTS")
+        if exists is None:
+            return
+        await self.unindex_jobs(jid for jid, found in zip(candidates, exists) if not found)
+
+    async def rebuild_status_index(self) -> int:
+        """Rebuild the status indexes from the stored jobs.
+
+        Returns:
+            Number of jobs indexed.
+        """
+        pipe = self._pipeline()
+        for status in self.statuses:
+            pipe.delete(self._status_key(status))
+        await self.redis.execute_pipeline(pipe, "REBUILD INDEX")
+
+        indexed = 0
+        pipe = self._pipeline()
+        async for job in self.iter_jobs(include_blobs=False):
+            self._queue_index(pipe, job)
+            indexed += 1
+        if indexed:
+            await self.redis.execute_pipeline(pipe, "REBUILD INDEX")
+        logger.info(f"Rebuilt status index for {self.service_name}: {indexed} jobs")
+        return indexed
+
+    async def cleanup_expired(self, max_age_hours: int | None = None) -> int:
+        """Delete expired jobs; see :meth:`JobRedisStore.cleanup_expired`.
+
+        Returns:
+            Number of jobs removed.
+        """
+        if max_age_hours is not None:
+            cutoff = now_brazil().timestamp() - max_age_hours * 3600
+            expired_ids = [
+                str(jid) for jid in await self.redis.zrangebyscore(self.list_key, "-inf", cutoff)
+            ]
+        else:
+            expired_ids = [
+                job.id async for job in self.iter_jobs(include_blobs=False) if job.is_expired
+            ]
+
+        removed = 0
+        for i in range(0, len(expired_ids), SCAN_BATCH_SIZE):
+            batch = expired_ids[i : i + SCAN_BATCH_SIZE]
+            pipe = self._pipeline()
+            self._queue_unindex(pipe, batch)
+            pipe.delete(*(self._job_key(jid) for jid in batch))
+            if self.blob_fields:
+                pipe.delete(*(self._blobs_key(jid) for jid in batch))
+            results = await self.redis.execute_pipeline(pipe, "CLEANUP")
+            self._forget_blob_digests(batch)
+            if results is not None:
+                removed += results[len(self.statuses) + 1]
+        return removed
+
+    async def find_orphaned(self, max_age_hours: float = 2) -> list[StandardJob]:
+        """Active jobs started more than *max_age_hours* ago."""
+        now = now_brazil()
+        orphaned: list[StandardJob] = []
+        for status in self.active_statuses:
+            async for job in self.iter_jobs(status=status, include_blobs=False):
+                if self._is_orphaned(job, now, max_age_hours):
+                    orphaned.append(job)
+        return orphaned
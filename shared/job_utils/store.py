@@ -3,64 +3,432 @@ Standard Redis store for job persistence.
 
 Provides a unified interface for saving, retrieving, updating,
 and deleting jobs in Redis with consistent key naming and TTL.
+
+Besides the job keys, the store maintains two kinds of sorted sets, all
+scored by ``created_at``:
+
+- ``{service}:jobs:list`` — every job, newest first
+- ``{service}:jobs:status:{status}`` — one secondary index per status,
+  updated on every save
+
+Listing reads one page of ids from the relevant set and fetches the jobs
+with a single ``MGET``; stats are ``ZCARD`` calls in one pipeline. Neither
+depends on the total number of jobs.
+
+Index entries are dropped when their job key is gone. Because every save
+refreshes the key's TTL, an entry older than the TTL is only a candidate:
+it is removed after ``EXISTS`` confirms the key has expired.
+
+With a ``serializer`` (see :mod:`common.redis_utils.binary_serializer`) the
+job key holds a compact binary encoding instead of ``model_dump_json()``,
+and the fields listed in ``blob_fields`` (e.g. transcription text and
+segments) are moved to a separate ``{prefix}{id}:blobs`` hash. A blob is
+rewritten only when its content changes, so progress updates write just the
+small status payload.
 """
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel
 
-from common.redis_utils import ResilientRedisStore
+from common.datetime_utils import now_brazil
+from common.redis_utils import BinarySerializer, JobEventPublisher, ResilientRedisStore
 from common.job_utils.models import StandardJob, JobStatus
 
 logger = logging.getLogger(__name__)
 
+#: Statuses that get a secondary index.
+INDEXED_STATUSES: tuple[str, ...] = tuple(s.value for s in JobStatus)
+#: Terminal statuses; every other indexed status is scanned for orphans.
+TERMINAL_STATUSES: frozenset[str] = frozenset(
+    (JobStatus.COMPLETED.value, JobStatus.FAILED.value, JobStatus.CANCELLED.value)
+)
+#: Jobs fetched per MGET when scanning.
+SCAN_BATCH_SIZE = 500
+#: Blob digests remembered per store to skip rewriting unchanged blobs.
+BLOB_DIGEST_CACHE_SIZE = 4096
+
+
+@dataclass
+class _BlobWrite:
+    """Blob commands queued by one binary save."""
+
+    blobs_key: str
+    #: Digest per (job id, field) to remember once the pipeline succeeds.
+    digests: dict[tuple[str, str], bytes] = field(default_factory=dict)
+    #: Encoded blobs not resent because their digest matched.
+    unchanged: dict[str, bytes] = field(default_factory=dict)
+    #: Pipeline position of the first ``HEXISTS`` for *unchanged*.
+    check_index: int = 0
+
+
+def _status_value(status: Any) -> str:
+    return status.value if hasattr(status, "value") else str(status)
+
+
+class BaseJobRedisStore:
+    """Key layout, indexing and (de)serialization shared by the sync and
+    async stores.
+
+    Methods named ``_queue_*`` only add commands to a pipeline; executing it
+    is left to the concrete store, so both variants write exactly the same
+    keys.
+    """
 
-class JobRedisStore:
     def __init__(
         self,
-        redis_store: ResilientRedisStore,
+        redis_store: Any,
         service_name: str,
         ttl_hours: int = 24,
+        job_model: type[BaseModel] = StandardJob,
+        statuses: Iterable[str] = INDEXED_STATUSES,
+        serializer: BinarySerializer | None = None,
+        blob_fields: Iterable[str] = (),
+        publish_events: bool = True,
+        key_prefix: str | None = None,
     ) -> None:
         self.redis = redis_store
         self.service_name = service_name
-        self.key_prefix = f"{service_name}:job:"
+        self.key_prefix = key_prefix or f"{service_name}:job:"
         self.list_key = f"{service_name}:jobs:list"
         self.ttl_seconds = ttl_hours * 3600
+        self.job_model = job_model
+        # Every status a saved job can have; a job is removed from all the
+        # other indexes on save, so services with their own status enum
+        # must list its values here.
+        self.statuses = tuple(dict.fromkeys(_status_value(s) for s in statuses))
+        self.serializer = serializer
+        self.blob_fields = tuple(blob_fields) if serializer else ()
+        self.events = JobEventPublisher(redis_store, service_name) if publish_events else None
+        self._blob_digests: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+    @property
+    def active_statuses(self) -> tuple[str, ...]:
+        return tuple(s for s in self.statuses if s not in TERMINAL_STATUSES)
 
     def _job_key(self, job_id: str) -> str:
         return f"{self.key_prefix}{job_id}"
 
+    def _blobs_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}{job_id}:blobs"
+
+    def _status_key(self, status: Any) -> str:
+        return f"{self.service_name}:jobs:status:{_status_value(status)}"
+
+    def _index_key(self, status: Any | None) -> str:
+        return self._status_key(status) if status else self.list_key
+
+    # -- pipeline builders -----------------------------------------------------
+
+    def _queue_binary_write(self, pipe: Any, job: Any) -> _BlobWrite:
+        """Queue the status payload and any changed blobs.
+
+        Blobs whose digest matches the last write are not resent; an
+        ``HEXISTS`` is queued instead, so a field removed meanwhile (key
+        expired, job deleted by another process) is detected by
+        :meth:`_lost_blobs` and rewritten.
+
+        Returns:
+            What was queued: digests to remember once the pipeline succeeds
+            and the unchanged blobs to check.
+        """
+        data = job.model_dump(mode="json")
+        blobs = {name: data.pop(name) for name in self.blob_fields if name in data}
+        write = _BlobWrite(self._blobs_key(job.id))
+
+        pipe.set(self._job_key(job.id), self.serializer.dumps(data), ex=self.ttl_seconds)
+        for name, value in blobs.items():
+            cache_key = (job.id, name)
+            if value is None:
+                if self._blob_digests.get(cache_key) != b"":
+                    pipe.hdel(write.blobs_key, name)
+                write.digests[cache_key] = b""
+                continue
+            encoded = self.serializer.encode(value)
+            digest = hashlib.blake2b(encoded, digest_size=8).digest()
+            if self._blob_digests.get(cache_key) != digest:
+                pipe.hset(write.blobs_key, name, encoded)
+            else:
+                write.unchanged[name] = encoded
+            write.digests[cache_key] = digest
+        write.check_index = len(pipe)
+        for name in write.unchanged:
+            pipe.hexists(write.blobs_key, name)
+        if blobs:
+            pipe.expire(write.blobs_key, self.ttl_seconds)
+        return write
+
+    @staticmethod
+    def _lost_blobs(write: _BlobWrite, results: list[Any]) -> dict[str, bytes]:
+        """Unchanged blobs that were not resent but are missing from Redis."""
+        found = results[write.check_index : write.check_index + len(write.unchanged)]
+        return {name: encoded for (name, encoded), exists in zip(write.unchanged.items(), found) if not exists}
+
+    def _queue_blob_restore(self, pipe: Any, write: _BlobWrite, lost: dict[str, bytes]) -> None:
+        logger.warning(f"Rewriting blobs missing from {write.blobs_key}: {', '.join(lost)}")
+        pipe.hset(write.blobs_key, mapping=lost)
+        pipe.expire(write.blobs_key, self.ttl_seconds)
+
+    def _remember_blob_digests(self, written: dict[tuple[str, str], bytes]) -> None:
+        for cache_key, digest in written.items():
+            self._blob_digests[cache_key] = digest
+            self._blob_digests.move_to_end(cache_key)
+        while len(self._blob_digests) > BLOB_DIGEST_CACHE_SIZE:
+            self._blob_digests.popitem(last=False)
+
+    def _forget_blob_digests(self, job_ids: Iterable[str]) -> None:
+        for job_id in job_ids:
+            for name in self.blob_fields:
+                self._blob_digests.pop((job_id, name), None)
+
+    def _queue_index(self, pipe: Any, job: Any) -> None:
+        """Queue adding *job* to the listing and to its status index.
+
+        The job is removed from every other status index in the same
+        pipeline, so no read of the previous status is needed.
+        """
+        score = job.created_at.timestamp()
+        current = _status_value(job.status)
+        pipe.zadd(self.list_key, {job.id: score})
+        for status in self.statuses:
+            if status != current:
+                pipe.zrem(self._status_key(status), job.id)
+        pipe.zadd(self._status_key(current), {job.id: score})
+
+    def _queue_unindex(self, pipe: Any, job_ids: list[str]) -> None:
+        pipe.zrem(self.list_key, *job_ids)
+        for status in self.statuses:
+            pipe.zrem(self._status_key(status), *job_ids)
+
+    def _queue_binary_read(self, pipe: Any, job_ids: list[str], include_blobs: bool) -> bool:
+        """Queue one MGET for the payloads and, optionally, the blob hashes.
+
+        Returns:
+            Whether blob hashes were queued (one result per id after the MGET).
+        """
+        read_blobs = include_blobs and bool(self.blob_fields)
+        pipe.execute_command("MGET", *(self._job_key(jid) for jid in job_ids), NEVER_DECODE=True)
+        if read_blobs:
+            for jid in job_ids:
+                pipe.execute_command("HGETALL", self._blobs_key(jid), NEVER_DECODE=True)
+        return read_blobs
+
+    def _index_keys(self) -> list[str]:
+        return [self.list_key] + [self._status_key(s) for s in self.statuses]
+
+    def _queue_index_counts(self, pipe: Any) -> list[str]:
+        keys = self._index_keys()
+        for key in keys:
+            pipe.zcard(key)
+        return keys
+
+    def _queue_prune_candidates(self, pipe: Any) -> None:
+        """Queue reading the index entries created before the TTL window.
+
+        Only these can belong to an expired key; whether they do is checked
+        with :meth:`_queue_exists`, since saves refresh the TTL.
+        """
+        cutoff = now_brazil().timestamp() - self.ttl_seconds
+        for key in self._index_keys():
+            pipe.zrangebyscore(key, "-inf", cutoff)
+
+    @staticmethod
+    def _prune_candidates(results: list[Any]) -> list[str]:
+        return list(dict.fromkeys(str(jid) for ids in results for jid in ids))
+
+    def _queue_exists(self, pipe: Any, job_ids: list[str]) -> None:
+        for job_id in job_ids:
+            pipe.exists(self._job_key(job_id))
+
+    # -- decoding --------------------------------------------------------------
+
+    def _parse(
+        self,
+        job_id: str,
+        data: str | bytes,
+        blobs: dict[bytes, bytes] | None = None,
+    ) -> StandardJob | None:
+        try:
+            if self.serializer is None:
+                return self.job_model.model_validate_json(data)
+            fields = self.serializer.loads(data)
+            for name, raw in (blobs or {}).items():
+                fields[name.decode()] = self.serializer.decode(raw)
+            return self.job_model.model_validate(fields)
+        except Exception as e:
+            logger.error(f"Failed to deserialize job {job_id}: {e}")
+            return None
+
+    def _build_jobs(
+        self,
+        job_ids: list[str],
+        values: list[Any],
+        blobs: list[dict[bytes, bytes]] | None,
+    ) -> tuple[list[StandardJob], list[str]]:
+        """Parse fetched payloads; returns the jobs and the ids with no key."""
+        jobs: list[StandardJob] = []
+        missing: list[str] = []
+        for i, (job_id, data) in enumerate(zip(job_ids, values)):
+            if not data:
+                missing.append(job_id)
+                continue
+            job = self._parse(job_id, data, blobs[i] if blobs else None)
+            if job is not None:
+                jobs.append(job)
+        return jobs, missing
+
+    def _stats_from_counts(self, counts: dict[str, int]) -> dict[str, int | dict[str, int]]:
+        by_status = {
+            status: counts[self._status_key(status)]
+            for status in self.statuses
+            if counts[self._status_key(status)]
+        }
+        return {"total_jobs": counts[self.list_key], "by_status": by_status}
+
+    def _needs_index_rebuild(self, counts: dict[str, int]) -> bool:
+        # Jobs saved before the status indexes existed.
+        return bool(counts[self.list_key]) and not any(
+            counts[self._status_key(s)] for s in self.statuses
+        )
+
+    def _is_orphaned(self, job: Any, now: Any, max_age_hours: float) -> bool:
+        started = job.started_at
+        if job.is_terminal or not started:
+            return False
+        return (now - started).total_seconds() / 3600 > max_age_hours
+
+
+class JobRedisStore(BaseJobRedisStore):
+    """Synchronous job store on top of :class:`ResilientRedisStore`.
+
+    FastAPI handlers should use :class:`AsyncJobRedisStore` instead; both
+    read and write the same keys.
+    """
+
+    redis: ResilientRedisStore
+
+    # -- persistence -----------------------------------------------------------
+
     def save_job(self, job: StandardJob) -> bool:
         key = self._job_key(job.id)
-        data = job.model_dump_json()
-        saved = self.redis.setex(key, self.ttl_seconds, data)
+        if self.serializer is not None:
+            saved = self._write_binary(job)
+        else:
+            saved = self.redis.setex(key, self.ttl_seconds, job.model_dump_json())
         if saved:
-            self.redis.redis.zadd(self.list_key, {job.id: job.created_at.timestamp()})
+            self.index_job(job)
+            if self.events is not None:
+                self.events.publish_job(job)
         return saved
 
+    def _write_binary(self, job: Any) -> bool:
+        """Write the status payload and any changed blobs in one transaction."""
+        pipe = self.redis.redis.pipeline(transaction=True)
+        write = self._queue_binary_write(pipe, job)
+        try:
+            results = pipe.execute()
+            lost = self._lost_blobs(write, results)
+            if lost:
+                pipe = self.redis.redis.pipeline(transaction=True)
+                self._queue_blob_restore(pipe, write, lost)
+                pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to save job {job.id}: {e}")
+            return False
+        self._remember_blob_digests(write.digests)
+        return True
+
+    def index_job(self, job: Any) -> None:
+        """Add *job* to the listing and to the index of its current status."""
+        pipe = self.redis.redis.pipeline(transaction=False)
+        self._queue_index(pipe, job)
+        pipe.execute()
+
+    def unindex_jobs(self, job_ids: Iterable[str]) -> None:
+        """Remove *job_ids* from the listing and from every status index."""
+        ids = list(job_ids)
+        if not ids:
+            return
+        pipe = self.redis.redis.pipeline(transaction=False)
+        self._queue_unindex(pipe, ids)
+        pipe.execute()
+
     def get_job(self, job_id: str) -> StandardJob | None:
+        if self.serializer is not None:
+            jobs = self.get_jobs([job_id], prune_missing=False)
+            return jobs[0] if jobs else None
         key = self._job_key(job_id)
         data = self.redis.get(key)
         if not data:
             return None
+        return self._parse(job_id, data)
+
+    def get_jobs(
+        self,
+        job_ids: list[str],
+        include_blobs: bool = True,
+        prune_missing: bool = True,
+    ) -> list[StandardJob]:
+        """Fetch *job_ids* with a single MGET, preserving order.
+
+        Ids whose key has expired are dropped from the indexes on the way.
+        With a serializer, ``include_blobs=False`` skips the blob hashes
+        (listings that only need status and progress).
+        """
+        if not job_ids:
+            return []
+        if self.serializer is not None:
+            values, blobs = self._read_binary(job_ids, include_blobs)
+        else:
+            values, blobs = self.redis.mget([self._job_key(jid) for jid in job_ids]), None
+        if values is None:
+            return []
+
+        jobs, missing = self._build_jobs(job_ids, values, blobs)
+        if missing and prune_missing:
+            self.unindex_jobs(missing)
+        return jobs
+
+    def _read_binary(
+        self, job_ids: list[str], include_blobs: bool
+    ) -> tuple[list[bytes | None] | None, list[dict[bytes, bytes]] | None]:
+        """Raw status payloads (one MGET) and, optionally, the blob hashes."""
+        pipe = self.redis.redis.pipeline(transaction=False)
+        read_blobs = self._queue_binary_read(pipe, job_ids, include_blobs)
         try:
-            return StandardJob.model_validate_json(data)
+            results = pipe.execute()
         except Exception as e:
-            logger.error(f"Failed to deserialize job {job_id}: {e}")
-            return None
+            logger.error(f"Failed to read {len(job_ids)} jobs: {e}")
+            return None, None
+        return results[0], (results[1:] if read_blobs else None)
 
     def update_job(self, job: StandardJob) -> bool:
         return self.save_job(job)
 
     def delete_job(self, job_id: str) -> bool:
         key = self._job_key(job_id)
-        self.redis.redis.zrem(self.list_key, job_id)
+        self.unindex_jobs([job_id])
         deleted = self.redis.delete(key)
+        if self.blob_fields:
+            self.redis.delete(self._blobs_key(job_id))
+        self._forget_blob_digests([job_id])
         return deleted > 0
 
-    def list_job_ids(self) -> list[str]:
-        ids = self.redis.redis.zrevrange(self.list_key, 0, -1)
+    # -- listing ---------------------------------------------------------------
+
+    def list_job_ids(
+        self,
+        start: int = 0,
+        stop: int = -1,
+        status: str | None = None,
+    ) -> list[str]:
+        ids = self.redis.redis.zrevrange(self._index_key(status), start, stop)
         return [str(jid) for jid in ids]
 
     def list_jobs(
@@ -68,52 +436,109 @@ class JobRedisStore:
         status: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        include_blobs: bool = True,
     ) -> list[StandardJob]:
-        all_ids = self.list_job_ids()
-        jobs: list[StandardJob] = []
-        for job_id in all_ids:
-            job = self.get_job(job_id)
-            if job is None:
-                continue
-            if status and job.status != status:
-                continue
-            jobs.append(job)
-            if len(jobs) >= limit:
-                break
-        return jobs[offset : offset + limit] if offset else jobs[:limit]
+        """Return one page of jobs, newest first, optionally for one status."""
+        if limit <= 0:
+            return []
+        ids = self.list_job_ids(offset, offset + limit - 1, status=status)
+        return self.get_jobs(ids, include_blobs=include_blobs)
+
+    def iter_jobs(
+        self,
+        status: str | None = None,
+        batch_size: int = SCAN_BATCH_SIZE,
+        include_blobs: bool = True,
+    ) -> Iterator[StandardJob]:
+        """Yield every indexed job, fetching *batch_size* jobs per MGET."""
+        ids = self.list_job_ids(status=status)
+        for i in range(0, len(ids), batch_size):
+            yield from self.get_jobs(ids[i : i + batch_size], include_blobs=include_blobs)
+
+    # -- stats and maintenance -------------------------------------------------
 
     def get_stats(self) -> dict[str, int | dict[str, int]]:
-        all_ids = self.list_job_ids()
-        total = len(all_ids)
-        by_status: dict[str, int] = {}
-        for job_id in all_ids:
-            job = self.get_job(job_id)
-            if job:
-                by_status[job.status] = by_status.get(job.status, 0) + 1
-        return {"total_jobs": total, "by_status": by_status}
-
-    def cleanup_expired(self) -> int:
-        all_ids = self.list_job_ids()
+        self._prune_expired_entries()
+        counts = self._index_counts()
+        if self._needs_index_rebuild(counts):
+            self.rebuild_status_index()
+            counts = self._index_counts()
+        return self._stats_from_counts(counts)
+
+    def _index_counts(self) -> dict[str, int]:
+        pipe = self.redis.redis.pipeline(transaction=False)
+        keys = self._queue_index_counts(pipe)
+        return dict(zip(keys, (int(n or 0) for n in pipe.execute())))
+
+    def _prune_expired_entries(self) -> None:
+        """Drop index entries whose job key has expired."""
+        pipe = self.redis.redis.pipeline(transaction=False)
+        self._queue_prune_candidates(pipe)
+        candidates = self._prune_candidates(pipe.execute())
+        if not candidates:
+            return
+        pipe = self.redis.redis.pipeline(transaction=False)
+        self._queue_exists(pipe, candidates)
+        self.unindex_jobs(jid for jid, exists in zip(candidates, pipe.execute()) if not exists)
+
+    def rebuild_status_index(self) -> int:
+        """Rebuild the status indexes from the stored jobs.
+
+        Returns:
+            Number of jobs indexed.
+        """
+        pipe = self.redis.redis.pipeline(transaction=False)
+        for status in self.statuses:
+            pipe.delete(self._status_key(status))
+        pipe.execute()
+        indexed = 0
+        for job in self.iter_jobs(include_blobs=False):
+            self.index_job(job)
+            indexed += 1
+        logger.info(f"Rebuilt status index for {self.service_name}: {indexed} jobs")
+        return indexed
+
+    def cleanup_expired(self, max_age_hours: int | None = None) -> int:
+        """Delete expired jobs.
+
+        Args:
+            max_age_hours: When given, delete every job created more than
+                this many hours ago (a score range on the listing, without
+                loading the jobs). Otherwise scan in batches and delete jobs
+                whose ``is_expired`` is true.
+
+        Returns:
+            Number of jobs removed.
+        """
+        if max_age_hours is not None:
+            cutoff = now_brazil().timestamp() - max_age_hours * 3600
+            expired_ids = [
+                str(jid) for jid in self.redis.redis.zrangebyscore(self.list_key, "-inf", cutoff)
+            ]
+        else:
+            expired_ids = [job.id for job in self.iter_jobs(include_blobs=False) if job.is_expired]
+        return self._delete_many(expired_ids)
+
+    def _delete_many(self, job_ids: list[str]) -> int:
         removed = 0
-        for job_id in all_ids:
-            job = self.get_job(job_id)
-            if job and job.is_expired:
-                if self.delete_job(job_id):
-                    removed += 1
+        for i in range(0, len(job_ids), SCAN_BATCH_SIZE):
+            batch = job_ids[i : i + SCAN_BATCH_SIZE]
+            self.unindex_jobs(batch)
+            removed += self.redis.delete(*(self._job_key(jid) for jid in batch))
+            if self.blob_fields:
+                self.redis.delete(*(self._blobs_key(jid) for jid in batch))
+            self._forget_blob_digests(batch)
         return removed
 
-    def find_orphaned(self, max_age_hours: int = 2) -> list[StandardJob]:
-        all_ids = self.list_job_ids()
-        orphaned: list[StandardJob] = []
-        for job_id in all_ids:
-            job = self.get_job(job_id)
-            if job and not job.is_terminal:
-                age = (job.created_at - job.created_at.__class__.now()).total_seconds()
-                started = job.started_at
-                if started:
-                    elapsed_hours = (
-                        (job.started_at.__class__.now() - started).total_seconds() / 3600
-                    )
-                    if elapsed_hours > max_age_hours:
-                        orphaned.append(job)
-        return orphaned
+    def find_orphaned(self, max_age_hours: float = 2) -> list[StandardJob]:
+        """Active jobs started more than *max_age_hours* ago.
+
+        Only the non-terminal status indexes are scanned.
+        """
+        now = now_brazil()
+        return [
+            job
+            for status in self.active_statuses
+            for job in self.iter_jobs(status=status, include_blobs=False)
+            if self._is_orphaned(job, now, max_age_hours)
+        ]
@@ -4,6 +4,13 @@ from __future__ import annotations
 Redis utilities with resilience patterns
 """
 from .resilient_store import ResilientRedisStore, RedisCircuitBreaker
+from .async_store import AsyncResilientRedisStore
 from .serializers import ModelSerializer, SERIALIZATION_VERSION
+from .binary_serializer import BinarySerializer, create_job_serializer
+from .job_events import JobEventPublisher, build_job_event, job_events_channel
 
-__all__ = ['ResilientRedisStore', 'RedisCircuitBreaker', 'ModelSerializer', 'SERIALIZATION_VERSION']
+__all__ = [
+    'ResilientRedisStore', 'AsyncResilientRedisStore', 'RedisCircuitBreaker', 'ModelSerializer', 'SERIALIZATION_VERSION',
+    'BinarySerializer', 'create_job_serializer',
+    'JobEventPublisher', 'build_job_event', 'job_events_channel',
+]
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+"""
+Asyncio-native counterpart of ResilientRedisStore.
+
+Same API (as coroutines), same circuit breaker and the same graceful
+degradation, on top of ``redis.asyncio``: a slow Redis delays only the
+request waiting for it instead of blocking the whole event loop.
+
+Intended for FastAPI processes; Celery workers keep the synchronous store.
+Both can share the same keys.
+
+``redis.asyncio`` connections belong to the event loop that opened them, so
+the client is created lazily and recreated when the store is used from a
+different loop (``asyncio.run`` per call, test clients).
+"""
+import asyncio
+import logging
+import socket
+from collections.abc import Callable
+from typing import Any
+
+from redis.asyncio import ConnectionPool, Redis
+
+from .resilient_store import CircuitBreakerOpenError, RedisCircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResilientRedisStore:
+    """
+    Redis store assíncrono com:
+    - Connection pooling
+    - Circuit breaker (``RedisCircuitBreaker.acall``)
+    - Graceful degradation
+    - Dependency injection (accepts external async Redis client)
+
+    Ao contrário da versão síncrona, o construtor não testa a conexão
+    (não há event loop garantido); use :meth:`ping` no startup.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "",
+        max_connections: int = 50,
+        socket_keepalive: bool = True,
+        socket_connect_timeout: int = 5,
+        socket_timeout: int = 10,
+        retry_on_timeout: bool = True,
+        health_check_interval: int = 30,
+        circuit_breaker_enabled: bool = True,
+        circuit_breaker_max_failures: int = 5,
+        circuit_breaker_timeout: int = 60,
+        redis_client: Any = None,
+        client_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        """
+        Inicializa Redis store assíncrono.
+
+        Args:
+            redis_url: URL de conexão Redis
+            max_connections: Máximo de conexões no pool
+            socket_keepalive: Habilita TCP keepalive
+            socket_connect_timeout: Timeout de conexão (segundos)
+            socket_timeout: Timeout de operações (segundos)
+            retry_on_timeout: Retry automático em timeout
+            health_check_interval: Intervalo de health check (segundos)
+            circuit_breaker_enabled: Habilita circuit breaker
+            circuit_breaker_max_failures: Falhas para abrir circuit
+            circuit_breaker_timeout: Tempo de recovery do circuit (segundos)
+            redis_client: Cliente ``redis.asyncio`` já criado (fixo, não é
+                recriado por event loop)
+            client_factory: Cria um cliente novo para cada event loop
+                (padrão: pool a partir de ``redis_url``)
+        """
+        self.redis_url = redis_url
+        self.pool: ConnectionPool | None = None
+        self._client: Any = redis_client
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+        if client_factory is not None or redis_client is not None:
+            self.client_factory = client_factory
+        else:
+            keepalive_options = {}
+            if socket_keepalive:
+                keepalive_options = {
+                    socket.TCP_KEEPIDLE: 60,
+                    socket.TCP_KEEPINTVL: 10,
+                    socket.TCP_KEEPCNT: 3,
+                }
+
+            def _create_client() -> Redis:
+                self.pool = ConnectionPool.from_url(
+                    redis_url,
+                    max_connections=max_connections,
+                    socket_connect_timeout=socket_connect_timeout,
+                    socket_timeout=socket_timeout,
+                    socket_keepalive=socket_keepalive,
+                    socket_keepalive_options=keepalive_options,
+                    retry_on_timeout=retry_on_timeout,
+                    health_check_interval=health_check_interval,
+                    decode_responses=True,
+                )
+                return Redis(connection_pool=self.pool)
+
+            self.client_factory = _create_client
+
+        self.circuit_breaker = None
+        if circuit_breaker_enabled:
+            self.circuit_breaker = RedisCircuitBreaker(
+                max_failures=circuit_breaker_max_failures,
+                timeout_seconds=circuit_breaker_timeout,
+            )
+
+    @property
+    def redis(self) -> Any:
+        """Cliente ``redis.asyncio`` do event loop atual."""
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if self.client_factory is not None and (
+            self._client is None or (loop is not None and loop is not self._client_loop)
+        ):
+            if self._client is not None:
+                logger.debug("Event loop changed, creating a new async Redis client")
+                self._discard_client(self._client, self._client_loop)
+            self._client = self.client_factory()
+            self._client_loop = loop
+        return self._client
+
+    @staticmethod
+    def _discard_client(client: Any, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Fecha o cliente de um event loop que deixou de ser o atual.
+
+        O fechamento precisa rodar no loop dono das conexões: é agendado
+        nele se ainda estiver aberto. Num loop já fechado não há como
+        aguardar; os sockets são liberados quando os transports são coletados.
+        """
+        if loop is None or loop.is_closed():
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            # Loop parado (ex.: reutilizado pela próxima task Celery): fecha na próxima execução
+            loop.create_task(client.aclose())
+
+    @redis.setter
+    def redis(self, client: Any) -> None:
+        self._client = client
+        self._client_loop = None
+        self.client_factory = None
+
+    async def _execute_with_circuit_breaker(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """Executa operação com circuit breaker se habilitado"""
+        if self.circuit_breaker:
+            return await self.circuit_breaker.acall(func, *args, **kwargs)
+        return await func(*args, **kwargs)
+
+    async def _safe_call(self, operation: str, func: Any, *args: Any, default: Any = None, **kwargs: Any) -> Any:
+        """Execute an async Redis operation with circuit breaker and error handling.
+
+        Args:
+            operation: Name for logging (e.g., "GET", "SET").
+            func: The async Redis method to call.
+            *args: Positional args for the method.
+            default: Value to return on error.
+            **kwargs: Keyword args for the method.
+
+        Returns:
+            Result of the operation, or *default* on error.
+        """
+        try:
+            return await self._execute_with_circuit_breaker(func, *args, **kwargs)
+        except CircuitBreakerOpenError:
+            logger.warning("Circuit breaker open, skipping %s", operation)
+            return default
+        except Exception as e:
+            logger.error("Redis %s failed: %s", operation, e)
+            return default
+
+    async def execute_pipeline(self, pipe: Any, operation: str = "PIPELINE") -> list[Any] | None:
+        """Executa um pipeline pelo circuit breaker.
+
+        Returns:
+            Resultados do pipeline, ou None em erro/circuit aberto
+        """
+        return await self._safe_call(operation, pipe.execute, default=None)
+
+    async def ping(self) -> bool:
+        """Verifica se Redis está acessível."""
+        return bool(await self._safe_call("PING", self.redis.ping, default=False))
+
+    async def get(self, key: str) -> str | None:
+        """Obtém valor do Redis (None se não encontrado/erro)."""
+        return await self._safe_call(f"GET {key}", self.redis.get, key)
+
+    async def set(
+        self,
+        key: str,
+        value: str,
+        ex: int | None = None,
+        nx: bool = False,
+    ) -> bool:
+        """Define valor, com expiração opcional."""
+        result = await self._safe_call(
+            f"SET {key}", self.redis.set, key, value, ex=ex, nx=nx, default=False
+        )
+        return bool(result)
+
+    async def setex(self, key: str, time: int, value: str) -> bool:
+        """Define valor com expiração."""
+        result = await self._safe_call(
+            f"SETEX {key}", self.redis.setex, key, time, value, default=False
+        )
+        return bool(result)
+
+    async def mget(self, keys: list[str]) -> list[str | None] | None:
+        """Obtém vários valores em uma única ida ao Redis (None em erro)."""
+        if not keys:
+            return []
+        return await self._safe_call(f"MGET ({len(keys)} keys)", self.redis.mget, keys, default=None)
+
+    async def delete(self, *keys: str) -> int:
+        """Deleta chaves e retorna quantas foram removidas."""
+        return await self._safe_call(f"DELETE {keys}", self.redis.delete, *keys, default=0)
+
+    async def exists(self, *keys: str) -> int:
+        """Número de chaves que existem."""
+        return await self._safe_call(f"EXISTS {keys}", self.redis.exists, *keys, default=0)
+
+    async def zrevrange(self, key: str, start: int, stop: int) -> list[str]:
+        """Membros de um sorted set, do maior score para o menor."""
+        return await self._safe_call(f"ZREVRANGE {key}", self.redis.zrevrange, key, start, stop, default=[])
+
+    async def zrangebyscore(self, key: str, min: Any, max: Any) -> list[str]:
+        """Membros de um sorted set com score entre *min* e *max*."""
+        return await self._safe_call(f"ZRANGEBYSCORE {key}", self.redis.zrangebyscore, key, min, max, default=[])
+
+    async def publish(self, channel: str, message: str) -> int:
+        """Publica mensagem em um canal pub/sub."""
+        return await self._safe_call(f"PUBLISH {channel}", self.redis.publish, channel, message, default=0)
+
+    async def close(self) -> None:
+        """Fecha conexões do pool"""
+        if self._client is None:
+            return
+        try:
+            await self._client.aclose()
+            logger.info("Async Redis connection pool closed")
+        except Exception as e:
+            logger.error(f"Error closing async Redis pool: {e}")
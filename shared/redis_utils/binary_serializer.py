@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+"""
+Compact binary serialization for Redis job data.
+
+``BinarySerializer`` encodes job dicts with msgpack or orjson, optionally
+compressed with zstd, and keeps the ``_version`` tagging (and migrations)
+of :class:`ModelSerializer`. Every payload starts with a two-byte header
+(magic + format/compression flags), so values are self-describing:
+
+- readers decode any format, whatever the serializer is configured to write
+- legacy plain-JSON values (starting with ``{``) are still read
+
+msgpack, orjson and zstandard are optional dependencies, imported on first
+use.
+
+Usage:
+    serializer = create_job_serializer("msgpack", compression="zstd")
+    raw = serializer.dumps(job.model_dump(mode="json"))
+    job_dict = serializer.loads(raw)
+"""
+import importlib
+import json
+import logging
+from typing import Any
+
+from .serializers import ModelSerializer
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = 0x59  # "Y"
+_ZSTD_FLAG = 0x10
+_FORMAT_CODES = {"json": 0, "orjson": 1, "msgpack": 2}
+_FORMAT_NAMES = {code: name for name, code in _FORMAT_CODES.items()}
+
+SUPPORTED_FORMATS = tuple(_FORMAT_CODES)
+SUPPORTED_COMPRESSION = ("zstd",)
+
+
+def _require(module: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"'{module}' is required for this Redis serializer; install it with "
+            f"`pip install {module}` or `pip install ytcaption-common[binary]`"
+        ) from e
+
+
+class BinarySerializer:
+    """
+    Versioned, optionally compressed binary encoding of job data.
+
+    Args:
+        format: ``"msgpack"``, ``"orjson"`` or ``"json"`` (stdlib)
+        compression: ``"zstd"`` or None
+        compress_min_bytes: Payloads smaller than this are stored
+            uncompressed (small status dicts do not benefit from zstd)
+        compression_level: zstd level
+    """
+
+    def __init__(
+        self,
+        format: str = "msgpack",
+        compression: str | None = None,
+        compress_min_bytes: int = 1024,
+        compression_level: int = 3,
+    ) -> None:
+        if format not in _FORMAT_CODES:
+            raise ValueError(f"Unsupported format {format!r}; expected one of {SUPPORTED_FORMATS}")
+        if compression and compression not in SUPPORTED_COMPRESSION:
+            raise ValueError(f"Unsupported compression {compression!r}; expected one of {SUPPORTED_COMPRESSION}")
+        self.format = format
+        self.compression = compression or None
+        self.compress_min_bytes = compress_min_bytes
+        self.compression_level = compression_level
+        # Fail at construction time rather than on the first save.
+        self._codec_module(format)
+        if self.compression:
+            _require("zstandard")
+
+    # -- job dicts (versioned) -------------------------------------------------
+
+    def dumps(self, model_dict: dict[str, Any]) -> bytes:
+        """Encode a job dict, adding the ``_version`` tag."""
+        return self.encode(ModelSerializer.serialize(model_dict))
+
+    def loads(self, raw: bytes | str) -> dict[str, Any]:
+        """Decode a job dict (binary or legacy JSON) and migrate its version."""
+        if not raw:
+            return {}
+        return ModelSerializer.deserialize(self.decode(raw))
+
+    # -- arbitrary values ------------------------------------------------------
+
+    def encode(self, value: Any) -> bytes:
+        """Encode any JSON-compatible value with the header."""
+        payload = self._pack(self.format, value)
+        flags = _FORMAT_CODES[self.format]
+        if self.compression and len(payload) >= self.compress_min_bytes:
+            zstd = _require("zstandard")
+            payload = zstd.ZstdCompressor(level=self.compression_level).compress(payload)
+            flags |= _ZSTD_FLAG
+        return bytes((_MAGIC, flags)) + payload
+
+    def decode(self, raw: bytes | str) -> Any:
+        """Decode a value written by :meth:`encode` or plain JSON."""
+        if isinstance(raw, str):
+            return json.loads(raw)
+        if len(raw) < 2 or raw[0] != _MAGIC:
+            return json.loads(raw)
+
+        flags = raw[1]
+        payload = raw[2:]
+        if flags & _ZSTD_FLAG:
+            payload = _require("zstandard").ZstdDecompressor().decompress(payload)
+        fmt = _FORMAT_NAMES.get(flags & 0x0F)
+        if fmt is None:
+            raise ValueError(f"Unknown serializer format flags: {flags:#x}")
+        return self._unpack(fmt, payload)
+
+    # -- codecs ----------------------------------------------------------------
+
+    @staticmethod
+    def _codec_module(fmt: str) -> Any:
+        return json if fmt == "json" else _require(fmt)
+
+    def _pack(self, fmt: str, value: Any) -> bytes:
+        if fmt == "msgpack":
+            return _require("msgpack").packb(value, use_bin_type=True, default=str)
+        if fmt == "orjson":
+            return _require("orjson").dumps(value, default=str)
+        return json.dumps(value, default=str, separators=(",", ":")).encode()
+
+    def _unpack(self, fmt: str, payload: bytes) -> Any:
+        if fmt == "msgpack":
+            return _require("msgpack").unpackb(payload, raw=False)
+        if fmt == "orjson":
+            return _require("orjson").loads(payload)
+        return json.loads(payload)
+
+
+def create_job_serializer(
+    format: str | None = "json",
+    compression: str | None = None,
+) -> BinarySerializer | None:
+    """Build the serializer for a store from configuration values.
+
+    Returns None for plain uncompressed JSON, which keeps the stores on their
+    original ``model_dump_json()`` string format.
+    """
+    format = (format or "json").lower()
+    compression = (compression or "").lower() or None
+    if compression == "none":
+        compression = None
+    if format == "json" and compression is None:
+        return None
+    return BinarySerializer(format=format, compression=compression)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+"""
+Job state change notifications over Redis pub/sub.
+
+Worker services publish a small JSON event every time a job is saved, so
+consumers (e.g. the orchestrator) can react to completion immediately
+instead of polling the job status endpoint.
+
+Pub/sub channels are server-wide in Redis (not scoped to a DB number),
+so services using different Redis databases on the same server still
+see each other's events.
+
+Usage:
+    publisher = JobEventPublisher(resilient_store, "audio_normalization")
+    publisher.publish_job(job)
+
+    # Consumer side subscribes to job_events_channel("audio_normalization")
+"""
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+JOB_EVENTS_CHANNEL_SUFFIX = "job_events"
+
+
+def job_events_channel(service_name: str) -> str:
+    """Return the pub/sub channel where *service_name* publishes job events."""
+    return f"{service_name}:{JOB_EVENTS_CHANNEL_SUFFIX}"
+
+
+def build_job_event(job: Any) -> dict[str, Any]:
+    """Build the event payload for a job model.
+
+    Only small, status-related fields are included; consumers fetch the
+    full job through the service API when they need it.
+    """
+    status = getattr(job, "status", None)
+    return {
+        "job_id": job.id,
+        "status": getattr(status, "value", status),
+        "progress": getattr(job, "progress", None),
+        "error_message": getattr(job, "error_message", None),
+    }
+
+
+class JobEventPublisher:
+    """
+    Publishes job state changes for one service.
+
+    Publishing is best-effort: failures are logged and never propagate to
+    the caller, so a pub/sub problem cannot break job persistence.
+    """
+
+    def __init__(self, redis_store: Any, service_name: str) -> None:
+        """
+        Args:
+            redis_store: ResilientRedisStore (or any object exposing ``publish``)
+            service_name: Service identifier used to build the channel name
+        """
+        self.redis_store = redis_store
+        self.service_name = service_name
+        self.channel = job_events_channel(service_name)
+
+    def publish_job(self, job: Any) -> int:
+        """Publish the current state of *job*.
+
+        Returns:
+            Number of subscribers that received the event (0 on error)
+        """
+        try:
+            message = json.dumps(build_job_event(job), default=str)
+            return self.redis_store.publish(self.channel, message) or 0
+        except Exception as e:
+            logger.warning("Failed to publish job event for %s on %s: %s", getattr(job, "id", "?"), self.channel, e)
+            return 0
+
+    async def apublish_job(self, job: Any) -> int:
+        """Async variant of :meth:`publish_job` for an ``AsyncResilientRedisStore``."""
+        try:
+            message = json.dumps(build_job_event(job), default=str)
+            return await self.redis_store.publish(self.channel, message) or 0
+        except Exception as e:
+            logger.warning("Failed to publish job event for %s on %s: %s", getattr(job, "id", "?"), self.channel, e)
+            return 0
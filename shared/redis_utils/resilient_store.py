@@ -346,6 +346,21 @@ class ResilientRedisStore:
         )
         return bool(result)
 
+    def mget(self, keys: list[str]) -> list[str | None] | None:
+        """
+        Obtém vários valores em uma única ida ao Redis.
+
+        Args:
+            keys: Chaves
+
+        Returns:
+            Valores na mesma ordem das chaves (None para ausentes), ou None
+            em erro (para não confundir falha do Redis com chaves expiradas)
+        """
+        if not keys:
+            return []
+        return self._safe_call(f"MGET ({len(keys)} keys)", self.redis.mget, keys, default=None)
+
     def delete(self, *keys: str) -> int:
         """
         Deleta chaves.
@@ -382,6 +397,19 @@ class ResilientRedisStore:
         """
         return self._safe_call(f"KEYS {pattern}", self.redis.keys, pattern, default=[])
     
+    def publish(self, channel: str, message: str) -> int:
+        """
+        Publica mensagem em um canal pub/sub.
+
+        Args:
+            channel: Canal
+            message: Mensagem serializada
+
+        Returns:
+            Número de assinantes que receberam a mensagem
+        """
+        return self._safe_call(f"PUBLISH {channel}", self.redis.publish, channel, message, default=0)
+
     def close(self) -> None:
         """Fecha conexões do pool"""
         try:
@@ -23,6 +23,9 @@ setup(
         "fastapi>=0.100.0",
         "celery>=5.3.0",
     ],
+    extras_require={
+        "binary": ["msgpack>=1.0.0", "orjson>=3.9.0", "zstandard>=0.22.0"],
+    },
     python_requires=">=3.11",
     classifiers=[
         "Development Status :: 4 - Beta",
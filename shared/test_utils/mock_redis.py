@@ -10,6 +10,7 @@ Usage in conftest.py:
 """
 try:
     import fakeredis
+    import fakeredis.aioredis
     from unittest.mock import patch
 
     class MockRedis:
@@ -25,20 +26,28 @@ try:
             """Create a job store backed by fakeredis.
 
             Args:
-                store_class: The job store class (e.g., VideoDownloadJobStore)
+                store_class: The job store class (e.g., VideoDownloadJobStore).
+                    Async clients (``_async_resilient``) get a
+                    ``fakeredis.aioredis`` factory sharing the same data.
                 redis_url: Ignored for fake redis, kept for API compat
                 **kwargs: Additional kwargs for the store class
 
             Returns:
                 Store instance with fake Redis backend
             """
-            fake_redis = fakeredis.FakeRedis(decode_responses=True)
+            server = fakeredis.FakeServer()
+            fake_redis = fakeredis.FakeRedis(server=server, decode_responses=True)
             with patch("common.redis_utils.resilient_store.ResilientRedisStore._test_connection"):
                 store = store_class(redis_url=redis_url, **kwargs)
             if hasattr(store, 'redis'):
                 store.redis = fake_redis
             if hasattr(store, '_resilient') and hasattr(store._resilient, 'redis'):
                 store._resilient.redis = fake_redis
+            if hasattr(store, '_async_resilient') and hasattr(store._async_resilient, 'client_factory'):
+                store._async_resilient.client_factory = lambda: fakeredis.aioredis.FakeRedis(
+                    server=server, decode_responses=True
+                )
+                store._async_resilient._client = None
             return store
 
 except ImportError: